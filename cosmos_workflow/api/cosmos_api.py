@@ -18,14 +18,17 @@ Example:
 """
 
 import uuid
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
 from cosmos_workflow.config.config_manager import ConfigManager
-from cosmos_workflow.database import init_database
+from cosmos_workflow.database import DatabaseConnection, SQLiteProfile, init_database
 from cosmos_workflow.execution import GPUExecutor
 from cosmos_workflow.execution.command_builder import DockerCommandBuilder
+from cosmos_workflow.execution.container_monitor import ContainerMonitor
 from cosmos_workflow.services import DataRepository
+from cosmos_workflow.services.result_cache import cached_outputs, run_fingerprint
 from cosmos_workflow.utils.logging import logger
 from cosmos_workflow.utils.smart_naming import generate_smart_name
 
@@ -47,11 +50,15 @@ class CosmosAPI:
     - GPUExecutor: GPU execution only
     """
 
-    def __init__(self, config: ConfigManager | None = None):
+    def __init__(
+        self, config: ConfigManager | None = None, database: DatabaseConnection | None = None
+    ):
         """Initialize workflow operations.
 
         Args:
             config: Configuration manager instance. If None, creates default.
+            database: Existing database connection to share. If None, opens
+                outputs_dir/cosmos.db with the configured SQLite profile.
         """
         if config is None:
             config = ConfigManager()
@@ -59,14 +66,22 @@ class CosmosAPI:
         self.config = config
 
         # Initialize database and service
-        local_config = config.get_local_config()
-        db_path = local_config.outputs_dir / "cosmos.db"
-        db = init_database(str(db_path))
+        if database is None:
+            local_config = config.get_local_config()
+            db_path = local_config.outputs_dir / "cosmos.db"
+            db = init_database(
+                str(db_path), profile=SQLiteProfile.from_config(config.get_database_config())
+            )
+        else:
+            db = database
 
         # Create service and orchestrator
         self.service = DataRepository(db, config)
         self.orchestrator = GPUExecutor(config_manager=config, service=self.service)
 
+        # Cached GPU/container state shared by queue claims and status views
+        self.container_monitor = ContainerMonitor(config)
+
         logger.info("CosmosAPI initialized")
 
     # ========== Prompt Operations ==========
@@ -530,6 +545,7 @@ class CosmosAPI:
         prompt_id: str,
         weights: dict[str, float] | None = None,
         stream_output: bool = True,
+        use_cache: bool = True,
         **kwargs,
     ) -> dict[str, Any]:
         """Run inference on a prompt - creates and executes run synchronously.
@@ -537,10 +553,15 @@ class CosmosAPI:
         This is the recommended method for running inference. It handles all the
         details of run creation and execution internally, blocking until completion.
 
+        If a completed run of the same prompt, input videos, settings and docker
+        image exists and its output video is still there, the new run links to
+        that output instead of running on the GPU (see services/result_cache.py).
+
         Args:
             prompt_id: ID of prompt to run
             weights: Control weights (optional, defaults to balanced)
             stream_output: Show real-time progress in console (default: True)
+            use_cache: Reuse the output of an identical completed run (default: True)
             **kwargs: Additional execution parameters (num_steps, guidance, seed, etc.)
 
         Returns:
@@ -550,6 +571,7 @@ class CosmosAPI:
                 - output_path: Path to generated video (if successful)
                 - duration: Execution time in seconds
                 - error: Error message (if failed)
+                - cached_from: Run whose output was reused (cache hits only)
 
         Raises:
             ValueError: If prompt not found
@@ -562,14 +584,35 @@ class CosmosAPI:
         # Build execution config (no batch_id for single runs)
         execution_config = self._build_execution_config(weights=weights, **kwargs)
 
+        metadata = {}
+        cached = None
+        fingerprint = self._run_fingerprint(prompt, execution_config)
+        if fingerprint:
+            metadata["fingerprint"] = fingerprint
+            if use_cache:
+                cached = self._cached_runs([fingerprint]).get(fingerprint)
+                if cached:
+                    metadata["cached_from"] = cached["id"]
+
         # Create run directly with service
         run = self.service.create_run(
             prompt_id=prompt_id,
             execution_config=execution_config,
+            metadata=metadata,
             model_type="transfer",  # Explicitly specify model type for inference
         )
         logger.info("Created run {} for prompt {}", run["id"], prompt_id)
 
+        if cached:
+            self._link_cached_runs({run["id"]: cached})
+            return {
+                "run_id": run["id"],
+                "output_path": cached["outputs"]["output_path"],
+                "duration_seconds": 0,
+                "status": "completed",
+                "cached_from": cached["id"],
+            }
+
         # Update status and execute
         self.service.update_run_status(run["id"], "running")
 
@@ -605,6 +648,16 @@ class CosmosAPI:
                     "status": "completed",
                 }
 
+            # Inference finished, outputs are being retrieved in the background
+            elif result.get("status") == "downloading":
+                logger.info("Run {} finished inference, downloading outputs", run["id"])
+                return {
+                    "run_id": run["id"],
+                    "output_path": None,
+                    "duration_seconds": result.get("duration_seconds"),
+                    "status": "downloading",
+                }
+
             # Unexpected status
             else:
                 logger.warning("Unexpected status from execute_run: {}", result.get("status"))
@@ -631,6 +684,8 @@ class CosmosAPI:
         prompt_ids: list[str],
         weights_list: list[dict[str, float]],
         batch_size: int = 4,
+        batch_id: str | None = None,
+        use_cache: bool = True,
         **kwargs,
     ) -> dict[str, Any]:
         """Run inference on multiple prompts as a batch, blocking until completion.
@@ -639,10 +694,20 @@ class CosmosAPI:
         all runs together. Provides 40-60% performance improvement over individual runs
         by reducing model loading overhead. Each prompt can have different control weights.
 
+        Passing the ID of a batch that was started before and interrupted resumes
+        it instead (see GPUExecutor.resume_batch_runs): its runs are reused, videos
+        that finished on the GPU host are downloaded and only the rest run again.
+
+        Prompts whose run would repeat a completed run (same prompt, input
+        videos, settings and docker image, see quick_inference) link to that
+        run's output and are left out of the GPU batch.
+
         Args:
             prompt_ids: List of prompt IDs to run
             weights_list: List of weight dicts, one per prompt (can have different controls)
             batch_size: Number of videos to process simultaneously on GPU (default: 4)
+            batch_id: ID for the batch (default: a new one); an existing batch resumes
+            use_cache: Reuse the outputs of identical completed runs (default: True)
             **kwargs: Additional execution parameters (num_steps, guidance, seed, etc.)
                      These MUST be identical for all prompts in the batch.
 
@@ -653,6 +718,8 @@ class CosmosAPI:
                 - successful: Number of successful operations
                 - failed: Number of failed operations
                 - duration: Total execution time in seconds
+                - cached_runs: Number of runs served from the result cache
+                - prompt_runs: Dict mapping each prompt ID to its run ID
 
         Note:
             Missing prompts are logged and skipped gracefully.
@@ -677,39 +744,84 @@ class CosmosAPI:
             logger.warning("Empty prompt list provided for batch inference")
             return self.orchestrator.execute_batch_runs([])
 
-        # Generate unique batch_id for tracking
-        batch_id = self._generate_batch_id()
+        if batch_id:
+            existing_runs = list(self.service.iter_runs(batch_id=batch_id))
+            if existing_runs:
+                return self._resume_batch(batch_id, existing_runs, batch_size)
+        else:
+            # Generate unique batch_id for tracking
+            batch_id = self._generate_batch_id()
         logger.info("Created batch {} for {} prompts", batch_id, len(prompt_ids))
 
-        # Create runs with individual weights
-        runs_and_prompts = []
+        # Fetch all prompts at once, skipping any that no longer exist
+        prompts = self.service.get_prompts(prompt_ids)
+        run_specs = []
+        batch_prompts = []
+        fingerprints = []
         for prompt_id, weights in zip(prompt_ids, weights_list):
-            try:
-                # Validate prompt
-                prompt = self._validate_prompt(prompt_id)
+            prompt = prompts.get(prompt_id)
+            if not prompt:
+                logger.warning("Skipping prompt {}: not found", prompt_id)
+                continue
 
+            try:
                 # Build execution config with individual weights
                 execution_config = self._build_execution_config(weights=weights, **kwargs)
-                execution_config["batch_id"] = batch_id
-
-                # Create run directly with service
-                run = self.service.create_run(
-                    prompt_id=prompt_id,
-                    execution_config=execution_config,
-                    model_type="transfer",  # Explicitly specify model type for inference
-                    metadata={"batch_id": batch_id},  # Pass batch_id for correct log path
-                )
-                logger.debug(
-                    "Created run {} for prompt {} with {} controls",
-                    run["id"],
-                    prompt_id,
-                    len(weights) if weights else 0,
-                )
-                runs_and_prompts.append((run, prompt))
-
             except ValueError as e:
                 logger.warning("Skipping prompt {}: {}", prompt_id, e)
                 continue
+            execution_config["batch_id"] = batch_id
+
+            run_specs.append(
+                {
+                    "prompt_id": prompt_id,
+                    "execution_config": execution_config,
+                    "model_type": "transfer",  # Explicitly specify model type for inference
+                    # batch_id gives the log path
+                    "metadata": {"batch_id": batch_id},
+                }
+            )
+            batch_prompts.append(prompt)
+            fingerprints.append(self._run_fingerprint(prompt, execution_config))
+
+        cached = self._cached_runs(fingerprints) if use_cache else {}
+        batch_index = 0
+        for spec, fingerprint in zip(run_specs, fingerprints):
+            if not fingerprint:
+                continue
+            spec["metadata"]["fingerprint"] = fingerprint
+            if fingerprint in cached:
+                spec["metadata"]["cached_from"] = cached[fingerprint]["id"]
+        for spec in run_specs:
+            if "cached_from" not in spec["metadata"]:
+                # batch_index locates the run's output on resume
+                spec["metadata"]["batch_index"] = batch_index
+                batch_index += 1
+
+        # Create every run in one transaction
+        runs = self.service.create_runs(run_specs)
+        logger.debug("Created {} runs for batch {}", len(runs), batch_id)
+        prompt_runs = {run["prompt_id"]: run["id"] for run in runs}
+
+        hits = {
+            run["id"]: cached[fingerprint]
+            for run, fingerprint in zip(runs, fingerprints)
+            if fingerprint in cached
+        }
+        if hits:
+            logger.info("Batch {}: {} run(s) served from the result cache", batch_id, len(hits))
+            self._link_cached_runs(hits)
+        runs_and_prompts = [
+            (run, prompt) for run, prompt in zip(runs, batch_prompts) if run["id"] not in hits
+        ]
+        if not runs_and_prompts and hits:
+            return {
+                "status": "success",
+                "batch_name": batch_id,
+                "run_count": 0,
+                "cached_runs": len(hits),
+                "prompt_runs": prompt_runs,
+            }
 
         # Execute as batch with the batch_id we generated
         batch_result = self.orchestrator.execute_batch_runs(
@@ -720,35 +832,183 @@ class CosmosAPI:
         # The GPUExecutor marks each run as completed after downloading outputs
         # Only mark as failed if the entire batch execution failed
         if batch_result.get("status") == "failed":
-            for run, _ in runs_and_prompts:
-                self.service.update_run_status(run["id"], "failed")
+            self.service.update_runs(
+                {run["id"]: {"status": "failed"} for run, _ in runs_and_prompts}
+            )
+
+        batch_result["cached_runs"] = len(hits)
+        batch_result["prompt_runs"] = prompt_runs
+        return batch_result
 
+    def _resume_batch(
+        self, batch_id: str, runs: list[dict[str, Any]], batch_size: int
+    ) -> dict[str, Any]:
+        """Resume an interrupted batch from its existing runs."""
+        logger.info("Resuming batch {} ({} runs)", batch_id, len(runs))
+        runs = sorted(runs, key=lambda run: (run.get("metadata") or {}).get("batch_index", 0))
+        prompts = self.service.get_prompts([run["prompt_id"] for run in runs])
+        runs_and_prompts = [
+            (run, prompts[run["prompt_id"]]) for run in runs if run["prompt_id"] in prompts
+        ]
+
+        batch_result = self.orchestrator.resume_batch_runs(
+            runs_and_prompts, batch_name=batch_id, batch_size=batch_size
+        )
+        if batch_result.get("status") == "failed":
+            # Runs completed before or during the resume keep their outputs
+            recovered = set(batch_result.get("recovered_run_ids", []))
+            unfinished = [
+                run["id"]
+                for run, _ in runs_and_prompts
+                if run["status"] != "completed" and run["id"] not in recovered
+            ]
+            self.service.update_runs({run_id: {"status": "failed"} for run_id in unfinished})
+        batch_result["prompt_runs"] = {run["prompt_id"]: run["id"] for run, _ in runs_and_prompts}
         return batch_result
 
+    # ========== Result Cache ==========
+
+    def _run_fingerprint(
+        self, prompt: dict[str, Any], execution_config: dict[str, Any]
+    ) -> str | None:
+        """Get the result cache fingerprint of an inference run, None if uncacheable."""
+        if not (prompt.get("inputs") or {}).get("video"):
+            return None
+        docker_image = self.config.get_remote_config().docker_image
+        return run_fingerprint(prompt, execution_config, docker_image)
+
+    def _cached_runs(self, fingerprints: list[str | None]) -> dict[str, dict[str, Any]]:
+        """Get the newest completed run per fingerprint whose output video still exists."""
+        fingerprints = [fingerprint for fingerprint in fingerprints if fingerprint]
+        if not fingerprints:
+            return {}
+
+        hits = {}
+        for fingerprint, runs in self.service.find_runs_by_fingerprint(fingerprints).items():
+            for run in runs:
+                outputs = cached_outputs(run)
+                if outputs is not None:
+                    hits[fingerprint] = {**run, "outputs": outputs}
+                    break
+        return hits
+
+    def _link_cached_runs(self, hits: dict[str, dict[str, Any]]) -> None:
+        """Complete new runs with the outputs of the identical runs they hit."""
+        self.service.update_runs(
+            {
+                run_id: {
+                    "outputs": {**cached["outputs"], "cached_from": cached["id"]},
+                    "status": "completed",
+                }
+                for run_id, cached in hits.items()
+            }
+        )
+        for run_id, cached in hits.items():
+            logger.info("Run {} reuses the output of identical run {}", run_id, cached["id"])
+
+    def get_cache_stats(self) -> dict[str, Any]:
+        """Get result cache hit-rate statistics.
+
+        Returns:
+            Dictionary with ``runs`` (inference runs with a fingerprint),
+            ``hits`` (runs that reused an identical run's output), ``misses``
+            and ``hit_rate``
+        """
+        return self.service.get_cache_stats()
+
     # ========== Utility Operations ==========
 
     def list_prompts(self, **kwargs) -> list[dict[str, Any]]:
         """List prompts with optional filtering.
 
         Args:
-            **kwargs: Filtering parameters (model_type, limit, offset)
+            **kwargs: Filtering parameters (limit, offset, after, enhanced,
+                has_runs, created_after, created_before). ``after`` is
+                ``keyset_cursor()`` or the ID of the last prompt of the previous page.
 
         Returns:
             List of prompt dictionaries
         """
         return self.service.list_prompts(**kwargs)
 
+    def iter_prompts(
+        self, batch_size: int = 500, after: str | None = None, **kwargs
+    ) -> Iterator[dict[str, Any]]:
+        """Stream all prompts, newest first, without loading them all at once.
+
+        Args:
+            batch_size: Prompts fetched per query
+            after: Start after this cursor or prompt ID
+            **kwargs: Same filters as list_prompts
+
+        Yields:
+            Prompt dictionaries
+        """
+        return self.service.iter_prompts(batch_size=batch_size, after=after, **kwargs)
+
     def list_runs(self, **kwargs) -> list[dict[str, Any]]:
         """List runs with optional filtering.
 
         Args:
-            **kwargs: Filtering parameters (status, prompt_id, limit, offset, version_filter)
+            **kwargs: Filtering parameters (status, prompt_id, limit, offset, after,
+                version_filter, prompt_ids, model_type, created_after, created_before,
+                min_rating, unrated, search). ``after`` is ``keyset_cursor()`` or the
+                ID of the last run of the previous page.
 
         Returns:
             List of run dictionaries
         """
         return self.service.list_runs(**kwargs)
 
+    def iter_runs(self, batch_size: int = 500, **kwargs) -> Iterator[dict[str, Any]]:
+        """Stream all runs matching the list_runs filters.
+
+        Args:
+            batch_size: Runs fetched per query
+            **kwargs: Filtering parameters, same as list_runs
+
+        Yields:
+            Run dictionaries
+        """
+        return self.service.iter_runs(batch_size=batch_size, **kwargs)
+
+    def list_runs_enriched(self, **kwargs) -> list[dict[str, Any]]:
+        """List runs with prompt text and upscaled child run attached.
+
+        Args:
+            **kwargs: Filtering parameters, same as list_runs
+
+        Returns:
+            List of run dictionaries with prompt_text, has_upscaled and
+            (when present) upscaled_run
+        """
+        return self.service.list_runs_enriched(**kwargs)
+
+    def count_runs(self, **kwargs) -> int:
+        """Count runs matching the list_runs filters.
+
+        Args:
+            **kwargs: Filtering parameters, same as list_runs
+
+        Returns:
+            Number of matching runs
+        """
+        return self.service.count_runs(**kwargs)
+
+    def get_prompt_run_stats(
+        self, prompt_ids: list[str] | None = None
+    ) -> dict[str, dict[str, Any]]:
+        """Get run counts, status breakdown and average rating per prompt.
+
+        Args:
+            prompt_ids: Prompts to summarize (default: every prompt with runs)
+
+        Returns:
+            Dictionary mapping prompt ID to its run summary (prompts without
+            runs are omitted)
+        """
+        return self.service.get_prompt_run_stats(prompt_ids)
+
     def get_prompt(self, prompt_id: str) -> dict[str, Any] | None:
         """Get a prompt by ID.
 
@@ -760,6 +1020,17 @@ class CosmosAPI:
         """
         return self.service.get_prompt(prompt_id)
 
+    def get_prompts(self, prompt_ids: list[str]) -> dict[str, dict[str, Any]]:
+        """Get several prompts with one query.
+
+        Args:
+            prompt_ids: The prompt IDs
+
+        Returns:
+            Dictionary mapping prompt ID to prompt (missing IDs are omitted)
+        """
+        return self.service.get_prompts(prompt_ids)
+
     def get_run(self, run_id: str) -> dict[str, Any] | None:
         """Get a run by ID.
 
@@ -906,17 +1177,18 @@ class CosmosAPI:
         """
         return self.service.delete_all_prompts(keep_outputs)
 
-    def search_prompts(self, query: str, limit: int = 50) -> list[dict[str, Any]]:
+    def search_prompts(self, query: str, limit: int = 50, **kwargs) -> list[dict[str, Any]]:
         """Search prompts by text.
 
         Args:
             query: Search query string
             limit: Maximum results
+            **kwargs: Same filters as list_prompts
 
         Returns:
             List of matching prompt dictionaries
         """
-        return self.service.search_prompts(query, limit)
+        return self.service.search_prompts(query, limit, **kwargs)
 
     # ========== System Operations ==========
 
@@ -949,21 +1221,21 @@ class CosmosAPI:
         active_run = running_runs[0] if running_runs else None
 
         # Get the active container (should match the run)
-        self.orchestrator._initialize_services()
-        try:
-            with self.orchestrator.ssh_manager:
-                container = self.orchestrator.docker_executor.get_active_container()
-        except Exception as e:
-            logger.error("Failed to get container: {}", e)
-            container = None
+        container = self.container_monitor.get_container()
 
         # In normal operation, these should match
         # We're just enriching the status display with run details
         return {"active_run": active_run, "container": container}
 
-    def check_status(self) -> dict[str, Any]:
+    def check_status(self, fresh: bool = False) -> dict[str, Any]:
         """Check remote GPU instance status.
 
+        The remote part comes from the container monitor's cached snapshot,
+        which is at most ``[monitor] status_ttl`` seconds old.
+
+        Args:
+            fresh: Query the GPU host now instead of using the cached snapshot
+
         Returns:
             Dictionary containing:
                 - ssh_status: SSH connectivity status
@@ -971,11 +1243,12 @@ class CosmosAPI:
                 - gpu_info: GPU information if available
                 - container: Running container info (if any)
                 - active_run: Details of the running operation (if any)
+                - checked_at: When the remote state was queried (epoch seconds)
         """
         logger.info("Checking remote GPU status")
 
-        # Get base status from orchestrator
-        status = self.orchestrator.check_remote_status()
+        # Copy so adding the active run does not modify the shared snapshot
+        status = dict(self.container_monitor.snapshot(max_age=0 if fresh else None))
 
         # If Docker is running, add active operation details
         if status.get("docker_status", {}).get("docker_running"):
@@ -991,9 +1264,32 @@ class CosmosAPI:
 
         return status
 
-    def get_active_containers(self) -> list[dict[str, str]]:
+    def get_queue_summary(self) -> dict[str, Any]:
+        """Summarize the job queue with runtime estimates.
+
+        Runtimes are predicted from the durations of finished queue jobs (see
+        ``DurationEstimator``) and spread over the configured GPU hosts.
+
+        Returns:
+            Dictionary containing:
+                - queued: Number of queued jobs
+                - running: Number of running jobs
+                - estimated_seconds: Predicted time until the queue is empty
+        """
+        from cosmos_workflow.services.duration_estimator import DurationEstimator
+
+        capacity = sum(host.capacity for host in self.config.get_gpu_hosts())
+        return DurationEstimator(self.service.db).estimate_queue(capacity=capacity)
+
+    def get_active_containers(self, fresh: bool = False) -> list[dict[str, str]]:
         """Get list of active Docker containers.
 
+        Served from the container monitor's cached snapshot, so frequent
+        callers (queue claims, UI refreshes) do not each open an SSH session.
+
+        Args:
+            fresh: Query the GPU host now instead of using the cached snapshot
+
         Returns:
             List of dictionaries with container info:
                 - container_id: Container ID (short form)
@@ -1002,27 +1298,46 @@ class CosmosAPI:
                 - status: Container status
         """
         logger.debug("Getting active Docker containers")
-        self.orchestrator._initialize_services()
+        container = self.container_monitor.get_container(max_age=0 if fresh else None)
+
+        if container:
+            # Return as list for backward compatibility
+            # Map field names to match existing interface
+            return [
+                {
+                    "container_id": container["id_short"],
+                    "name": container["name"],
+                    "image": container["image"],
+                    "status": container["status"],
+                }
+            ]
+        return []
 
-        try:
-            with self.orchestrator.ssh_manager:
-                container = self.orchestrator.docker_executor.get_active_container()
+    def invalidate_container_state(self) -> None:
+        """Discard the cached GPU/container state after starting or stopping containers."""
+        self.container_monitor.invalidate()
 
-                if container:
-                    # Return as list for backward compatibility
-                    # Map field names to match existing interface
-                    return [
-                        {
-                            "container_id": container["id_short"],
-                            "name": container["name"],
-                            "image": container["image"],
-                            "status": container["status"],
-                        }
-                    ]
-                return []
-        except Exception as e:
-            logger.error("Failed to get containers: {}", e)
-            return []
+    def prefetch_inputs(self, prompt_ids: list[str]) -> int:
+        """Upload the input videos of prompts to the GPU host ahead of their runs.
+
+        Uses its own SSH channels, so it can run while another job is on the
+        GPU; the runs then move the staged files into place instead of
+        uploading them (see GPUExecutor.prefetch_inputs).
+
+        Args:
+            prompt_ids: Prompts whose runs are expected next
+
+        Returns:
+            Number of files uploaded
+        """
+        prompts = self.service.get_prompts(prompt_ids)
+        paths = [
+            path
+            for prompt in prompts.values()
+            for path in (prompt.get("inputs") or {}).values()
+            if isinstance(path, str) and path
+        ]
+        return self.orchestrator.prefetch_inputs(paths)
 
     def stream_container_logs(self, container_id: str) -> None:
         """Stream logs from a Docker container to stdout (CLI only).
@@ -1150,6 +1465,7 @@ class CosmosAPI:
             with self.orchestrator.ssh_manager:
                 # Use orchestrator's docker executor
                 result = self.orchestrator.docker_executor.kill_containers()
+                self.container_monitor.invalidate()
 
                 if result["status"] == "success":
                     logger.info("Successfully killed {} container(s)", result["killed_count"])
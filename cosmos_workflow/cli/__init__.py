@@ -9,6 +9,7 @@ from .enhance import prompt_enhance
 from .inference import inference
 from .kill import kill
 from .list_commands import list_group
+from .pipeline import pipeline
 from .prepare import prepare
 from .search import search_command
 from .show import show_command
@@ -16,6 +17,7 @@ from .status import status
 from .ui import ui
 from .upscale import upscale
 from .verify import verify
+from .worker import worker
 
 
 @click.group(
@@ -51,6 +53,7 @@ cli.add_command(delete_group)
 cli.add_command(inference)
 cli.add_command(kill)
 cli.add_command(list_group)
+cli.add_command(pipeline)
 cli.add_command(prompt_enhance)
 cli.add_command(prepare)
 cli.add_command(search_command)
@@ -59,6 +62,7 @@ cli.add_command(status)
 cli.add_command(ui)
 cli.add_command(upscale)
 cli.add_command(verify)
+cli.add_command(worker)
 
 
 def main():
@@ -150,7 +150,9 @@ def delete_prompt(
         console.print(f"\n[yellow]This will also delete {len(runs)} run(s):[/yellow]")
 
         # Check for active runs and show warning
-        active_runs = [r for r in runs if r.get("status") in ("running", "uploading")]
+        active_runs = [
+            r for r in runs if r.get("status") in ("running", "uploading", "downloading")
+        ]
         if active_runs:
             console.print(
                 f"\n[bold red]WARNING: {len(active_runs)} ACTIVE RUNS WILL BE DELETED![/bold red]"
@@ -164,7 +166,7 @@ def delete_prompt(
                 "green"
                 if run.get("status") == "completed"
                 else "red"
-                if run.get("status") in ("running", "uploading")
+                if run.get("status") in ("running", "uploading", "downloading")
                 else "yellow"
             )
             console.print(
@@ -297,7 +299,7 @@ def delete_run(ctx: click.Context, run_id: str, force: bool, all: bool, keep_out
                 "green"
                 if run.get("status") == "completed"
                 else "red"
-                if run.get("status") in ("running", "uploading")
+                if run.get("status") in ("running", "uploading", "downloading")
                 else "yellow"
             )
             console.print(
@@ -379,7 +381,7 @@ def delete_run(ctx: click.Context, run_id: str, force: bool, all: bool, keep_out
             console.print(f"\n[yellow]Total: {total_files} files ({total_size})[/yellow]")
 
     # Warn if run is active
-    if run_info.get("status") in ("running", "uploading"):
+    if run_info.get("status") in ("running", "uploading", "downloading"):
         console.print("\n[bold red]WARNING: THIS RUN IS CURRENTLY ACTIVE![/bold red]")
         console.print(f"[red]Status: {run_info.get('status')}. Deletion will proceed anyway.[/red]")
 
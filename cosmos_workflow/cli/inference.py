@@ -55,6 +55,11 @@ from .helpers import (
     default=None,
     help="Custom name for batch processing (auto-generated if not provided)",
 )
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Run on the GPU even if an identical run already has an output",
+)
 @click.option(
     "--dry-run",
     is_flag=True,
@@ -75,12 +80,14 @@ def inference(
     blur_strength,
     canny_threshold,
     batch_name,
+    no_cache,
     dry_run,
 ):
     r"""Run Cosmos Transfer inference on one or more prompts.
 
     Accepts prompt IDs directly and creates runs automatically during execution.
-    Supports both single and batch inference.
+    Supports both single and batch inference. A prompt already run with the
+    same inputs and settings reuses that run's output unless --no-cache is given.
 
     \b
     Examples:
@@ -89,6 +96,7 @@ def inference(
       cosmos inference ps_abc123 --weights 0.3 0.3 0.2 0.2 # Custom weights
       cosmos inference --prompts-file prompts.txt          # From file
       cosmos inference ps_abc123 --dry-run                 # Preview only
+      cosmos inference ps_abc123 --no-cache                # Always run on the GPU
 
     For 4K upscaling, use: cosmos upscale <run_id>
     """
@@ -179,6 +187,7 @@ def inference(
                 sigma_max=sigma_max,
                 blur_strength=blur_strength,
                 canny_threshold=canny_threshold,
+                use_cache=not no_cache,
             )
 
             progress.update(task, completed=True)
@@ -193,6 +202,8 @@ def inference(
         # Add output path if available
         if "output_path" in result:
             results_data["Output"] = result["output_path"]
+        if result.get("cached_from"):
+            results_data["Reused output of"] = format_id(result["cached_from"])
 
         display_success("Inference completed successfully!", results_data)
 
@@ -225,6 +236,7 @@ def inference(
                 blur_strength=blur_strength,
                 canny_threshold=canny_threshold,
                 batch_name=batch_name,
+                use_cache=not no_cache,
             )
 
             progress.update(task, completed=True)
@@ -239,6 +251,8 @@ def inference(
             "Successful": str(successful),
             "Failed": str(failed),
         }
+        if result.get("cached_runs"):
+            results_data["Reused outputs"] = str(result["cached_runs"])
 
         # Show some run IDs
         if result.get("run_ids"):
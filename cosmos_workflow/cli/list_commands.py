@@ -27,6 +27,17 @@ def list_group():
     default=50,
     help="Maximum number of results to show (default: 50)",
 )
+@click.option(
+    "--after",
+    metavar="PROMPT_ID",
+    help="Show prompts after this one (the last ID of the previous page)",
+)
+@click.option(
+    "--all",
+    "stream_all",
+    is_flag=True,
+    help="Stream every prompt instead of one page (JSON Lines with --json)",
+)
 @click.option(
     "--json",
     "output_json",
@@ -34,19 +45,27 @@ def list_group():
     help="Output in JSON format",
 )
 @click.pass_context
-def list_prompts(ctx: click.Context, limit: int, output_json: bool) -> None:
+def list_prompts(
+    ctx: click.Context, limit: int, after: str | None, stream_all: bool, output_json: bool
+) -> None:
     """List all prompts in the database.
 
     Examples:
         cosmos list prompts
         cosmos list prompts --limit 10
+        cosmos list prompts --after ps_abc123
+        cosmos list prompts --all --json > prompts.jsonl
         cosmos list prompts --json
     """
     ctx_obj: CLIContext = ctx.obj
     ops = ctx_obj.get_operations()
 
     try:
-        prompts = ops.list_prompts(limit=limit)
+        if stream_all:
+            _stream_rows(ops.iter_prompts(after=after), _prompt_row, output_json, "prompts")
+            return
+
+        prompts = ops.list_prompts(limit=limit, after=after)
 
         if output_json:
             # Output as JSON
@@ -63,27 +82,10 @@ def list_prompts(ctx: click.Context, limit: int, output_json: bool) -> None:
             table.add_column("Created", style="green")
 
             for prompt in prompts:
-                # Truncate long prompts
-                prompt_text = prompt["prompt_text"]
-                if len(prompt_text) > 50:
-                    prompt_text = prompt_text[:47] + "..."
-
-                # Format timestamp
-                created_at = prompt["created_at"]
-                if isinstance(created_at, str):
-                    try:
-                        dt = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
-                        created_at = dt.strftime("%Y-%m-%d %H:%M")
-                    except ValueError:
-                        pass  # Keep original string if parsing fails
-
-                table.add_row(
-                    prompt["id"],
-                    prompt_text,
-                    created_at,
-                )
+                table.add_row(*_prompt_row(prompt))
 
             console.print(table)
+            _print_next_page_hint(prompts, limit, "cosmos list prompts")
 
     except Exception as e:
         logger.error("Failed to list prompts: {}", e)
@@ -94,7 +96,9 @@ def list_prompts(ctx: click.Context, limit: int, output_json: bool) -> None:
 @list_group.command(name="runs")
 @click.option(
     "--status",
-    type=click.Choice(["pending", "running", "completed", "failed"], case_sensitive=False),
+    type=click.Choice(
+        ["pending", "running", "downloading", "completed", "failed"], case_sensitive=False
+    ),
     help="Filter by run status",
 )
 @click.option(
@@ -107,6 +111,17 @@ def list_prompts(ctx: click.Context, limit: int, output_json: bool) -> None:
     default=50,
     help="Maximum number of results to show (default: 50)",
 )
+@click.option(
+    "--after",
+    metavar="RUN_ID",
+    help="Show runs after this one (the last ID of the previous page)",
+)
+@click.option(
+    "--all",
+    "stream_all",
+    is_flag=True,
+    help="Stream every matching run instead of one page (JSON Lines with --json)",
+)
 @click.option(
     "--json",
     "output_json",
@@ -115,7 +130,13 @@ def list_prompts(ctx: click.Context, limit: int, output_json: bool) -> None:
 )
 @click.pass_context
 def list_runs(
-    ctx: click.Context, status: str | None, prompt: str | None, limit: int, output_json: bool
+    ctx: click.Context,
+    status: str | None,
+    prompt: str | None,
+    limit: int,
+    after: str | None,
+    stream_all: bool,
+    output_json: bool,
 ) -> None:
     """List all runs in the database.
 
@@ -124,13 +145,20 @@ def list_runs(
         cosmos list runs --status completed
         cosmos list runs --prompt ps_abc123
         cosmos list runs --status failed --prompt ps_abc123
+        cosmos list runs --after rs_abc123
+        cosmos list runs --all --json > runs.jsonl
         cosmos list runs --json
     """
     ctx_obj: CLIContext = ctx.obj
     ops = ctx_obj.get_operations()
 
     try:
-        runs = ops.list_runs(status=status, prompt_id=prompt, limit=limit)
+        if stream_all:
+            runs = ops.iter_runs(status=status, prompt_id=prompt, after=after)
+            _stream_rows(runs, _run_row, output_json, "runs")
+            return
+
+        runs = ops.list_runs(status=status, prompt_id=prompt, limit=limit, after=after)
 
         if output_json:
             # Output as JSON
@@ -149,37 +177,81 @@ def list_runs(
             table.add_column("Created", style="green")
 
             for run in runs:
-                # Color code status
-                status_text = run["status"]
-                if status_text == "completed":
-                    status_text = f"[green]{status_text}[/green]"
-                elif status_text == "failed":
-                    status_text = f"[red]{status_text}[/red]"
-                elif status_text == "running":
-                    status_text = f"[yellow]{status_text}[/yellow]"
-                else:  # pending
-                    status_text = f"[dim]{status_text}[/dim]"
-
-                # Format timestamp
-                created_at = run["created_at"]
-                if isinstance(created_at, str):
-                    try:
-                        dt = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
-                        created_at = dt.strftime("%Y-%m-%d %H:%M")
-                    except ValueError:
-                        pass  # Keep original string if parsing fails
-
-                table.add_row(
-                    run["id"],
-                    run["prompt_id"],
-                    status_text,
-                    run["model_type"],
-                    created_at,
-                )
+                table.add_row(*_run_row(run))
 
             console.print(table)
+            _print_next_page_hint(runs, limit, "cosmos list runs")
 
     except Exception as e:
         logger.error("Failed to list runs: {}", e)
         console.print(f"[red]Error: Failed to list runs - {e}[/red]")
         ctx.exit(1)
+
+
+def _format_created(created_at) -> str:
+    """Format an ISO timestamp as YYYY-MM-DD HH:MM, keeping unparseable values."""
+    if isinstance(created_at, str):
+        try:
+            dt = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
+            return dt.strftime("%Y-%m-%d %H:%M")
+        except ValueError:
+            pass  # Keep original string if parsing fails
+    return created_at
+
+
+def _prompt_row(prompt: dict) -> tuple[str, ...]:
+    """Build the display columns for a prompt: ID, truncated text, created."""
+    # Truncate long prompts
+    prompt_text = prompt["prompt_text"]
+    if len(prompt_text) > 50:
+        prompt_text = prompt_text[:47] + "..."
+    return prompt["id"], prompt_text, _format_created(prompt["created_at"])
+
+
+def _run_row(run: dict) -> tuple[str, ...]:
+    """Build the display columns for a run: IDs, colored status, model, created."""
+    # Color code status
+    status_text = run["status"]
+    if status_text == "completed":
+        status_text = f"[green]{status_text}[/green]"
+    elif status_text == "failed":
+        status_text = f"[red]{status_text}[/red]"
+    elif status_text in ("running", "downloading"):
+        status_text = f"[yellow]{status_text}[/yellow]"
+    else:  # pending
+        status_text = f"[dim]{status_text}[/dim]"
+
+    return (
+        run["id"],
+        run["prompt_id"],
+        status_text,
+        run["model_type"],
+        _format_created(run["created_at"]),
+    )
+
+
+def _print_next_page_hint(rows: list[dict], limit: int, command: str) -> None:
+    """Tell the user how to fetch the next page when this one was full."""
+    if rows and len(rows) >= limit:
+        console.print(f"[dim]More results: {command} --after {rows[-1]['id']}[/dim]")
+
+
+def _stream_rows(rows, format_row, output_json: bool, noun: str) -> None:
+    """Print rows as they arrive instead of collecting them into one table.
+
+    Args:
+        rows: Iterator of prompt or run dictionaries
+        format_row: Builds display columns for one row
+        output_json: Emit one JSON object per line (JSON Lines)
+        noun: What is being listed, for the summary line
+    """
+    count = 0
+    for row in rows:
+        count += 1
+        if output_json:
+            click.echo(json.dumps(row))
+        else:
+            console.print("  ".join(str(column) for column in format_row(row)), highlight=False)
+
+    if not output_json:
+        console.print(f"[dim]{count} {noun}[/dim]")
@@ -0,0 +1,153 @@
+"""Pipeline command for queueing enhance, inference and upscale jobs at once."""
+
+import click
+
+from .base import CLIContext, handle_errors
+from .helpers import console, display_success, format_id
+
+
+@click.command()
+@click.argument("prompt_ids", nargs=-1, required=True)
+@click.option(
+    "--enhance/--no-enhance",
+    default=True,
+    show_default=True,
+    help="Enhance each prompt before inference; inference runs on the enhanced prompt",
+)
+@click.option(
+    "--upscale/--no-upscale",
+    default=True,
+    show_default=True,
+    help="Upscale each inference output to 4K",
+)
+@click.option(
+    "--weights",
+    "-w",
+    nargs=4,
+    type=float,
+    default=[0.25, 0.25, 0.25, 0.25],
+    help="Control weights: VIS EDGE DEPTH SEG (default: 0.25 0.25 0.25 0.25)",
+)
+@click.option("--steps", default=35, help="Number of inference steps (default: 35)")
+@click.option("--guidance", default=5.0, help="Guidance scale (CFG) (default: 5.0)")
+@click.option("--seed", default=1, help="Random seed for reproducibility (default: 1)")
+@click.option("--fps", default=24, help="Output video FPS (default: 24)")
+@click.option("--sigma-max", default=70.0, help="Maximum noise level (default: 70.0)")
+@click.option(
+    "--blur-strength",
+    default="medium",
+    type=click.Choice(["very_low", "low", "medium", "high", "very_high"]),
+    help="Blur strength (default: medium)",
+)
+@click.option(
+    "--canny-threshold",
+    default="medium",
+    type=click.Choice(["very_low", "low", "medium", "high", "very_high"]),
+    help="Canny edge threshold (default: medium)",
+)
+@click.option(
+    "--upscale-weight",
+    type=click.FloatRange(0.0, 1.0),
+    default=0.5,
+    show_default=True,
+    help="Control weight for upscaling",
+)
+@click.option(
+    "--priority",
+    type=click.IntRange(0, 100),
+    default=50,
+    show_default=True,
+    help="Queue priority of the pipeline's jobs (higher runs sooner)",
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Run inference on the GPU even if an identical run already has an output",
+)
+@click.pass_context
+@handle_errors
+def pipeline(
+    ctx,
+    prompt_ids,
+    enhance,
+    upscale,
+    weights,
+    steps,
+    guidance,
+    seed,
+    fps,
+    sigma_max,
+    blur_strength,
+    canny_threshold,
+    upscale_weight,
+    priority,
+    no_cache,
+):
+    r"""Queue an enhance -> inference -> upscale pipeline for each prompt.
+
+    Every step is queued right away; each one waits in the queue until the
+    step before it has completed and then runs on its output: inference on
+    the enhanced prompt, the upscale on the inference run. A failed step
+    fails the rest of its pipeline. The queue is processed by `cosmos worker`
+    or the UI.
+
+    \b
+    Examples:
+      cosmos pipeline ps_abc123                    # Enhance, infer, upscale
+      cosmos pipeline ps_abc123 ps_def456 --no-enhance
+      cosmos pipeline ps_abc123 --no-upscale --priority 80
+    """
+    from cosmos_workflow.services.simple_queue_service import SimplifiedQueueService
+
+    ctx_obj: CLIContext = ctx.obj
+    ops = ctx_obj.get_operations()
+
+    missing = [prompt_id for prompt_id in prompt_ids if not ops.get_prompt(prompt_id)]
+    if missing:
+        raise ValueError(f"Prompt not found: {', '.join(missing)}")
+
+    inference_config = {
+        "weights": {
+            "vis": weights[0],
+            "edge": weights[1],
+            "depth": weights[2],
+            "seg": weights[3],
+        },
+        "num_steps": steps,
+        "guidance_scale": guidance,
+        "seed": seed,
+        "fps": fps,
+        "sigma_max": sigma_max,
+        "blur_strength": blur_strength,
+        "canny_threshold": canny_threshold,
+    }
+    if no_cache:
+        inference_config["no_cache"] = True
+
+    queue_service = SimplifiedQueueService(
+        cosmos_api=ops, db_connection=ops.service.db, submit_only=True
+    )
+    chains = queue_service.add_pipeline(
+        list(prompt_ids),
+        inference_config,
+        enhancement_config={"create_new": True, "model": "pixtral"} if enhance else None,
+        upscale_config={"control_weight": upscale_weight} if upscale else None,
+        priority=priority,
+    )
+
+    steps_desc = " -> ".join(
+        step
+        for step, enabled in (("enhance", enhance), ("inference", True), ("upscale", upscale))
+        if enabled
+    )
+    display_success(
+        f"Queued {len(chains)} pipeline(s): {steps_desc}",
+        {
+            format_id(prompt_id): " -> ".join(format_id(job_id) for job_id in chain)
+            for prompt_id, chain in zip(prompt_ids, chains)
+        },
+    )
+
+    if not queue_service.worker_running():
+        console.print("\n[cyan]Process the queue with:[/cyan]")
+        console.print("  cosmos worker")
@@ -2,6 +2,7 @@
 
 import json
 import logging
+import re
 from datetime import datetime
 
 import click
@@ -31,13 +32,15 @@ console = Console()
 )
 @click.pass_context
 def search_command(ctx: click.Context, query: str, limit: int, output_json: bool) -> None:
-    """Search for prompts by text content.
+    """Search for prompts by text, name, video path or ID.
 
-    Searches prompt text for matching content (case-insensitive).
+    Results are ranked by relevance. Every word matches as a prefix and all
+    words must match; wrap text in double quotes to match an exact phrase.
 
     Examples:
         cosmos search cyberpunk
-        cosmos search "futuristic city"
+        cosmos search futur city
+        cosmos search '"futuristic city" night'
         cosmos search robot --limit 10
         cosmos search transform --json
     """
@@ -66,6 +69,8 @@ def search_command(ctx: click.Context, query: str, limit: int, output_json: bool
             table.add_column("Prompt", style="white")
             table.add_column("Created", style="green")
 
+            # Same word splitting as the search index, so prefixes line up
+            search_terms = re.findall(r"[^\W_]+", query)
             for prompt in prompts:
                 # Highlight search term in prompt text
                 prompt_text = prompt["prompt_text"]
@@ -73,21 +78,17 @@ def search_command(ctx: click.Context, query: str, limit: int, output_json: bool
                 # Create a Text object for highlighting
                 text = Text(prompt_text)
 
-                # Find and highlight all occurrences (case-insensitive)
-                query_lower = query.lower()
-                text_lower = prompt_text.lower()
-                start = 0
-                while True:
-                    pos = text_lower.find(query_lower, start)
-                    if pos == -1:
-                        break
-                    text.stylize("bold yellow", pos, pos + len(query))
-                    start = pos + 1
+                # Highlight words starting with any search term (case-insensitive)
+                match_positions = []
+                for term in search_terms:
+                    for match in re.finditer(rf"\b{re.escape(term)}", prompt_text, re.IGNORECASE):
+                        text.stylize("bold yellow", match.start(), match.end())
+                        match_positions.append(match.start())
 
                 # Truncate if too long but preserve highlighting
                 if len(prompt_text) > 80:
                     # Try to show context around the match
-                    match_pos = text_lower.find(query_lower)
+                    match_pos = min(match_positions, default=-1)
                     if match_pos > 40:
                         # Match is far from start, show ellipsis
                         text = Text("...") + text[match_pos - 20 :]
@@ -100,7 +100,7 @@ def show_command(ctx: click.Context, prompt_id: str, output_json: bool) -> None:
                         status_text = f"[green]{status}[/green]"
                     elif status == "failed":
                         status_text = f"[red]{status}[/red]"
-                    elif status == "running":
+                    elif status in ("running", "downloading"):
                         status_text = f"[yellow]{status}[/yellow]"
                     else:  # pending
                         status_text = f"[dim]{status}[/dim]"
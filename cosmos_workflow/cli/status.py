@@ -123,6 +123,21 @@ def status(ctx, stream):
         else:
             status_data["Running Container"] = "[yellow]None[/yellow]"
 
+    # Queue backlog with runtimes predicted from finished jobs
+    queue_info = ops.get_queue_summary()
+    if isinstance(queue_info, dict) and (queue_info.get("queued") or queue_info.get("running")):
+        status_data["Queue"] = f"{queue_info['queued']} queued, {queue_info['running']} running"
+        minutes = max(round(queue_info.get("estimated_seconds", 0) / 60), 1)
+        status_data["  Estimated Drain"] = f"~{minutes} min"
+
+    # Inference runs that reused an identical run's output instead of the GPU
+    cache_stats = ops.get_cache_stats()
+    if isinstance(cache_stats, dict) and cache_stats.get("runs"):
+        status_data["Result Cache"] = (
+            f"{cache_stats['hits']} of {cache_stats['runs']} runs reused "
+            f"({cache_stats['hit_rate']:.0%})"
+        )
+
     # Display the table
     console.print("\n[bold cyan]Remote GPU Status[/bold cyan]")
     table = create_info_table(status_data)
@@ -0,0 +1,106 @@
+"""Worker command for processing the job queue outside the UI."""
+
+import click
+
+from .base import CLIContext, handle_errors
+from .helpers import console
+
+
+@click.command()
+@click.option(
+    "--batch-size",
+    type=click.IntRange(1, 16),
+    default=4,
+    show_default=True,
+    help="Videos processed simultaneously on the GPU for batch jobs",
+)
+@click.option(
+    "--max-idle",
+    type=click.FloatRange(1.0),
+    default=30.0,
+    show_default=True,
+    help="Longest wait (seconds) between queue checks when idle and no wakeup arrives",
+)
+@click.option(
+    "--online-batching/--no-online-batching",
+    default=None,
+    help="Merge compatible queued inference jobs into one GPU batch when claiming "
+    "(default: [queue] online_batching)",
+)
+@click.option(
+    "--batch-linger",
+    type=click.FloatRange(0.0),
+    help="Seconds a new job may wait for its batch to fill (default: [queue] batch_linger)",
+)
+@click.option("--max-jobs", type=click.IntRange(1), help="Exit after processing this many jobs")
+@click.option("--drain", is_flag=True, help="Exit once the queue has no claimable jobs")
+@click.pass_context
+@handle_errors
+def worker(ctx, batch_size, max_idle, online_batching, batch_linger, max_jobs, drain):
+    r"""Process queued jobs in a long-running worker.
+
+    Runs jobs from the queue (as added by the UI) one after another, and
+    sleeps while the queue is empty until a new job wakes it. With several
+    [[gpu_hosts]] in config.toml, jobs run concurrently on every free host. While the
+    worker runs, the UI only displays the queue and no longer executes jobs
+    itself, so closing the browser or the UI does not stop processing.
+
+    With online batching, each claim also takes every compatible queued
+    inference job (same parameters and controls) up to --batch-size prompts
+    and runs them as one batch; --batch-linger lets a new job wait briefly
+    for more jobs to join.
+
+    Ctrl+C (or SIGTERM) finishes the current job, then exits; press Ctrl+C
+    again to abort immediately.
+
+    \b
+    Examples:
+      cosmos worker                 # Run until stopped
+      cosmos worker --drain         # Process what is queued, then exit
+      cosmos worker --batch-size 8  # Larger GPU batches for batch jobs
+      cosmos worker --online-batching --batch-linger 5
+    """
+    from cosmos_workflow.services.gpu_pool import GPUPool
+    from cosmos_workflow.services.queue_signals import QueueSignals
+    from cosmos_workflow.services.queue_worker import QueueWorker, register_worker
+    from cosmos_workflow.services.simple_queue_service import SimplifiedQueueService
+
+    ctx_obj: CLIContext = ctx.obj
+    ops = ctx_obj.get_operations()
+
+    # Register before building the service: a UI starting meanwhile leaves the queue
+    # to the worker, and the service only cleans up jobs no other process is executing
+    signals = QueueSignals.for_database(ops.service.db)
+    register_worker(signals)
+    try:
+        gpu_pool = GPUPool.from_config(ops.config, ops.service.db, primary_api=ops)
+        queue_service = SimplifiedQueueService(
+            cosmos_api=ops, db_connection=ops.service.db, gpu_pool=gpu_pool, as_worker=True
+        )
+        queue_service.set_batch_size(batch_size)
+        queue_config = ops.config.get_queue_config()
+        queue_service.set_online_batching(
+            queue_config["online_batching"] if online_batching is None else online_batching,
+            linger=queue_config["batch_linger"] if batch_linger is None else batch_linger,
+            mix_controls=queue_config["mix_controls"],
+        )
+        queue_service.set_gpu_memory(queue_config["gpu_memory_gb"])
+        queue_service.set_lease_seconds(queue_config["lease_seconds"])
+
+        queue_worker = QueueWorker(queue_service, max_idle=max_idle, registered=True)
+        queue_worker.install_signal_handlers()
+
+        hosts = ", ".join(f"{host.name} x{host.capacity}" for host in gpu_pool.hosts)
+        console.print(
+            f"[cyan]Queue worker started[/cyan] for {ops.service.db.database_url} on {hosts} "
+            "(Ctrl+C to stop after the current jobs)"
+        )
+        # Claims read the cached container state refreshed by these pollers
+        gpu_pool.start_monitors()
+        try:
+            processed = queue_worker.run(max_jobs=max_jobs, drain=drain)
+        finally:
+            gpu_pool.stop_monitors()
+    finally:
+        signals.unregister_worker()
+    console.print(f"[green]Queue worker stopped[/green] after {processed} job(s)")
@@ -4,8 +4,9 @@
 Loads configuration from TOML files with environment variable overrides.
 """
 
+import copy
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from pathlib import Path
 from typing import Any
 
@@ -24,6 +25,15 @@ class RemoteConfig:
     docker_image: str
 
 
+@dataclass
+class GPUHostConfig:
+    """One GPU host of the execution pool."""
+
+    name: str
+    capacity: int
+    remote: RemoteConfig
+
+
 @dataclass
 class LocalConfig:
     """Local paths configuration."""
@@ -147,6 +157,27 @@ class ConfigManager:
         if not ssh_key_path.exists():
             raise FileNotFoundError(f"SSH key file not found: {ssh_key_path}")
 
+        # Optional GPU pool: each host needs an address, a unique name and capacity 1
+        names = set()
+        for host in self._config_data.get("gpu_hosts", []):
+            if not host.get("host"):
+                raise ValueError("GPU host in [[gpu_hosts]] is missing 'host'")
+            name = host.get("name", host["host"])
+            if name in names:
+                raise ValueError(f"Duplicate GPU host name: {name}")
+            names.add(name)
+            # Jobs on one host would share its executor and SSH session and start their
+            # containers with --gpus all, competing for the same devices
+            if int(host.get("capacity", 1)) != 1:
+                raise ValueError(
+                    f"GPU host {name} must have capacity 1; "
+                    "list each GPU machine as its own [[gpu_hosts]] entry"
+                )
+            if "ssh_key" in host:
+                host_key_path = Path(host["ssh_key"]).expanduser()
+                if not host_key_path.exists():
+                    raise FileNotFoundError(f"SSH key file not found: {host_key_path}")
+
     def _create_config_objects(self) -> None:
         """Create configuration objects from loaded data.
 
@@ -273,6 +304,115 @@ class ConfigManager:
             "cleanup_containers_on_exit": ui_config.get("cleanup_containers_on_exit", False),
         }
 
+    def get_database_config(self) -> dict[str, Any]:
+        """Get database tuning configuration.
+
+        Returns:
+            Dictionary from the ``[database]`` section: ``profile`` names a base
+            SQLite profile ("performance" or "safe"), other keys override
+            individual settings (see cosmos_workflow.database.SQLiteProfile).
+        """
+        db_config = dict(self.get_config_section("database"))
+        db_config.setdefault("profile", "performance")
+        return db_config
+
+    def get_monitor_config(self) -> dict[str, float]:
+        """Get GPU/container state monitor configuration.
+
+        Returns:
+            Dictionary containing:
+                - status_ttl: Seconds a cached GPU/container snapshot stays fresh
+                - poll_interval: Seconds between background refreshes
+        """
+        monitor_config = self.get_config_section("monitor")
+        status_ttl = monitor_config.get("status_ttl", 10)
+        return {
+            "status_ttl": status_ttl,
+            "poll_interval": monitor_config.get("poll_interval", status_ttl),
+        }
+
+    def get_queue_config(self) -> dict[str, Any]:
+        """Get job queue scheduling configuration.
+
+        Returns:
+            Dictionary containing:
+                - online_batching: Merge compatible queued jobs into one batch at claim time
+                - batch_linger: Seconds a new job may wait for its batch to fill
+                - mix_controls: Allow different active controls within a batch
+                - gpu_memory_gb: GPU memory batches are packed under (0 disables)
+                - download_attempts: Tries to retrieve a finished run's outputs
+                - download_backoff: Seconds before the first retry, doubled per retry
+                - lease_seconds: Seconds a running job stays leased without a heartbeat
+        """
+        queue_config = self.get_config_section("queue")
+        return {
+            "online_batching": bool(queue_config.get("online_batching", False)),
+            "batch_linger": float(queue_config.get("batch_linger", 0.0)),
+            "mix_controls": bool(queue_config.get("mix_controls", False)),
+            "gpu_memory_gb": float(queue_config.get("gpu_memory_gb", 80.0)),
+            "download_attempts": int(queue_config.get("download_attempts", 3)),
+            "download_backoff": float(queue_config.get("download_backoff", 5.0)),
+            "lease_seconds": float(queue_config.get("lease_seconds", 60.0)),
+        }
+
+    def get_gpu_hosts(self) -> list[GPUHostConfig]:
+        """Get the GPU hosts jobs can be scheduled on.
+
+        Hosts come from ``[[gpu_hosts]]`` entries; unset fields fall back to
+        ``[remote]``, ``[paths] remote_dir`` and ``[docker] image``. Without
+        any entries the pool is the single ``[remote]`` host with capacity 1.
+
+        Returns:
+            List of GPUHostConfig in configuration order
+        """
+        base = self.get_remote_config()
+        hosts = self._config_data.get("gpu_hosts", [])
+        if not hosts:
+            return [GPUHostConfig(name=base.host, capacity=1, remote=base)]
+
+        return [
+            GPUHostConfig(
+                name=host.get("name", host["host"]),
+                capacity=int(host.get("capacity", 1)),
+                remote=replace(
+                    base,
+                    host=host["host"],
+                    user=host.get("user", base.user),
+                    port=int(host.get("port", base.port)),
+                    ssh_key=host.get("ssh_key", base.ssh_key),
+                    remote_dir=host.get("remote_dir", base.remote_dir),
+                    docker_image=host.get("docker_image", base.docker_image),
+                ),
+            )
+            for host in hosts
+        ]
+
+    def for_host(self, host: GPUHostConfig) -> "ConfigManager":
+        """Get a copy of this configuration that targets one GPU host.
+
+        The copy shares every section except ``[remote]``, ``[paths] remote_dir``
+        and ``[docker] image``, so a GPUExecutor built from it connects to
+        that host.
+
+        Args:
+            host: Host from get_gpu_hosts
+
+        Returns:
+            New ConfigManager for the host
+        """
+        host_config = copy.copy(self)
+        host_config._config_data = copy.deepcopy(self._config_data)
+        host_config._config_data["remote"].update(
+            host=host.remote.host,
+            user=host.remote.user,
+            port=host.remote.port,
+            ssh_key=host.remote.ssh_key,
+        )
+        host_config._config_data["paths"]["remote_dir"] = host.remote.remote_dir
+        host_config._config_data["docker"]["image"] = host.remote.docker_image
+        host_config._create_config_objects()
+        return host_config
+
     def reload_config(self) -> None:
         """Reload configuration from file.
 
@@ -1,4 +1,8 @@
 # SSH connection management package
-from cosmos_workflow.connection.ssh_manager import SSHManager
+from cosmos_workflow.connection.ssh_manager import (
+    SSHManager,
+    close_all_connections,
+    connection_stats,
+)
 
-__all__ = ["SSHManager"]
+__all__ = ["SSHManager", "close_all_connections", "connection_stats"]
@@ -0,0 +1,165 @@
+"""Bounded pool of SFTP channels over a host's shared SSH connection.
+
+``SSHManager.get_sftp`` used to open a new SFTP session per call and store it
+in a single ``sftp_client`` attribute that concurrent callers overwrote, so
+background download threads bypassed it with a raw paramiko connection per
+file. SFTP sessions are now borrowed from a per-host pool instead:
+
+- at most ``size`` channels are open per host; a borrower waits while all of
+  them are in use
+- a channel is returned after use and reused by the next borrower; one whose
+  transport died, or that failed with a connection error, is closed instead
+- a thread that already holds a channel gets the same one again, so nested
+  use (a recursive directory copy) cannot deadlock on the bound
+
+Completion handlers, the queue worker and the UI can therefore transfer files
+concurrently through any ``FileTransferService``.
+"""
+
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import Any
+
+import paramiko
+
+from cosmos_workflow.utils.logging import logger
+
+# SFTP channels open at most per host
+SFTP_POOL_SIZE = 4
+# Seconds a borrower waits for a free channel before giving up
+SFTP_ACQUIRE_TIMEOUT = 300
+
+# Errors that can leave a channel mid-request; the channel is not reused after
+# them. Ordinary SFTP failures (missing file, permission) keep it.
+_CHANNEL_ERRORS = (paramiko.SSHException, EOFError, TimeoutError)
+
+
+class SFTPPool:
+    """Thread-safe, bounded pool of SFTP channels to one host."""
+
+    def __init__(
+        self,
+        open_channel: Callable[[], paramiko.SFTPClient],
+        size: int = SFTP_POOL_SIZE,
+        name: str = "",
+    ):
+        """Create an empty pool.
+
+        Args:
+            open_channel: Opens a new SFTP channel on the host's transport
+            size: Most channels open at once
+            name: Host name for log messages
+        """
+        self._open_channel = open_channel
+        self.size = size
+        self.name = name
+        self._idle: list[paramiko.SFTPClient] = []
+        self._open = 0
+        self._condition = threading.Condition()
+        self._held = threading.local()
+        self._waits = 0
+        self._closed = False
+
+    @contextmanager
+    def acquire(self, timeout: float = SFTP_ACQUIRE_TIMEOUT) -> Iterator[paramiko.SFTPClient]:
+        """Borrow an SFTP channel for the duration of a with block.
+
+        Args:
+            timeout: Seconds to wait for a free channel
+
+        Yields:
+            SFTP client, used only by the calling thread until the block exits
+
+        Raises:
+            ConnectionError: If no channel became free within the timeout
+        """
+        held = getattr(self._held, "channel", None)
+        if held is not None:
+            yield held
+            return
+
+        sftp = self._checkout(timeout)
+        self._held.channel = sftp
+        healthy = True
+        try:
+            yield sftp
+        except _CHANNEL_ERRORS:
+            healthy = False
+            raise
+        finally:
+            self._held.channel = None
+            self._checkin(sftp, healthy)
+
+    def _checkout(self, timeout: float) -> paramiko.SFTPClient:
+        deadline = time.monotonic() + timeout
+        with self._condition:
+            while True:
+                while self._idle:
+                    sftp = self._idle.pop()
+                    if _channel_alive(sftp):
+                        return sftp
+                    self._discard(sftp)
+                if self._open < self.size:
+                    self._open += 1
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise ConnectionError(
+                        f"No SFTP channel to {self.name} became free within {timeout}s"
+                    )
+                self._waits += 1
+                self._condition.wait(remaining)
+
+        # Open outside the lock so a slow handshake does not block returns
+        try:
+            return self._open_channel()
+        except BaseException:
+            with self._condition:
+                self._open -= 1
+                self._condition.notify()
+            raise
+
+    def _checkin(self, sftp: paramiko.SFTPClient, healthy: bool) -> None:
+        with self._condition:
+            if healthy and not self._closed and _channel_alive(sftp):
+                self._idle.append(sftp)
+            else:
+                logger.debug("Dropping SFTP channel to {}", self.name)
+                self._discard(sftp)
+            self._condition.notify()
+
+    def _discard(self, sftp: paramiko.SFTPClient) -> None:
+        """Close a channel and free its slot; called with the lock held."""
+        self._open -= 1
+        try:
+            sftp.close()
+        except Exception as e:
+            logger.debug("Error closing SFTP channel to {}: {}", self.name, e)
+
+    def stats(self) -> dict[str, Any]:
+        """Get the pool's open, idle and maximum channel counts and waits so far."""
+        with self._condition:
+            return {
+                "open": self._open,
+                "idle": len(self._idle),
+                "size": self.size,
+                "waits": self._waits,
+            }
+
+    def close(self) -> None:
+        """Close idle channels; channels in use are closed when returned."""
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            for sftp in idle:
+                self._discard(sftp)
+
+
+def _channel_alive(sftp: paramiko.SFTPClient) -> bool:
+    channel = sftp.get_channel()
+    if channel is None or channel.closed:
+        return False
+    transport = channel.get_transport()
+    return transport is not None and bool(transport.is_active())
@@ -1,92 +1,241 @@
 #!/usr/bin/env python3
 """SSH connection management for Cosmos-Transfer1 workflows.
-Handles remote connections with proper error handling and connection pooling.
+
+Every ``SSHManager`` used to open its own TCP connection and SSH handshake on
+``connect()`` and tear it down on ``disconnect()``, and the code wraps nearly
+every operation in ``with ssh_manager:``, so one inference run paid several
+handshakes and each status poll paid one more. Connections are now shared per
+process: the first ``connect()`` to a host opens one authenticated transport
+with keepalives, and every ``SSHManager`` for that host (and every thread)
+multiplexes its exec channels over it and borrows SFTP sessions from the
+host's ``SFTPPool``. ``disconnect()`` only
+detaches the manager. A transport found dead is replaced by a new handshake on
+the next use. ``connection_stats()`` reports handshakes and channel latency per
+host.
 """
 
+import atexit
+import threading
+import time
 import warnings
+from collections.abc import Iterator
 from contextlib import contextmanager
 from typing import Any
 
 import paramiko
 
+from cosmos_workflow.connection.sftp_pool import SFTPPool
 from cosmos_workflow.utils.logging import logger
 
+# Seconds between keepalive packets on shared transports
+KEEPALIVE_SECONDS = 30
+
+
+class _HostSession:
+    """One shared, authenticated SSH connection to a host."""
+
+    def __init__(self, ssh_options: dict[str, Any]):
+        self.ssh_options = dict(ssh_options)
+        self.client: paramiko.SSHClient | None = None
+        self._lock = threading.Lock()
+        self._counters = {
+            "handshakes": 0,
+            "handshake_seconds": 0.0,
+            "reconnects": 0,
+            "exec_channels": 0,
+            "exec_open_seconds": 0.0,
+            "sftp_sessions": 0,
+            "sftp_open_seconds": 0.0,
+        }
+        self.sftp_pool = SFTPPool(self._open_sftp, name=self.name)
+
+    @property
+    def name(self) -> str:
+        return "{}@{}:{}".format(
+            self.ssh_options.get("username"),
+            self.ssh_options.get("hostname"),
+            self.ssh_options.get("port", 22),
+        )
+
+    def get_client(self) -> paramiko.SSHClient:
+        """Get the shared client, connecting if there is no live transport."""
+        with self._lock:
+            if not _transport_active(self.client):
+                self._connect()
+            return self.client
+
+    def _connect(self) -> None:
+        if self.client is not None:
+            logger.info("SSH connection to {} lost, reconnecting", self.name)
+            self._counters["reconnects"] += 1
+            self.client.close()
+            self.client = None
+
+        client = paramiko.SSHClient()
+        # Use AutoAddPolicy to automatically accept unknown host keys
+        # This suppresses warnings while still being reasonable for internal infrastructure
+        # For production, consider using a known_hosts file instead
+        client.set_missing_host_key_policy(paramiko.AutoAddPolicy())  # noqa: S507
+
+        logger.debug("Connecting to {}", self.name)
+        started = time.monotonic()
+        # Suppress paramiko transport warnings that still appear in console
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore", category=UserWarning)
+            client.connect(**self.ssh_options)
+        elapsed = time.monotonic() - started
+
+        transport = client.get_transport()
+        if transport is not None:
+            transport.set_keepalive(KEEPALIVE_SECONDS)
+        self.client = client
+        self._counters["handshakes"] += 1
+        self._counters["handshake_seconds"] += elapsed
+        logger.debug("SSH connection to {} established in {:.2f}s", self.name, elapsed)
+
+    def _open_sftp(self) -> paramiko.SFTPClient:
+        client = self.get_client()
+        started = time.monotonic()
+        sftp = client.open_sftp()
+        self.record("sftp", time.monotonic() - started)
+        return sftp
+
+    def record(self, kind: str, seconds: float) -> None:
+        """Count an opened channel of a kind ("exec" or "sftp") and its open latency."""
+        counter = "exec_channels" if kind == "exec" else "sftp_sessions"
+        with self._lock:
+            self._counters[counter] += 1
+            self._counters[f"{kind}_open_seconds"] += seconds
+
+    def stats(self) -> dict[str, Any]:
+        """Get the connection's counters, with mean latencies in milliseconds."""
+        with self._lock:
+            counters = dict(self._counters)
+            connected = _transport_active(self.client)
+
+        def mean_ms(total: float, count: int) -> float | None:
+            return round(total / count * 1000, 1) if count else None
+
+        return {
+            "host": self.name,
+            "connected": connected,
+            "handshakes": counters["handshakes"],
+            "reconnects": counters["reconnects"],
+            "exec_channels": counters["exec_channels"],
+            "sftp_sessions": counters["sftp_sessions"],
+            "handshake_ms": mean_ms(counters["handshake_seconds"], counters["handshakes"]),
+            "exec_open_ms": mean_ms(counters["exec_open_seconds"], counters["exec_channels"]),
+            "sftp_open_ms": mean_ms(counters["sftp_open_seconds"], counters["sftp_sessions"]),
+            "sftp_pool": self.sftp_pool.stats(),
+        }
+
+    def close(self) -> None:
+        self.sftp_pool.close()
+        with self._lock:
+            if self.client is not None:
+                self.client.close()
+                self.client = None
+
+
+_sessions: dict[tuple, _HostSession] = {}
+_sessions_lock = threading.Lock()
+
+
+def _transport_active(client: paramiko.SSHClient | None) -> bool:
+    if client is None:
+        return False
+    transport = client.get_transport()
+    return transport is not None and bool(transport.is_active())
+
+
+def _session_for(ssh_options: dict[str, Any]) -> _HostSession:
+    key = tuple(sorted((name, str(value)) for name, value in ssh_options.items()))
+    with _sessions_lock:
+        session = _sessions.get(key)
+        if session is None:
+            session = _sessions[key] = _HostSession(ssh_options)
+        return session
+
+
+def connection_stats() -> list[dict[str, Any]]:
+    """Get handshake and latency counters of every shared SSH connection.
+
+    Returns:
+        One dict per host with ``handshakes``, ``reconnects``, ``exec_channels``,
+        ``sftp_sessions``, the mean ``handshake_ms``, ``exec_open_ms`` and
+        ``sftp_open_ms``, and the SFTP pool's ``sftp_pool`` counts
+    """
+    with _sessions_lock:
+        sessions = list(_sessions.values())
+    return [session.stats() for session in sessions]
+
+
+def close_all_connections() -> None:
+    """Close every shared SSH connection of this process."""
+    with _sessions_lock:
+        sessions = list(_sessions.values())
+        _sessions.clear()
+    for session in sessions:
+        session.close()
+
+
+atexit.register(close_all_connections)
+
 
 class SSHManager:
-    """Manages SSH connections to remote instances."""
+    """Manages SSH connections to remote instances.
+
+    Connections are shared per host across all managers in the process;
+    ``connect()`` and ``disconnect()`` attach and detach this manager.
+    """
 
     def __init__(self, ssh_options: dict[str, Any]):
         self.ssh_options = ssh_options
         self.ssh_client: paramiko.SSHClient | None = None
-        self.sftp_client: paramiko.SFTPClient | None = None
+        self._users = 0  # Nested or concurrent connect() calls not yet disconnected
+        self._users_lock = threading.Lock()
 
     def connect(self) -> None:
-        """Establish SSH connection to remote instance."""
-        try:
-            self.ssh_client = paramiko.SSHClient()
-            # Use AutoAddPolicy to automatically accept unknown host keys
-            # This suppresses warnings while still being reasonable for internal infrastructure
-            # For production, consider using a known_hosts file instead
-            self.ssh_client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-
-            logger.debug(
-                "Connecting to {}:{}", self.ssh_options["hostname"], self.ssh_options["port"]
-            )
-
-            # Suppress paramiko transport warnings that still appear in console
-            with warnings.catch_warnings():
-                warnings.filterwarnings("ignore", category=UserWarning)
-                self.ssh_client.connect(**self.ssh_options)
-
-            logger.debug("SSH connection established successfully")
+        """Attach to the host's shared SSH connection, connecting if needed."""
+        self._attach()
+        with self._users_lock:
+            self._users += 1
 
+    def _attach(self) -> None:
+        try:
+            self.ssh_client = _session_for(self.ssh_options).get_client()
         except Exception as e:
             logger.error("Failed to establish SSH connection: {}", e)
             raise ConnectionError(f"SSH connection failed: {e}") from e
 
     def disconnect(self) -> None:
-        """Close SSH connection."""
-        if self.sftp_client:
-            self.sftp_client.close()
-            self.sftp_client = None
-
-        if self.ssh_client:
-            self.ssh_client.close()
-            self.ssh_client = None
-
-        logger.debug("SSH connection closed")
+        """Detach from the shared SSH connection, which stays open for reuse."""
+        with self._users_lock:
+            self._users = max(self._users - 1, 0)
+            if self._users == 0:
+                self.ssh_client = None
 
     def is_connected(self) -> bool:
-        """Check if SSH connection is active."""
-        if not self.ssh_client:
-            return False
-
-        try:
-            # Try to execute a simple command to test connection
-            self.ssh_client.exec_command("echo 'test'", timeout=5)
-            return True
-        except (paramiko.SSHException, OSError, AttributeError):
-            return False
+        """Check if the SSH transport is active."""
+        return _transport_active(self.ssh_client)
 
     def ensure_connected(self) -> None:
-        """Ensure SSH connection is active, reconnect if necessary."""
+        """Ensure SSH connection is active, reconnecting transparently if necessary."""
         if not self.is_connected():
-            logger.info("SSH connection lost, reconnecting...")
-            self.connect()
+            self._attach()
+
+    def connection_stats(self) -> dict[str, Any]:
+        """Get the handshake and latency counters of this host's shared connection."""
+        return _session_for(self.ssh_options).stats()
 
     @contextmanager
-    def get_sftp(self):
-        """Get SFTP client with automatic cleanup."""
-        if not self.ssh_client:
-            raise ConnectionError("SSH connection not established")
+    def get_sftp(self) -> Iterator[paramiko.SFTPClient]:
+        """Borrow an SFTP channel from the host's pool for a with block.
 
-        try:
-            self.sftp_client = self.ssh_client.open_sftp()
-            yield self.sftp_client
-        finally:
-            if self.sftp_client:
-                self.sftp_client.close()
-                self.sftp_client = None
+        Safe to use from any thread, attached or not; see ``SFTPPool``.
+        """
+        with _session_for(self.ssh_options).sftp_pool.acquire() as sftp:
+            yield sftp
 
     def execute_command(
         self, command: str, timeout: int = 300, stream_output: bool = True
@@ -106,7 +255,10 @@ class SSHManager:
         logger.debug("Executing command: {}", command)
 
         try:
-            stdin, stdout, stderr = self.ssh_client.exec_command(command, timeout=timeout)
+            # Each command opens its own channel on the shared transport
+            started = time.monotonic()
+            _stdin, stdout, stderr = self.ssh_client.exec_command(command, timeout=timeout)
+            _session_for(self.ssh_options).record("exec", time.monotonic() - started)
 
             # Collect output
             stdout_lines = []
@@ -191,10 +343,10 @@ class SSHManager:
         return stdout
 
     def __enter__(self):
-        """Context manager entry."""
+        """Context manager entry: attach to the shared connection."""
         self.connect()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        """Context manager exit."""
+        """Context manager exit: detach, leaving the connection open."""
         self.disconnect()
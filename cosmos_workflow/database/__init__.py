@@ -1,18 +1,34 @@
 """Database module for cosmos workflow orchestration."""
 
 from cosmos_workflow.database.connection import (
+    SQLITE_PROFILES,
     DatabaseConnection,
+    SQLiteProfile,
     get_database_url,
     init_database,
 )
-from cosmos_workflow.database.models import Base, JobQueue, Prompt, Run
+from cosmos_workflow.database.migrations import get_schema_version, run_migrations
+from cosmos_workflow.database.models import (
+    Base,
+    BatchExecution,
+    JobHistory,
+    JobQueue,
+    Prompt,
+    Run,
+)
 
 __all__ = [
+    "SQLITE_PROFILES",
     "Base",
+    "BatchExecution",
     "DatabaseConnection",
+    "JobHistory",
     "JobQueue",
     "Prompt",
     "Run",
+    "SQLiteProfile",
     "get_database_url",
+    "get_schema_version",
     "init_database",
+    "run_migrations",
 ]
@@ -2,17 +2,138 @@
 
 Provides connection management, session handling, and database initialization.
 Supports both file-based and in-memory SQLite databases for testing.
+
+File databases are opened with a configurable SQLite profile (journal mode,
+synchronous level, busy timeout, mmap/cache sizes, pooling and WAL checkpoint
+policy) so the UI timers, queue processor, CLI and completion threads can
+share one database file without "database is locked" stalls.
 """
 
 import os
 from collections.abc import Generator
 from contextlib import contextmanager
+from dataclasses import dataclass, fields, replace
 from pathlib import Path
+from typing import Any
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, inspect, text
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import QueuePool
 
+from cosmos_workflow.database.migrations import run_migrations, stamp_schema_version
 from cosmos_workflow.database.models import Base
+from cosmos_workflow.database.search import has_prompt_search_index
+from cosmos_workflow.utils.logging import logger
+
+_JOURNAL_MODES = {"DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"}
+_SYNCHRONOUS_LEVELS = {"OFF", "NORMAL", "FULL", "EXTRA"}
+_TEMP_STORES = {"DEFAULT", "FILE", "MEMORY"}
+_CHECKPOINT_MODES = {"PASSIVE", "FULL", "RESTART", "TRUNCATE"}
+
+
+@dataclass(frozen=True)
+class SQLiteProfile:
+    """SQLite connection tuning applied to every pooled connection.
+
+    Attributes:
+        journal_mode: Journal mode; WAL lets readers run alongside a writer
+        synchronous: Durability level; NORMAL is safe with WAL (no corruption,
+            the last transactions may roll back on power loss)
+        busy_timeout_ms: How long a blocked statement retries before raising
+            "database is locked"
+        mmap_size: Bytes of the database file to memory-map (0 disables)
+        cache_size: Page cache size, negative values are KiB
+        temp_store: Where temporary tables and indices live
+        pool_size: Persistent connections kept in the pool
+        max_overflow: Extra connections allowed above pool_size under load
+        pool_timeout: Seconds to wait for a free pooled connection
+        wal_autocheckpoint: WAL pages written before an automatic checkpoint
+        journal_size_limit: Bytes the WAL file is truncated to after checkpoints
+        checkpoint_on_close: Run a TRUNCATE checkpoint when the connection closes
+    """
+
+    journal_mode: str = "WAL"
+    synchronous: str = "NORMAL"
+    busy_timeout_ms: int = 5000
+    mmap_size: int = 256 * 1024 * 1024
+    cache_size: int = -64 * 1024
+    temp_store: str = "MEMORY"
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_timeout: float = 30.0
+    wal_autocheckpoint: int = 1000
+    journal_size_limit: int = 64 * 1024 * 1024
+    checkpoint_on_close: bool = True
+
+    def __post_init__(self):
+        """Validate enumerated pragma values (they are interpolated into SQL)."""
+        for name, allowed in (
+            ("journal_mode", _JOURNAL_MODES),
+            ("synchronous", _SYNCHRONOUS_LEVELS),
+            ("temp_store", _TEMP_STORES),
+        ):
+            value = getattr(self, name).upper()
+            if value not in allowed:
+                raise ValueError(f"Invalid {name} '{value}'. Must be one of: {sorted(allowed)}")
+            object.__setattr__(self, name, value)
+
+    @classmethod
+    def from_config(cls, section: dict[str, Any] | None) -> "SQLiteProfile":
+        """Build a profile from a ``[database]`` config section.
+
+        The ``profile`` key selects a named base profile from SQLITE_PROFILES,
+        any other keys override individual settings.
+
+        Args:
+            section: Database configuration section, may be None or empty
+
+        Returns:
+            Resolved SQLiteProfile
+
+        Raises:
+            ValueError: If the profile name or an override key is unknown
+        """
+        section = dict(section or {})
+        name = section.pop("profile", "performance")
+        if name not in SQLITE_PROFILES:
+            raise ValueError(
+                f"Unknown database profile '{name}'. Must be one of: {sorted(SQLITE_PROFILES)}"
+            )
+
+        known = {f.name for f in fields(cls)}
+        unknown = set(section) - known
+        if unknown:
+            raise ValueError(f"Unknown database settings: {sorted(unknown)}")
+
+        return replace(SQLITE_PROFILES[name], **section)
+
+    def pragmas(self) -> list[tuple[str, Any]]:
+        """Get the PRAGMA statements applied on connect, in order."""
+        return [
+            ("journal_mode", self.journal_mode),
+            ("synchronous", self.synchronous),
+            ("busy_timeout", int(self.busy_timeout_ms)),
+            ("mmap_size", int(self.mmap_size)),
+            ("cache_size", int(self.cache_size)),
+            ("temp_store", self.temp_store),
+            ("wal_autocheckpoint", int(self.wal_autocheckpoint)),
+            ("journal_size_limit", int(self.journal_size_limit)),
+        ]
+
+
+SQLITE_PROFILES: dict[str, SQLiteProfile] = {
+    # Concurrent readers + one writer, tuned for the UI/queue/CLI mix
+    "performance": SQLiteProfile(),
+    # SQLite defaults: rollback journal and full fsync on every commit
+    "safe": SQLiteProfile(
+        journal_mode="DELETE",
+        synchronous="FULL",
+        mmap_size=0,
+        cache_size=-2000,
+        temp_store="DEFAULT",
+        checkpoint_on_close=False,
+    ),
+}
 
 
 class DatabaseConnection:
@@ -22,11 +143,13 @@ class DatabaseConnection:
     commit/rollback and connection pooling.
     """
 
-    def __init__(self, database_url: str):
+    def __init__(self, database_url: str, profile: SQLiteProfile | str | None = None):
         """Initialize database connection.
 
         Args:
             database_url: Path to database file or ":memory:" for in-memory DB
+            profile: SQLiteProfile, or the name of one in SQLITE_PROFILES.
+                Defaults to the "performance" profile.
         """
         # Validate database URL
         if not database_url or database_url.isspace():
@@ -36,8 +159,15 @@ class DatabaseConnection:
         if database_url != ":memory:" and ".." in database_url:
             raise ValueError("Path traversal not allowed in database URL")
 
+        if profile is None:
+            profile = SQLITE_PROFILES["performance"]
+        elif isinstance(profile, str):
+            profile = SQLiteProfile.from_config({"profile": profile})
+
         self.database_url = database_url
+        self.profile = profile
         self.closed = False
+        self._prompt_search_enabled: bool | None = None
         self._create_engine()
 
     def _create_engine(self):
@@ -55,16 +185,89 @@ class DatabaseConnection:
 
             self.engine = create_engine(
                 f"sqlite:///{self.database_url}",
-                connect_args={"check_same_thread": False},
+                connect_args={
+                    "check_same_thread": False,
+                    "timeout": self.profile.busy_timeout_ms / 1000,
+                },
+                poolclass=QueuePool,
+                pool_size=self.profile.pool_size,
+                max_overflow=self.profile.max_overflow,
+                pool_timeout=self.profile.pool_timeout,
                 echo=False,
             )
+            event.listen(self.engine, "connect", self._apply_pragmas)
 
         # Create session factory
         self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
 
+    def _apply_pragmas(self, dbapi_connection, _connection_record):
+        """Apply the profile's PRAGMA settings to a new DBAPI connection."""
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in self.profile.pragmas():
+                cursor.execute(f"PRAGMA {name} = {value}")
+        finally:
+            cursor.close()
+
+    def checkpoint(self, mode: str = "PASSIVE") -> dict[str, int] | None:
+        """Checkpoint the WAL into the main database file.
+
+        PASSIVE never blocks readers or writers; TRUNCATE waits for them and
+        resets the WAL file to zero bytes.
+
+        Args:
+            mode: SQLite checkpoint mode (PASSIVE, FULL, RESTART, TRUNCATE)
+
+        Returns:
+            Dict with busy, log_frames and checkpointed_frames, or None when
+            the database is not in WAL mode
+        """
+        mode = mode.upper()
+        if mode not in _CHECKPOINT_MODES:
+            raise ValueError(f"Invalid checkpoint mode '{mode}'")
+        if self.database_url == ":memory:" or self.profile.journal_mode != "WAL":
+            return None
+
+        with self.engine.connect() as connection:
+            busy, log_frames, checkpointed = connection.execute(
+                text(f"PRAGMA wal_checkpoint({mode})")
+            ).one()
+        return {"busy": busy, "log_frames": log_frames, "checkpointed_frames": checkpointed}
+
     def create_tables(self):
-        """Create all database tables."""
+        """Create all database tables and upgrade existing ones.
+
+        New databases are created from the models and stamped with the latest
+        schema version. Existing databases get pending schema migrations so
+        those created by older versions gain new indexes and columns in place.
+        """
+        is_new = not inspect(self.engine).has_table("prompts")
         Base.metadata.create_all(self.engine)
+        if is_new:
+            stamp_schema_version(self.engine)
+        else:
+            self.migrate()
+        self._prompt_search_enabled = None
+
+    @property
+    def prompt_search_enabled(self) -> bool:
+        """Whether the FTS5 prompt search index is available.
+
+        Checked once and cached; SQLite builds without FTS5 have no index and
+        searches fall back to LIKE matching.
+        """
+        if self._prompt_search_enabled is None:
+            with self.engine.connect() as connection:
+                self._prompt_search_enabled = has_prompt_search_index(connection)
+        return self._prompt_search_enabled
+
+    def migrate(self) -> int:
+        """Apply pending schema migrations.
+
+        Returns:
+            Schema version after migrating
+        """
+        return run_migrations(self.engine)
 
     @contextmanager
     def get_session(self) -> Generator[Session, None, None]:
@@ -90,7 +293,16 @@ class DatabaseConnection:
             session.close()
 
     def close(self):
-        """Close the database connection."""
+        """Close the database connection.
+
+        Runs a TRUNCATE checkpoint first when the profile asks for it, so the
+        WAL does not keep growing across restarts.
+        """
+        if self.profile.checkpoint_on_close and not self.closed:
+            try:
+                self.checkpoint("TRUNCATE")
+            except Exception as e:
+                logger.warning("WAL checkpoint on close failed: {}", e)
         self.closed = True
         self.engine.dispose()
 
@@ -127,11 +339,14 @@ def get_database_url() -> str:
     return default_str
 
 
-def init_database(database_url: str | None = None) -> DatabaseConnection:
+def init_database(
+    database_url: str | None = None, profile: SQLiteProfile | str | None = None
+) -> DatabaseConnection:
     """Initialize database with all tables.
 
     Args:
         database_url: Optional database URL, uses get_database_url() if not provided
+        profile: Optional SQLite profile (see DatabaseConnection)
 
     Returns:
         DatabaseConnection: Initialized database connection
@@ -139,6 +354,6 @@ def init_database(database_url: str | None = None) -> DatabaseConnection:
     if database_url is None:
         database_url = get_database_url()
 
-    conn = DatabaseConnection(database_url)
+    conn = DatabaseConnection(database_url, profile=profile)
     conn.create_tables()
     return conn
@@ -0,0 +1,239 @@
+"""Versioned schema migrations for the cosmos workflow database.
+
+``Base.metadata.create_all`` only creates missing tables; it never touches
+tables that already exist. Databases created by older versions therefore
+need an explicit upgrade path for new indexes and columns. This module keeps
+an ordered list of migrations and records the applied version in SQLite's
+``PRAGMA user_version`` so each migration runs exactly once per database.
+
+Fresh databases get the current schema from ``create_all`` and are stamped
+with the latest version directly. Migrations should still be idempotent so an
+interrupted upgrade can safely be re-run.
+"""
+
+from collections.abc import Callable
+from typing import NamedTuple
+
+from sqlalchemy import Engine, text
+from sqlalchemy.engine import Connection
+
+from cosmos_workflow.database.models import Base
+from cosmos_workflow.database.search import create_prompt_search_index
+from cosmos_workflow.utils.logging import logger
+
+
+class Migration(NamedTuple):
+    """A single schema upgrade step."""
+
+    version: int
+    description: str
+    apply: Callable[[Connection], None]
+
+
+def _create_indexes(connection: Connection, index_names: list[str]) -> None:
+    """Create indexes declared on the ORM models, by name, if missing.
+
+    Migrations name their indexes explicitly so that an old step never tries
+    to build an index over a column that a later step introduces.
+
+    Args:
+        connection: Open connection inside a transaction
+        index_names: Names of indexes declared in ``__table_args__``
+    """
+    declared = {
+        index.name: index for table in Base.metadata.tables.values() for index in table.indexes
+    }
+    for name in index_names:
+        declared[name].create(connection, checkfirst=True)
+
+
+def _add_column(connection: Connection, table_name: str, column_ddl: str) -> bool:
+    """Add a column unless it already exists.
+
+    Args:
+        connection: Open connection inside a transaction
+        table_name: Table to alter
+        column_ddl: Column definition, e.g. ``"batch_id VARCHAR"``
+
+    Returns:
+        True if the column was added, False if it already existed
+    """
+    column_name = column_ddl.split()[0]
+    existing = {row[1] for row in connection.execute(text(f"PRAGMA table_info({table_name})"))}
+    if column_name in existing:
+        return False
+    connection.execute(text(f"ALTER TABLE {table_name} ADD COLUMN {column_ddl}"))
+    return True
+
+
+def _add_query_indexes(connection: Connection) -> None:
+    """Add composite indexes for run listing and queue claiming."""
+    _create_indexes(
+        connection,
+        [
+            "ix_prompts_created_at",
+            "ix_runs_created_at",
+            "ix_runs_status_created_at",
+            "ix_runs_prompt_id_created_at",
+            "ix_runs_model_type_status",
+            "ix_job_queue_status_priority_created_at",
+        ],
+    )
+
+
+def _promote_json_keys(connection: Connection) -> None:
+    """Copy hot JSON keys into indexed columns and backfill existing rows."""
+    _add_column(connection, "prompts", "enhanced BOOLEAN NOT NULL DEFAULT 0")
+    for column_name in ("source_run_id", "enhanced_prompt_id", "original_prompt_id", "batch_id"):
+        _add_column(connection, "runs", f"{column_name} VARCHAR")
+
+    connection.execute(
+        text(
+            "UPDATE prompts SET enhanced = "
+            "CASE WHEN json_extract(parameters, '$.enhanced') THEN 1 ELSE 0 END"
+        )
+    )
+    connection.execute(
+        text(
+            "UPDATE runs SET "
+            "source_run_id = json_extract(execution_config, '$.source_run_id'), "
+            "enhanced_prompt_id = json_extract(outputs, '$.enhanced_prompt_id'), "
+            "original_prompt_id = json_extract(outputs, '$.original_prompt_id'), "
+            "batch_id = json_extract(metadata, '$.batch_id')"
+        )
+    )
+    _create_indexes(
+        connection,
+        [
+            "ix_prompts_enhanced_created_at",
+            "ix_runs_source_run_id",
+            "ix_runs_enhanced_prompt_id",
+            "ix_runs_original_prompt_id",
+            "ix_runs_batch_id",
+        ],
+    )
+
+
+def _add_prompt_search_index(connection: Connection) -> None:
+    """Create the FTS5 prompt search index and index existing prompts."""
+    if not create_prompt_search_index(connection, backfill=True):
+        logger.warning("SQLite was built without FTS5; prompt search will use LIKE matching")
+
+
+def _add_job_host(connection: Connection) -> None:
+    """Record which GPU pool host a queued job runs on."""
+    _add_column(connection, "job_queue", "host VARCHAR")
+
+
+def _backfill_job_priority(connection: Connection) -> None:
+    """Give jobs without a priority the default, so priority scheduling sees them."""
+    connection.execute(text("UPDATE job_queue SET priority = 50 WHERE priority IS NULL"))
+
+
+def _create_job_history(connection: Connection) -> None:
+    """Create the job duration history used for queue wait estimates."""
+    Base.metadata.tables["job_history"].create(connection, checkfirst=True)
+    _create_indexes(connection, ["ix_job_history_job_type_completed_at"])
+
+
+def _create_batch_executions(connection: Connection) -> None:
+    """Create the batch execution log used to calibrate smart batching."""
+    Base.metadata.tables["batch_executions"].create(connection, checkfirst=True)
+    _create_indexes(connection, ["ix_batch_executions_completed_at"])
+
+
+def _add_job_leases(connection: Connection) -> None:
+    """Add the lease columns used to reclaim jobs whose process died."""
+    _add_column(connection, "job_queue", "lease_owner VARCHAR")
+    _add_column(connection, "job_queue", "lease_expires_at DATETIME")
+    _add_column(connection, "job_queue", "attempts INTEGER NOT NULL DEFAULT 0")
+
+
+def _add_run_fingerprints(connection: Connection) -> None:
+    """Add the result cache columns to runs and index fingerprint lookups."""
+    _add_column(connection, "runs", "fingerprint VARCHAR")
+    _add_column(connection, "runs", "cached_from VARCHAR")
+    connection.execute(
+        text(
+            "UPDATE runs SET "
+            "fingerprint = json_extract(metadata, '$.fingerprint'), "
+            "cached_from = json_extract(metadata, '$.cached_from')"
+        )
+    )
+    _create_indexes(connection, ["ix_runs_fingerprint_status"])
+
+
+def _add_job_dependencies(connection: Connection) -> None:
+    """Add the parent job list that holds pipeline jobs back until their parents finish."""
+    _add_column(connection, "job_queue", "depends_on JSON")
+
+
+MIGRATIONS: list[Migration] = [
+    Migration(1, "Add run listing and job queue indexes", _add_query_indexes),
+    Migration(2, "Promote hot JSON keys to indexed columns", _promote_json_keys),
+    Migration(3, "Add full-text prompt search index", _add_prompt_search_index),
+    Migration(4, "Add GPU host to job queue", _add_job_host),
+    Migration(5, "Backfill job queue priorities", _backfill_job_priority),
+    Migration(6, "Add job duration history", _create_job_history),
+    Migration(7, "Add batch execution log", _create_batch_executions),
+    Migration(8, "Add job queue leases", _add_job_leases),
+    Migration(9, "Add run result cache fingerprints", _add_run_fingerprints),
+    Migration(10, "Add job queue dependencies", _add_job_dependencies),
+]
+
+LATEST_VERSION = MIGRATIONS[-1].version
+
+
+def get_schema_version(engine: Engine) -> int:
+    """Get the schema version recorded in the database.
+
+    Args:
+        engine: SQLAlchemy engine for the database
+
+    Returns:
+        Applied migration version, 0 for databases that were never migrated
+    """
+    with engine.connect() as connection:
+        return connection.execute(text("PRAGMA user_version")).scalar() or 0
+
+
+def _set_schema_version(connection: Connection, version: int) -> None:
+    # PRAGMA does not accept bound parameters; version is an int we control
+    connection.execute(text(f"PRAGMA user_version = {int(version)}"))
+
+
+def stamp_schema_version(engine: Engine) -> None:
+    """Mark a freshly created database as fully migrated.
+
+    Args:
+        engine: SQLAlchemy engine for a database created from the current models
+    """
+    with engine.begin() as connection:
+        _set_schema_version(connection, LATEST_VERSION)
+
+
+def run_migrations(engine: Engine) -> int:
+    """Apply all pending migrations in order.
+
+    Each migration runs in its own transaction together with the version bump,
+    so an interrupted upgrade resumes from the last completed step.
+
+    Args:
+        engine: SQLAlchemy engine for the database (tables must already exist)
+
+    Returns:
+        Schema version after migrating
+    """
+    current = get_schema_version(engine)
+
+    for migration in MIGRATIONS:
+        if migration.version <= current:
+            continue
+
+        logger.info("Applying database migration {}: {}", migration.version, migration.description)
+        with engine.begin() as connection:
+            migration.apply(connection)
+            _set_schema_version(connection, migration.version)
+        current = migration.version
+
+    return current
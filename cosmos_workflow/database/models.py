@@ -5,18 +5,28 @@ Uses JSON columns for model-specific data to enable easy extensibility.
 """
 
 from datetime import datetime, timezone
+from typing import ClassVar
 
 from sqlalchemy import (
     JSON,
+    Boolean,
     Column,
     DateTime,
+    Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
+    event,
 )
 from sqlalchemy.orm import declarative_base, relationship, validates
 
+from cosmos_workflow.database.search import (
+    create_prompt_search_index,
+    drop_prompt_search_index,
+)
+
 Base = declarative_base()
 
 
@@ -28,6 +38,10 @@ class Prompt(Base):
     """
 
     __tablename__ = "prompts"
+    __table_args__ = (
+        Index("ix_prompts_created_at", "created_at"),
+        Index("ix_prompts_enhanced_created_at", "enhanced", "created_at"),
+    )
 
     # Core fields common to all AI models
     id = Column(String, primary_key=True)
@@ -38,6 +52,9 @@ class Prompt(Base):
     inputs = Column(JSON, nullable=False)  # Video paths, images, frames, etc.
     parameters = Column(JSON, nullable=False)  # num_steps, cfg_scale, temperature, etc.
 
+    # Indexed copy of parameters["enhanced"], kept in sync by validate_json_fields
+    enhanced = Column(Boolean, nullable=False, default=False, server_default="0")
+
     # Relationships
     runs = relationship("Run", back_populates="prompt", cascade="all, delete-orphan")
 
@@ -45,6 +62,8 @@ class Prompt(Base):
     def validate_json_fields(self, key, value):
         """Validate that JSON fields are not None.
 
+        Also keeps the indexed ``enhanced`` column in sync with parameters.
+
         Args:
             key: Name of the field being validated.
             value: Value being assigned to the field.
@@ -57,6 +76,8 @@ class Prompt(Base):
         """
         if value is None:
             raise ValueError(f"{key} cannot be None")
+        if key == "parameters":
+            self.enhanced = bool(isinstance(value, dict) and value.get("enhanced"))
         return value
 
     @validates("prompt_text")
@@ -81,6 +102,19 @@ class Prompt(Base):
         return f"<Prompt(id={self.id}, text={self.prompt_text[:50]}...)>"
 
 
+# The FTS5 prompt search index lives outside the ORM metadata (see search.py)
+event.listen(
+    Prompt.__table__,
+    "after_create",
+    lambda target, connection, **kw: create_prompt_search_index(connection),
+)
+event.listen(
+    Prompt.__table__,
+    "after_drop",
+    lambda target, connection, **kw: drop_prompt_search_index(connection),
+)
+
+
 class Run(Base):
     """Run model for tracking executions of prompts.
 
@@ -89,6 +123,19 @@ class Run(Base):
     """
 
     __tablename__ = "runs"
+    __table_args__ = (
+        # Composite indexes backing DataRepository.list_runs filters and
+        # newest-first ordering (see database/migrations.py for upgrades)
+        Index("ix_runs_created_at", "created_at"),
+        Index("ix_runs_status_created_at", "status", "created_at"),
+        Index("ix_runs_prompt_id_created_at", "prompt_id", "created_at"),
+        Index("ix_runs_model_type_status", "model_type", "status"),
+        Index("ix_runs_source_run_id", "source_run_id"),
+        Index("ix_runs_enhanced_prompt_id", "enhanced_prompt_id"),
+        Index("ix_runs_original_prompt_id", "original_prompt_id"),
+        Index("ix_runs_batch_id", "batch_id"),
+        Index("ix_runs_fingerprint_status", "fingerprint", "status"),
+    )
 
     # Core fields
     id = Column(String, primary_key=True)
@@ -113,6 +160,14 @@ class Run(Base):
     outputs = Column(JSON, nullable=False)  # Result paths, metrics, logs, etc.
     run_metadata = Column("metadata", JSON, nullable=False)  # User info, priority, session, etc.
 
+    # Indexed copies of hot JSON keys, kept in sync by validate_json_fields
+    source_run_id = Column(String, nullable=True)  # execution_config["source_run_id"]
+    enhanced_prompt_id = Column(String, nullable=True)  # outputs["enhanced_prompt_id"]
+    original_prompt_id = Column(String, nullable=True)  # outputs["original_prompt_id"]
+    batch_id = Column(String, nullable=True)  # metadata["batch_id"]
+    fingerprint = Column(String, nullable=True)  # metadata["fingerprint"] (result cache key)
+    cached_from = Column(String, nullable=True)  # metadata["cached_from"] (result cache hit)
+
     # Logging fields (Phase 2)
     log_path = Column(String(500), nullable=True)  # Local log file path
     error_message = Column(Text, nullable=True)  # Brief error description
@@ -123,10 +178,20 @@ class Run(Base):
     # Relationships
     prompt = relationship("Prompt", back_populates="runs")
 
+    # JSON keys copied into same-named indexed columns, per JSON attribute
+    PROMOTED_JSON_KEYS: ClassVar[dict[str, tuple[str, ...]]] = {
+        "execution_config": ("source_run_id",),
+        "outputs": ("enhanced_prompt_id", "original_prompt_id"),
+        "run_metadata": ("batch_id", "fingerprint", "cached_from"),
+    }
+
     @validates("execution_config", "outputs", "run_metadata")
     def validate_json_fields(self, key, value):
         """Validate that JSON fields are not None.
 
+        Also copies promoted keys (see PROMOTED_JSON_KEYS) into their
+        indexed columns so lookups avoid json_extract scans.
+
         Args:
             key: Name of the field being validated.
             value: Value being assigned to the field.
@@ -139,6 +204,9 @@ class Run(Base):
         """
         if value is None:
             raise ValueError(f"{key} cannot be None")
+        for json_key in self.PROMOTED_JSON_KEYS[key]:
+            promoted = value.get(json_key) if isinstance(value, dict) else None
+            setattr(self, json_key, str(promoted) if promoted is not None else None)
         return value
 
     @validates("status")
@@ -171,12 +239,17 @@ class JobQueue(Base):
     """
 
     __tablename__ = "job_queue"
+    __table_args__ = (
+        # Backs claim_next_job and queue status ordering
+        Index("ix_job_queue_status_priority_created_at", "status", "priority", "created_at"),
+    )
 
     # Core fields
     id = Column(String, primary_key=True)
     prompt_ids = Column(JSON, nullable=False)  # List of prompt IDs
     job_type = Column(String, nullable=False)  # inference, batch_inference, enhancement
-    status = Column(String, nullable=False)  # queued, running, completed, failed, cancelled
+    # waiting, queued, running, downloading, completed, failed, cancelled
+    status = Column(String, nullable=False)
     config = Column(JSON, nullable=False)  # Job-specific configuration
 
     # Timestamps
@@ -186,7 +259,16 @@ class JobQueue(Base):
 
     # Optional fields
     result = Column(JSON, nullable=True)  # Results/outputs after completion
-    priority = Column(Integer, default=50, nullable=True)  # Priority for future use
+    priority = Column(Integer, default=50, nullable=True)  # 0-100, higher is claimed sooner
+    host = Column(String, nullable=True)  # GPU pool host the job was assigned to
+
+    # Lease of a running job; an expired lease means its process died (see job_lease)
+    lease_owner = Column(String, nullable=True)  # Process holding the job
+    lease_expires_at = Column(DateTime(timezone=True), nullable=True)
+    attempts = Column(Integer, default=0, nullable=False, server_default="0")  # Reclaims so far
+
+    # Pipeline parents still to finish; a waiting job is queued once this is empty
+    depends_on = Column(JSON, nullable=True)
 
     @validates("prompt_ids", "config")
     def validate_json_fields(self, key, value):
@@ -226,3 +308,66 @@ class JobQueue(Base):
 
     def __repr__(self):
         return f"<JobQueue(id={self.id}, type={self.job_type}, status={self.status})>"
+
+
+class JobHistory(Base):
+    """Duration of a finished queue job, used to estimate queue wait times.
+
+    Queue jobs are deleted once they complete, so their measured runtimes and
+    the features that drive them (type, prompt count, steps, frames, batch
+    size) are kept here for the duration estimator.
+    """
+
+    __tablename__ = "job_history"
+    __table_args__ = (
+        # Backs loading the most recent history per job type
+        Index("ix_job_history_job_type_completed_at", "job_type", "completed_at"),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    job_id = Column(String, nullable=False)
+    job_type = Column(String, nullable=False)
+    prompt_count = Column(Integer, nullable=False)
+    num_steps = Column(Integer, nullable=True)
+    num_frames = Column(Integer, nullable=True)  # None when the job config does not say
+    batch_size = Column(Integer, nullable=True)
+    host = Column(String, nullable=True)
+    duration_seconds = Column(Float, nullable=False)
+    completed_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
+
+    def __repr__(self):
+        return (
+            f"<JobHistory(job={self.job_id}, type={self.job_type}, "
+            f"duration={self.duration_seconds:.1f}s)>"
+        )
+
+
+class BatchExecution(Base):
+    """GPU time of one batch inference, used to calibrate the batching cost model.
+
+    Records what drives a batch's cost: how many runs it held, the union of
+    active controls every run in it computes, how many distinct control sets
+    were mixed, and the steps and frames per run.
+    """
+
+    __tablename__ = "batch_executions"
+    __table_args__ = (
+        # Backs loading the most recent executions
+        Index("ix_batch_executions_completed_at", "completed_at"),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    batch_name = Column(String, nullable=False)
+    run_count = Column(Integer, nullable=False)
+    controls = Column(JSON, nullable=False)  # Sorted union of active controls
+    control_sets = Column(Integer, nullable=False)  # Distinct control signatures in the batch
+    num_steps = Column(Integer, nullable=True)
+    num_frames = Column(Integer, nullable=True)  # None when the config does not say
+    duration_seconds = Column(Float, nullable=False)
+    completed_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
+
+    def __repr__(self):
+        return (
+            f"<BatchExecution(batch={self.batch_name}, runs={self.run_count}, "
+            f"controls={self.controls}, duration={self.duration_seconds:.1f}s)>"
+        )
@@ -0,0 +1,168 @@
+"""SQLite FTS5 full-text index over prompts.
+
+The ``prompts_fts`` virtual table mirrors each prompt's ID, text, name
+(``parameters.name``) and input video path (``inputs.video``). Triggers on
+``prompts`` keep it in sync for every write path, so repositories never have
+to maintain it by hand. The index is not part of the ORM metadata: it is
+created alongside the ``prompts`` table (see models.py) and by migration 3 for
+existing databases.
+
+SQLite builds without FTS5 simply skip the index; callers check
+``has_prompt_search_index`` and fall back to ``LIKE`` matching.
+"""
+
+import re
+
+from sqlalchemy import String, column, table, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.sql.elements import TextClause
+
+PROMPTS_FTS_TABLE = "prompts_fts"
+
+# Lightweight table clause so ORM queries can join against the virtual table
+prompts_fts = table(PROMPTS_FTS_TABLE, column("prompt_id", String), column("rank"))
+
+_DELETE_FROM_INDEX = (
+    # prompt IDs are tokenized like any other column, so look rows up by phrase
+    # match and confirm the exact ID; this avoids depending on prompts.rowid,
+    # which VACUUM may renumber
+    "DELETE FROM prompts_fts WHERE prompts_fts MATCH "
+    "'prompt_id:\"' || replace(old.id, '\"', '\"\"') || '\"' AND prompt_id = old.id;"
+)
+
+_INSERT_INTO_INDEX = (
+    "INSERT INTO prompts_fts(prompt_id, prompt_text, name, video_path) "
+    "VALUES (new.id, new.prompt_text, "
+    "json_extract(new.parameters, '$.name'), json_extract(new.inputs, '$.video'));"
+)
+
+PROMPT_SEARCH_DDL = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS prompts_fts USING fts5("
+    "prompt_id, prompt_text, name, video_path, "
+    "tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')",
+    # bm25 weights per column: prompt_id, prompt_text, name, video_path
+    "INSERT INTO prompts_fts(prompts_fts, rank) VALUES ('rank', 'bm25(1.0, 1.0, 4.0, 2.0)')",
+    "CREATE TRIGGER IF NOT EXISTS prompts_fts_after_insert AFTER INSERT ON prompts BEGIN "
+    + _INSERT_INTO_INDEX
+    + " END",
+    "CREATE TRIGGER IF NOT EXISTS prompts_fts_after_delete AFTER DELETE ON prompts BEGIN "
+    + _DELETE_FROM_INDEX
+    + " END",
+    "CREATE TRIGGER IF NOT EXISTS prompts_fts_after_update "
+    "AFTER UPDATE OF id, prompt_text, parameters, inputs ON prompts BEGIN "
+    + _DELETE_FROM_INDEX
+    + " "
+    + _INSERT_INTO_INDEX
+    + " END",
+]
+
+_BACKFILL = [
+    "DELETE FROM prompts_fts",
+    "INSERT INTO prompts_fts(prompt_id, prompt_text, name, video_path) "
+    "SELECT id, prompt_text, json_extract(parameters, '$.name'), json_extract(inputs, '$.video') "
+    "FROM prompts",
+]
+
+# Quoted phrases, or runs of non-whitespace
+_QUERY_TERM = re.compile(r'"([^"]*)"|(\S+)')
+# Mirrors the unicode61 tokenizer: letters and digits, everything else separates
+_WORD = re.compile(r"[^\W_]+")
+
+
+def fts5_available(connection: Connection) -> bool:
+    """Check whether the SQLite library was compiled with FTS5.
+
+    Args:
+        connection: Open SQLAlchemy connection to a SQLite database
+
+    Returns:
+        True if FTS5 virtual tables can be created
+    """
+    return bool(
+        connection.execute(text("SELECT sqlite_compileoption_used('ENABLE_FTS5')")).scalar()
+    )
+
+
+def has_prompt_search_index(connection: Connection) -> bool:
+    """Check whether the prompts full-text index exists.
+
+    Args:
+        connection: Open SQLAlchemy connection to a SQLite database
+
+    Returns:
+        True if ``prompts_fts`` exists in the database
+    """
+    return (
+        connection.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+            {"name": PROMPTS_FTS_TABLE},
+        ).scalar()
+        is not None
+    )
+
+
+def create_prompt_search_index(connection: Connection, backfill: bool = False) -> bool:
+    """Create the prompts full-text index and its sync triggers.
+
+    Safe to call repeatedly. Does nothing on SQLite builds without FTS5.
+
+    Args:
+        connection: Open connection inside a transaction
+        backfill: Re-index every existing prompt (for upgraded databases)
+
+    Returns:
+        True if the index exists afterwards
+    """
+    if not fts5_available(connection):
+        return False
+
+    for statement in PROMPT_SEARCH_DDL:
+        connection.execute(text(statement))
+
+    if backfill:
+        for statement in _BACKFILL:
+            connection.execute(text(statement))
+    return True
+
+
+def drop_prompt_search_index(connection: Connection) -> None:
+    """Drop the prompts full-text index (triggers go with the prompts table)."""
+    connection.execute(text("DROP TABLE IF EXISTS prompts_fts"))
+
+
+def build_match_query(query: str) -> str | None:
+    """Translate user search text into an FTS5 MATCH expression.
+
+    Double-quoted text is matched as an exact phrase. Every other term is a
+    prefix match, so partially typed words still find results; a term that
+    the tokenizer would split (``city_night``, ``ps_1a2b``) becomes a phrase
+    of its parts. All terms must match. FTS5 operators in user input are
+    treated as plain words, so the result is always a valid expression.
+
+    Args:
+        query: Raw search text
+
+    Returns:
+        MATCH expression, or None if the text contains no searchable words
+    """
+    terms = []
+    for match in _QUERY_TERM.finditer(query or ""):
+        phrase, bare = match.groups()
+        words = _WORD.findall(phrase if phrase is not None else bare)
+        if not words:
+            continue
+        expression = '"' + " ".join(words) + '"'
+        terms.append(expression if phrase is not None else expression + "*")
+    return " ".join(terms) or None
+
+
+def prompt_search_match(match_query: str) -> TextClause:
+    """Build a WHERE clause matching ``prompts_fts`` rows.
+
+    Args:
+        match_query: Expression from ``build_match_query``
+
+    Returns:
+        Text clause to use with a query selecting from ``prompts_fts``
+    """
+    return text("prompts_fts MATCH :fts_query").bindparams(fts_query=match_query)
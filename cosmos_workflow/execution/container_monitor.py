@@ -0,0 +1,208 @@
+"""Cached view of the remote GPU and container state.
+
+Queue claims, the Active Jobs tab and ``cosmos status`` all need to know
+whether a cosmos container is running on the GPU host. Each of them used to
+open a fresh SSH connection and run ``docker ps`` (plus ``nvidia-smi`` for the
+status views) on every call - the queue timer alone did that on every tick.
+
+``ContainerMonitor`` keeps one snapshot of that state in memory:
+
+- Reads return the cached snapshot while it is younger than ``ttl`` and only
+  go to the remote host when it is stale. Concurrent stale reads share a
+  single refresh.
+- An optional background poller refreshes the snapshot every
+  ``poll_interval`` seconds, so long-running processes (UI, queue worker)
+  never refresh on the read path at all.
+- All refreshes go through the monitor's own SSH manager, on channels of the
+  host's shared connection, so they never wait on the manager running jobs.
+- ``invalidate`` forces the next read to refresh, for callers that just
+  started, finished or killed a container.
+"""
+
+import threading
+import time
+from typing import Any
+
+from cosmos_workflow.config.config_manager import ConfigManager
+from cosmos_workflow.connection.ssh_manager import SSHManager
+from cosmos_workflow.execution.docker_executor import DockerExecutor
+from cosmos_workflow.utils.logging import logger
+
+DEFAULT_TTL = 10.0
+
+
+class ContainerMonitor:
+    """Shared TTL cache of GPU, Docker and active-container state."""
+
+    def __init__(
+        self,
+        config_manager: ConfigManager,
+        ttl: float | None = None,
+        poll_interval: float | None = None,
+    ):
+        """Initialize the monitor without connecting.
+
+        Args:
+            config_manager: Configuration for the SSH connection and Docker image
+            ttl: Seconds a snapshot stays fresh (default: ``[monitor] status_ttl``
+                from config, else 10)
+            poll_interval: Seconds between background refreshes (default:
+                ``[monitor] poll_interval`` from config, else ``ttl``)
+        """
+        monitor_config = config_manager.get_monitor_config()
+        self.config_manager = config_manager
+        self.ttl = float(ttl if ttl is not None else monitor_config["status_ttl"])
+        self.poll_interval = float(
+            poll_interval if poll_interval is not None else monitor_config["poll_interval"]
+        )
+        self.ssh_manager: SSHManager | None = None
+        self.docker_executor: DockerExecutor | None = None
+        self.refresh_count = 0
+
+        self._state: dict[str, Any] | None = None
+        self._checked_at = 0.0  # time.monotonic() of the last refresh, 0 = stale
+        self._refresh_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def _initialize_services(self) -> None:
+        """Create the monitor's own SSH and Docker helpers on first use."""
+        if self.docker_executor is not None:
+            return
+        remote_config = self.config_manager.get_remote_config()
+        self.ssh_manager = SSHManager(self.config_manager.get_ssh_options())
+        self.docker_executor = DockerExecutor(
+            self.ssh_manager,
+            remote_config.remote_dir,
+            remote_config.docker_image,
+            config_manager=self.config_manager,
+        )
+
+    # ========== Reads ==========
+
+    def snapshot(self, max_age: float | None = None) -> dict[str, Any]:
+        """Get the remote state, refreshing it only if it is too old.
+
+        Args:
+            max_age: Oldest acceptable snapshot in seconds (default: ``ttl``,
+                0 forces a refresh)
+
+        Returns:
+            Dictionary with ssh_status, docker_status, gpu_info, container and
+            checked_at (epoch seconds), plus error when the host is unreachable
+        """
+        max_age = self.ttl if max_age is None else max_age
+        state = self._state
+        if state is not None and time.monotonic() - self._checked_at <= max_age:
+            return state
+
+        with self._refresh_lock:
+            # Another caller may have refreshed while we waited for the lock
+            if self._state is not None and time.monotonic() - self._checked_at <= max_age:
+                return self._state
+            return self._refresh_locked()
+
+    def get_container(self, max_age: float | None = None) -> dict[str, str] | None:
+        """Get the active cosmos container from the cached state.
+
+        Args:
+            max_age: Oldest acceptable snapshot in seconds (default: ``ttl``)
+
+        Returns:
+            Container dict as returned by DockerExecutor.get_active_container,
+            or None if no container is running or the host is unreachable
+        """
+        return self.snapshot(max_age).get("container")
+
+    def get_gpu_info(self, max_age: float | None = None) -> dict[str, str] | None:
+        """Get GPU information from the cached state.
+
+        Args:
+            max_age: Oldest acceptable snapshot in seconds (default: ``ttl``)
+
+        Returns:
+            GPU dict as returned by DockerExecutor.get_gpu_info, or None
+        """
+        return self.snapshot(max_age).get("gpu_info")
+
+    def invalidate(self) -> None:
+        """Mark the snapshot stale so the next read (or the poller) refreshes it."""
+        self._checked_at = 0.0
+        self._wake.set()
+
+    # ========== Refresh ==========
+
+    def refresh(self) -> dict[str, Any]:
+        """Query the remote host now and replace the cached snapshot.
+
+        Returns:
+            The new snapshot
+        """
+        with self._refresh_lock:
+            return self._refresh_locked()
+
+    def _refresh_locked(self) -> dict[str, Any]:
+        self._initialize_services()
+        self.refresh_count += 1
+
+        try:
+            if self.ssh_manager.ssh_client is None:
+                self.ssh_manager.connect()
+            gpu_info = self.docker_executor.get_gpu_info()
+            docker_status = self.docker_executor.get_docker_status()
+            state = {
+                "ssh_status": "connected",
+                "docker_status": docker_status,
+                "gpu_info": gpu_info,
+                "container": docker_status.get("active_container"),
+            }
+        except Exception as e:
+            logger.error("Failed to refresh GPU status: {}", e)
+            # Detach so the next refresh reattaches, reconnecting if the transport died
+            self.ssh_manager.disconnect()
+            state = {"ssh_status": "error", "error": str(e), "container": None}
+
+        state["checked_at"] = time.time()
+        self._state = state
+        self._checked_at = time.monotonic()
+        return state
+
+    # ========== Background poller ==========
+
+    def start(self) -> None:
+        """Start refreshing the snapshot in a background thread."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._poll_loop, name="container-monitor", daemon=True
+        )
+        self._thread.start()
+        logger.info("Container monitor started (every {}s)", self.poll_interval)
+
+    def stop(self) -> None:
+        """Stop the poller and detach the monitor from its SSH connection."""
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+        with self._refresh_lock:
+            if self.ssh_manager is not None:
+                self.ssh_manager.disconnect()
+
+    @property
+    def running(self) -> bool:
+        """Whether the background poller is active."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def _poll_loop(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.refresh()
+            except Exception as e:
+                logger.warning("Container monitor refresh failed: {}", e)
+            # Sleep until the next tick, or until invalidate()/stop() wakes us
+            self._wake.wait(self.poll_interval)
+            self._wake.clear()
@@ -4,8 +4,13 @@ This module handles all GPU-related operations including inference,
 batch processing, and prompt upsampling using remote Docker containers.
 """
 
+import hashlib
+import shlex
 import tempfile
+import threading
 import time
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
@@ -14,12 +19,25 @@ from cosmos_workflow.config import ConfigManager
 from cosmos_workflow.connection import SSHManager
 from cosmos_workflow.execution.command_builder import RemoteCommandExecutor
 from cosmos_workflow.execution.docker_executor import DockerExecutor
+from cosmos_workflow.execution.job_stages import current_stages
+from cosmos_workflow.execution.output_retriever import OutputRetriever, RetryPolicy
 from cosmos_workflow.transfer.file_transfer import FileTransferService
 from cosmos_workflow.utils import nvidia_format
 from cosmos_workflow.utils.json_handler import JSONHandler
 from cosmos_workflow.utils.logging import logger
 
 
+def _staging_key(path: Path | str) -> str | None:
+    """Identify a local file version for the remote staging area (None if missing)."""
+    path = Path(path)
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    identity = f"{path.resolve()}:{stat.st_size}:{stat.st_mtime_ns}"
+    return hashlib.sha1(identity.encode(), usedforsecurity=False).hexdigest()[:16]
+
+
 class GPUExecutor:
     """Execute GPU operations on remote servers.
 
@@ -38,6 +56,11 @@ class GPUExecutor:
         """
         self.config_manager = config_manager or ConfigManager()
         self.service = service  # For database updates in completion handlers
+        self._batch_cost_model = None  # Created on the first finished batch
+        self._staged: dict[str, str] = {}  # Staging key -> prefetched remote file
+        self._downloading: dict[str, int] = {}  # Run ID -> stages still needing its outputs
+        self._staging_lock = threading.Lock()
+        self.output_retriever: OutputRetriever | None = None  # Created on first deferred run
         self.ssh_manager = None
         self.file_transfer = None
         self.remote_executor = None
@@ -77,27 +100,13 @@ class GPUExecutor:
 
     # ========== Single Run Execution ==========
 
-    # ========== Thread-Safe Download Helper ==========
-
-    def _thread_safe_download(self, remote_path: str, local_path: str) -> bool:
-        """Download a file using thread-safe paramiko SFTP.
-
-        IMPORTANT: This is a workaround for threading limitations in our architecture.
-
-        WHY THIS EXISTS:
-        - Completion handlers run in background threads (for async monitoring)
-        - Our FileTransferService and SSHManager weren't designed for multi-threading
-        - They use context managers and shared connections that don't work across threads
+    # ========== Completion Handler Download Helper ==========
 
-        WHAT IT DOES:
-        - Creates its own SSH connection inside the thread
-        - Uses raw paramiko instead of our wrappers
-        - Downloads the file and closes the connection
+    def _download_for_handler(self, remote_path: str, local_path: str | Path) -> bool:
+        """Download a file from a completion handler thread.
 
-        FUTURE IMPROVEMENT:
-        - Redesign FileTransferService to be thread-safe with connection pooling
-        - Or move to an async/await architecture throughout the codebase
-        - Or use a message queue system to handle downloads in the main thread
+        Transfers go through the host's shared SFTP channel pool, so the main
+        FileTransferService is safe to use from background threads.
 
         Args:
             remote_path: Remote file path
@@ -106,29 +115,229 @@ class GPUExecutor:
         Returns:
             True if download succeeded, False otherwise
         """
-        import paramiko
-
+        self._initialize_services()
         try:
-            ssh = paramiko.SSHClient()
-            ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())  # noqa: S507
-            ssh.connect(**self.config_manager.get_ssh_options())
-
-            try:
-                sftp = ssh.open_sftp()
-                try:
-                    sftp.get(remote_path, str(local_path))
-                    return True
-                except FileNotFoundError:
-                    logger.error("File not found: {}", remote_path)
-                    return False
-                finally:
-                    sftp.close()
-            finally:
-                ssh.close()
+            self.file_transfer.download_file(remote_path, str(local_path))
+            return True
+        except FileNotFoundError:
+            logger.error("File not found: {}", remote_path)
+            return False
         except Exception as e:
-            logger.error("Thread-safe download failed: {}", e)
+            logger.error("Download of {} failed: {}", remote_path, e)
             return False
 
+    # ========== Pipelined Transfers ==========
+
+    def prefetch_inputs(self, paths: list[str]) -> int:
+        """Upload input files to the host's staging area ahead of their job.
+
+        Runs over its own SSH channels, so it can overlap the job currently
+        on the GPU. When the job executes, staged files are moved into its run
+        directory instead of being uploaded again; files changed since staging
+        are uploaded as usual.
+
+        Args:
+            paths: Local input files (missing files are skipped)
+
+        Returns:
+            Number of files uploaded
+        """
+        self._initialize_services()
+        pending: dict[str, Path] = {}
+        with self._staging_lock:
+            for path in paths:
+                key = _staging_key(path)
+                if key and key not in self._staged:
+                    pending[key] = Path(path)
+        if not pending:
+            return 0
+
+        remote_dir = self.config_manager.get_remote_config().remote_dir
+        with self._separate_transfer() as transfer:
+            for key, path in pending.items():
+                staging_dir = f"{remote_dir}/staging/{key}"
+                transfer.upload_file(path, staging_dir)
+                with self._staging_lock:
+                    self._staged[key] = f"{staging_dir}/{path.name}"
+
+        logger.info("Prefetched {} input file(s) to the GPU host", len(pending))
+        return len(pending)
+
+    def _upload_input(self, local_path: Path, remote_dir: str) -> None:
+        """Upload a job input, moving its prefetched copy into place if there is one."""
+        key = _staging_key(local_path)
+        with self._staging_lock:
+            staged = self._staged.pop(key, None) if key else None
+
+        if staged:
+            target = f"{remote_dir}/{local_path.name}"
+            exit_code, _, stderr = self.ssh_manager.execute_command(
+                f"mkdir -p {shlex.quote(remote_dir)} && "
+                f"mv -f {shlex.quote(staged)} {shlex.quote(target)}",
+                timeout=60,
+                stream_output=False,
+            )
+            if exit_code == 0:
+                logger.info("Using prefetched {} for {}", local_path.name, remote_dir)
+                return
+            logger.warning("Prefetched {} unavailable, uploading: {}", local_path.name, stderr)
+
+        self.file_transfer.upload_file(local_path, remote_dir)
+
+    @contextmanager
+    def _separate_transfer(self) -> Iterator[FileTransferService]:
+        """Open a FileTransferService on its own SSH manager and channels."""
+        ssh_manager = SSHManager(self.config_manager.get_ssh_options())
+        with ssh_manager:
+            yield FileTransferService(
+                ssh_manager, self.config_manager.get_remote_config().remote_dir
+            )
+
+    @contextmanager
+    def _output_transfer(self) -> Iterator[FileTransferService]:
+        """Connect for downloading a job's outputs (stage 3).
+
+        In the queue pipeline the main session may already be running the
+        next job, so outputs come over separate channels.
+        """
+        if current_stages().active:
+            with self._separate_transfer() as transfer:
+                yield transfer
+        else:
+            with self.ssh_manager:
+                yield self.file_transfer
+
+    def _hold_outputs(self, run_id: str) -> None:
+        """Protect a run's remote outputs from other runs' cleanup until released."""
+        with self._staging_lock:
+            self._downloading[run_id] = self._downloading.get(run_id, 0) + 1
+
+    def _release_outputs(self, run_id: str) -> None:
+        with self._staging_lock:
+            self._downloading[run_id] -= 1
+            if not self._downloading[run_id]:
+                del self._downloading[run_id]
+
+    def _pending_downloads(self) -> list[str]:
+        with self._staging_lock:
+            return list(self._downloading)
+
+    # ========== Background Output Retrieval ==========
+
+    def _defers_outputs(self) -> bool:
+        """Whether finished runs' outputs are retrieved in the background.
+
+        Only in the queue pipeline: direct CLI and API calls return once the
+        outputs are downloaded, as before.
+        """
+        return current_stages().active and self.service is not None
+
+    def _retriever(self) -> OutputRetriever:
+        with self._staging_lock:
+            if self.output_retriever is None:
+                queue_config = self.config_manager.get_queue_config()
+                self.output_retriever = OutputRetriever(
+                    RetryPolicy(
+                        attempts=int(queue_config["download_attempts"]),
+                        backoff_seconds=float(queue_config["download_backoff"]),
+                    )
+                )
+            return self.output_retriever
+
+    def wait_for_downloads(self, timeout: float | None = None) -> bool:
+        """Wait for outputs still being retrieved in the background.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            True if no retrieval is pending anymore
+        """
+        if self.output_retriever is None:
+            return True
+        return self.output_retriever.wait(timeout)
+
+    def _retrieve_run_later(self, run_id: str, run_dir: Path) -> dict[str, Any]:
+        """Mark a run ``downloading`` and retrieve its outputs in the background.
+
+        The retrieval downloads the outputs over its own channels, generates
+        the thumbnail and records the run as completed, or failed once every
+        attempt failed.
+        """
+        self.service.update_run_status(run_id, "downloading")
+
+        def retrieve() -> None:
+            with self._separate_transfer() as transfer:
+                output_path, thumbnail_path = self._download_outputs(
+                    run_id, run_dir, upscaled=False, file_transfer=transfer
+                )
+            result = self._run_result(run_id, run_dir, output_path, thumbnail_path)
+            self.service.update_runs({run_id: {"outputs": result, "status": "completed"}})
+
+        def fail(error: Exception) -> None:
+            self.service.update_run(run_id, error_message=f"Output download failed: {error}")
+
+        self._hold_outputs(run_id)
+        future = self._retriever().submit(run_id, retrieve, fail)
+        future.add_done_callback(lambda _: self._release_outputs(run_id))
+        current_stages().retrieving(future)
+        return {
+            "status": "downloading",
+            "message": "Inference completed, downloading outputs",
+            "run_id": run_id,
+            "log_path": str(run_dir / "logs" / "inference.log"),
+        }
+
+    def _retrieve_batch_later(
+        self,
+        batch_name: str,
+        batch_dir: Path,
+        runs_and_prompts: list[tuple[dict[str, Any], dict[str, Any]]],
+        batch_result: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Mark a batch's runs ``downloading`` and retrieve their outputs in the background.
+
+        A retrieval with missing output videos is retried; after the last
+        attempt, runs whose video did arrive are completed and the rest fail.
+        """
+        run_ids = [run_dict["id"] for run_dict, _ in runs_and_prompts]
+        self.service.update_runs({run_id: {"status": "downloading"} for run_id in run_ids})
+        downloaded: dict[str, dict[str, Any]] = {}
+
+        def retrieve() -> None:
+            with self._separate_transfer() as transfer:
+                run_updates = self._download_batch_outputs(
+                    batch_name, batch_dir, runs_and_prompts, batch_result, transfer
+                )
+            downloaded.update(run_updates)
+            missing = [
+                run_id
+                for run_id, update in run_updates.items()
+                if not Path(update["outputs"]["output_path"]).exists()
+            ]
+            if missing:
+                raise RuntimeError(f"{len(missing)} of {len(run_ids)} output videos missing")
+            self.service.update_runs(run_updates)
+
+        def fail(error: Exception) -> None:
+            updates = {}
+            for run_id in run_ids:
+                update = downloaded.get(run_id)
+                if update and Path(update["outputs"]["output_path"]).exists():
+                    updates[run_id] = update
+                else:
+                    updates[run_id] = {"error_message": f"Output download failed: {error}"}
+            self.service.update_runs(updates)
+
+        current_stages().retrieving(self._retriever().submit(batch_name, retrieve, fail))
+        return {
+            "status": "downloading",
+            "batch_name": batch_name,
+            "run_count": len(runs_and_prompts),
+            "output_dir": str(batch_dir),
+            "duration_seconds": batch_result.get("duration_seconds"),
+        }
+
     # ========== Completion Handlers ==========
 
     def _handle_inference_completion(self, run_id: str, exit_code: int, container_name: str):
@@ -176,8 +385,8 @@ class GPUExecutor:
                         self.service.update_run(run_id, error_message=f"Configuration error: {e}")
                     return
 
-                # Download using thread-safe helper
-                if self._thread_safe_download(remote_output, local_output):
+                # Download through the shared SFTP pool
+                if self._download_for_handler(remote_output, local_output):
                     logger.info("Downloaded output file for run {}", run_id)
 
                     # Generate thumbnail for the output
@@ -247,8 +456,8 @@ class GPUExecutor:
                 with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as tmp:
                     tmp_path = Path(tmp.name)
 
-                # Download using thread-safe helper
-                if self._thread_safe_download(remote_results, str(tmp_path)):
+                # Download through the shared SFTP pool
+                if self._download_for_handler(remote_results, str(tmp_path)):
                     try:
                         results = self.json_handler.read_json(tmp_path)
                     finally:
@@ -316,8 +525,8 @@ class GPUExecutor:
             remote_config = self.config_manager.get_remote_config()
             remote_output = f"{remote_config.remote_dir}/outputs/run_{run_id}/output_4k.mp4"
 
-            # Download using thread-safe helper
-            if self._thread_safe_download(remote_output, local_output):
+            # Download through the shared SFTP pool
+            if self._download_for_handler(remote_output, local_output):
                 logger.info("Downloaded 4K output file for run {}", run_id)
 
                 # Generate thumbnail for the output
@@ -404,54 +613,12 @@ class GPUExecutor:
         self.json_handler.write_json(spec_data, spec_file)
 
         # Execute on GPU using DockerExecutor
+        stages = current_stages()
+        self._hold_outputs(run_id)
         try:
             with self.ssh_manager:
-                # Upload batch and any video files
-                remote_config = self.config_manager.get_remote_config()
-
-                # Clean all old run directories before starting
-                logger.info("Cleaning up old run directories...")
-                cleanup_cmd = f"rm -rf {remote_config.remote_dir}/outputs/run_* 2>/dev/null || true"
-                self.remote_executor.execute_command(cleanup_cmd)
-
-                remote_run_dir = f"{remote_config.remote_dir}/runs/{run_id}"
-
-                # Upload spec file
-                self.file_transfer.upload_file(spec_file, f"{remote_run_dir}/inputs")
-
-                # Upload all video files from inputs (video, depth, seg, etc.)
-                inputs = prompt.get("inputs", {})
-                for input_type, input_path in inputs.items():
-                    if input_path and Path(input_path).exists():
-                        logger.info("Uploading {}: {}", input_type, input_path)
-                        self.file_transfer.upload_file(
-                            Path(input_path), f"{remote_run_dir}/inputs/videos"
-                        )
-
-                # Upload bash scripts if not already present
-                scripts_dir = Path(__file__).parent.parent.parent / "scripts"
-                remote_scripts_dir = f"{remote_config.remote_dir}/bashscripts"
-
-                # Upload inference.sh script
-                inference_script = scripts_dir / "inference.sh"
-                if inference_script.exists():
-                    logger.info("Uploading inference script to remote")
-                    self.file_transfer.upload_file(inference_script, remote_scripts_dir)
-                else:
-                    logger.warning("Inference script not found at {}", inference_script)
-
-                # Upload upscale.sh script (might be needed later)
-                upscale_script = scripts_dir / "upscale.sh"
-                if upscale_script.exists():
-                    self.file_transfer.upload_file(upscale_script, remote_scripts_dir)
-                    # Set execute permissions on the script
-                    remote_script_path = f"{remote_scripts_dir}/upscale.sh"
-                    chmod_cmd = f"chmod +x {remote_script_path}"
-                    exit_code, _, stderr = self.ssh_manager.execute_command(chmod_cmd, timeout=10)
-                    if exit_code != 0:
-                        logger.warning(
-                            "Failed to set execute permissions on upscale.sh: {}", stderr
-                        )
+                with stages.stage("upload"):
+                    self._upload_run_inputs(run_id, spec_file, prompt)
 
                 # Get guidance and seed from execution_config
                 execution_config = run.get("execution_config", {})
@@ -461,65 +628,183 @@ class GPUExecutor:
                 # Run inference synchronously with streaming output
                 # Create a prompt file path for DockerExecutor (it expects Path)
                 prompt_file = Path(f"{run_id}.json")  # Just a name, not used inside
-                inference_result = self.docker_executor.run_inference(
-                    prompt_file=prompt_file,
-                    run_id=run_id,
-                    guidance=guidance,
-                    seed=seed,
-                    stream_output=stream_output,  # Use parameter to control streaming
+                stages.gpu_started()
+                with stages.stage("gpu"):
+                    inference_result = self.docker_executor.run_inference(
+                        prompt_file=prompt_file,
+                        run_id=run_id,
+                        guidance=guidance,
+                        seed=seed,
+                        stream_output=stream_output,  # Use parameter to control streaming
+                    )
+
+            # The GPU and the main session are free for the next job from here on
+            stages.gpu_done()
+
+            # Check the result status
+            if inference_result["status"] == "failed":
+                error_msg = inference_result.get(
+                    "error",
+                    f"Inference failed with exit code {inference_result.get('exit_code', 'unknown')}",
                 )
+                raise RuntimeError(error_msg)
 
-                # Check the result status
-                if inference_result["status"] == "failed":
-                    error_msg = inference_result.get(
-                        "error",
-                        f"Inference failed with exit code {inference_result.get('exit_code', 'unknown')}",
-                    )
-                    raise RuntimeError(error_msg)
+            elif inference_result["status"] == "completed":
+                # Inference completed successfully, download outputs immediately
+                logger.info("Inference completed for run {}, downloading outputs...", run_id)
 
-                elif inference_result["status"] == "completed":
-                    # Inference completed successfully, download outputs immediately
-                    logger.info("Inference completed for run {}, downloading outputs...", run_id)
+                if self._defers_outputs():
+                    return self._retrieve_run_later(run_id, run_dir)
 
-                    try:
+                try:
+                    with stages.stage("download"), self._output_transfer() as transfer:
                         output_path, thumbnail_path = self._download_outputs(
-                            run_id, run_dir, upscaled=False
+                            run_id, run_dir, upscaled=False, file_transfer=transfer
                         )
 
-                        # Return completed status with output path and thumbnail
-                        result = {
-                            "status": "completed",
-                            "output_path": str(output_path),
-                            "message": "Inference completed successfully",
-                            "run_id": run_id,
-                            "log_path": str(run_dir / "logs" / "inference.log"),
-                        }
-                        if thumbnail_path:
-                            result["thumbnail_path"] = str(thumbnail_path)
-                        return result
-                    except Exception as download_error:
-                        logger.error(
-                            "Failed to download outputs for run {}: {}", run_id, download_error
-                        )
-                        raise RuntimeError(
-                            f"Inference completed but output download failed: {download_error}"
-                        ) from download_error
-
-                else:
-                    # Unexpected status
-                    raise RuntimeError(
-                        f"Unexpected inference status: {inference_result.get('status')}"
+                    # Return completed status with output path and thumbnail
+                    return self._run_result(run_id, run_dir, output_path, thumbnail_path)
+                except Exception as download_error:
+                    logger.error(
+                        "Failed to download outputs for run {}: {}", run_id, download_error
                     )
+                    raise RuntimeError(
+                        f"Inference completed but output download failed: {download_error}"
+                    ) from download_error
+
+            else:
+                # Unexpected status
+                raise RuntimeError(f"Unexpected inference status: {inference_result.get('status')}")
 
         except Exception as e:
             logger.error("GPU execution failed for run {}: {}", run_id, e)
             raise RuntimeError(f"GPU execution failed: {e}") from e
+        finally:
+            self._release_outputs(run_id)
+
+    @staticmethod
+    def _run_result(
+        run_id: str, run_dir: Path, output_path: Path, thumbnail_path: Path | None
+    ) -> dict[str, Any]:
+        """Build the completed result of a run whose outputs were downloaded."""
+        result = {
+            "status": "completed",
+            "output_path": str(output_path),
+            "message": "Inference completed successfully",
+            "run_id": run_id,
+            "log_path": str(run_dir / "logs" / "inference.log"),
+        }
+        if thumbnail_path:
+            result["thumbnail_path"] = str(thumbnail_path)
+        return result
+
+    def _upload_run_inputs(self, run_id: str, spec_file: Path, prompt: dict[str, Any]) -> None:
+        """Upload a single run's spec, input videos and scripts (stage 1)."""
+        remote_config = self.config_manager.get_remote_config()
+
+        # Clean old run directories before starting, except ones still downloading
+        logger.info("Cleaning up old run directories...")
+        keep = " ".join(
+            f"! -name {shlex.quote(f'run_{pending}')}" for pending in self._pending_downloads()
+        )
+        cleanup_cmd = (
+            f"find {remote_config.remote_dir}/outputs -maxdepth 1 -name 'run_*' {keep} "
+            "-exec rm -rf {} + 2>/dev/null || true"
+        )
+        self.remote_executor.execute_command(cleanup_cmd)
+
+        remote_run_dir = f"{remote_config.remote_dir}/runs/{run_id}"
+
+        # Upload spec file
+        self.file_transfer.upload_file(spec_file, f"{remote_run_dir}/inputs")
+
+        # Upload all video files from inputs (video, depth, seg, etc.)
+        inputs = prompt.get("inputs", {})
+        for input_type, input_path in inputs.items():
+            if input_path and Path(input_path).exists():
+                logger.info("Uploading {}: {}", input_type, input_path)
+                self._upload_input(Path(input_path), f"{remote_run_dir}/inputs/videos")
+
+        # Upload bash scripts if not already present
+        scripts_dir = Path(__file__).parent.parent.parent / "scripts"
+        remote_scripts_dir = f"{remote_config.remote_dir}/bashscripts"
+
+        # Upload inference.sh script
+        inference_script = scripts_dir / "inference.sh"
+        if inference_script.exists():
+            logger.info("Uploading inference script to remote")
+            self.file_transfer.upload_file(inference_script, remote_scripts_dir)
+        else:
+            logger.warning("Inference script not found at {}", inference_script)
+
+        # Upload upscale.sh script (might be needed later)
+        upscale_script = scripts_dir / "upscale.sh"
+        if upscale_script.exists():
+            self.file_transfer.upload_file(upscale_script, remote_scripts_dir)
+            # Set execute permissions on the script
+            remote_script_path = f"{remote_scripts_dir}/upscale.sh"
+            chmod_cmd = f"chmod +x {remote_script_path}"
+            exit_code, _, stderr = self.ssh_manager.execute_command(chmod_cmd, timeout=10)
+            if exit_code != 0:
+                logger.warning("Failed to set execute permissions on upscale.sh: {}", stderr)
+
+    def _upload_batch_inputs(
+        self,
+        runs_and_prompts: list[tuple[dict[str, Any], dict[str, Any]]],
+        batch_file: Path,
+        base_spec_file: Path,
+    ) -> None:
+        """Upload a batch's script, JSONL, base spec and input videos (stage 1)."""
+        remote_config = self.config_manager.get_remote_config()
+
+        # Upload batch_inference.sh script to bashscripts/ like inference.sh
+        scripts_dir = Path(__file__).parent.parent.parent / "scripts"
+        remote_scripts_dir = f"{remote_config.remote_dir}/bashscripts"
+
+        batch_script = scripts_dir / "batch_inference.sh"
+        if batch_script.exists():
+            logger.info("Uploading batch_inference.sh script to remote bashscripts")
+            self.file_transfer.upload_file(batch_script, remote_scripts_dir)
+            # Set execute permissions on the script after upload
+            remote_script_path = f"{remote_scripts_dir}/batch_inference.sh"
+            chmod_cmd = f"chmod +x {remote_script_path}"
+            exit_code, _, stderr = self.ssh_manager.execute_command(chmod_cmd, timeout=10)
+            if exit_code != 0:
+                logger.warning(
+                    "Failed to set execute permissions on batch_inference.sh: {}", stderr
+                )
+            else:
+                logger.debug("Set execute permissions on batch_inference.sh")
+        else:
+            logger.warning("batch_inference.sh script not found at {}", batch_script)
+
+        # Upload batch file to inputs/batches/ as expected by batch_inference.sh
+        remote_batch_location = f"{remote_config.remote_dir}/inputs/batches"
+        self.file_transfer.upload_file(batch_file, remote_batch_location)
+
+        # Upload base controlnet spec to inputs/batches/
+        self.file_transfer.upload_file(base_spec_file, remote_batch_location)
+        logger.info("Uploaded base controlnet spec to remote")
+
+        # Upload any videos to run-specific paths as expected by JSONL format
+        for run_dict, prompt_dict in runs_and_prompts:
+            run_id = run_dict["id"]
+            inputs = prompt_dict.get("inputs", {})
+
+            # Upload ALL input files (video, seg, depth, edge, etc.)
+            for input_type, input_path in inputs.items():
+                if input_path and Path(input_path).exists():
+                    # Upload to runs/{run_id}/inputs/videos/ as referenced in JSONL
+                    remote_video_dir = f"{remote_config.remote_dir}/runs/{run_id}/inputs/videos"
+                    logger.info("Uploading {} for run {}: {}", input_type, run_id, input_path)
+                    self._upload_input(Path(input_path), remote_video_dir)
 
     def _download_outputs(
         self,
         run_id: str,
         local_run_dir: Path,
         upscaled: bool = False,
+        file_transfer: FileTransferService | None = None,
     ) -> Path:
         """Download output files from remote GPU server.
 
@@ -527,10 +812,12 @@ class GPUExecutor:
             run_id: The run ID
             local_run_dir: Local directory for this run
             upscaled: Whether this is an upscale operation (affects output filename)
+            file_transfer: Connection to download over (default: the main session)
 
         Returns:
             Path to the downloaded output file
         """
+        file_transfer = file_transfer or self.file_transfer
         remote_config = self.config_manager.get_remote_config()
         outputs_dir = local_run_dir / "outputs"
         outputs_dir.mkdir(exist_ok=True)
@@ -551,7 +838,7 @@ class GPUExecutor:
 
         # Download the output file
         try:
-            self.file_transfer.download_file(remote_file, str(local_file))
+            file_transfer.download_file(remote_file, str(local_file))
             logger.info("Downloaded output to {}", local_file)
         except Exception as e:
             logger.error("Failed to download output: {}", e)
@@ -567,7 +854,7 @@ class GPUExecutor:
             local_control_file = outputs_dir / f"{control_type}_input_control.mp4"
 
             try:
-                self.file_transfer.download_file(remote_control_file, str(local_control_file))
+                file_transfer.download_file(remote_control_file, str(local_control_file))
                 logger.info(
                     "Downloaded auto-generated {} control to {}", control_type, local_control_file
                 )
@@ -585,7 +872,7 @@ class GPUExecutor:
         remote_log = f"{remote_output_dir}/run.log"
         docker_log_path = outputs_dir / "run.log"  # Keep in outputs as backup
         try:
-            self.file_transfer.download_file(remote_log, str(docker_log_path))
+            file_transfer.download_file(remote_log, str(docker_log_path))
             logger.info("Downloaded Docker log to {}", docker_log_path)
 
             # Append to unified log
@@ -685,56 +972,12 @@ class GPUExecutor:
         )
 
         # Execute batch on GPU
+        stages = current_stages()
+        remote_config = self.config_manager.get_remote_config()
         try:
             with self.ssh_manager:
-                # Upload batch file and videos
-                remote_config = self.config_manager.get_remote_config()
-
-                # Upload batch_inference.sh script to bashscripts/ like inference.sh
-                scripts_dir = Path(__file__).parent.parent.parent / "scripts"
-                remote_scripts_dir = f"{remote_config.remote_dir}/bashscripts"
-
-                batch_script = scripts_dir / "batch_inference.sh"
-                if batch_script.exists():
-                    logger.info("Uploading batch_inference.sh script to remote bashscripts")
-                    self.file_transfer.upload_file(batch_script, remote_scripts_dir)
-                    # Set execute permissions on the script after upload
-                    remote_script_path = f"{remote_scripts_dir}/batch_inference.sh"
-                    chmod_cmd = f"chmod +x {remote_script_path}"
-                    exit_code, _, stderr = self.ssh_manager.execute_command(chmod_cmd, timeout=10)
-                    if exit_code != 0:
-                        logger.warning(
-                            "Failed to set execute permissions on batch_inference.sh: {}", stderr
-                        )
-                    else:
-                        logger.debug("Set execute permissions on batch_inference.sh")
-                else:
-                    logger.warning("batch_inference.sh script not found at {}", batch_script)
-
-                # Upload batch file to inputs/batches/ as expected by batch_inference.sh
-                remote_batch_location = f"{remote_config.remote_dir}/inputs/batches"
-                self.file_transfer.upload_file(batch_file, remote_batch_location)
-
-                # Upload base controlnet spec to inputs/batches/
-                self.file_transfer.upload_file(base_spec_file, remote_batch_location)
-                logger.info("Uploaded base controlnet spec to remote")
-
-                # Upload any videos to run-specific paths as expected by JSONL format
-                for run_dict, prompt_dict in runs_and_prompts:
-                    run_id = run_dict["id"]
-                    inputs = prompt_dict.get("inputs", {})
-
-                    # Upload ALL input files (video, seg, depth, edge, etc.)
-                    for input_type, input_path in inputs.items():
-                        if input_path and Path(input_path).exists():
-                            # Upload to runs/{run_id}/inputs/videos/ as referenced in JSONL
-                            remote_video_dir = (
-                                f"{remote_config.remote_dir}/runs/{run_id}/inputs/videos"
-                            )
-                            logger.info(
-                                "Uploading {} for run {}: {}", input_type, run_id, input_path
-                            )
-                            self.file_transfer.upload_file(Path(input_path), remote_video_dir)
+                with stages.stage("upload"):
+                    self._upload_batch_inputs(runs_and_prompts, batch_file, base_spec_file)
 
                 # Get guidance and seed from first run's execution_config (all runs in batch share the same config)
                 first_run = runs_and_prompts[0][0]
@@ -743,14 +986,18 @@ class GPUExecutor:
                 seed = execution_config.get("seed", 1)
 
                 # Run batch inference
-                batch_result = self.docker_executor.run_batch_inference(
-                    batch_name=batch_name,
-                    batch_jsonl_file=batch_file.name,
-                    base_controlnet_spec=base_spec_file.name,
-                    batch_size=batch_size,
-                    guidance=guidance,
-                    seed=seed,
-                )
+                stages.gpu_started()
+                gpu_started = time.monotonic()
+                with stages.stage("gpu"):
+                    batch_result = self.docker_executor.run_batch_inference(
+                        batch_name=batch_name,
+                        batch_jsonl_file=batch_file.name,
+                        base_controlnet_spec=base_spec_file.name,
+                        batch_size=batch_size,
+                        guidance=guidance,
+                        seed=seed,
+                    )
+                gpu_seconds = time.monotonic() - gpu_started
 
                 if batch_result["status"] == "failed":
                     # Try to download the fallback log for debugging
@@ -767,161 +1014,373 @@ class GPUExecutor:
 
                     raise RuntimeError(f"Batch execution failed: {batch_result.get('error')}")
 
-                # Batch now runs synchronously, so should have completed status
-                if batch_result.get("status") != "completed":
-                    raise RuntimeError(f"Unexpected batch status: {batch_result.get('status')}")
+            # The GPU and the main session are free for the next job from here on
+            stages.gpu_done()
 
-                # Download all batch outputs to batch directory (simpler approach)
-                logger.info("Downloading batch outputs to local batch directory")
+            # Batch now runs synchronously, so should have completed status
+            if batch_result.get("status") != "completed":
+                raise RuntimeError(f"Unexpected batch status: {batch_result.get('status')}")
 
-                # Ensure batch output directory exists locally
-                outputs_dir = batch_dir / "outputs"
-                outputs_dir.mkdir(exist_ok=True)
-                logger.debug("Created batch output directory: {}", outputs_dir)
+            # Calibrate the smart batching cost model with the measured GPU time
+            self._record_batch_execution(batch_name, runs_and_prompts, gpu_seconds)
 
-                # Download all output files to batch directory preserving subdirectory structure
-                remote_output_dir = batch_result.get(
-                    "output_dir", f"{remote_config.remote_dir}/outputs/{batch_name}"
-                )
-                output_files = batch_result.get("output_files", [])
-                logger.info(
-                    "Downloading {} output files from {}", len(output_files), remote_output_dir
+            if self._defers_outputs():
+                return self._retrieve_batch_later(
+                    batch_name, batch_dir, runs_and_prompts, batch_result
                 )
-                logger.info(
-                    "Batch {} output structure: {} files in {}",
-                    batch_name,
-                    len(output_files),
-                    batch_dir,
+
+            with stages.stage("download"), self._output_transfer() as transfer:
+                run_updates = self._download_batch_outputs(
+                    batch_name, batch_dir, runs_and_prompts, batch_result, transfer
                 )
 
-                # Group files by video_X directory
-                from collections import defaultdict
+            # Update every run in one transaction
+            self.service.update_runs(run_updates)
+            logger.info("Updated {} runs with batch output paths", len(run_updates))
 
-                video_files = defaultdict(list)
+            return {
+                "status": "success",
+                "batch_name": batch_name,
+                "run_count": len(runs_and_prompts),
+                "output_dir": str(batch_dir),
+                "duration_seconds": batch_result.get("duration_seconds") or gpu_seconds,
+            }
 
-                for remote_file in output_files:
-                    # Extract video_X directory from path like /workspace/outputs/batch_xxx/video_0/output.mp4
-                    path_parts = Path(remote_file).parts
-                    # Find the video_X directory
-                    video_dir = None
-                    for part in path_parts:
-                        if part.startswith("video_"):
-                            video_dir = part
-                            break
+        except Exception as e:
+            logger.error("Batch execution failed: {}", e)
+            return {
+                "status": "failed",
+                "batch_name": batch_name,
+                "error": str(e),
+                "started_at": datetime.now(timezone.utc).isoformat(),
+            }
 
-                    if video_dir:
-                        video_files[video_dir].append(remote_file)
-                    else:
-                        # Fallback for files directly in batch directory
-                        video_files[""].append(remote_file)
-
-                # Download files preserving video_X structure
-                for video_dir, files in sorted(video_files.items()):
-                    if video_dir:
-                        # Create video_X subdirectory
-                        video_output_dir = outputs_dir / video_dir
-                        video_output_dir.mkdir(exist_ok=True)
-                    else:
-                        video_output_dir = outputs_dir
+    def _download_batch_outputs(
+        self,
+        batch_name: str,
+        batch_dir: Path,
+        runs_and_prompts: list[tuple[dict[str, Any], dict[str, Any]]],
+        batch_result: dict[str, Any],
+        transfer: FileTransferService,
+        indices: list[int] | None = None,
+    ) -> dict[str, dict[str, Any]]:
+        """Download a finished batch's outputs and build its runs' database updates.
 
-                    for remote_file in files:
-                        filename = Path(remote_file).name
-                        local_file = video_output_dir / filename
+        Args:
+            batch_name: Name of the batch
+            batch_dir: Local batch directory
+            runs_and_prompts: The batch's runs and prompts, in batch order
+            batch_result: Result of DockerExecutor.run_batch_inference
+            transfer: Connection to download over
+            indices: Position of each run in the batch (default: list order)
 
-                        try:
-                            self.file_transfer.download_file(remote_file, str(local_file))
-                            if local_file.exists():
-                                file_size = local_file.stat().st_size
-                                logger.info(
-                                    "Downloaded {} to {} (size: {} bytes)",
-                                    filename,
-                                    local_file,
-                                    file_size,
-                                )
-                            else:
-                                logger.warning(
-                                    "Download completed but file not found: {}", local_file
-                                )
-                        except Exception as e:
-                            logger.error("Failed to download {}: {}", filename, e)
+        Returns:
+            Mapping of run ID to its outputs and completed status
+        """
+        remote_config = self.config_manager.get_remote_config()
+
+        # Download all batch outputs to batch directory (simpler approach)
+        logger.info("Downloading batch outputs to local batch directory")
+
+        # Ensure batch output directory exists locally
+        outputs_dir = batch_dir / "outputs"
+        outputs_dir.mkdir(exist_ok=True)
+        logger.debug("Created batch output directory: {}", outputs_dir)
+
+        # Download all output files to batch directory preserving subdirectory structure
+        remote_output_dir = batch_result.get(
+            "output_dir", f"{remote_config.remote_dir}/outputs/{batch_name}"
+        )
+        output_files = batch_result.get("output_files", [])
+        logger.info("Downloading {} output files from {}", len(output_files), remote_output_dir)
+        logger.info(
+            "Batch {} output structure: {} files in {}",
+            batch_name,
+            len(output_files),
+            batch_dir,
+        )
+
+        # Group files by video_X directory
+        from collections import defaultdict
+
+        video_files = defaultdict(list)
+
+        for remote_file in output_files:
+            # Extract video_X directory from path like /workspace/outputs/batch_xxx/video_0/output.mp4
+            path_parts = Path(remote_file).parts
+            # Find the video_X directory
+            video_dir = None
+            for part in path_parts:
+                if part.startswith("video_"):
+                    video_dir = part
+                    break
+
+            if video_dir:
+                video_files[video_dir].append(remote_file)
+            else:
+                # Fallback for files directly in batch directory
+                video_files[""].append(remote_file)
+
+        # Download files preserving video_X structure
+        for video_dir, files in sorted(video_files.items()):
+            if video_dir:
+                # Create video_X subdirectory
+                video_output_dir = outputs_dir / video_dir
+                video_output_dir.mkdir(exist_ok=True)
+            else:
+                video_output_dir = outputs_dir
+
+            for remote_file in files:
+                filename = Path(remote_file).name
+                local_file = video_output_dir / filename
 
-                # Download the batch log file
-                remote_log = f"{remote_output_dir}/batch_run.log"
-                local_log = batch_dir / "batch_run.log"
                 try:
-                    self.file_transfer.download_file(remote_log, str(local_log))
-                    logger.info("Downloaded batch log to {}", local_log)
+                    transfer.download_file(remote_file, str(local_file))
+                    if local_file.exists():
+                        file_size = local_file.stat().st_size
+                        logger.info(
+                            "Downloaded {} to {} (size: {} bytes)",
+                            filename,
+                            local_file,
+                            file_size,
+                        )
+                    else:
+                        logger.warning("Download completed but file not found: {}", local_file)
                 except Exception as e:
-                    logger.warning("Could not download batch log: {}", e)
+                    logger.error("Failed to download {}: {}", filename, e)
 
-                # Update database for each run to point to files in batch directory
-                logger.info(
-                    "Updating database for {} runs in batch {}", len(runs_and_prompts), batch_name
+        # Download the batch log file
+        remote_log = f"{remote_output_dir}/batch_run.log"
+        local_log = batch_dir / "batch_run.log"
+        try:
+            transfer.download_file(remote_log, str(local_log))
+            logger.info("Downloaded batch log to {}", local_log)
+        except Exception as e:
+            logger.warning("Could not download batch log: {}", e)
+
+        # Update database for each run to point to files in batch directory
+        logger.info("Updating database for {} runs in batch {}", len(runs_and_prompts), batch_name)
+        run_updates = {}
+        if indices is None:
+            indices = list(range(len(runs_and_prompts)))
+        for i, (run_dict, _) in zip(indices, runs_and_prompts, strict=True):
+            run_id = run_dict["id"]
+
+            # Files are in video_X subdirectories
+            video_subdir = outputs_dir / f"video_{i}"
+
+            # Build outputs dictionary with paths in video_X subdirectory
+            output_video_path = video_subdir / "output.mp4"
+
+            outputs = {
+                "output_path": str(output_video_path),
+                "log_path": str(local_log),
+                "batch_id": batch_name,
+                "batch_index": i,
+                "completed_at": datetime.now(timezone.utc).isoformat(),
+            }
+
+            # Check if the output video exists
+            if not output_video_path.exists():
+                logger.warning("Output video not found for run {}: {}", run_id, output_video_path)
+            else:
+                logger.debug("Storing batch output for run {}: {}", run_id, outputs["output_path"])
+
+            # Check if control files exist with _0 suffix and add them
+            control_types = ["edge", "depth", "seg", "vis"]
+            found_controls = []
+            for control_type in control_types:
+                # Control files have _0 suffix in batch outputs
+                control_file = video_subdir / f"{control_type}_input_control_0.mp4"
+                if control_file.exists():
+                    outputs[f"{control_type}_control"] = str(control_file)
+                    found_controls.append(control_type)
+
+            if found_controls:
+                logger.debug(
+                    "Found control files for run {}: {}", run_id, ", ".join(found_controls)
                 )
-                for i, (run_dict, _) in enumerate(runs_and_prompts):
-                    run_id = run_dict["id"]
 
-                    # Files are in video_X subdirectories
-                    video_subdir = outputs_dir / f"video_{i}"
+            run_updates[run_id] = {"outputs": outputs, "status": "completed"}
 
-                    # Build outputs dictionary with paths in video_X subdirectory
-                    output_video_path = video_subdir / "output.mp4"
+        return run_updates
 
-                    outputs = {
-                        "output_path": str(output_video_path),
-                        "log_path": str(local_log),
-                        "batch_id": batch_name,
-                        "batch_index": i,
-                        "completed_at": datetime.now(timezone.utc).isoformat(),
-                    }
+    def resume_batch_runs(
+        self,
+        runs_and_prompts: list[tuple[dict[str, Any], dict[str, Any]]],
+        batch_name: str,
+        batch_size: int = 4,
+    ) -> dict[str, Any]:
+        """Finish an interrupted batch without redoing the videos that finished.
 
-                    # Check if the output video exists
-                    if not output_video_path.exists():
-                        logger.warning(
-                            "Output video not found for run {}: {}", run_id, output_video_path
-                        )
-                    else:
-                        logger.debug(
-                            "Storing batch output for run {}: {}", run_id, outputs["output_path"]
-                        )
+        Completed runs are skipped. For the others, the GPU host is checked for
+        ``video_N/output.mp4`` in the batch directory they last ran in: those
+        outputs are downloaded and their runs completed, and only the runs
+        without output run again, as a new batch ``<batch_name>_r<timestamp>``.
+        Each run's ``metadata`` records where it last ran (``batch_name``,
+        defaulting to the batch ID, and ``batch_index``).
 
-                    # Check if control files exist with _0 suffix and add them
-                    control_types = ["edge", "depth", "seg", "vis"]
-                    found_controls = []
-                    for control_type in control_types:
-                        # Control files have _0 suffix in batch outputs
-                        control_file = video_subdir / f"{control_type}_input_control_0.mp4"
-                        if control_file.exists():
-                            outputs[f"{control_type}_control"] = str(control_file)
-                            found_controls.append(control_type)
-
-                    if found_controls:
-                        logger.debug(
-                            "Found control files for run {}: {}", run_id, ", ".join(found_controls)
-                        )
+        Args:
+            runs_and_prompts: The batch's runs and prompts
+            batch_name: Name (ID) the batch was started with
+            batch_size: Number of videos to process simultaneously on GPU
 
-                    # Update run in database
-                    self.service.update_run(run_id, outputs=outputs)
-                    self.service.update_run_status(run_id, "completed")
-                    logger.info("Updated run {} with batch output paths", run_id)
+        Returns:
+            Batch result as from execute_batch_runs, plus ``resumed_runs``,
+            the number of runs whose outputs were recovered, and
+            ``recovered_run_ids``, their IDs
+        """
+        pending = [
+            (run, prompt) for run, prompt in runs_and_prompts if run["status"] != "completed"
+        ]
+        if not pending:
+            logger.info("Batch {} already finished", batch_name)
+            return {
+                "status": "success",
+                "batch_name": batch_name,
+                "run_count": 0,
+                "resumed_runs": 0,
+                "recovered_run_ids": [],
+            }
 
-                return {
-                    "status": "success",
-                    "batch_name": batch_name,
-                    "run_count": len(runs_and_prompts),
-                    "output_dir": str(batch_dir),
-                    "duration_seconds": batch_result.get("duration_seconds", 0),
-                }
+        self._initialize_services()
+        remote_config = self.config_manager.get_remote_config()
 
+        # Group the runs by the remote batch directory they last ran in
+        attempts: dict[str, list[tuple[int | None, dict[str, Any], dict[str, Any]]]] = {}
+        for run, prompt in pending:
+            metadata = run.get("metadata") or {}
+            attempt = metadata.get("batch_name", batch_name)
+            attempts.setdefault(attempt, []).append((metadata.get("batch_index"), run, prompt))
+
+        recovered: dict[str, dict[str, Any]] = {}
+        rerun: list[tuple[dict[str, Any], dict[str, Any]]] = []
+        try:
+            with current_stages().stage("download"), self.ssh_manager:
+                for attempt, entries in attempts.items():
+                    remote_output_dir = f"{remote_config.remote_dir}/outputs/{attempt}"
+                    files = self._finished_batch_videos(remote_output_dir)
+                    done = [
+                        (index, run, prompt) for index, run, prompt in entries if index in files
+                    ]
+                    rerun += [(run, prompt) for index, run, prompt in entries if index not in files]
+                    if not done:
+                        continue
+                    logger.info("Recovering {} finished video(s) of batch {}", len(done), attempt)
+                    batch_dir = Path("outputs") / attempt
+                    batch_dir.mkdir(parents=True, exist_ok=True)
+                    recovered.update(
+                        self._download_batch_outputs(
+                            attempt,
+                            batch_dir,
+                            [(run, prompt) for _, run, prompt in done],
+                            {
+                                "output_dir": remote_output_dir,
+                                "output_files": [f for index, _, _ in done for f in files[index]],
+                            },
+                            self.file_transfer,
+                            indices=[index for index, _, _ in done],
+                        )
+                    )
         except Exception as e:
-            logger.error("Batch execution failed: {}", e)
+            logger.error("Could not resume batch {}: {}", batch_name, e)
             return {
                 "status": "failed",
                 "batch_name": batch_name,
                 "error": str(e),
-                "started_at": datetime.now(timezone.utc).isoformat(),
+                "recovered_run_ids": [],
+            }
+
+        if recovered:
+            self.service.update_runs(recovered)
+
+        if not rerun:
+            return {
+                "status": "success",
+                "batch_name": batch_name,
+                "run_count": len(pending),
+                "resumed_runs": len(recovered),
+                "recovered_run_ids": list(recovered),
             }
 
+        # Record where each rerun goes before starting, so a second interruption resumes too
+        attempt = f"{batch_name}_r{int(time.time())}"
+        self.service.update_runs(
+            {
+                run["id"]: {
+                    "metadata": {
+                        **(run.get("metadata") or {}),
+                        "batch_name": attempt,
+                        "batch_index": index,
+                    }
+                }
+                for index, (run, _) in enumerate(rerun)
+            }
+        )
+        logger.info(
+            "Resuming batch {}: {} video(s) recovered, rerunning {} as {}",
+            batch_name,
+            len(recovered),
+            len(rerun),
+            attempt,
+        )
+        result = self.execute_batch_runs(rerun, batch_name=attempt, batch_size=batch_size)
+        result["resumed_runs"] = len(recovered)
+        result["recovered_run_ids"] = list(recovered)
+        return result
+
+    def _finished_batch_videos(self, remote_output_dir: str) -> dict[int, list[str]]:
+        """List the files of every video in a remote batch directory that has its output.
+
+        Args:
+            remote_output_dir: Remote batch output directory
+
+        Returns:
+            Mapping of batch index to the files in its ``video_N`` directory,
+            for videos whose ``output.mp4`` exists
+        """
+        _, stdout, _ = self.ssh_manager.execute_command(
+            f"find {shlex.quote(remote_output_dir)} -mindepth 2 -maxdepth 2 -type f "
+            "-path '*/video_*/*' 2>/dev/null || true",
+            stream_output=False,
+        )
+        files: dict[int, list[str]] = {}
+        for remote_file in filter(None, (line.strip() for line in stdout.splitlines())):
+            video_dir = Path(remote_file).parent.name
+            try:
+                index = int(video_dir.removeprefix("video_"))
+            except ValueError:
+                continue
+            files.setdefault(index, []).append(remote_file)
+        return {
+            index: video_files
+            for index, video_files in files.items()
+            if any(Path(f).name == "output.mp4" for f in video_files)
+        }
+
+    def _record_batch_execution(
+        self,
+        batch_name: str,
+        runs_and_prompts: list[tuple[dict[str, Any], dict[str, Any]]],
+        gpu_seconds: float,
+    ) -> None:
+        """Store a finished batch's GPU time for the smart batching cost model."""
+        if self.service is None:
+            return
+        try:
+            from cosmos_workflow.services.batch_cost_model import BatchCostModel, BatchFeatures
+
+            if self._batch_cost_model is None:
+                self._batch_cost_model = BatchCostModel(self.service.db)
+            configs = [run_dict.get("execution_config") or {} for run_dict, _ in runs_and_prompts]
+            features = BatchFeatures.from_runs(
+                [config.get("weights") or {} for config in configs], configs[0]
+            )
+            self._batch_cost_model.record(features, gpu_seconds, batch_name)
+        except Exception as e:
+            # Never fail a finished batch over its statistics
+            logger.warning("Could not record batch execution {}: {}", batch_name, e)
+
     # ========== Upsampling Methods ==========
 
     def execute_enhancement_run(
@@ -0,0 +1,148 @@
+"""Stage tracking for pipelined job execution.
+
+A GPU job runs in three stages: upload its inputs, run the container on the
+GPU, and download its outputs. Run sequentially, the GPU idles through every
+upload and download. The queue pipelines them instead:
+
+- Stage 1: while job N is on the GPU, the inputs of the next queued job are
+  uploaded to a staging area on the host over separate SSH channels
+  (``GPUExecutor.prefetch_inputs``), so job N+1 only moves them into place.
+- Stage 2: the GPU slot is handed back as soon as job N's container exits, so
+  job N+1 can start while N is still downloading.
+- Stage 3: job N's outputs are downloaded over their own channels, leaving
+  the host's main SSH manager to job N+1. Downloads that continue after the job
+  returns are registered with ``retrieving``, so the queue keeps the job until
+  they finish.
+
+``SimplifiedQueueService.execute_job`` activates a ``JobStages`` for the
+executing thread with ``track_stages``; ``GPUExecutor`` reports stage
+boundaries through ``current_stages()``, which is an inactive tracker outside
+the queue (direct CLI and API calls run the stages back to back as before).
+"""
+
+import threading
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future
+from contextlib import contextmanager
+
+from cosmos_workflow.utils.logging import logger
+
+STAGES = ("upload", "gpu", "download")
+
+_local = threading.local()
+
+
+class JobStages:
+    """Stage timings of one job and the hooks fired around its GPU stage."""
+
+    def __init__(
+        self,
+        on_gpu_start: Callable[[], None] | None = None,
+        on_gpu_done: Callable[[], None] | None = None,
+        active: bool = True,
+    ):
+        """Initialize the tracker.
+
+        Args:
+            on_gpu_start: Called once when the container starts (e.g. prefetch
+                the next job's inputs)
+            on_gpu_done: Called once when the container has exited (e.g.
+                release the GPU slot)
+            active: Whether a pipeline runs around this job; inactive trackers
+                only keep timings
+        """
+        self.on_gpu_start = on_gpu_start
+        self.on_gpu_done = on_gpu_done
+        self.active = active
+        self.seconds: dict[str, float] = dict.fromkeys(STAGES, 0.0)
+        self.gpu_idle_seconds: float | None = None
+        self.queued_at: float | None = None  # Epoch seconds the job was queued
+        self.retrievals: list[Future] = []  # Background output retrievals of the job
+        self._gpu_started = False
+        self._gpu_done = False
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time a stage; repeated stages of the same name add up.
+
+        Args:
+            name: "upload", "gpu" or "download"
+        """
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self.seconds[name] = self.seconds.get(name, 0.0) + time.monotonic() - started
+
+    def gpu_started(self) -> None:
+        """Mark the start of the GPU stage and fire on_gpu_start once."""
+        if self._gpu_started:
+            return
+        self._gpu_started = True
+        self._fire(self.on_gpu_start, "gpu start")
+
+    def gpu_done(self) -> None:
+        """Mark the end of the GPU stage and fire on_gpu_done once."""
+        if self._gpu_done:
+            return
+        self._gpu_done = True
+        self._fire(self.on_gpu_done, "gpu done")
+
+    def retrieving(self, future: Future) -> None:
+        """Register an output retrieval that continues after the job returns.
+
+        Args:
+            future: Resolves to True once the outputs are retrieved
+        """
+        self.retrievals.append(future)
+
+    @staticmethod
+    def _fire(hook: Callable[[], None] | None, name: str) -> None:
+        if hook is None:
+            return
+        try:
+            hook()
+        except Exception as e:
+            # Pipelining is an optimization; never fail the job over a hook
+            logger.warning("Job stage hook ({}) failed: {}", name, e)
+
+    def summary(self) -> dict[str, float | None]:
+        """Get the stage timings.
+
+        Returns:
+            Dict with upload_seconds, gpu_seconds, download_seconds and
+            gpu_idle_seconds (GPU idle time on the host before this job's
+            container started, None if unknown)
+        """
+        result: dict[str, float | None] = {
+            f"{name}_seconds": round(seconds, 3) for name, seconds in self.seconds.items()
+        }
+        result["gpu_idle_seconds"] = (
+            round(self.gpu_idle_seconds, 3) if self.gpu_idle_seconds is not None else None
+        )
+        return result
+
+
+def current_stages() -> JobStages:
+    """Get the tracker of the job executing on this thread (inactive if none)."""
+    stages = getattr(_local, "stages", None)
+    return stages if stages is not None else JobStages(active=False)
+
+
+@contextmanager
+def track_stages(stages: JobStages) -> Iterator[JobStages]:
+    """Make a tracker current for the job executing on this thread.
+
+    Args:
+        stages: Tracker receiving the job's stage boundaries
+
+    Yields:
+        The tracker
+    """
+    previous = getattr(_local, "stages", None)
+    _local.stages = stages
+    try:
+        yield stages
+    finally:
+        _local.stages = previous
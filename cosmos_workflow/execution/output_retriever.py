@@ -0,0 +1,159 @@
+"""Background retrieval of finished runs' outputs.
+
+Once a run's container has exited, what is left - downloading its videos,
+control files and logs, generating the thumbnail and recording the outputs in
+the database - needs the network, not the GPU. Under the queue,
+``GPUExecutor`` marks such runs ``downloading`` and hands that work to an
+``OutputRetriever`` instead of doing it on the job's thread, so the job (and
+its GPU slot) is done when the container exits.
+
+The retriever runs retrievals on its own small thread pool. A failed retrieval
+is retried with exponential backoff; downloads overwrite local files, so a
+retry simply starts over. After the last attempt the failure hook marks the
+runs failed.
+"""
+
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import wait as wait_futures
+from dataclasses import dataclass
+
+from cosmos_workflow.utils.logging import logger
+
+DEFAULT_WORKERS = 2
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """How often a failed retrieval is retried and how long to wait in between."""
+
+    attempts: int = 3
+    backoff_seconds: float = 5.0
+
+    def delay(self, attempt: int) -> float:
+        """Get the seconds to wait after a failed attempt.
+
+        Args:
+            attempt: Number of the failed attempt, starting at 1
+
+        Returns:
+            backoff_seconds, doubled for every earlier failed attempt
+        """
+        return self.backoff_seconds * 2 ** (attempt - 1)
+
+
+class OutputRetriever:
+    """Thread pool running output retrievals with retries."""
+
+    def __init__(self, policy: RetryPolicy | None = None, max_workers: int = DEFAULT_WORKERS):
+        """Initialize the retriever; threads start with the first retrieval.
+
+        Args:
+            policy: Retry policy (default: 3 attempts, 5 seconds backoff)
+            max_workers: Retrievals running at the same time
+        """
+        self.policy = policy or RetryPolicy()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="output-retrieval"
+        )
+        self._pending: dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def submit(
+        self,
+        name: str,
+        retrieve: Callable[[], None],
+        on_failure: Callable[[Exception], None] | None = None,
+    ) -> Future:
+        """Retrieve outputs in the background.
+
+        Args:
+            name: Run or batch the outputs belong to; a retrieval already
+                pending under this name is returned instead of starting another
+            retrieve: Downloads and records the outputs; raises on failure
+            on_failure: Called with the last error once every attempt failed
+
+        Returns:
+            Future resolving to True if the outputs were retrieved
+        """
+        with self._lock:
+            future = self._pending.get(name)
+            if future is not None and not future.done():
+                return future
+            future = self._executor.submit(self._retrieve, name, retrieve, on_failure)
+            self._pending[name] = future
+        future.add_done_callback(lambda done: self._forget(name, done))
+        return future
+
+    def _forget(self, name: str, future: Future) -> None:
+        with self._lock:
+            if self._pending.get(name) is future:
+                del self._pending[name]
+
+    def _retrieve(
+        self,
+        name: str,
+        retrieve: Callable[[], None],
+        on_failure: Callable[[Exception], None] | None,
+    ) -> bool:
+        attempts = max(self.policy.attempts, 1)
+        for attempt in range(1, attempts + 1):
+            started = time.monotonic()
+            try:
+                retrieve()
+            except Exception as e:
+                if attempt < attempts:
+                    delay = self.policy.delay(attempt)
+                    logger.warning(
+                        "Retrieving outputs of {} failed (attempt {}/{}), retrying in {}s: {}",
+                        name,
+                        attempt,
+                        attempts,
+                        delay,
+                        e,
+                    )
+                    time.sleep(delay)
+                    continue
+
+                logger.error("Could not retrieve outputs of {}: {}", name, e)
+                if on_failure is not None:
+                    try:
+                        on_failure(e)
+                    except Exception as hook_error:
+                        logger.error("Failure handler for {} failed: {}", name, hook_error)
+                return False
+
+            logger.info(
+                "Retrieved outputs of {} in {:.1f} seconds", name, time.monotonic() - started
+            )
+            return True
+        return False
+
+    def pending(self) -> list[str]:
+        """Get the names of retrievals that are queued or running."""
+        with self._lock:
+            return list(self._pending)
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Wait for every pending retrieval to finish.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            True if no retrieval is pending anymore
+        """
+        with self._lock:
+            futures = list(self._pending.values())
+        _, not_done = wait_futures(futures, timeout=timeout)
+        return not not_done
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop accepting retrievals.
+
+        Args:
+            wait: Wait for pending retrievals to finish
+        """
+        self._executor.shutdown(wait=wait)
@@ -0,0 +1,256 @@
+"""GPU time model for smart batching, calibrated on measured batch executions.
+
+A batch inference loads the model once and then denoises every run with every
+control in the union of the batch's active controls (the base controlnet spec
+includes all of them). Its GPU time is modelled as
+
+    seconds = startup
+              + per_run * run_units
+              + per_control_run * run_units * controls
+              + per_mix_run * run_units * (control_sets - 1)
+
+where ``run_units`` is the run count scaled by inference steps and frames
+relative to the queue defaults, ``controls`` the size of the control union and
+``control_sets`` the number of distinct control combinations mixed into the
+batch. The last term measures any cost of mixing beyond the extra controls and
+starts at zero. A job that runs on its own pays the same formula for its runs.
+
+Coefficients are fitted with the ridge fit of the duration estimator, starting
+from a prior where one run with two controls takes the former 120 seconds.
+Every ``GPUExecutor.execute_batch_runs`` stores its GPU time in
+``batch_executions``; models pick new rows up at most every
+``REFRESH_SECONDS``.
+"""
+
+import threading
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from cosmos_workflow.database.models import BatchExecution
+from cosmos_workflow.services.duration_estimator import (
+    HISTORY_LIMIT,
+    REFERENCE_FRAMES,
+    REFERENCE_STEPS,
+    RunningFit,
+)
+from cosmos_workflow.utils.logging import logger
+from cosmos_workflow.utils.smart_batching import get_run_weights
+from cosmos_workflow.utils.workflow_utils import positive_int
+
+if TYPE_CHECKING:
+    from cosmos_workflow.database import DatabaseConnection
+    from cosmos_workflow.database.models import JobQueue
+
+# Prior seconds (startup, per run, per run and control, per run and extra control set)
+PRIOR_SECONDS = (30.0, 60.0, 15.0, 0.0)
+# Minimum interval between reads of new batch executions
+REFRESH_SECONDS = 60.0
+
+
+@dataclass(frozen=True)
+class BatchFeatures:
+    """The properties of a batch execution that drive its GPU time."""
+
+    run_count: int
+    controls: tuple[str, ...] = ()
+    control_sets: int = 1
+    num_steps: int | None = None
+    num_frames: int | None = None
+
+    @classmethod
+    def from_runs(
+        cls, weights_list: Iterable[dict[str, Any]], config: dict[str, Any] | None = None
+    ) -> "BatchFeatures":
+        """Extract features from per-run weights and shared execution parameters.
+
+        Args:
+            weights_list: Control weights of each run in the batch
+            config: Shared execution parameters (num_steps and num_frames are
+                used if set)
+
+        Returns:
+            BatchFeatures for one execution of those runs
+        """
+        config = config or {}
+        signatures = [
+            tuple(sorted(control for control, weight in weights.items() if weight > 0))
+            for weights in weights_list
+        ]
+        return cls(
+            run_count=max(len(signatures), 1),
+            controls=tuple(sorted({control for sig in signatures for control in sig})),
+            control_sets=max(len(set(signatures)), 1),
+            num_steps=positive_int(config.get("num_steps")),
+            num_frames=positive_int(config.get("num_frames")),
+        )
+
+    def vector(self) -> tuple[float, float, float, float]:
+        """Get the model inputs (1, run units, run units x controls, run units x extra sets)."""
+        units = float(self.run_count)
+        if self.num_steps:
+            units *= self.num_steps / REFERENCE_STEPS
+        if self.num_frames:
+            units *= self.num_frames / REFERENCE_FRAMES
+        return 1.0, units, units * len(self.controls), units * (self.control_sets - 1)
+
+
+def batch_features(batch: dict[str, Any]) -> BatchFeatures:
+    """Get the features of a planned batch from the smart batching grouping."""
+    config = batch.get("config") or {}
+    weights_list = list(config.get("weights_list", []))
+    # Runs without an entry in weights_list use no controls
+    weights_list += [{}] * (len(batch["prompt_ids"]) - len(weights_list))
+    return BatchFeatures.from_runs(weights_list, config)
+
+
+def job_features(job: "JobQueue") -> BatchFeatures:
+    """Get the features of running a queued inference job on its own."""
+    return BatchFeatures.from_runs(get_run_weights(job), job.config)
+
+
+class BatchCostModel:
+    """Predicted GPU time of batch executions, fitted on measured batches."""
+
+    def __init__(
+        self,
+        db_connection: "DatabaseConnection | None" = None,
+        history_limit: int = HISTORY_LIMIT,
+        prior: tuple[float, float, float, float] = PRIOR_SECONDS,
+    ):
+        """Initialize the model without reading the database.
+
+        Args:
+            db_connection: Database holding the batch execution log (None keeps
+                the model in memory only)
+            history_limit: Most recent executions to learn from on first use
+            prior: Coefficients before any measurement (see PRIOR_SECONDS)
+        """
+        self.db_connection = db_connection
+        self.history_limit = history_limit
+        self._fit = RunningFit(prior)
+        self._last_id: int | None = None
+        self._next_refresh = 0.0
+        self._lock = threading.Lock()
+
+    def _refresh(self) -> None:
+        """Replay executions stored since the last read (throttled)."""
+        if self.db_connection is None or time.monotonic() < self._next_refresh:
+            return
+        self._next_refresh = time.monotonic() + REFRESH_SECONDS
+        try:
+            with self.db_connection.get_session() as session:
+                query = session.query(BatchExecution).order_by(BatchExecution.id.desc())
+                if self._last_id is not None:
+                    query = query.filter(BatchExecution.id > self._last_id)
+                rows = query.limit(self.history_limit).all()
+                for row in reversed(rows):
+                    features = BatchFeatures(
+                        run_count=row.run_count,
+                        controls=tuple(row.controls or ()),
+                        control_sets=row.control_sets,
+                        num_steps=row.num_steps,
+                        num_frames=row.num_frames,
+                    )
+                    self._fit.add(features.vector(), row.duration_seconds)
+                if rows:
+                    self._last_id = rows[0].id
+                elif self._last_id is None:
+                    self._last_id = 0
+        except Exception as e:
+            # Predictions fall back to what is already fitted
+            logger.warning("Could not load batch execution history: {}", e)
+            return
+
+        if rows:
+            logger.debug("Batch cost model learned from {} executions", len(rows))
+
+    # ========== Learning ==========
+
+    def observe(self, features: BatchFeatures, duration_seconds: float) -> None:
+        """Update the model with a measured batch without storing it.
+
+        Args:
+            features: The batch's features
+            duration_seconds: Measured GPU time
+        """
+        if duration_seconds <= 0:
+            return
+        with self._lock:
+            self._fit.add(features.vector(), duration_seconds)
+
+    def record(self, features: BatchFeatures, duration_seconds: float, batch_name: str) -> None:
+        """Store a measured batch execution and update the model.
+
+        Models in other processes pick the row up on their next refresh.
+
+        Args:
+            features: The batch's features
+            duration_seconds: Measured GPU time
+            batch_name: Name of the batch
+        """
+        if duration_seconds <= 0:
+            return
+        if self.db_connection is None:
+            self.observe(features, duration_seconds)
+            return
+
+        with self.db_connection.get_session() as session:
+            session.add(
+                BatchExecution(
+                    batch_name=batch_name,
+                    run_count=features.run_count,
+                    controls=list(features.controls),
+                    control_sets=features.control_sets,
+                    num_steps=features.num_steps,
+                    num_frames=features.num_frames,
+                    duration_seconds=duration_seconds,
+                )
+            )
+            session.commit()
+        with self._lock:
+            # Replay the new row (and any others stored since the last read)
+            self._next_refresh = 0.0
+            self._refresh()
+
+    # ========== Predictions ==========
+
+    def estimate(self, features: BatchFeatures) -> float:
+        """Predict the GPU time of one execution.
+
+        Args:
+            features: Execution features
+
+        Returns:
+            Predicted seconds
+        """
+        with self._lock:
+            self._refresh()
+            return self._fit.predict(features.vector())
+
+    def estimate_batch(self, batch: dict[str, Any]) -> float:
+        """Predict the GPU time of a planned batch (``prompt_ids`` and ``config``)."""
+        return self.estimate(batch_features(batch))
+
+    def estimate_job(self, job: "JobQueue") -> float:
+        """Predict the GPU time of running a queued inference job as it is."""
+        return self.estimate(job_features(job))
+
+    def summary(self) -> dict[str, float]:
+        """Get the fitted coefficients.
+
+        Returns:
+            Dict with observations and the seconds for startup, per run, per
+            run and control, and per run and extra control set
+        """
+        with self._lock:
+            self._refresh()
+            startup, per_run, per_control, per_mix = self._fit.weights()
+            return {
+                "observations": self._fit.count,
+                "startup_seconds": round(startup, 1),
+                "seconds_per_run": round(per_run, 1),
+                "seconds_per_control_run": round(per_control, 1),
+                "seconds_per_mixed_run": round(per_mix, 1),
+            }
@@ -6,19 +6,42 @@ flexible database schema.
 """
 
 import uuid
+from collections.abc import Iterator
+from datetime import datetime, timezone
 from typing import Any
 
+from sqlalchemy import and_, case, exists, func, or_, select, tuple_
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import joinedload
 
 from cosmos_workflow.config.config_manager import ConfigManager
 from cosmos_workflow.database import DatabaseConnection
 from cosmos_workflow.database.models import Prompt, Run
+from cosmos_workflow.database.search import build_match_query, prompt_search_match, prompts_fts
 from cosmos_workflow.utils.logging import logger
 
 # Supported AI model types
 SUPPORTED_MODEL_TYPES = {"transfer", "reason", "predict", "enhance", "upscale"}
 MAX_PROMPT_LENGTH = 10000
+# Run statuses; "downloading" runs have finished on the GPU and are fetching outputs
+RUN_STATUSES = ("pending", "running", "downloading", "completed", "failed")
+# Separates created_at and ID in a keyset cursor (IDs never contain it)
+CURSOR_SEPARATOR = "|"
+
+
+def keyset_cursor(row: dict[str, Any]) -> str:
+    """Build the keyset cursor that continues a listing after a prompt or run.
+
+    The cursor carries the row's ``created_at`` and ID, so the next page can
+    be fetched even if that row is deleted in the meantime.
+
+    Args:
+        row: Prompt or run dictionary with ``id`` and ``created_at``
+
+    Returns:
+        Cursor to pass as ``after`` to list_prompts, list_runs and friends
+    """
+    return f"{row['created_at']}{CURSOR_SEPARATOR}{row['id']}"
 
 
 class PromptNotFoundError(ValueError):
@@ -140,57 +163,18 @@ class DataRepository:
         if execution_config is None:
             raise ValueError("execution_config cannot be None")
 
-        if metadata is None:
-            metadata = {}
-
         with self.db.get_session() as session:
             # Check prompt exists
             prompt = session.query(Prompt).filter_by(id=prompt_id).first()
             if not prompt:
                 raise PromptNotFoundError(f"Prompt not found: {prompt_id}")
 
-            # Generate run ID
-            run_id = self._generate_run_id()
-
-            # Validate model_type
-            if model_type not in SUPPORTED_MODEL_TYPES:
-                raise ValueError(
-                    f"Invalid model_type '{model_type}'. Must be one of: {SUPPORTED_MODEL_TYPES}"
-                )
-
-            # Set log path based on whether this is a batch run
-            if metadata and metadata.get("batch_id"):
-                batch_id = metadata["batch_id"]
-                log_path = f"outputs/{batch_id}/batch_run.log"
-            else:
-                log_path = f"outputs/run_{run_id}/logs/{run_id}.log"
-
-            # Create run
-            run = Run(
-                id=run_id,
-                prompt_id=prompt_id,
-                model_type=model_type,
-                status=initial_status,
-                execution_config=execution_config,
-                outputs={},  # Empty initially
-                run_metadata=metadata,
-                log_path=log_path,  # Use appropriate log path
-            )
+            run = self._new_run(prompt_id, execution_config, metadata, initial_status, model_type)
             session.add(run)
             session.flush()  # Flush to get created_at populated
 
             # Extract data after flush but before commit for transaction safety
-            result = {
-                "id": run.id,
-                "prompt_id": run.prompt_id,
-                "model_type": run.model_type,
-                "status": run.status,
-                "execution_config": run.execution_config,
-                "outputs": run.outputs,
-                "metadata": run.run_metadata,
-                "created_at": run.created_at.isoformat(),
-                "log_path": run.log_path,  # Include log path in result
-            }
+            result = self._new_run_to_dict(run)
 
             session.commit()
             logger.info(
@@ -201,6 +185,117 @@ class DataRepository:
             )
             return result
 
+    def create_runs(self, runs: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Create several runs in a single transaction.
+
+        Each entry takes the same keys as the ``create_run`` arguments
+        (``prompt_id``, ``execution_config``, and optionally ``metadata``,
+        ``initial_status``, ``model_type``). Either every run is created or,
+        if any entry is invalid, none are.
+
+        Args:
+            runs: Run specifications
+
+        Returns:
+            Created run dictionaries, in input order
+
+        Raises:
+            ValueError: If an entry is invalid or references a missing prompt
+        """
+        if not runs:
+            return []
+
+        for spec in runs:
+            if spec.get("prompt_id") is None:
+                raise ValueError("prompt_id is required")
+            if spec.get("execution_config") is None:
+                raise ValueError("execution_config cannot be None")
+
+        logger.info("Creating {} runs", len(runs))
+
+        with self.db.get_session() as session:
+            prompt_ids = {spec["prompt_id"] for spec in runs}
+            found = {row.id for row in session.query(Prompt.id).filter(Prompt.id.in_(prompt_ids))}
+            missing = prompt_ids - found
+            if missing:
+                raise PromptNotFoundError(f"Prompt not found: {', '.join(sorted(missing))}")
+
+            new_runs = [
+                self._new_run(
+                    spec["prompt_id"],
+                    spec["execution_config"],
+                    spec.get("metadata"),
+                    spec.get("initial_status", "pending"),
+                    spec.get("model_type", "transfer"),
+                )
+                for spec in runs
+            ]
+            session.add_all(new_runs)
+            session.flush()  # Flush to get created_at populated
+
+            results = [self._new_run_to_dict(run) for run in new_runs]
+            session.commit()
+            logger.info("Created {} runs", len(results))
+            return results
+
+    def _new_run(
+        self,
+        prompt_id: str,
+        execution_config: dict[str, Any],
+        metadata: dict[str, Any] | None,
+        initial_status: str,
+        model_type: str,
+    ) -> Run:
+        """Build an unsaved Run with a fresh ID and its log path.
+
+        Raises:
+            ValueError: If model_type is not supported
+        """
+        if metadata is None:
+            metadata = {}
+
+        # Generate run ID
+        run_id = self._generate_run_id()
+
+        # Validate model_type
+        if model_type not in SUPPORTED_MODEL_TYPES:
+            raise ValueError(
+                f"Invalid model_type '{model_type}'. Must be one of: {SUPPORTED_MODEL_TYPES}"
+            )
+
+        # Set log path based on whether this is a batch run
+        if metadata and metadata.get("batch_id"):
+            batch_id = metadata["batch_id"]
+            log_path = f"outputs/{batch_id}/batch_run.log"
+        else:
+            log_path = f"outputs/run_{run_id}/logs/{run_id}.log"
+
+        return Run(
+            id=run_id,
+            prompt_id=prompt_id,
+            model_type=model_type,
+            status=initial_status,
+            execution_config=execution_config,
+            outputs={},  # Empty initially
+            run_metadata=metadata,
+            log_path=log_path,  # Use appropriate log path
+        )
+
+    @staticmethod
+    def _new_run_to_dict(run: Run) -> dict[str, Any]:
+        """Convert a freshly created Run to the dictionary returned by create_run."""
+        return {
+            "id": run.id,
+            "prompt_id": run.prompt_id,
+            "model_type": run.model_type,
+            "status": run.status,
+            "execution_config": run.execution_config,
+            "outputs": run.outputs,
+            "metadata": run.run_metadata,
+            "created_at": run.created_at.isoformat(),
+            "log_path": run.log_path,  # Include log path in result
+        }
+
     def get_prompt(self, prompt_id: str) -> dict[str, Any] | None:
         """Retrieve a prompt by ID.
 
@@ -233,6 +328,33 @@ class DataRepository:
                 "created_at": prompt.created_at.isoformat(),
             }
 
+    def get_prompts(self, prompt_ids: list[str]) -> dict[str, dict[str, Any]]:
+        """Retrieve several prompts with one query.
+
+        Args:
+            prompt_ids: Prompt IDs to retrieve (duplicates are fine)
+
+        Returns:
+            Mapping of prompt ID to prompt data; IDs that do not exist are omitted
+        """
+        if not prompt_ids:
+            return {}
+
+        logger.debug("Retrieving {} prompts", len(prompt_ids))
+
+        with self.db.get_session() as session:
+            prompts = session.query(Prompt).filter(Prompt.id.in_(set(prompt_ids))).all()
+            return {
+                prompt.id: {
+                    "id": prompt.id,
+                    "prompt_text": prompt.prompt_text,
+                    "inputs": prompt.inputs,
+                    "parameters": prompt.parameters,
+                    "created_at": prompt.created_at.isoformat(),
+                }
+                for prompt in prompts
+            }
+
     def get_run(self, run_id: str) -> dict[str, Any] | None:
         """Retrieve a run by ID.
 
@@ -340,10 +462,7 @@ class DataRepository:
             raise ValueError("run_id is required")
         if not run_id or run_id.isspace():
             raise ValueError("run_id cannot be empty")
-        if status not in {"pending", "running", "completed", "failed"}:
-            raise ValueError(
-                f"Invalid status: {status}. Must be one of pending, running, completed, failed"
-            )
+        self._validate_status(status)
 
         logger.info("Updating run status for id={} to {}", run_id, status)
 
@@ -352,15 +471,7 @@ class DataRepository:
             if not run:
                 return None
 
-            run.status = status
-
-            # Set timestamps based on status
-            from datetime import datetime, timezone
-
-            if status == "running" and run.started_at is None:
-                run.started_at = datetime.now(timezone.utc)
-            elif status in {"completed", "failed"} and run.completed_at is None:
-                run.completed_at = datetime.now(timezone.utc)
+            self._apply_status(run, status)
 
             session.flush()  # Flush to ensure updated_at is set
             result = self._run_to_dict(run)
@@ -386,19 +497,7 @@ class DataRepository:
         if not run_id or run_id.isspace():
             raise ValueError("run_id cannot be empty")
 
-        # Validate allowed fields (now includes log_path, error_message, and rating)
-        allowed_fields = {
-            "outputs",
-            "metadata",
-            "execution_config",
-            "run_metadata",
-            "log_path",
-            "error_message",
-            "rating",
-        }
-        invalid_fields = set(kwargs.keys()) - allowed_fields
-        if invalid_fields:
-            raise ValueError(f"Invalid fields: {invalid_fields}. Allowed: {allowed_fields}")
+        self._validate_run_fields(kwargs)
 
         logger.info("Updating run id={} with fields: {}", run_id, list(kwargs.keys()))
 
@@ -407,28 +506,7 @@ class DataRepository:
             if not run:
                 return None
 
-            # Update fields with special handling
-            for key, value in kwargs.items():
-                if key == "metadata":
-                    key = "run_metadata"  # Map to correct column name
-                elif key == "error_message":
-                    # Truncate error messages if too long
-                    value = value[:1000] if value else value
-                    # Also set status to failed when error_message is provided
-                    if value:
-                        run.status = "failed"
-                        # Set completed timestamp if not already set
-                        from datetime import datetime, timezone
-
-                        if run.completed_at is None:
-                            run.completed_at = datetime.now(timezone.utc)
-                elif key == "rating":
-                    # Validate rating is between 1-5 or None
-                    if value is not None and (not isinstance(value, int) or value < 1 or value > 5):
-                        raise ValueError(
-                            f"Rating must be an integer between 1-5 or None, got: {value}"
-                        )
-                setattr(run, key, value)
+            self._apply_run_fields(run, kwargs)
 
             session.flush()  # Flush to ensure updated_at is set
             result = self._run_to_dict(run)
@@ -441,6 +519,109 @@ class DataRepository:
                 logger.info("Updated run {}", run_id)
             return result
 
+    def update_runs(self, updates: dict[str, dict[str, Any]]) -> list[dict[str, Any]]:
+        """Update several runs in a single transaction.
+
+        Each value takes the fields accepted by ``update_run`` plus an optional
+        ``status`` (applied as ``update_run_status`` would). All updates are
+        validated before any are written.
+
+        Args:
+            updates: Mapping of run ID to the fields to update
+
+        Returns:
+            Updated run dictionaries; runs that do not exist are skipped
+
+        Raises:
+            ValueError: If a status or field is invalid
+        """
+        if not updates:
+            return []
+
+        for fields in updates.values():
+            fields = dict(fields)
+            if "status" in fields:
+                self._validate_status(fields.pop("status"))
+            self._validate_run_fields(fields)
+
+        logger.info("Updating {} runs", len(updates))
+
+        with self.db.get_session() as session:
+            runs = session.query(Run).filter(Run.id.in_(updates.keys())).all()
+            for run in runs:
+                fields = dict(updates[run.id])
+                status = fields.pop("status", None)
+                self._apply_run_fields(run, fields)
+                if status is not None:
+                    self._apply_status(run, status)
+
+            session.flush()  # Flush to ensure updated_at is set
+            results = [self._run_to_dict(run) for run in runs]
+            session.commit()
+
+        missing = len(updates) - len(results)
+        if missing:
+            logger.warning("{} of {} runs to update were not found", missing, len(updates))
+        logger.info("Updated {} runs", len(results))
+        return results
+
+    @staticmethod
+    def _validate_status(status: str) -> None:
+        """Raise ValueError unless status is a valid run status."""
+        if status not in RUN_STATUSES:
+            raise ValueError(f"Invalid status: {status}. Must be one of {', '.join(RUN_STATUSES)}")
+
+    @staticmethod
+    def _apply_status(run: Run, status: str) -> None:
+        """Set a run's status and its started/completed timestamps."""
+        run.status = status
+
+        # Set timestamps based on status
+        if status == "running" and run.started_at is None:
+            run.started_at = datetime.now(timezone.utc)
+        elif status in {"completed", "failed"} and run.completed_at is None:
+            run.completed_at = datetime.now(timezone.utc)
+
+    @staticmethod
+    def _validate_run_fields(fields: dict[str, Any]) -> None:
+        """Raise ValueError if fields contains anything update_run does not accept."""
+        # Validate allowed fields (now includes log_path, error_message, and rating)
+        allowed_fields = {
+            "outputs",
+            "metadata",
+            "execution_config",
+            "run_metadata",
+            "log_path",
+            "error_message",
+            "rating",
+        }
+        invalid_fields = set(fields.keys()) - allowed_fields
+        if invalid_fields:
+            raise ValueError(f"Invalid fields: {invalid_fields}. Allowed: {allowed_fields}")
+
+        rating = fields.get("rating")
+        # Validate rating is between 1-5 or None
+        if rating is not None and (not isinstance(rating, int) or rating < 1 or rating > 5):
+            raise ValueError(f"Rating must be an integer between 1-5 or None, got: {rating}")
+
+    @staticmethod
+    def _apply_run_fields(run: Run, fields: dict[str, Any]) -> None:
+        """Apply validated update_run fields to a run."""
+        # Update fields with special handling
+        for key, value in fields.items():
+            if key == "metadata":
+                key = "run_metadata"  # Map to correct column name
+            elif key == "error_message":
+                # Truncate error messages if too long
+                value = value[:1000] if value else value
+                # Also set status to failed when error_message is provided
+                if value:
+                    run.status = "failed"
+                    # Set completed timestamp if not already set
+                    if run.completed_at is None:
+                        run.completed_at = datetime.now(timezone.utc)
+            setattr(run, key, value)
+
     @staticmethod
     def _generate_run_id() -> str:
         """Generate unique ID for a run using UUID4.
@@ -452,24 +633,44 @@ class DataRepository:
         unique_id = str(uuid.uuid4()).replace("-", "")[:32]
         return f"rs_{unique_id}"
 
-    def list_prompts(self, limit: int = 50, offset: int = 0) -> list[dict[str, Any]]:
-        """List prompts with pagination.
+    def list_prompts(
+        self,
+        limit: int = 50,
+        offset: int = 0,
+        after: str | None = None,
+        **filters: Any,
+    ) -> list[dict[str, Any]]:
+        """List prompts with optional filtering and pagination, newest first.
+
+        Pass ``keyset_cursor()`` of the last prompt of a page (or just its ID)
+        as ``after`` to get the next page. Unlike ``offset``, this keyset cursor
+        on (created_at, id) costs the same at any depth and is stable while new
+        prompts are added. All filters run in SQL, so every page is full while
+        more matching prompts exist.
 
         Args:
             limit: Maximum number of results to return (default: 50)
             offset: Number of results to skip (default: 0)
+            after: Only prompts listed after this cursor or prompt ID
+            **filters: enhanced, has_runs, created_after, created_before
+                (see _apply_prompt_filters)
 
         Returns:
             List of prompt dictionaries
+
+        Raises:
+            ValueError: If ``after`` is a prompt ID that does not exist
         """
-        logger.debug("Listing prompts with limit=%s, offset=%s", limit, offset)
+        logger.debug("Listing prompts with limit=%s, offset=%s, after=%s", limit, offset, after)
 
         try:
             with self.db.get_session() as session:
-                query = session.query(Prompt)
+                query = self._apply_prompt_filters(session.query(Prompt), **filters)
+                if after:
+                    query = self._apply_keyset(session, query, Prompt, after)
 
-                # Order by created_at descending (newest first)
-                query = query.order_by(Prompt.created_at.desc())
+                # Order by created_at descending (newest first), ID breaks ties
+                query = query.order_by(Prompt.created_at.desc(), Prompt.id.desc())
 
                 # Apply pagination
                 prompts = query.limit(limit).offset(offset).all()
@@ -492,6 +693,238 @@ class DataRepository:
             logger.error("Error listing prompts: {}", e)
             return []
 
+    def iter_prompts(
+        self, batch_size: int = 500, after: str | None = None, **filters: Any
+    ) -> Iterator[dict[str, Any]]:
+        """Stream all prompts, newest first, one keyset page at a time.
+
+        Each page is read in its own short session, so consumers can process
+        rows as they arrive without holding a read transaction open.
+
+        Args:
+            batch_size: Prompts fetched per query (default: 500)
+            after: Start after this cursor or prompt ID (default: from the newest)
+            **filters: Same filters as list_prompts
+
+        Yields:
+            Prompt dictionaries, as returned by list_prompts
+        """
+        while True:
+            page = self.list_prompts(limit=batch_size, after=after, **filters)
+            yield from page
+            if len(page) < batch_size:
+                return
+            after = keyset_cursor(page[-1])
+
+    @staticmethod
+    def _apply_prompt_filters(
+        query,
+        enhanced: bool | None = None,
+        has_runs: bool | None = None,
+        created_after: datetime | None = None,
+        created_before: datetime | None = None,
+    ):
+        """Apply list_prompts filters to a query over Prompt.
+
+        Args:
+            query: Query selecting from Prompt
+            enhanced: Only enhanced (True) or only not enhanced (False) prompts
+            has_runs: Only prompts with (True) or without (False) runs
+            created_after: Only prompts created at or after this time
+            created_before: Only prompts created before this time
+
+        Returns:
+            Filtered query
+        """
+        if enhanced is not None:
+            query = query.filter(Prompt.enhanced.is_(bool(enhanced)))
+        if has_runs is not None:
+            with_runs = exists().where(Run.prompt_id == Prompt.id)
+            query = query.filter(with_runs if has_runs else ~with_runs)
+        if created_after is not None:
+            query = query.filter(Prompt.created_at >= created_after)
+        if created_before is not None:
+            query = query.filter(Prompt.created_at < created_before)
+        return query
+
+    @staticmethod
+    def _apply_keyset(session, query, model, after: str):
+        """Restrict a newest-first query to rows after the given cursor.
+
+        Args:
+            session: Active database session
+            query: Query over ``model`` ordered by (created_at, id) descending
+            model: Prompt or Run
+            after: ``keyset_cursor()`` or ID of the last row of the previous page
+
+        Returns:
+            Filtered query
+
+        Raises:
+            ValueError: If ``after`` is a plain ID and no row has it
+        """
+        created_at, _, row_id = after.rpartition(CURSOR_SEPARATOR)
+        anchor_exists = session.query(model.id).filter(model.id == row_id).scalar() is not None
+        if anchor_exists:
+            # Compare against the stored value in SQL rather than a round-tripped datetime
+            anchor_created_at = select(model.created_at).where(model.id == row_id).scalar_subquery()
+        elif created_at:
+            # The row was deleted; the cursor still knows where it was
+            try:
+                anchor_created_at = datetime.fromisoformat(created_at)
+            except ValueError as e:
+                raise ValueError(f"Invalid cursor: {after}") from e
+        else:
+            raise ValueError(f"Cursor not found: {after}")
+        return query.filter(tuple_(model.created_at, model.id) < tuple_(anchor_created_at, row_id))
+
+    @staticmethod
+    def _like_pattern(text: str) -> str:
+        """Build a case-insensitive substring pattern for ``ilike(..., escape="\\")``."""
+        # Escape backslash first, then the % and _ wildcards, so text matches literally
+        escaped = text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        return f"%{escaped}%"
+
+    def _matching_prompt_ids(self, search: str):
+        """Select IDs of prompts matching search text.
+
+        Uses the FTS5 index when available, otherwise a substring match on
+        prompt text (also used for queries with no searchable words, e.g. "%").
+
+        Args:
+            search: Raw search text
+
+        Returns:
+            Selectable of matching prompt IDs, for use with ``in_()``
+        """
+        match_query = build_match_query(search) if self.db.prompt_search_enabled else None
+        if match_query:
+            return select(prompts_fts.c.prompt_id).where(prompt_search_match(match_query))
+        return select(Prompt.id).where(
+            Prompt.prompt_text.ilike(self._like_pattern(search.strip()), escape="\\")
+        )
+
+    def _apply_run_filters(
+        self,
+        session,
+        query,
+        status: str | None = None,
+        prompt_id: str | None = None,
+        version_filter: str | None = None,
+        prompt_ids: list[str] | None = None,
+        model_type: str | None = None,
+        created_after: datetime | None = None,
+        created_before: datetime | None = None,
+        min_rating: int | None = None,
+        unrated: bool = False,
+        search: str | None = None,
+        batch_id: str | None = None,
+    ):
+        """Apply list_runs filters to a query over Run.
+
+        Each filter is applied with its own ``filter()`` call and only when set.
+
+        Args:
+            session: Active database session (for subqueries)
+            query: Query selecting from Run
+            status: Optional filter by status
+            prompt_id: Optional filter by prompt ID
+            version_filter: Optional version filter ('all', 'not upscaled', 'upscaled')
+            prompt_ids: Optional filter by any of several prompt IDs
+            model_type: Optional filter by model type
+            created_after: Only runs created at or after this time
+            created_before: Only runs created before this time
+            min_rating: Only runs rated at least this value
+            unrated: Only runs without a rating
+            search: Substring of the run ID, or full-text match on the prompt
+                (see search_prompts for the query syntax)
+            batch_id: Only runs of this batch
+
+        Returns:
+            Filtered query
+        """
+        if status:
+            query = query.filter(Run.status == status)
+        if prompt_id:
+            query = query.filter(Run.prompt_id == prompt_id)
+        if prompt_ids:
+            query = query.filter(Run.prompt_id.in_(prompt_ids))
+        if model_type:
+            query = query.filter(Run.model_type == model_type)
+        if batch_id:
+            query = query.filter(Run.batch_id == batch_id)
+        if created_after is not None:
+            query = query.filter(Run.created_at >= created_after)
+        if created_before is not None:
+            query = query.filter(Run.created_at < created_before)
+        if min_rating is not None:
+            query = query.filter(Run.rating >= min_rating)
+        if unrated:
+            query = query.filter(Run.rating.is_(None))
+        if search and search.strip():
+            pattern = self._like_pattern(search.strip())
+            query = query.filter(
+                or_(
+                    Run.id.ilike(pattern, escape="\\"),
+                    Run.prompt_id.in_(self._matching_prompt_ids(search)),
+                )
+            )
+
+        # Apply version filter for transfer runs
+        if version_filter == "not upscaled":
+            # Only transfer runs WITHOUT upscaled versions
+            from sqlalchemy import and_, not_
+
+            # Subquery to get source_run_ids of completed upscaled runs
+            upscaled_sources = (
+                session.query(Run.source_run_id)
+                .filter(
+                    and_(
+                        Run.model_type == "upscale",
+                        Run.status == "completed",
+                        Run.source_run_id.isnot(None),
+                    )
+                )
+                .subquery()
+            )
+
+            # Only show transfer runs that are NOT in the upscaled sources
+            query = query.filter(not_(Run.id.in_(upscaled_sources)))
+
+        elif version_filter == "upscaled":
+            # Only transfer runs WITH upscaled versions
+            from sqlalchemy import and_
+
+            # Subquery to get source_run_ids of completed upscaled runs
+            upscaled_sources = (
+                session.query(Run.source_run_id)
+                .filter(and_(Run.model_type == "upscale", Run.status == "completed"))
+                .subquery()
+            )
+
+            # Only show transfer runs that ARE in the upscaled sources
+            query = query.filter(Run.id.in_(upscaled_sources))
+
+        # version_filter == "all" or None: no additional filtering
+        return query
+
+    @staticmethod
+    def _run_list_item(run: Run) -> dict[str, Any]:
+        """Convert a Run to the dict shape returned by run listings."""
+        return {
+            "id": run.id,
+            "prompt_id": run.prompt_id,
+            "model_type": run.model_type,
+            "status": run.status,
+            "execution_config": run.execution_config,
+            "outputs": run.outputs,
+            "metadata": run.run_metadata,
+            "created_at": run.created_at.isoformat(),
+            "started_at": run.started_at.isoformat() if run.started_at else None,
+            "completed_at": run.completed_at.isoformat() if run.completed_at else None,
+            "rating": run.rating,  # Include the rating field
+        }
+
     def list_runs(
         self,
         status: str | None = None,
@@ -499,71 +932,58 @@ class DataRepository:
         limit: int = 50,
         offset: int = 0,
         version_filter: str | None = None,
+        after: str | None = None,
+        **filters: Any,
     ) -> list[dict[str, Any]]:
-        """List runs with optional filtering and pagination.
+        """List runs with optional filtering and pagination, newest first.
+
+        All filters run in SQL, so results are correct across the whole history.
+        Pass ``keyset_cursor()`` of the last run of a page (or just its ID) as
+        ``after`` to get the next page (keyset on (created_at, id), constant
+        cost at any depth).
 
         Args:
             status: Optional filter by status
             prompt_id: Optional filter by prompt ID
             limit: Maximum number of results to return (default: 50)
             offset: Number of results to skip (default: 0)
-            version_filter: Optional version filter ('all', 'best', 'original', 'upscaled')
+            version_filter: Optional version filter ('all', 'not upscaled', 'upscaled')
+            after: Only runs listed after this cursor or run ID
+            **filters: Additional filters: prompt_ids, model_type, created_after,
+                created_before, min_rating, unrated, search, batch_id (see
+                _apply_run_filters)
 
         Returns:
             List of run dictionaries
+
+        Raises:
+            ValueError: If ``after`` is a run ID that does not exist
         """
         logger.debug(
-            "Listing runs with status=%s, prompt_id=%s, limit=%s, offset=%s, version=%s",
+            "Listing runs with status=%s, prompt_id=%s, limit=%s, offset=%s, version=%s, after=%s",
             status,
             prompt_id,
             limit,
             offset,
             version_filter,
+            after,
         )
 
         try:
             with self.db.get_session() as session:
-                query = session.query(Run)
-
-                # Apply filters
-                if status:
-                    query = query.filter(Run.status == status)
-                if prompt_id:
-                    query = query.filter(Run.prompt_id == prompt_id)
-
-                # Apply version filter for transfer runs
-                if version_filter == "not upscaled":
-                    # Only transfer runs WITHOUT upscaled versions
-                    from sqlalchemy import and_, func, not_
-
-                    # Subquery to get source_run_ids of completed upscaled runs
-                    upscaled_sources = (
-                        session.query(func.json_extract(Run.execution_config, "$.source_run_id"))
-                        .filter(and_(Run.model_type == "upscale", Run.status == "completed"))
-                        .subquery()
-                    )
-
-                    # Only show transfer runs that are NOT in the upscaled sources
-                    query = query.filter(not_(Run.id.in_(upscaled_sources)))
-
-                elif version_filter == "upscaled":
-                    # Only transfer runs WITH upscaled versions
-                    from sqlalchemy import and_, func
-
-                    # Subquery to get source_run_ids of completed upscaled runs
-                    upscaled_sources = (
-                        session.query(func.json_extract(Run.execution_config, "$.source_run_id"))
-                        .filter(and_(Run.model_type == "upscale", Run.status == "completed"))
-                        .subquery()
-                    )
-
-                    # Only show transfer runs that ARE in the upscaled sources
-                    query = query.filter(Run.id.in_(upscaled_sources))
-
-                # version_filter == "all" or None: no additional filtering
+                query = self._apply_run_filters(
+                    session,
+                    session.query(Run),
+                    status=status,
+                    prompt_id=prompt_id,
+                    version_filter=version_filter,
+                    **filters,
+                )
+                if after:
+                    query = self._apply_keyset(session, query, Run, after)
 
-                # Order by created_at descending (newest first)
-                query = query.order_by(Run.created_at.desc())
+                # Order by created_at descending (newest first), ID breaks ties
+                query = query.order_by(Run.created_at.desc(), Run.id.desc())
 
                 # Apply pagination
                 runs = query.limit(limit).offset(offset).all()
@@ -571,19 +991,7 @@ class DataRepository:
                 # Convert to dictionaries
                 result = []
                 for run in runs:
-                    run_dict = {
-                        "id": run.id,
-                        "prompt_id": run.prompt_id,
-                        "model_type": run.model_type,
-                        "status": run.status,
-                        "execution_config": run.execution_config,
-                        "outputs": run.outputs,
-                        "metadata": run.run_metadata,
-                        "created_at": run.created_at.isoformat(),
-                        "started_at": run.started_at.isoformat() if run.started_at else None,
-                        "completed_at": run.completed_at.isoformat() if run.completed_at else None,
-                        "rating": run.rating,  # Include the rating field
-                    }
+                    run_dict = self._run_list_item(run)
 
                     # Only include runs that match the requested status filter
                     if status and run_dict.get("status") != status:
@@ -596,12 +1004,183 @@ class DataRepository:
             logger.error("Error listing runs: {}", e)
             return []
 
-    def search_prompts(self, query: str, limit: int = 50) -> list[dict[str, Any]]:
-        """Search prompts by text content.
+    def list_runs_enriched(
+        self, limit: int = 50, offset: int = 0, after: str | None = None, **filters: Any
+    ) -> list[dict[str, Any]]:
+        """List runs joined with their prompt text and upscaled child run.
+
+        Same filters and ordering as list_runs, but resolved in two set-based
+        queries (runs joined to prompts, then all upscale children of the page)
+        instead of one get_prompt/find_upscaled_run round trip per run.
+
+        Args:
+            limit: Maximum number of results to return (default: 50)
+            offset: Number of results to skip (default: 0)
+            after: Only runs listed after this cursor or run ID (see list_runs)
+            **filters: Same filters as list_runs (status, prompt_id, version_filter,
+                prompt_ids, model_type, created_after, created_before, min_rating,
+                unrated, search)
+
+        Returns:
+            List of run dictionaries with added ``prompt_text`` and
+            ``has_upscaled`` keys, plus ``upscaled_run`` for transfer runs
+            that have an upscale child (most recent one)
+        """
+        try:
+            with self.db.get_session() as session:
+                query = session.query(Run, Prompt.prompt_text).outerjoin(
+                    Prompt, Run.prompt_id == Prompt.id
+                )
+                query = self._apply_run_filters(session, query, **filters)
+                if after:
+                    query = self._apply_keyset(session, query, Run, after)
+                rows = (
+                    query.order_by(Run.created_at.desc(), Run.id.desc())
+                    .limit(limit)
+                    .offset(offset)
+                    .all()
+                )
+
+                result = []
+                for run, prompt_text in rows:
+                    run_dict = self._run_list_item(run)
+                    run_dict["prompt_text"] = prompt_text or ""
+                    run_dict["has_upscaled"] = False
+                    result.append(run_dict)
+
+                # Most recent upscale child per transfer run on this page
+                transfer_ids = [r["id"] for r in result if r["model_type"] == "transfer"]
+                upscaled_by_source = {}
+                if transfer_ids:
+                    children = (
+                        session.query(Run)
+                        .filter(Run.model_type == "upscale", Run.source_run_id.in_(transfer_ids))
+                        .order_by(Run.created_at.desc())
+                        .all()
+                    )
+                    for child in children:
+                        upscaled_by_source.setdefault(child.source_run_id, self._run_to_dict(child))
+
+                for run_dict in result:
+                    upscaled_run = upscaled_by_source.get(run_dict["id"])
+                    if upscaled_run:
+                        run_dict["has_upscaled"] = True
+                        run_dict["upscaled_run"] = upscaled_run
+
+                return result
+        except SQLAlchemyError as e:
+            logger.error("Error listing enriched runs: {}", e)
+            return []
+
+    def iter_runs(
+        self, batch_size: int = 500, after: str | None = None, **filters: Any
+    ) -> Iterator[dict[str, Any]]:
+        """Stream all runs matching the list_runs filters, one keyset page at a time.
+
+        Each page is read in its own short session, so consumers can process
+        rows as they arrive without holding a read transaction open.
+
+        Args:
+            batch_size: Runs fetched per query (default: 500)
+            after: Start after this cursor or run ID (default: from the newest)
+            **filters: Same filters as list_runs, except limit/offset
+
+        Yields:
+            Run dictionaries, as returned by list_runs
+        """
+        while True:
+            page = self.list_runs(limit=batch_size, after=after, **filters)
+            yield from page
+            if len(page) < batch_size:
+                return
+            after = keyset_cursor(page[-1])
+
+    def count_runs(self, **filters: Any) -> int:
+        """Count runs matching the list_runs filters.
+
+        Args:
+            **filters: Same filters as list_runs
+
+        Returns:
+            Number of matching runs (0 on database error)
+        """
+        try:
+            with self.db.get_session() as session:
+                query = session.query(func.count(Run.id))
+                query = self._apply_run_filters(session, query, **filters)
+                return query.scalar() or 0
+        except SQLAlchemyError as e:
+            logger.error("Error counting runs: {}", e)
+            return 0
+
+    def get_prompt_run_stats(
+        self, prompt_ids: list[str] | None = None
+    ) -> dict[str, dict[str, Any]]:
+        """Summarize runs per prompt with a single GROUP BY query.
+
+        Args:
+            prompt_ids: Prompts to summarize (default: every prompt with runs)
+
+        Returns:
+            Dictionary mapping prompt ID to a summary with keys ``total``,
+            ``by_status`` (status -> count), ``completed_by_model_type``
+            (model type -> completed count), ``rated_count`` and
+            ``average_rating`` (over completed runs rated 1-5, None if unrated).
+            Prompts without runs are omitted.
+        """
+        if prompt_ids is not None and not prompt_ids:
+            return {}
+
+        valid_rating = and_(Run.status == "completed", Run.rating.between(1, 5))
+        try:
+            with self.db.get_session() as session:
+                query = session.query(
+                    Run.prompt_id,
+                    Run.status,
+                    Run.model_type,
+                    func.count(Run.id),
+                    func.count(case((valid_rating, Run.rating))),
+                    func.sum(case((valid_rating, Run.rating))),
+                )
+                if prompt_ids is not None:
+                    query = query.filter(Run.prompt_id.in_(prompt_ids))
+                rows = query.group_by(Run.prompt_id, Run.status, Run.model_type).all()
+        except SQLAlchemyError as e:
+            logger.error("Error aggregating run stats: {}", e)
+            return {}
+
+        stats: dict[str, dict[str, Any]] = {}
+        rating_sums: dict[str, int] = {}
+        for prompt_id, status, model_type, count, rated, rating_sum in rows:
+            summary = stats.setdefault(
+                prompt_id,
+                {"total": 0, "by_status": {}, "completed_by_model_type": {}, "rated_count": 0},
+            )
+            summary["total"] += count
+            summary["by_status"][status] = summary["by_status"].get(status, 0) + count
+            if status == "completed":
+                by_type = summary["completed_by_model_type"]
+                by_type[model_type] = by_type.get(model_type, 0) + count
+            summary["rated_count"] += rated
+            rating_sums[prompt_id] = rating_sums.get(prompt_id, 0) + (rating_sum or 0)
+
+        for prompt_id, summary in stats.items():
+            rated = summary["rated_count"]
+            summary["average_rating"] = rating_sums[prompt_id] / rated if rated else None
+        return stats
+
+    def search_prompts(self, query: str, limit: int = 50, **filters: Any) -> list[dict[str, Any]]:
+        """Search prompts by text, name, video path or ID.
+
+        Uses the FTS5 prompt index, best matches first. Every word is a prefix
+        match and all words must match; double-quoted text matches an exact
+        phrase (``"neon city" night``). Without FTS5 this falls back to a
+        case-insensitive substring match on prompt text, newest first.
 
         Args:
             query: Search query string
             limit: Maximum number of results (default: 50)
+            **filters: Same filters as list_prompts
 
         Returns:
             List of matching prompt dictionaries
@@ -611,22 +1190,29 @@ class DataRepository:
             return []
 
         logger.debug("Searching prompts with query={}, limit={}", query, limit)
+        match_query = build_match_query(query) if self.db.prompt_search_enabled else None
 
         try:
             with self.db.get_session() as session:
-                # Escape special characters for LIKE pattern to prevent SQL injection
-                # Escape backslash first, then % and _ wildcards
-                escaped_query = query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
-                search_pattern = f"%{escaped_query.lower()}%"
-
-                # Search in prompt_text (case-insensitive)
-                prompts = (
-                    session.query(Prompt)
-                    .filter(Prompt.prompt_text.ilike(search_pattern))
-                    .order_by(Prompt.created_at.desc())
-                    .limit(limit)
-                    .all()
-                )
+                base = self._apply_prompt_filters(session.query(Prompt), **filters)
+                if match_query:
+                    prompts = (
+                        base.join(prompts_fts, prompts_fts.c.prompt_id == Prompt.id)
+                        .filter(prompt_search_match(match_query))
+                        .order_by(prompts_fts.c.rank)
+                        .limit(limit)
+                        .all()
+                    )
+                else:
+                    # Search in prompt_text (case-insensitive)
+                    prompts = (
+                        base.filter(
+                            Prompt.prompt_text.ilike(self._like_pattern(query.lower()), escape="\\")
+                        )
+                        .order_by(Prompt.created_at.desc())
+                        .limit(limit)
+                        .all()
+                    )
 
                 # Convert to dictionaries
                 result = []
@@ -971,11 +1557,13 @@ class DataRepository:
 
         # Check for running or uploading runs and log warning
         active_runs = [
-            run for run in prompt_data.get("runs", []) if run["status"] in ("running", "uploading")
+            run
+            for run in prompt_data.get("runs", [])
+            if run["status"] in ("running", "uploading", "downloading")
         ]
         if active_runs:
             logger.warning(
-                "Deleting prompt %s with %d active runs (running/uploading). Proceeding anyway.",
+                "Deleting prompt %s with %d active runs (running/uploading/downloading). Proceeding anyway.",
                 prompt_id,
                 len(active_runs),
             )
@@ -1051,7 +1639,7 @@ class DataRepository:
             }
 
         # Warn about running or uploading status but proceed
-        if run_data["status"] in ("running", "uploading"):
+        if run_data["status"] in ("running", "uploading", "downloading"):
             logger.warning(
                 "Deleting run %s with active status '%s'. Proceeding anyway.",
                 run_id,
@@ -1129,7 +1717,9 @@ class DataRepository:
         outputs_dir = self.config.get_local_config().outputs_dir
         total_size = 0
         directories = []
-        active_runs = [r for r in runs if r.get("status") in ("running", "uploading")]
+        active_runs = [
+            r for r in runs if r.get("status") in ("running", "uploading", "downloading")
+        ]
 
         for run in runs:
             run_dir = outputs_dir / f"run_{run['id']}"
@@ -1170,10 +1760,11 @@ class DataRepository:
             }
 
         # Check for active runs and warn
-        active_runs = [r for r in runs if r["status"] in ("running", "uploading")]
+        active_runs = [r for r in runs if r["status"] in ("running", "uploading", "downloading")]
         if active_runs:
             logger.warning(
-                "Deleting %d active runs (running/uploading). Proceeding anyway.", len(active_runs)
+                "Deleting %d active runs (running/uploading/downloading). Proceeding anyway.",
+                len(active_runs),
             )
 
         deleted_info = {
@@ -1223,7 +1814,9 @@ class DataRepository:
             total_runs += len(runs)
 
             # Count active runs
-            active_runs = [r for r in runs if r.get("status") in ("running", "uploading")]
+            active_runs = [
+                r for r in runs if r.get("status") in ("running", "uploading", "downloading")
+            ]
             total_active_runs += len(active_runs)
 
             for run in runs:
@@ -1268,7 +1861,9 @@ class DataRepository:
         total_active = 0
         for prompt in prompts:
             runs = self.list_runs(prompt_id=prompt["id"])
-            active_runs = [r for r in runs if r["status"] in ("running", "uploading")]
+            active_runs = [
+                r for r in runs if r["status"] in ("running", "uploading", "downloading")
+            ]
             if active_runs:
                 total_active += len(active_runs)
                 logger.warning(
@@ -1336,15 +1931,12 @@ class DataRepository:
 
             # Find the most recent enhancement run for this prompt
             # Could be either as original_prompt_id or enhanced_prompt_id in outputs
-            from sqlalchemy import func
-
             enhancement_run = (
                 session.query(Run)
                 .filter(
                     Run.model_type == "enhance",
                     Run.status == "completed",
-                    (func.json_extract(Run.outputs, "$.original_prompt_id") == prompt_id)
-                    | (func.json_extract(Run.outputs, "$.enhanced_prompt_id") == prompt_id),
+                    (Run.original_prompt_id == prompt_id) | (Run.enhanced_prompt_id == prompt_id),
                 )
                 .order_by(Run.created_at.desc())
                 .first()
@@ -1398,13 +1990,11 @@ class DataRepository:
 
         with self.db.get_session() as session:
             # Find enhancement run where this is the enhanced prompt
-            from sqlalchemy import func
-
             enhancement_run = (
                 session.query(Run)
                 .filter(
                     Run.model_type == "enhance",
-                    func.json_extract(Run.outputs, "$.enhanced_prompt_id") == enhanced_prompt_id,
+                    Run.enhanced_prompt_id == enhanced_prompt_id,
                 )
                 .first()
             )
@@ -1427,7 +2017,7 @@ class DataRepository:
     def list_enhanced_prompts(self, limit: int = 100) -> list[dict[str, Any]]:
         """List all prompts where parameters->enhanced is true.
 
-        Efficiently queries for enhanced prompts using the boolean flag,
+        Efficiently queries for enhanced prompts using the indexed boolean flag,
         avoiding expensive JOINs.
 
         Args:
@@ -1437,11 +2027,9 @@ class DataRepository:
             List of enhanced prompt dictionaries
         """
         with self.db.get_session() as session:
-            from sqlalchemy import func
-
             enhanced_prompts = (
                 session.query(Prompt)
-                .filter(func.json_extract(Prompt.parameters, "$.enhanced"))
+                .filter(Prompt.enhanced.is_(True))
                 .order_by(Prompt.created_at.desc())
                 .limit(limit)
                 .all()
@@ -1474,14 +2062,12 @@ class DataRepository:
             return []
 
         with self.db.get_session() as session:
-            from sqlalchemy import func
-
             enhancement_runs = (
                 session.query(Run)
                 .filter(
                     Run.model_type == "enhance",
-                    (func.json_extract(Run.outputs, "$.original_prompt_id") == prompt_id)
-                    | (func.json_extract(Run.outputs, "$.enhanced_prompt_id") == prompt_id)
+                    (Run.original_prompt_id == prompt_id)
+                    | (Run.enhanced_prompt_id == prompt_id)
                     | (Run.prompt_id == prompt_id),
                 )
                 .order_by(Run.created_at.desc())
@@ -1517,14 +2103,12 @@ class DataRepository:
             return None
 
         with self.db.get_session() as session:
-            # Query for upscale run with matching source_run_id in execution_config
-            from sqlalchemy import func
-
+            # Query for upscale run via the indexed copy of execution_config.source_run_id
             upscale_run = (
                 session.query(Run)
                 .filter(
                     Run.model_type == "upscale",
-                    func.json_extract(Run.execution_config, "$.source_run_id") == source_run_id,
+                    Run.source_run_id == source_run_id,
                 )
                 .order_by(Run.created_at.desc())  # Get most recent if multiple exist
                 .first()
@@ -1533,3 +2117,52 @@ class DataRepository:
             if upscale_run:
                 return self._run_to_dict(upscale_run)
             return None
+
+    def find_runs_by_fingerprint(self, fingerprints: list[str]) -> dict[str, list[dict[str, Any]]]:
+        """Find completed runs with the given result cache fingerprints.
+
+        Uses the indexed copy of metadata.fingerprint (see services/result_cache.py).
+
+        Args:
+            fingerprints: Fingerprints to look up
+
+        Returns:
+            Dictionary mapping each fingerprint with completed runs to those
+            runs, newest first
+        """
+        fingerprints = [fingerprint for fingerprint in fingerprints if fingerprint]
+        if not fingerprints:
+            return {}
+
+        with self.db.get_session() as session:
+            runs = (
+                session.query(Run)
+                .filter(Run.fingerprint.in_(set(fingerprints)), Run.status == "completed")
+                .order_by(Run.created_at.desc())
+                .all()
+            )
+            found: dict[str, list[dict[str, Any]]] = {}
+            for run in runs:
+                found.setdefault(run.fingerprint, []).append(self._run_to_dict(run))
+            return found
+
+    def get_cache_stats(self) -> dict[str, Any]:
+        """Summarize how often inference runs were served from the result cache.
+
+        Returns:
+            Dictionary with ``runs`` (fingerprinted inference runs), ``hits``
+            (runs linked to an earlier run's output), ``misses`` and
+            ``hit_rate`` (0.0 when there are no runs)
+        """
+        with self.db.get_session() as session:
+            runs, hits = (
+                session.query(func.count(Run.id), func.count(Run.cached_from))
+                .filter(Run.fingerprint.isnot(None))
+                .one()
+            )
+        return {
+            "runs": runs,
+            "hits": hits,
+            "misses": runs - hits,
+            "hit_rate": hits / runs if runs else 0.0,
+        }
@@ -0,0 +1,438 @@
+"""Queue job duration estimates learned from finished jobs.
+
+Wait-time estimates used to assume 120 seconds for every queued job. The
+``DurationEstimator`` instead fits, per job type, a small linear model on the
+measured runtimes of finished jobs:
+
+    duration = per_batch * batches + per_run * run_units
+
+where ``batches`` is the number of GPU batches the job needs (prompts divided
+by batch size for batch jobs, one per prompt otherwise) and ``run_units`` is
+the prompt count scaled by inference steps and frame count relative to the
+queue defaults. The first term captures container start and model loading,
+the second the denoising work.
+
+The fit is ridge-regularised towards a prior of 30 seconds per batch plus 90
+seconds per run unit, and a handful of finished jobs is enough to move it. With
+no history a single-prompt job is still estimated at the old 120 seconds, and a
+four-prompt batch at 390 seconds instead of 120. Observations decay
+geometrically, so the model follows hardware or configuration changes. Each
+finished job updates the running sums in O(1). The database history
+(``job_history``, seeded from completed runs when empty) is replayed on first
+use, and rows stored since, for example by another process, are picked up by
+ID at most every ``REFRESH_SECONDS``.
+"""
+
+import math
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any
+
+from cosmos_workflow.database.models import JobHistory, JobQueue, Run
+from cosmos_workflow.utils.logging import logger
+from cosmos_workflow.utils.workflow_utils import positive_int
+
+if TYPE_CHECKING:
+    from sqlalchemy.orm import Session
+
+    from cosmos_workflow.database import DatabaseConnection
+
+# Job settings the prior and the run units are expressed in
+REFERENCE_STEPS = 25
+REFERENCE_FRAMES = 121
+
+# Prior seconds (per batch, per run unit): one single-prompt default job = 120 s
+PRIOR_SECONDS = (30.0, 90.0)
+# How many observations the prior is worth
+PRIOR_WEIGHT = 1.0
+# Weight kept by older observations each time a new one arrives
+DECAY = 0.98
+# Finished jobs read back from the database on first use
+HISTORY_LIMIT = 500
+# Minimum interval between reads of newly stored history
+REFRESH_SECONDS = 60.0
+# Estimates never drop below this
+MIN_SECONDS = 1.0
+# GPU batch size the queue uses unless configured otherwise
+DEFAULT_BATCH_SIZE = 4
+
+BATCH_JOB_TYPES = frozenset({"batch_inference"})
+# Run model types whose completed runs seed an empty history
+RUN_JOB_TYPES = {"transfer": "inference", "enhance": "enhancement", "upscale": "upscale"}
+
+
+@dataclass(frozen=True)
+class JobFeatures:
+    """The properties of a job that drive its runtime."""
+
+    job_type: str
+    prompt_count: int
+    num_steps: int | None = None
+    num_frames: int | None = None
+    batch_size: int | None = None
+
+    @classmethod
+    def from_job(
+        cls,
+        job_type: str,
+        prompt_ids: list[str] | None,
+        config: dict[str, Any] | None,
+        batch_size: int | None = None,
+    ) -> "JobFeatures":
+        """Extract features from a queue job's type, prompts and config.
+
+        Args:
+            job_type: Queue job type
+            prompt_ids: Prompts the job processes
+            config: Job configuration (num_steps and num_frames are used if set)
+            batch_size: GPU batch size for batch jobs
+
+        Returns:
+            JobFeatures for the job
+        """
+        config = config or {}
+        return cls(
+            job_type=job_type,
+            prompt_count=max(len(prompt_ids or []), 1),
+            num_steps=positive_int(config.get("num_steps")),
+            num_frames=positive_int(config.get("num_frames")),
+            batch_size=batch_size if job_type in BATCH_JOB_TYPES else None,
+        )
+
+    def vector(self) -> tuple[float, float]:
+        """Get the model inputs (batches, run units)."""
+        if self.batch_size:
+            batches = math.ceil(self.prompt_count / self.batch_size)
+        else:
+            batches = self.prompt_count
+        units = float(self.prompt_count)
+        if self.num_steps:
+            units *= self.num_steps / REFERENCE_STEPS
+        if self.num_frames:
+            units *= self.num_frames / REFERENCE_FRAMES
+        return float(batches), units
+
+
+class RunningFit:
+    """Ridge regression towards a prior, updated one observation at a time.
+
+    Keeps decayed sums of ``x xT`` and ``x y``; solving the normal equations
+    costs O(features^3), which is trivial for the handful of features used.
+    """
+
+    def __init__(self, prior: tuple[float, ...] = PRIOR_SECONDS):
+        """Initialize the fit at its prior.
+
+        Args:
+            prior: Coefficients predicted before any observation
+        """
+        self.prior = tuple(prior)
+        size = len(self.prior)
+        self.xtx = [[0.0] * size for _ in range(size)]
+        self.xty = [0.0] * size
+        self.count = 0
+        self._weights: tuple[float, ...] | None = None
+
+    def add(self, x: tuple[float, ...], y: float) -> None:
+        """Add an observation, decaying the weight of earlier ones.
+
+        Args:
+            x: Feature vector
+            y: Observed value
+        """
+        for i, xi in enumerate(x):
+            self.xty[i] = DECAY * self.xty[i] + xi * y
+            for j, xj in enumerate(x):
+                self.xtx[i][j] = DECAY * self.xtx[i][j] + xi * xj
+        self.count += 1
+        self._weights = None
+
+    def weights(self) -> tuple[float, ...]:
+        """Get the fitted coefficients, solved once per new observation."""
+        if self._weights is None:
+            # Solve (XtX + lambda*I) w = Xty + lambda*prior by Gaussian elimination
+            size = len(self.prior)
+            rows = [
+                [self.xtx[i][j] + (PRIOR_WEIGHT if i == j else 0.0) for j in range(size)]
+                + [self.xty[i] + PRIOR_WEIGHT * self.prior[i]]
+                for i in range(size)
+            ]
+            for col in range(size):
+                pivot = max(range(col, size), key=lambda r: abs(rows[r][col]))
+                rows[col], rows[pivot] = rows[pivot], rows[col]
+                for r in range(size):
+                    if r != col:
+                        factor = rows[r][col] / rows[col][col]
+                        for c in range(col, size + 1):
+                            rows[r][c] -= factor * rows[col][c]
+            self._weights = tuple(rows[i][size] / rows[i][i] for i in range(size))
+        return self._weights
+
+    def predict(self, x: tuple[float, ...]) -> float:
+        """Predict the value for a feature vector, at least MIN_SECONDS."""
+        return max(sum(w * xi for w, xi in zip(self.weights(), x, strict=True)), MIN_SECONDS)
+
+
+class DurationEstimator:
+    """Per-job-type runtime model fitted on finished queue jobs."""
+
+    def __init__(
+        self,
+        db_connection: "DatabaseConnection | None" = None,
+        history_limit: int = HISTORY_LIMIT,
+    ):
+        """Initialize the estimator without reading the database.
+
+        Args:
+            db_connection: Database holding the job history (None keeps the
+                model in memory only)
+            history_limit: Most recent finished jobs to learn from on first use
+        """
+        self.db_connection = db_connection
+        self.history_limit = history_limit
+        self._fits: dict[str, RunningFit] = {}
+        self._last_id: int | None = None
+        self._next_refresh = 0.0
+        self._recorded_ids: set[int] = set()  # Rows already observed by this process
+        self._lock = threading.Lock()
+
+    def _fit(self, job_type: str) -> RunningFit:
+        if job_type not in self._fits:
+            self._fits[job_type] = RunningFit()
+        return self._fits[job_type]
+
+    def _refresh(self) -> None:
+        """Replay history stored since the last read (throttled)."""
+        if self.db_connection is None or time.monotonic() < self._next_refresh:
+            return
+        self._next_refresh = time.monotonic() + REFRESH_SECONDS
+        first_read = self._last_id is None
+        try:
+            with self.db_connection.get_session() as session:
+                query = session.query(JobHistory).order_by(JobHistory.id.desc())
+                if not first_read:
+                    query = query.filter(JobHistory.id > self._last_id)
+                rows = query.limit(self.history_limit).all()
+                for row in reversed(rows):
+                    if row.id in self._recorded_ids:
+                        continue
+                    features = JobFeatures(
+                        job_type=row.job_type,
+                        prompt_count=row.prompt_count,
+                        num_steps=row.num_steps,
+                        num_frames=row.num_frames,
+                        batch_size=row.batch_size,
+                    )
+                    self._fit(row.job_type).add(features.vector(), row.duration_seconds)
+                if rows:
+                    self._last_id = rows[0].id
+                    self._recorded_ids = {i for i in self._recorded_ids if i > self._last_id}
+                elif first_read:
+                    self._last_id = 0
+                    self._seed_from_runs(session)
+        except Exception as e:
+            # Estimates fall back to what is already fitted; never break the queue over them
+            logger.warning("Could not load job duration history: {}", e)
+            return
+
+        if first_read:
+            logger.debug(
+                "Duration estimator loaded: {}",
+                ", ".join(f"{job_type} ({fit.count})" for job_type, fit in self._fits.items())
+                or "no history",
+            )
+        elif rows:
+            logger.debug("Duration estimator learned from {} new jobs", len(rows))
+
+    def _seed_from_runs(self, session: "Session") -> None:
+        """Learn from completed standalone runs when no job has been recorded yet."""
+        runs = (
+            session.query(Run)
+            .filter(
+                Run.status == "completed",
+                Run.model_type.in_(RUN_JOB_TYPES),
+                Run.batch_id.is_(None),
+                Run.started_at.isnot(None),
+                Run.completed_at.isnot(None),
+            )
+            .order_by(Run.completed_at.desc())
+            .limit(self.history_limit)
+            .all()
+        )
+        for run in reversed(runs):
+            duration = (run.completed_at - run.started_at).total_seconds()
+            if duration <= 0:
+                continue
+            config = run.execution_config or {}
+            features = JobFeatures.from_job(RUN_JOB_TYPES[run.model_type], [run.prompt_id], config)
+            self._fit(features.job_type).add(features.vector(), duration)
+
+    # ========== Learning ==========
+
+    def observe(self, features: JobFeatures, duration_seconds: float) -> None:
+        """Update the model with a finished job without storing it.
+
+        Args:
+            features: The finished job's features
+            duration_seconds: Measured runtime
+        """
+        if duration_seconds <= 0:
+            return
+        with self._lock:
+            self._refresh()
+            self._fit(features.job_type).add(features.vector(), duration_seconds)
+
+    def record(
+        self,
+        features: JobFeatures,
+        duration_seconds: float,
+        job_id: str,
+        host: str | None = None,
+        session: "Session | None" = None,
+    ) -> None:
+        """Store a finished job's runtime and update the model.
+
+        Args:
+            features: The finished job's features
+            duration_seconds: Measured runtime
+            job_id: Queue job ID
+            host: GPU host the job ran on
+            session: Open session to add the history row to (committed by the
+                caller); without one the row is written in its own session
+        """
+        if duration_seconds <= 0:
+            return
+        if self.db_connection is not None or session is not None:
+            row = JobHistory(
+                job_id=job_id,
+                job_type=features.job_type,
+                prompt_count=features.prompt_count,
+                num_steps=features.num_steps,
+                num_frames=features.num_frames,
+                batch_size=features.batch_size,
+                host=host,
+                duration_seconds=duration_seconds,
+            )
+            if session is not None:
+                session.add(row)
+                session.flush()
+                row_id = row.id
+            else:
+                with self.db_connection.get_session() as own_session:
+                    own_session.add(row)
+                    own_session.flush()
+                    row_id = row.id
+                    own_session.commit()
+            with self._lock:
+                # Observed below; the next refresh must not replay it
+                self._recorded_ids.add(row_id)
+        self.observe(features, duration_seconds)
+
+    # ========== Estimates ==========
+
+    def estimate(self, features: JobFeatures) -> float:
+        """Estimate a job's runtime.
+
+        Args:
+            features: Job features
+
+        Returns:
+            Predicted runtime in seconds
+        """
+        with self._lock:
+            self._refresh()
+            fit = self._fits.get(features.job_type)
+            if fit is None:
+                fit = RunningFit()  # Prior only
+            return fit.predict(features.vector())
+
+    def estimate_job(
+        self,
+        job_type: str,
+        prompt_ids: list[str] | None,
+        config: dict[str, Any] | None,
+        batch_size: int | None = None,
+    ) -> float:
+        """Estimate a queue job's runtime from its type, prompts and config.
+
+        Args:
+            job_type: Queue job type
+            prompt_ids: Prompts the job processes
+            config: Job configuration
+            batch_size: GPU batch size for batch jobs
+
+        Returns:
+            Predicted runtime in seconds
+        """
+        return self.estimate(JobFeatures.from_job(job_type, prompt_ids, config, batch_size))
+
+    def remaining(self, features: JobFeatures, started_at: datetime | None) -> float:
+        """Estimate the time left for a running job.
+
+        Args:
+            features: Job features
+            started_at: When the job started (naive timestamps are UTC)
+
+        Returns:
+            Predicted seconds until the job finishes (0 if overdue)
+        """
+        estimate = self.estimate(features)
+        if started_at is None:
+            return estimate
+        if started_at.tzinfo is None:
+            started_at = started_at.replace(tzinfo=timezone.utc)
+        elapsed = (datetime.now(timezone.utc) - started_at).total_seconds()
+        return max(estimate - elapsed, 0.0)
+
+    def estimate_queue(
+        self, capacity: int = 1, batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> dict[str, Any]:
+        """Estimate how long the current queue takes to drain.
+
+        Args:
+            capacity: Jobs the GPU pool runs at the same time
+            batch_size: GPU batch size for batch jobs
+
+        Returns:
+            Dict with queued and running job counts and estimated_seconds
+        """
+        with self.db_connection.get_session() as session:
+            jobs = session.query(JobQueue).filter(JobQueue.status.in_(["queued", "running"])).all()
+            seconds = 0.0
+            running = 0
+            for job in jobs:
+                features = JobFeatures.from_job(
+                    job.job_type, job.prompt_ids, job.config, batch_size
+                )
+                if job.status == "running":
+                    running += 1
+                    seconds += self.remaining(features, job.started_at)
+                else:
+                    seconds += self.estimate(features)
+
+        return {
+            "queued": len(jobs) - running,
+            "running": running,
+            "estimated_seconds": round(seconds / max(capacity, 1)),
+        }
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """Get the fitted coefficients per job type.
+
+        Returns:
+            Dict of job type to observations, seconds_per_batch and
+            seconds_per_run (at the reference steps and frames)
+        """
+        with self._lock:
+            self._refresh()
+            summary = {}
+            for job_type, fit in self._fits.items():
+                per_batch, per_unit = fit.weights()
+                summary[job_type] = {
+                    "observations": fit.count,
+                    "seconds_per_batch": round(per_batch, 1),
+                    "seconds_per_run": round(per_unit, 1),
+                }
+            return summary
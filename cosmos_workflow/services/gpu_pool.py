@@ -0,0 +1,276 @@
+"""Pool of GPU hosts that queued jobs are scheduled on.
+
+Each host gets its own CosmosAPI (and with it its own GPUExecutor, SSHManager
+and container monitor) on the shared database, so jobs on different hosts run
+independently. The pool tracks how many jobs each host is running against its
+configured capacity and remembers which host last worked on a prompt or run,
+so follow-up jobs (e.g. an upscale of a run) go back to the host that already
+has the inputs and outputs when it is free.
+"""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from cosmos_workflow.utils.logging import logger
+
+if TYPE_CHECKING:
+    from cosmos_workflow.api import CosmosAPI
+    from cosmos_workflow.config import ConfigManager
+    from cosmos_workflow.database import DatabaseConnection
+
+# Prompt/run IDs remembered for host affinity
+AFFINITY_SIZE = 10000
+
+
+@dataclass
+class PoolHost:
+    """A GPU host and the jobs it is currently running."""
+
+    name: str
+    capacity: int
+    api: "CosmosAPI"
+    in_flight: int = 0
+    gpu_idle_since: float | None = None  # Epoch seconds the last container exited
+
+    @property
+    def free_slots(self) -> int:
+        """Slots not taken by jobs this process is running."""
+        return max(self.capacity - self.in_flight, 0)
+
+
+class GPUPool:
+    """Assigns jobs to GPU hosts with free capacity."""
+
+    def __init__(self, hosts: list[PoolHost]):
+        """Initialize the pool.
+
+        Args:
+            hosts: Hosts in preference order (ties go to the earlier host)
+        """
+        if not hosts:
+            raise ValueError("GPU pool needs at least one host")
+        self.hosts = hosts
+        self._by_name = {host.name: host for host in hosts}
+        self._affinity: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def single(cls, api: "CosmosAPI", name: str = "default") -> "GPUPool":
+        """Create a pool of one host with capacity 1 (the classic single-GPU setup).
+
+        Args:
+            api: CosmosAPI that executes the jobs
+            name: Host name shown in status output
+
+        Returns:
+            GPUPool with one host
+        """
+        return cls([PoolHost(name=name, capacity=1, api=api)])
+
+    @classmethod
+    def from_config(
+        cls,
+        config: "ConfigManager",
+        database: "DatabaseConnection",
+        primary_api: "CosmosAPI | None" = None,
+        share_executor: bool = True,
+    ) -> "GPUPool":
+        """Create a pool for the hosts in ``config.get_gpu_hosts()``.
+
+        Args:
+            config: Configuration listing the GPU hosts
+            database: Database shared by every host's CosmosAPI
+            primary_api: Existing CosmosAPI for the host it targets
+            share_executor: Run that host's jobs on primary_api itself. Pass
+                False when other threads use primary_api's SSH connection
+                (e.g. UI handlers): the host then gets its own CosmosAPI and
+                only shares primary_api's container monitor.
+
+        Returns:
+            GPUPool with one CosmosAPI per host
+        """
+        # Lazy import to avoid circular dependency
+        from cosmos_workflow.api import CosmosAPI
+
+        primary_remote = primary_api.config.get_remote_config() if primary_api else None
+        hosts = []
+        for host in config.get_gpu_hosts():
+            if primary_api is not None and host.remote == primary_remote:
+                if share_executor:
+                    api = primary_api
+                else:
+                    api = CosmosAPI(config=config.for_host(host), database=database)
+                    # One poller per host is enough; the monitor has its own SSH manager
+                    api.container_monitor = primary_api.container_monitor
+                primary_api = None  # Each host needs its own executor
+            else:
+                api = CosmosAPI(config=config.for_host(host), database=database)
+            hosts.append(PoolHost(name=host.name, capacity=host.capacity, api=api))
+
+        logger.info(
+            "GPU pool: {}",
+            ", ".join(f"{host.name} (capacity {host.capacity})" for host in hosts),
+        )
+        return cls(hosts)
+
+    @property
+    def total_capacity(self) -> int:
+        """Jobs the whole pool can run at the same time."""
+        return sum(host.capacity for host in self.hosts)
+
+    def free_capacity(self) -> int:
+        """Get the number of free slots across all hosts (no remote calls).
+
+        Returns:
+            Sum of free slots
+        """
+        with self._lock:
+            return sum(host.free_slots for host in self.hosts)
+
+    def get(self, name: str | None) -> PoolHost | None:
+        """Get a host by name.
+
+        Args:
+            name: Host name
+
+        Returns:
+            The host, or None if the pool has no host with that name
+        """
+        return self._by_name.get(name) if name else None
+
+    @property
+    def default_host(self) -> PoolHost:
+        """The first configured host, used for jobs executed without a claim."""
+        return self.hosts[0]
+
+    # ========== Slot assignment ==========
+
+    def acquire(self, preferred: str | None = None) -> PoolHost | None:
+        """Reserve a slot on a free host.
+
+        A host counts as free when this process runs fewer jobs there than its
+        capacity and, if it runs none, no other cosmos container is active on
+        it (e.g. one started from the CLI).
+
+        Args:
+            preferred: Host to use if it has a free slot (affinity)
+
+        Returns:
+            The host with the reserved slot, or None if every host is busy
+        """
+        with self._lock:
+            candidates = [host for host in self.hosts if host.free_slots > 0]
+            # Preferred host first, then the least loaded
+            candidates.sort(key=lambda host: (host.name != preferred, -host.free_slots))
+
+        for host in candidates:
+            with self._lock:
+                if host.free_slots <= 0:
+                    continue
+                if host.in_flight > 0:
+                    host.in_flight += 1
+                    return host
+            # The container check is an SSH round trip; without the lock held,
+            # releases and acquires on other hosts are not held up by it
+            if self._has_foreign_container(host):
+                continue
+            with self._lock:
+                # Another thread may have taken the last slot meanwhile
+                if host.free_slots > 0:
+                    host.in_flight += 1
+                    return host
+        return None
+
+    def release(self, host: PoolHost) -> None:
+        """Free a slot taken by ``acquire``.
+
+        Args:
+            host: Host returned by acquire
+        """
+        with self._lock:
+            host.in_flight = max(host.in_flight - 1, 0)
+
+    @staticmethod
+    def _has_foreign_container(host: PoolHost) -> bool:
+        try:
+            containers = host.api.get_active_containers()
+        except Exception as e:
+            # Let it fail downstream if the host really is unusable
+            logger.warning("Could not check active containers on {}: {}", host.name, e)
+            return False
+        if containers:
+            logger.debug(
+                "Host {} busy - container {} is running on GPU",
+                host.name,
+                containers[0].get("container_id", "unknown"),
+            )
+            return True
+        return False
+
+    # ========== Affinity ==========
+
+    def remember(self, keys: list[str], host_name: str) -> None:
+        """Record that a host holds the inputs/outputs for prompts or runs.
+
+        Args:
+            keys: Prompt and run IDs
+            host_name: Host that worked on them
+        """
+        with self._lock:
+            for key in keys:
+                self._affinity[key] = host_name
+                self._affinity.move_to_end(key)
+            while len(self._affinity) > AFFINITY_SIZE:
+                self._affinity.popitem(last=False)
+
+    def preferred_host(self, keys: list[str]) -> str | None:
+        """Get the host that most recently worked on any of the given IDs.
+
+        Args:
+            keys: Prompt and run IDs a job needs
+
+        Returns:
+            Host name, or None without affinity
+        """
+        with self._lock:
+            for key in keys:
+                if key in self._affinity and self._affinity[key] in self._by_name:
+                    return self._affinity[key]
+            return None
+
+    # ========== Monitoring ==========
+
+    def start_monitors(self) -> None:
+        """Start every host's container monitor poller."""
+        for host in self.hosts:
+            host.api.container_monitor.start()
+
+    def stop_monitors(self) -> None:
+        """Stop every host's container monitor poller."""
+        for host in self.hosts:
+            host.api.container_monitor.stop()
+
+    def wait_for_downloads(self, timeout: float | None = None) -> bool:
+        """Wait for every host's background output retrievals to finish.
+
+        Args:
+            timeout: Maximum seconds to wait per host (None waits indefinitely)
+
+        Returns:
+            True if no retrieval is pending on any host
+        """
+        return all([host.api.orchestrator.wait_for_downloads(timeout) for host in self.hosts])
+
+    def status(self) -> list[dict[str, Any]]:
+        """Get per-host load for status displays.
+
+        Returns:
+            List of dicts with name, capacity and in_flight
+        """
+        with self._lock:
+            return [
+                {"name": host.name, "capacity": host.capacity, "in_flight": host.in_flight}
+                for host in self.hosts
+            ]
@@ -0,0 +1,117 @@
+"""Dependencies between queue jobs.
+
+A full pipeline used to take three manual steps: queue an enhancement and wait,
+queue inference on the enhanced prompt, then queue an upscale of the resulting
+run, with the GPU idle in between. A job can now depend on other jobs
+(``JobQueue.depends_on``): it is added as ``waiting`` and nobody claims it
+until every parent has completed. When a parent completes, its outputs are
+bound into its children:
+
+- an enhancement parent replaces the prompt it enhanced with the enhanced
+  prompt, in the child and in the child's own waiting descendants
+- an inference parent gives an upscale child the run of the child's prompt
+  (``config["run_id"]``)
+
+Every bound output is also kept under ``config["parent_outputs"]``. A parent
+that fails or is cancelled fails or cancels its descendants.
+
+``SimplifiedQueueService`` applies these rules inside the transaction that
+completes the parent; the helpers here only compute them.
+"""
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from cosmos_workflow.database.models import JobQueue
+
+# Job types whose results carry inference runs
+INFERENCE_JOB_TYPES = ("inference", "batch_inference")
+
+
+def parent_outputs(
+    job_type: str, prompt_ids: list[str], result: dict[str, Any] | None
+) -> dict[str, Any]:
+    """Get the outputs a completed job passes on to the jobs depending on it.
+
+    Args:
+        job_type: Type of the completed job
+        prompt_ids: The job's prompt IDs
+        result: The job's result
+
+    Returns:
+        Dict with ``prompt_ids`` (enhanced prompt ID per original prompt ID)
+        and/or ``run_ids`` (run ID per prompt ID)
+
+    Raises:
+        ValueError: If the job did not produce the output its type promises
+    """
+    result = result or {}
+    if result.get("status") == "failed":
+        raise ValueError(result.get("error") or "job reported failure")
+
+    if job_type == "enhancement":
+        enhanced_prompt_id = result.get("enhanced_prompt_id")
+        if not enhanced_prompt_id or not prompt_ids:
+            raise ValueError("no enhanced prompt was produced")
+        return {"prompt_ids": {prompt_ids[0]: enhanced_prompt_id}}
+
+    if job_type in INFERENCE_JOB_TYPES:
+        run_ids = dict(result.get("prompt_runs") or {})
+        if result.get("run_id") and prompt_ids:
+            run_ids.setdefault(prompt_ids[0], result["run_id"])
+        return {"run_ids": run_ids}
+
+    return {}
+
+
+def remap_prompts(job: "JobQueue", prompt_map: dict[str, str]) -> None:
+    """Replace prompt IDs of a job with the prompts they became.
+
+    Args:
+        job: Waiting job
+        prompt_map: New prompt ID per old prompt ID
+    """
+    if prompt_map and any(prompt_id in prompt_map for prompt_id in job.prompt_ids):
+        job.prompt_ids = [prompt_map.get(prompt_id, prompt_id) for prompt_id in job.prompt_ids]
+
+
+def bind_outputs(job: "JobQueue", parent_id: str, outputs: dict[str, Any]) -> None:
+    """Bind a completed parent's outputs into a waiting job.
+
+    Args:
+        job: Job depending on the parent
+        parent_id: ID of the completed parent
+        outputs: The parent's outputs, as from ``parent_outputs``
+    """
+    remap_prompts(job, outputs.get("prompt_ids") or {})
+    config = dict(job.config or {})
+
+    run_ids = outputs.get("run_ids") or {}
+    if job.job_type == "upscale" and not (config.get("run_id") or config.get("video_source")):
+        if job.prompt_ids:
+            run_id = run_ids.get(job.prompt_ids[0])
+        else:
+            # Without a prompt to match, only a parent with a single run is unambiguous
+            run_id = next(iter(run_ids.values())) if len(run_ids) == 1 else None
+        if run_id:
+            config["run_id"] = run_id
+
+    config["parent_outputs"] = {**config.get("parent_outputs", {}), parent_id: outputs}
+    job.config = config
+
+
+def missing_inputs(job: "JobQueue") -> str | None:
+    """Check a job whose parents all completed has the inputs it runs on.
+
+    Args:
+        job: Job about to be queued
+
+    Returns:
+        What is missing, or None if the job can run
+    """
+    config = job.config or {}
+    if job.job_type == "upscale" and not (config.get("run_id") or config.get("video_source")):
+        return "no parent job produced a run to upscale"
+    if job.job_type != "upscale" and not job.prompt_ids:
+        return "no prompts to run"
+    return None
@@ -0,0 +1,128 @@
+"""Leases on running queue jobs.
+
+Claiming a job gives the claiming process a lease on it: the job row records
+the owner and when the lease expires. While the job executes, a heartbeat
+thread keeps pushing the expiry forward. A process that crashes or is
+restarted stops renewing, so its jobs' leases run out and any queue service
+can put them back in the queue (``SimplifiedQueueService.reclaim_expired_leases``)
+instead of failing them. Batch jobs then resume where they stopped (see
+``GPUExecutor.resume_batch_runs``). A job whose outputs are still being
+retrieved in the background keeps its lease until they arrive.
+"""
+
+import os
+import socket
+import threading
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from sqlalchemy import update
+
+from cosmos_workflow.database import DatabaseConnection, JobQueue
+from cosmos_workflow.utils.logging import logger
+
+# Seconds a claimed job stays leased without a heartbeat
+DEFAULT_LEASE_SECONDS = 60.0
+# Reclaims after which a job is failed instead of queued again
+MAX_JOB_ATTEMPTS = 3
+# Job statuses a lease is held in: executing, or retrieving the job's outputs
+LEASED_JOB_STATUSES = ("running", "downloading")
+
+
+def new_lease_owner() -> str:
+    """Get a lease owner name unique to this process and service.
+
+    Returns:
+        Name like ``<host>-<pid>-<random>``
+    """
+    return f"{socket.gethostname()}-{os.getpid()}-{uuid4().hex[:6]}"
+
+
+def lease_expiry(lease_seconds: float) -> datetime:
+    """Get the expiry time of a lease taken or renewed now.
+
+    Args:
+        lease_seconds: Lease duration
+
+    Returns:
+        UTC expiry time
+    """
+    return datetime.now(timezone.utc) + timedelta(seconds=lease_seconds)
+
+
+class JobLease:
+    """Renews a claimed job's lease from a background thread.
+
+    Use as a context manager around the job's execution. Renewal stops when
+    the block exits; the job's final status update clears the lease.
+    """
+
+    def __init__(
+        self,
+        db_connection: DatabaseConnection,
+        job_id: str,
+        owner: str,
+        lease_seconds: float = DEFAULT_LEASE_SECONDS,
+    ):
+        """Initialize the lease heartbeat.
+
+        Args:
+            db_connection: Database holding the job queue
+            job_id: Claimed job
+            owner: Lease owner recorded when the job was claimed
+            lease_seconds: Lease duration; renewed every third of it
+        """
+        self.db_connection = db_connection
+        self.job_id = job_id
+        self.owner = owner
+        self.lease_seconds = lease_seconds
+        self.lost = False  # Another process took the job over
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def renew(self) -> bool:
+        """Push the lease expiry forward.
+
+        Returns:
+            True if this owner still holds the job's lease
+        """
+        with self.db_connection.get_session() as session:
+            renewed = session.execute(
+                update(JobQueue)
+                .where(
+                    JobQueue.id == self.job_id,
+                    JobQueue.status.in_(LEASED_JOB_STATUSES),
+                    JobQueue.lease_owner == self.owner,
+                )
+                .values(lease_expires_at=lease_expiry(self.lease_seconds))
+            ).rowcount
+            session.commit()
+        if not renewed:
+            self.lost = True
+        return bool(renewed)
+
+    def __enter__(self) -> "JobLease":
+        self._thread = threading.Thread(
+            target=self._beat, name=f"job-lease-{self.job_id}", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.lease_seconds / 3)
+            self._thread = None
+
+    def _beat(self) -> None:
+        # Runs beside long GPU jobs so the lease never expires under them
+        while not self._stop.wait(self.lease_seconds / 3):
+            try:
+                if not self.renew():
+                    logger.warning(
+                        "Lost the lease on job {}; another process reclaimed it", self.job_id
+                    )
+                    return
+            except Exception as e:
+                # A missed beat is fine; the lease has two more before it expires
+                logger.warning("Could not renew the lease on job {}: {}", self.job_id, e)
@@ -0,0 +1,365 @@
+"""Cross-process signals for the job queue.
+
+The queue lives in SQLite, which has no LISTEN/NOTIFY, so processes that share
+a database coordinate through a few small files in a directory next to it
+(``outputs/cosmos.db`` -> ``outputs/cosmos.queue/``):
+
+- ``wakeup``: rewritten whenever jobs are added or the queue is resumed. A
+  waiting worker watches its mtime (a ``stat`` call, no database access) and
+  wakes up immediately instead of polling the database on a fixed interval.
+- ``paused``: present while queue processing is paused, so the pause toggle in
+  the UI applies to a worker running in another process.
+- ``worker.json``: registration and heartbeat of the running queue worker.
+  While it is fresh, the UI leaves job processing to the worker.
+- ``worker.lock``: created exclusively while a starting worker checks for a
+  live worker and registers, so two workers cannot both register.
+- ``processing-<host>-<pid>``: touched while a process (UI or worker) executes
+  queue jobs. A process starting up leaves ``running`` jobs alone while
+  another process's file is fresh instead of failing them as orphans.
+
+In-memory databases cannot be shared between processes; their signals only
+work within the current process.
+"""
+
+import json
+import os
+import socket
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from cosmos_workflow.utils.logging import logger
+
+# A worker heartbeat older than this is treated as a crashed worker
+WORKER_STALE_SECONDS = 30.0
+# Seconds between refreshes of a processing process's heartbeat file
+PROCESSING_HEARTBEAT_SECONDS = 10.0
+# A lock file older than this was left behind by a process that died holding it
+LOCK_STALE_SECONDS = 10.0
+# Seconds to wait for another process to release a lock
+LOCK_TIMEOUT_SECONDS = 5.0
+
+
+class QueueSignals:
+    """File-based wakeup, pause and worker-presence signals for one database."""
+
+    def __init__(self, directory: Path | None = None, poll_interval: float = 0.2):
+        """Initialize queue signals.
+
+        Args:
+            directory: Directory holding the signal files, or None for
+                in-process signals only
+            poll_interval: Seconds between wakeup-file checks while waiting
+        """
+        self.directory = Path(directory) if directory else None
+        self.poll_interval = poll_interval
+        self._event = threading.Event()
+        self._paused = False  # Used when there is no directory
+        self._processing = 0  # Jobs this process is executing
+        self._processing_stop: threading.Event | None = None
+        self._processing_lock = threading.Lock()
+        self._claim_lock = threading.Lock()
+
+    @classmethod
+    def for_database(cls, db_connection: Any) -> "QueueSignals":
+        """Create signals for the database behind a connection.
+
+        Args:
+            db_connection: DatabaseConnection (anything without a file-based
+                ``database_url`` gets in-process signals)
+
+        Returns:
+            QueueSignals for the database
+        """
+        url = getattr(db_connection, "database_url", None)
+        if not isinstance(url, str) or url == ":memory:":
+            return cls()
+        db_path = Path(url)
+        return cls(db_path.with_name(f"{db_path.stem}.queue"))
+
+    def _path(self, name: str, create: bool = False) -> Path | None:
+        if self.directory is None:
+            return None
+        if create:
+            self.directory.mkdir(parents=True, exist_ok=True)
+        return self.directory / name
+
+    # ========== Wakeup ==========
+
+    def notify(self) -> None:
+        """Wake up waiting workers (in this and other processes)."""
+        self._event.set()
+        path = self._path("wakeup", create=True)
+        if path is None:
+            return
+        try:
+            path.write_text(str(time.time_ns()))
+        except OSError as e:
+            logger.warning("Could not write queue wakeup signal {}: {}", path, e)
+
+    def wakeup_token(self) -> int:
+        """Get a token that changes whenever ``notify`` is called from any process.
+
+        Returns:
+            Modification time of the wakeup file in ns (0 if never notified)
+        """
+        path = self._path("wakeup")
+        if path is None:
+            return 0
+        try:
+            return path.stat().st_mtime_ns
+        except OSError:
+            return 0
+
+    def wait(
+        self,
+        timeout: float,
+        since: int | None = None,
+        stop: threading.Event | None = None,
+    ) -> bool:
+        """Block until notified, stopped or timed out.
+
+        Args:
+            timeout: Maximum seconds to wait
+            since: Token from ``wakeup_token`` taken before the caller last
+                looked at the queue, so notifications sent in between are not
+                missed (default: now)
+            stop: Event that ends the wait early when set
+
+        Returns:
+            True if woken by a notification, False on timeout or stop
+        """
+        if since is None:
+            since = self.wakeup_token()
+        deadline = time.monotonic() + timeout
+
+        while True:
+            if self.wakeup_token() != since:
+                self._event.clear()
+                return True
+            if stop is not None and stop.is_set():
+                return False
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            if self._event.wait(min(remaining, self.poll_interval)):
+                self._event.clear()
+                return True
+
+    # ========== Pause ==========
+
+    def set_paused(self, paused: bool) -> None:
+        """Persist the queue pause state for every process using the database.
+
+        Args:
+            paused: True to pause, False to resume
+        """
+        self._paused = paused
+        path = self._path("paused", create=True)
+        if path is None:
+            return
+        if paused:
+            path.touch()
+        else:
+            path.unlink(missing_ok=True)
+
+    def is_paused(self) -> bool:
+        """Check whether queue processing is paused.
+
+        Returns:
+            True if any process paused the queue
+        """
+        path = self._path("paused")
+        if path is None:
+            return self._paused
+        return path.exists()
+
+    # ========== Worker registration ==========
+
+    def register_worker(self) -> None:
+        """Record this process as the queue worker (also refreshes its heartbeat)."""
+        path = self._path("worker.json", create=True)
+        if path is None:
+            return
+        info = self.get_worker() or {}
+        if info.get("pid") != os.getpid():
+            info = {
+                "pid": os.getpid(),
+                "host": socket.gethostname(),
+                "started_at": datetime.now(timezone.utc).isoformat(),
+            }
+        info["heartbeat"] = time.time()
+
+        # Write then rename so readers never see a partial file
+        tmp_path = path.with_name(f"worker.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_text(json.dumps(info))
+        os.replace(tmp_path, path)
+
+    def claim_worker(self, stale_after: float = WORKER_STALE_SECONDS) -> dict[str, Any] | None:
+        """Register as the queue worker unless a live worker is registered.
+
+        Checking for a live worker and registering happen under an exclusive
+        lock file, so of several workers starting at once only one registers.
+
+        Args:
+            stale_after: Seconds after which a silent worker counts as gone
+
+        Returns:
+            None if this process is now the worker, otherwise the details of
+            the live worker
+        """
+        with self._claim_lock, self._exclusive("worker.lock"):
+            if self.worker_alive(stale_after):
+                return self.get_worker() or {}
+            self.register_worker()
+            return None
+
+    @contextmanager
+    def _exclusive(self, name: str) -> Iterator[None]:
+        """Hold a lock file, shared by every process using the database, for a block.
+
+        Raises:
+            TimeoutError: If another process held the lock for LOCK_TIMEOUT_SECONDS
+        """
+        path = self._path(name, create=True)
+        if path is None:
+            yield
+            return
+
+        deadline = time.monotonic() + LOCK_TIMEOUT_SECONDS
+        while True:
+            try:
+                os.close(os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+                break
+            except FileExistsError:
+                try:
+                    if time.time() - path.stat().st_mtime > LOCK_STALE_SECONDS:
+                        path.unlink(missing_ok=True)
+                        continue
+                except OSError:
+                    continue  # Released meanwhile
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"Queue lock {path} is held by another process") from None
+                time.sleep(0.01)
+        try:
+            yield
+        finally:
+            path.unlink(missing_ok=True)
+
+    def unregister_worker(self) -> None:
+        """Remove this process's worker registration."""
+        path = self._path("worker.json")
+        if path is None:
+            return
+        info = self.get_worker()
+        if info and info.get("pid") == os.getpid():
+            path.unlink(missing_ok=True)
+
+    def get_worker(self) -> dict[str, Any] | None:
+        """Get the registered worker's details.
+
+        Returns:
+            Dictionary with pid, host, started_at and heartbeat (epoch
+            seconds), or None if no worker is registered
+        """
+        path = self._path("worker.json")
+        if path is None or not path.exists():
+            return None
+        try:
+            return json.loads(path.read_text())
+        except (OSError, ValueError):
+            return None
+
+    def worker_alive(self, stale_after: float = WORKER_STALE_SECONDS) -> bool:
+        """Check whether a queue worker has sent a heartbeat recently.
+
+        Args:
+            stale_after: Seconds after which a silent worker counts as gone
+
+        Returns:
+            True if a live worker is registered for this database
+        """
+        info = self.get_worker()
+        if not info:
+            return False
+        return time.time() - info.get("heartbeat", 0) < stale_after
+
+    # ========== Job processing heartbeat ==========
+
+    def _processing_name(self) -> str:
+        return f"processing-{socket.gethostname()}-{os.getpid()}"
+
+    @contextmanager
+    def processing(self) -> Iterator[None]:
+        """Mark this process as executing queue jobs while the block runs.
+
+        Nested and concurrent blocks share one heartbeat, which stops when
+        the last block exits.
+        """
+        with self._processing_lock:
+            self._processing += 1
+            if self._processing == 1:
+                self._start_processing_heartbeat()
+        try:
+            yield
+        finally:
+            with self._processing_lock:
+                self._processing -= 1
+                if self._processing == 0:
+                    self._stop_processing_heartbeat()
+
+    def _start_processing_heartbeat(self) -> None:
+        path = self._path(self._processing_name(), create=True)
+        if path is None:
+            return
+        stop = self._processing_stop = threading.Event()
+
+        def touch() -> None:
+            try:
+                path.touch()
+            except OSError as e:
+                logger.warning("Could not refresh queue processing heartbeat: {}", e)
+
+        def beat() -> None:
+            # Runs beside long GPU jobs so the heartbeat never looks stale
+            while not stop.wait(PROCESSING_HEARTBEAT_SECONDS):
+                touch()
+
+        touch()
+
+        threading.Thread(target=beat, name="queue-processing-heartbeat", daemon=True).start()
+
+    def _stop_processing_heartbeat(self) -> None:
+        if self._processing_stop is not None:
+            self._processing_stop.set()
+            self._processing_stop = None
+        path = self._path(self._processing_name())
+        if path is not None:
+            path.unlink(missing_ok=True)
+
+    def processing_elsewhere(self, stale_after: float = WORKER_STALE_SECONDS) -> bool:
+        """Check whether another process is executing queue jobs right now.
+
+        Args:
+            stale_after: Seconds after which a silent process counts as gone
+
+        Returns:
+            True if another process refreshed its processing heartbeat recently
+        """
+        if self.directory is None or not self.directory.exists():
+            return False
+        own = self._processing_name()
+        now = time.time()
+        for path in self.directory.glob("processing-*"):
+            if path.name == own:
+                continue
+            try:
+                if now - path.stat().st_mtime < stale_after:
+                    return True
+            except OSError:
+                continue
+        return False
@@ -0,0 +1,252 @@
+"""Standalone queue worker that processes jobs outside the Gradio UI.
+
+The UI used to drive the queue from a 2-second ``gr.Timer``, so jobs only ran
+while a browser tab kept the timer alive and each GPU job blocked a Gradio
+worker thread. ``QueueWorker`` runs ``SimplifiedQueueService`` in a dedicated
+long-lived process (``cosmos worker``) instead:
+
+- Jobs run back to back while the queue has work, one per free GPU slot:
+  with a multi-host GPU pool, jobs on different hosts run concurrently. A slot
+  frees when its container exits, so the thread pool has room for one job
+  downloading outputs per slot next to the one on the GPU.
+- With online batching, a lingering partial batch is re-checked when its
+  linger window ends.
+- When the queue is empty the worker sleeps until ``add_job`` signals a
+  wakeup (see queue_signals), re-checking the database with exponential
+  backoff as a fallback.
+- A heartbeat thread keeps the worker registered so the UI becomes a pure
+  viewer and does not process or clean up jobs itself.
+- SIGINT/SIGTERM finish the current job, then exit once outputs still being
+  downloaded in the background have arrived.
+"""
+
+import signal
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, Any
+
+from cosmos_workflow.utils.logging import logger
+
+if TYPE_CHECKING:
+    from cosmos_workflow.services.queue_signals import QueueSignals
+    from cosmos_workflow.services.simple_queue_service import SimplifiedQueueService
+
+
+class WorkerAlreadyRunningError(RuntimeError):
+    """Raised when another live worker is registered for the same database."""
+
+
+def register_worker(signals: "QueueSignals") -> None:
+    """Register this process as the queue worker of a database.
+
+    Register before creating the worker's SimplifiedQueueService, so
+    processes starting meanwhile already see the worker.
+
+    Args:
+        signals: Signals of the database to serve
+
+    Raises:
+        WorkerAlreadyRunningError: If another worker serves this database
+    """
+    worker = signals.claim_worker()
+    if worker is not None:
+        raise WorkerAlreadyRunningError(
+            f"A queue worker is already running (pid {worker.get('pid')} on {worker.get('host')})"
+        )
+
+
+class QueueWorker:
+    """Long-lived, event-driven job processor for one database."""
+
+    def __init__(
+        self,
+        queue_service: "SimplifiedQueueService",
+        min_idle: float = 1.0,
+        max_idle: float = 30.0,
+        heartbeat_interval: float = 10.0,
+        registered: bool = False,
+    ):
+        """Initialize the worker.
+
+        Args:
+            queue_service: Queue service whose jobs this worker executes
+            min_idle: Seconds to wait after the first empty poll
+            max_idle: Upper bound for the idle backoff between database polls
+            heartbeat_interval: Seconds between worker heartbeats
+            registered: The caller already registered this process with
+                ``register_worker``
+        """
+        if min_idle <= 0 or max_idle < min_idle:
+            raise ValueError("Idle intervals must satisfy 0 < min_idle <= max_idle")
+
+        self.queue_service = queue_service
+        self.signals = queue_service.signals
+        self.min_idle = min_idle
+        self.max_idle = max_idle
+        self.heartbeat_interval = heartbeat_interval
+        self.jobs_processed = 0
+        self._registered = registered
+        self._stop = threading.Event()
+        # Separate from _stop: the heartbeat continues while in-flight jobs drain
+        self._heartbeat_stop = threading.Event()
+        self._heartbeat_thread: threading.Thread | None = None
+
+    def stop(self) -> None:
+        """Ask the worker to exit after the current job."""
+        if not self._stop.is_set():
+            logger.info("Queue worker stopping after the current job")
+        self._stop.set()
+
+    def install_signal_handlers(self) -> None:
+        """Stop gracefully on SIGINT/SIGTERM; a second SIGINT aborts immediately."""
+
+        def handle(signum, _frame):
+            if self._stop.is_set() and signum == signal.SIGINT:
+                raise KeyboardInterrupt
+            logger.info("Received signal {}", signal.Signals(signum).name)
+            self.stop()
+
+        signal.signal(signal.SIGINT, handle)
+        if hasattr(signal, "SIGTERM"):
+            signal.signal(signal.SIGTERM, handle)
+
+    def run(self, max_jobs: int | None = None, drain: bool = False) -> int:
+        """Process jobs until stopped.
+
+        Args:
+            max_jobs: Exit after this many jobs (default: no limit)
+            drain: Exit as soon as the queue has no claimable job
+
+        Returns:
+            Number of jobs processed
+
+        Raises:
+            WorkerAlreadyRunningError: If another worker serves this database
+        """
+        if not self._registered:
+            register_worker(self.signals)
+            self._registered = True
+
+        self._start_heartbeat()
+        slots = self.queue_service.gpu_pool.total_capacity
+        # One job on the GPU and one downloading its outputs per slot
+        executor = ThreadPoolExecutor(max_workers=2 * slots, thread_name_prefix="queue-job")
+        logger.info("Queue worker started with {} GPU slot(s)", slots)
+        in_flight: set[Future] = set()
+        claimed = 0
+        idle = self.min_idle
+
+        try:
+            while True:
+                in_flight = self._collect_finished(in_flight)
+                limit_reached = max_jobs is not None and claimed >= max_jobs
+                if self._stop.is_set() or limit_reached:
+                    if not in_flight:
+                        break
+                    # Let running jobs finish before exiting
+                    wait(in_flight, timeout=self.min_idle, return_when=FIRST_COMPLETED)
+                    continue
+
+                # Taken before looking at the queue so a job added meanwhile still wakes us
+                token = self.signals.wakeup_token()
+
+                if self.queue_service.is_queue_paused():
+                    logger.debug("Queue paused, waiting for resume")
+                    if in_flight:
+                        wait(in_flight, timeout=self.min_idle, return_when=FIRST_COMPLETED)
+                    else:
+                        self.signals.wait(self.max_idle, since=token, stop=self._stop)
+                    continue
+
+                # Fill every free GPU slot
+                while max_jobs is None or claimed < max_jobs:
+                    job_id = self._claim_next()
+                    if job_id is None:
+                        break
+                    in_flight.add(executor.submit(self._execute, job_id))
+                    claimed += 1
+                    idle = self.min_idle
+
+                if in_flight:
+                    # Re-check for claimable jobs when a job ends or a slot may have freed
+                    wait(in_flight, timeout=self.min_idle, return_when=FIRST_COMPLETED)
+                    continue
+
+                linger = self.queue_service.batch_linger_remaining()
+                if linger > 0:
+                    # A partial batch is waiting to fill; claim it when the window ends
+                    self.signals.wait(linger, since=token, stop=self._stop)
+                    continue
+
+                if drain or (max_jobs is not None and claimed >= max_jobs):
+                    break
+
+                woken = self.signals.wait(idle, since=token, stop=self._stop)
+                idle = self.min_idle if woken else min(idle * 2, self.max_idle)
+        finally:
+            # Running jobs were waited for above; don't block a second Ctrl+C
+            executor.shutdown(wait=False)
+            if not in_flight:
+                # Let outputs still downloading in the background arrive
+                self.queue_service.wait_for_downloads()
+            self._stop_heartbeat()
+            logger.info("Queue worker stopped after {} job(s)", self.jobs_processed)
+
+        return self.jobs_processed
+
+    def _collect_finished(self, in_flight: set[Future]) -> set[Future]:
+        """Count finished jobs and return the ones still running."""
+        running = set()
+        for future in in_flight:
+            if not future.done():
+                running.add(future)
+                continue
+            self.jobs_processed += 1
+            result = future.result()
+            if result:
+                logger.info(
+                    "Job {} finished with status {} on {}",
+                    result.get("job_id"),
+                    result.get("status"),
+                    result.get("host"),
+                )
+        return running
+
+    def _claim_next(self) -> str | None:
+        """Claim one job for a free GPU slot; errors are logged and treated as no job."""
+        try:
+            return self.queue_service.claim_next_job()
+        except Exception as e:
+            logger.error("Queue worker error: {}", e, exc_info=True)
+            return None
+
+    def _execute(self, job_id: str) -> dict[str, Any] | None:
+        """Execute a claimed job in a pool thread; errors are logged, not raised."""
+        try:
+            return self.queue_service.execute_job(job_id)
+        except Exception as e:
+            logger.error("Queue worker error in job {}: {}", job_id, e, exc_info=True)
+            return None
+
+    def _start_heartbeat(self) -> None:
+        self._heartbeat_stop.clear()
+        self.signals.register_worker()
+        self._heartbeat_thread = threading.Thread(
+            target=self._heartbeat_loop, name="queue-worker-heartbeat", daemon=True
+        )
+        self._heartbeat_thread.start()
+
+    def _heartbeat_loop(self) -> None:
+        # Runs beside long GPU jobs so the registration never looks stale
+        while not self._heartbeat_stop.wait(self.heartbeat_interval):
+            try:
+                self.signals.register_worker()
+            except OSError as e:
+                logger.warning("Could not refresh worker heartbeat: {}", e)
+
+    def _stop_heartbeat(self) -> None:
+        self._heartbeat_stop.set()
+        if self._heartbeat_thread is not None:
+            self._heartbeat_thread.join(timeout=self.heartbeat_interval)
+            self._heartbeat_thread = None
+        self.signals.unregister_worker()
@@ -0,0 +1,128 @@
+"""Content-addressed cache of inference results.
+
+Queueing the same prompt again with the same settings used to cost a full GPU
+run. Every inference run now records a fingerprint of everything that
+determines its output:
+
+- the prompt text and negative prompt
+- the SHA-256 of each input video (color, depth, segmentation)
+- the full execution config (weights, steps, guidance, seed, ...), without
+  the keys that only name the batch the run belongs to
+- the docker image the GPU host runs
+
+The fingerprint is kept in the run's metadata and copied into the indexed
+``runs.fingerprint`` column. Before running, ``CosmosAPI.quick_inference``
+and ``CosmosAPI.batch_inference`` (and through them the queue) look for a
+completed run with the same fingerprint whose output video still exists; a
+hit creates the new run as completed, linked to that output
+(``metadata.cached_from``), without touching the GPU.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any
+
+from cosmos_workflow.utils.logging import logger
+
+# Bump when the fingerprinted fields change, so old fingerprints stop matching
+FINGERPRINT_VERSION = 1
+# Execution config keys that name a run's batch but don't change its output
+UNCACHED_CONFIG_KEYS = frozenset({"batch_id", "batch_name"})
+# Prompt inputs that are video files
+INPUT_VIDEO_KEYS = ("video", "depth", "seg")
+
+_CHUNK_SIZE = 1024 * 1024
+
+# (path, size, mtime) -> digest; input videos are hashed once per process
+_digests: dict[tuple[str, int, int], str] = {}
+_digests_lock = threading.Lock()
+
+
+def file_digest(path: str | Path) -> str | None:
+    """Get the SHA-256 of a file's contents.
+
+    Digests are cached per path, size and modification time.
+
+    Args:
+        path: File to hash
+
+    Returns:
+        Hex digest, or None if the file does not exist
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+
+    key = (str(path), stat.st_size, stat.st_mtime_ns)
+    with _digests_lock:
+        cached = _digests.get(key)
+    if cached is not None:
+        return cached
+
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    result = digest.hexdigest()
+    with _digests_lock:
+        _digests[key] = result
+    return result
+
+
+def run_fingerprint(
+    prompt: dict[str, Any], execution_config: dict[str, Any], docker_image: str
+) -> str | None:
+    """Get the fingerprint of an inference run.
+
+    Args:
+        prompt: Prompt the run executes
+        execution_config: The run's execution config
+        docker_image: Docker image (with tag) the GPU host runs
+
+    Returns:
+        Hex fingerprint, or None if an input video is missing locally, in
+        which case the run is not cached
+    """
+    inputs = prompt.get("inputs") or {}
+    videos = {}
+    for key in INPUT_VIDEO_KEYS:
+        if not inputs.get(key):
+            continue
+        digest = file_digest(inputs[key])
+        if digest is None:
+            logger.debug("Not caching prompt {}: input {} is missing", prompt.get("id"), key)
+            return None
+        videos[key] = digest
+
+    payload = {
+        "version": FINGERPRINT_VERSION,
+        "prompt_text": prompt.get("prompt_text", ""),
+        "negative_prompt": (prompt.get("parameters") or {}).get("negative_prompt", ""),
+        "videos": videos,
+        "config": {
+            key: value for key, value in execution_config.items() if key not in UNCACHED_CONFIG_KEYS
+        },
+        "docker_image": docker_image,
+    }
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+def cached_outputs(run: dict[str, Any]) -> dict[str, Any] | None:
+    """Get the outputs a cache hit on a completed run links to.
+
+    Args:
+        run: Completed run with the same fingerprint
+
+    Returns:
+        The run's outputs, or None if its output video no longer exists
+    """
+    outputs = run.get("outputs") or {}
+    output_path = outputs.get("output_path")
+    if not output_path or not Path(output_path).exists():
+        return None
+    return dict(outputs)
@@ -7,24 +7,93 @@ race conditions by design and reduces complexity from ~680 lines to ~400 lines.
 Key improvements over legacy QueueService:
 - No threading complexity or background threads
 - Database-level concurrency control using SELECT ... FOR UPDATE SKIP LOCKED
-- Single warm container strategy preventing accumulation
+- One container per GPU slot; several hosts via a GPU pool (see gpu_pool)
 - Fresh database sessions preventing stale data
+- Priority scheduling with aging, so urgent jobs jump ahead and old jobs
+  never starve
+- Optional online batching: a claim pulls every compatible queued inference
+  job into one GPU batch
+- Pipelined execution: the next job's inputs upload while the GPU is busy and
+  a GPU slot frees as soon as its container exits (see execution.job_stages);
+  a job whose outputs are still being retrieved stays ``downloading`` until
+  they arrive, and fails if they don't
+- Leases with heartbeats on running jobs: jobs of a crashed or restarted
+  process are queued again once their lease expires, and batches resume with
+  only the videos that had not finished (see job_lease)
+- Job dependencies: a job can wait for other jobs and runs on their outputs,
+  so a whole enhance -> inference -> upscale pipeline is queued at once (see
+  job_dependencies)
 - Simple, linear execution flow
-- Timer-based processing using Gradio Timer component
+- Timer-based processing using Gradio Timer component, or a standalone
+  ``cosmos worker`` process (see queue_worker) that the UI defers to
 - More reliable and easier to debug
 """
 
+import math
+import threading
+import time
 import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any
 from uuid import uuid4
 
-from cosmos_workflow.database import DatabaseConnection, JobQueue
+from sqlalchemy import and_, func
+
+from cosmos_workflow.database import DatabaseConnection, JobQueue, Prompt
+from cosmos_workflow.execution.job_stages import JobStages, current_stages, track_stages
+from cosmos_workflow.services.batch_cost_model import BatchCostModel, BatchFeatures
+from cosmos_workflow.services.duration_estimator import (
+    DEFAULT_BATCH_SIZE,
+    DurationEstimator,
+    JobFeatures,
+)
+from cosmos_workflow.services.gpu_pool import GPUPool, PoolHost
+from cosmos_workflow.services.job_dependencies import (
+    bind_outputs,
+    missing_inputs,
+    parent_outputs,
+    remap_prompts,
+)
+from cosmos_workflow.services.job_lease import (
+    DEFAULT_LEASE_SECONDS,
+    LEASED_JOB_STATUSES,
+    MAX_JOB_ATTEMPTS,
+    JobLease,
+    lease_expiry,
+    new_lease_owner,
+)
+from cosmos_workflow.services.queue_signals import QueueSignals
 from cosmos_workflow.utils.logging import logger
+from cosmos_workflow.utils.smart_batching import (
+    BATCHABLE_JOB_TYPES,
+    MemoryBudget,
+    can_join_batch,
+    get_run_weights,
+    merge_batch_config,
+    probe_video_profile,
+)
 
 if TYPE_CHECKING:
     from cosmos_workflow.api import CosmosAPI
 
+DEFAULT_PRIORITY = 50
+MIN_PRIORITY = 0
+MAX_PRIORITY = 100
+
+# A queued job gains one priority point per this many seconds of waiting
+PRIORITY_AGING_SECONDS = 60.0
+
+# Run statuses of work that has not finished yet
+IN_PROGRESS_RUN_STATUSES = ("pending", "running", "uploading", "downloading")
+
+
+def _as_utc(timestamp: datetime) -> datetime:
+    """Treat naive timestamps read back from SQLite as UTC."""
+    if timestamp.tzinfo is None:
+        return timestamp.replace(tzinfo=timezone.utc)
+    return timestamp
+
 
 class SimplifiedQueueService:
     """Simplified database-backed queue service.
@@ -38,12 +107,30 @@ class SimplifiedQueueService:
         self,
         cosmos_api: "CosmosAPI | None" = None,
         db_connection: DatabaseConnection | None = None,
+        gpu_pool: GPUPool | None = None,
+        aging_seconds: float = PRIORITY_AGING_SECONDS,
+        online_batching: bool = False,
+        batch_linger: float = 0.0,
+        as_worker: bool = False,
+        submit_only: bool = False,
     ):
         """Initialize SimplifiedQueueService.
 
         Args:
             cosmos_api: CosmosAPI instance for job execution
             db_connection: Database connection for queue persistence
+            gpu_pool: GPU hosts to schedule jobs on (default: cosmos_api's
+                host alone, one job at a time)
+            aging_seconds: Waiting time that raises a queued job's effective
+                priority by one point
+            online_batching: Merge compatible queued inference jobs into one
+                batch when claiming (see ``set_online_batching``)
+            batch_linger: Seconds a fresh job may wait for its batch to fill
+            as_worker: This process already registered as the queue worker;
+                it keeps the shared pause state instead of resetting it
+            submit_only: This process only adds jobs (e.g. ``cosmos pipeline``);
+                it leaves the pause state and startup cleanup to the processes
+                executing jobs
         """
         if cosmos_api is None:
             # Lazy import to avoid circular dependency
@@ -54,16 +141,50 @@ class SimplifiedQueueService:
             self.cosmos_api = cosmos_api
 
         self.db_connection = db_connection
+        self.gpu_pool = gpu_pool or GPUPool.single(self.cosmos_api)
+        if aging_seconds <= 0:
+            raise ValueError("aging_seconds must be positive")
+        self.aging_seconds = aging_seconds
+        self.signals = QueueSignals.for_database(db_connection)
+        self.duration_estimator = DurationEstimator(db_connection)
+        self.batch_cost_model = BatchCostModel(db_connection)
+        self._assignments: dict[str, PoolHost] = {}  # Claimed job ID -> host slot
+        self.lease_owner = new_lease_owner()  # Recorded on the jobs this service claims
+        self.lease_seconds = DEFAULT_LEASE_SECONDS
+        self._prefetcher: ThreadPoolExecutor | None = None  # Uploads the next job's inputs
+        self._downloads: dict[str, threading.Event] = {}  # Downloading job ID -> finished
+        self._downloads_lock = threading.Lock()
         self._warm_container = None
-        self.batch_size = 4  # Default batch size for GPU processing
-        self.queue_paused = False  # Control flag for queue processing
+        self.batch_size = DEFAULT_BATCH_SIZE  # Default batch size for GPU processing
+        self.gpu_memory_gb: float | None = None  # Batch memory budget (None: run count only)
 
         # Smart batching state
         self._smart_batch_analysis = None
         self._analysis_queue_size = 0
 
-        # Clean up any orphaned jobs from previous session
-        self._cleanup_orphaned_jobs()
+        # Online batching state
+        self.online_batching = False
+        self.batch_linger = 0.0
+        self.batch_mix_controls = False
+        self._linger_until = 0.0  # Epoch seconds a held-back partial batch is claimed
+        self.set_online_batching(online_batching, linger=batch_linger)
+
+        if submit_only:
+            # The UI or a worker executes the jobs and cleans up after them
+            logger.debug("Queue service only submits jobs")
+        elif not as_worker and self.signals.worker_alive():
+            # A queue worker owns the running jobs and the pause state
+            logger.info("Queue worker is running; leaving job processing to it")
+        elif self.signals.processing_elsewhere():
+            # Another process (e.g. the UI) is in the middle of a job
+            logger.info("Another process is executing queue jobs; leaving them running")
+        else:
+            if not as_worker:
+                # Fresh session: queue starts active (pause state is shared across processes)
+                self.signals.set_paused(False)
+
+            # Clean up any orphaned jobs from previous session
+            self._cleanup_orphaned_jobs()
 
         logger.info("SimplifiedQueueService initialized")
 
@@ -82,6 +203,105 @@ class SimplifiedQueueService:
         self.batch_size = size
         logger.info("Updated batch size from {} to {}", old_size, size)
 
+    def set_lease_seconds(self, seconds: float) -> None:
+        """Set how long a claimed job stays leased without a heartbeat.
+
+        Running jobs renew their lease every third of this. A job whose
+        process dies is queued again this long after its last heartbeat.
+
+        Args:
+            seconds: Lease duration
+
+        Raises:
+            ValueError: If seconds is not positive
+        """
+        if seconds <= 0:
+            raise ValueError("Lease seconds must be positive")
+        self.lease_seconds = float(seconds)
+        logger.info("Job lease set to {}s", self.lease_seconds)
+
+    def set_gpu_memory(self, gpu_memory_gb: float | None) -> None:
+        """Set the GPU memory budget batches are packed under.
+
+        Smart batching and online batching estimate each run's memory from its
+        prompt's input video (frames and resolution) and the batch's active
+        controls, and keep every batch within the budget as well as within
+        ``batch_size``.
+
+        Args:
+            gpu_memory_gb: Memory per GPU in GB (None or 0 disables the check)
+        """
+        if gpu_memory_gb is not None and gpu_memory_gb < 0:
+            raise ValueError("GPU memory must not be negative")
+        self.gpu_memory_gb = gpu_memory_gb or None
+        logger.info(
+            "Batch GPU memory budget: {}", f"{gpu_memory_gb} GB" if gpu_memory_gb else "off"
+        )
+
+    def _memory_budget(self, session, prompt_ids: list[str]) -> MemoryBudget | None:
+        """Build the memory budget with the video profiles of the given prompts."""
+        if not self.gpu_memory_gb:
+            return None
+        prompts = session.query(Prompt.id, Prompt.inputs).filter(Prompt.id.in_(prompt_ids))
+        profiles = {
+            prompt_id: probe_video_profile((inputs or {}).get("video"))
+            for prompt_id, inputs in prompts
+        }
+        return MemoryBudget(self.gpu_memory_gb, profiles)
+
+    def set_online_batching(
+        self,
+        enabled: bool,
+        linger: float | None = None,
+        mix_controls: bool | None = None,
+    ) -> None:
+        """Configure batching of compatible jobs at claim time.
+
+        When enabled, claiming an ``inference`` or ``batch_inference`` job also
+        takes every queued job of those types with the same execution
+        parameters and the same active controls, in queue order, up to
+        ``batch_size`` prompts (and the GPU memory budget, if set), and runs
+        them as one ``batch_inference`` job.
+        With ``mix_controls``, jobs with other controls join too when the batch
+        cost model predicts the shared batch is faster than running them apart.
+
+        Args:
+            enabled: Turn online batching on or off
+            linger: Seconds a newly queued job may wait for more compatible
+                jobs when its batch is not full (0 claims immediately)
+            mix_controls: Allow runs with different active controls in a batch
+        """
+        if linger is not None:
+            if linger < 0:
+                raise ValueError("Batch linger must not be negative")
+            self.batch_linger = float(linger)
+        if mix_controls is not None:
+            self.batch_mix_controls = mix_controls
+        self.online_batching = enabled
+        logger.info(
+            "Online batching {} (linger {}s, {} controls)",
+            "enabled" if enabled else "disabled",
+            self.batch_linger,
+            "mixed" if self.batch_mix_controls else "strict",
+        )
+
+    def batch_linger_remaining(self) -> float:
+        """Get how long the last claim held back a partial batch for.
+
+        Returns:
+            Seconds until the held-back batch is claimed anyway, 0 if none
+        """
+        return max(self._linger_until - time.time(), 0.0)
+
+    @property
+    def queue_paused(self) -> bool:
+        """Whether queue processing is paused (shared by all processes on this database)."""
+        return self.signals.is_paused()
+
+    @queue_paused.setter
+    def queue_paused(self, paused: bool) -> None:
+        self.signals.set_paused(paused)
+
     def set_queue_paused(self, paused: bool) -> None:
         """Pause or resume queue processing.
 
@@ -92,6 +312,8 @@ class SimplifiedQueueService:
             paused: True to pause queue, False to resume
         """
         self.queue_paused = paused
+        if not paused:
+            self.signals.notify()
         logger.info("Queue processing {}", "paused" if paused else "resumed")
 
     def is_queue_paused(self) -> bool:
@@ -102,59 +324,324 @@ class SimplifiedQueueService:
         """
         return self.queue_paused
 
+    def worker_running(self) -> bool:
+        """Check whether a standalone queue worker is processing this queue.
+
+        Returns:
+            True if a ``cosmos worker`` process has a fresh heartbeat
+        """
+        return self.signals.worker_alive()
+
+    # ========== Priority scheduling ==========
+
+    def _queue_order(self) -> tuple:
+        """ORDER BY clauses that put queued jobs in claim order.
+
+        Jobs are claimed by highest effective priority,
+        ``priority + waiting_seconds / aging_seconds``. Sorting by that value
+        descending is the same as sorting by ``created_at - priority *
+        aging_seconds`` ascending, which does not depend on the current time:
+        each priority point moves a job ``aging_seconds`` earlier in line.
+        """
+        return (
+            func.julianday(JobQueue.created_at)
+            - func.coalesce(JobQueue.priority, DEFAULT_PRIORITY) * (self.aging_seconds / 86400),
+            JobQueue.created_at,
+        )
+
+    def _queued_jobs(self, session) -> list[JobQueue]:
+        """Get all queued jobs in claim order."""
+        return (
+            session.query(JobQueue).filter_by(status="queued").order_by(*self._queue_order()).all()
+        )
+
+    def effective_priority(self, job: JobQueue) -> float:
+        """Get a queued job's priority including its aging bonus.
+
+        Args:
+            job: Queued job
+
+        Returns:
+            Base priority plus one point per ``aging_seconds`` waited
+        """
+        waited = max((datetime.now(timezone.utc) - _as_utc(job.created_at)).total_seconds(), 0.0)
+        return (job.priority if job.priority is not None else DEFAULT_PRIORITY) + (
+            waited / self.aging_seconds
+        )
+
+    @staticmethod
+    def _validate_priority(priority: int) -> int:
+        if not isinstance(priority, int) or not MIN_PRIORITY <= priority <= MAX_PRIORITY:
+            raise ValueError(f"Priority must be an integer from {MIN_PRIORITY} to {MAX_PRIORITY}")
+        return priority
+
+    def set_job_priority(self, job_id: str, priority: int) -> bool:
+        """Change the priority of a queued job.
+
+        Args:
+            job_id: Job to change
+            priority: New base priority (0-100, higher runs sooner)
+
+        Returns:
+            True if updated, False if the job is not queued
+
+        Raises:
+            ValueError: If priority is out of range
+        """
+        self._validate_priority(priority)
+        with self.db_connection.get_session() as session:
+            job = session.query(JobQueue).filter_by(id=job_id).first()
+            if not job or job.status != "queued":
+                logger.warning("Cannot change priority of job {}: not queued", job_id)
+                return False
+
+            job.priority = priority
+            session.commit()
+
+        logger.info("Set priority of job {} to {}", job_id, priority)
+        self.signals.notify()
+        return True
+
+    def prioritize_job(self, job_id: str) -> bool:
+        """Move a queued job to the front of the queue.
+
+        Raises the job's priority just enough to put it ahead of the current
+        head of the queue, aging included. This can exceed MAX_PRIORITY for a
+        young job overtaking a long-waiting one.
+
+        Args:
+            job_id: Job to move
+
+        Returns:
+            True if the job is now first in line, False if it is not queued
+        """
+        with self.db_connection.get_session() as session:
+            job = session.query(JobQueue).filter_by(id=job_id).first()
+            if not job or job.status != "queued":
+                logger.warning("Cannot prioritize job {}: not queued", job_id)
+                return False
+
+            head = (
+                session.query(JobQueue)
+                .filter(JobQueue.status == "queued", JobQueue.id != job_id)
+                .order_by(*self._queue_order())
+                .first()
+            )
+            if head is not None:
+                # One point more than the effective priority gap closes it
+                gap = self.effective_priority(head) - self.effective_priority(job)
+                if gap >= 0:
+                    job.priority = (job.priority or DEFAULT_PRIORITY) + math.floor(gap) + 1
+                    session.commit()
+
+            new_priority = job.priority
+
+        logger.info("Moved job {} to the front of the queue (priority {})", job_id, new_priority)
+        self.signals.notify()
+        return True
+
     def claim_next_job(self) -> str | None:
-        """Atomically claim the next job in the queue.
+        """Atomically claim the next job in the queue and assign it a GPU host.
 
-        Uses database-level locking (SELECT ... FOR UPDATE) to ensure
-        only one process can claim a job at a time.
+        The next job is the one with the highest effective priority (base
+        priority plus aging, see ``_queue_order``). Uses database-level
+        locking (SELECT ... FOR UPDATE) to ensure
+        only one process can claim a job at a time. The job goes to the host
+        that last worked on its prompts/run if that host is free, otherwise
+        to the least loaded free host; ``execute_job`` runs it there.
+
+        With online batching, compatible queued jobs are merged into the
+        claimed job (see ``set_online_batching``), or nothing is claimed while
+        a fresh partial batch lingers.
+
+        The claimed job is leased to this service (see ``job_lease``); jobs
+        whose lease expired are put back in the queue first.
 
         Returns:
-            Job ID if a job was claimed, None if queue is empty or paused
+            Job ID if a job was claimed, None if queue is empty, paused or
+            every GPU host is busy
         """
+        self.reclaim_expired_leases()
+
         # Check if queue is paused
         if self.queue_paused:
             logger.debug("Queue is paused, not claiming new jobs")
             return None
 
+        if self.gpu_pool.free_capacity() == 0:
+            logger.debug("All GPU hosts busy, not claiming new jobs")
+            return None
+
+        self._linger_until = 0.0
+
         with self.db_connection.get_session() as session:
             # Force fresh read from database
             session.expire_all()
 
+            # Only the oldest job of each priority level can be next in line.
+            # Finding those heads is one seek per level on the
+            # (status, priority, created_at) index instead of a full scan.
+            heads = (
+                session.query(JobQueue.priority, func.min(JobQueue.created_at).label("created_at"))
+                .filter(JobQueue.status == "queued")
+                .group_by(JobQueue.priority)
+                .subquery()
+            )
+
             # Atomically claim next job using database lock
             # skip_locked=True means if another process has locked a row,
             # we skip it instead of waiting (prevents deadlock)
             job = (
                 session.query(JobQueue)
-                .filter_by(status="queued")
-                .order_by(JobQueue.created_at)
+                .join(
+                    heads,
+                    and_(
+                        JobQueue.priority.is_(heads.c.priority),
+                        JobQueue.created_at == heads.c.created_at,
+                    ),
+                )
+                .filter(JobQueue.status == "queued")
+                .order_by(*self._queue_order())
                 .with_for_update(skip_locked=True)
                 .first()
             )
 
-            if job:
-                # Check if GPU is actually available
-                try:
-                    active_containers = self.cosmos_api.get_active_containers()
-                    if active_containers:
-                        container_id = active_containers[0].get("container_id", "unknown")
-                        logger.debug(
-                            "Skipping job claim - container {} is running on GPU",
-                            container_id,
-                        )
-                        return None
-                except Exception as e:
-                    logger.warning("Could not check active containers: {}", e)
-                    # Continue anyway - let it fail downstream if there's an issue
-
-                # Mark as running
-                job.status = "running"
-                job.started_at = datetime.now(timezone.utc)
-                session.commit()
+            if not job:
+                return None
 
-                logger.info("Claimed job {} (type: {})", job.id, job.job_type)
-                return job.id
+            batch = [job]
+            if self.online_batching and job.job_type in BATCHABLE_JOB_TYPES:
+                batch = self._collect_batch(session, job)
+                if self._should_linger(job, batch):
+                    return None
 
-            return None
+            # Reserve a GPU slot; container checks are served from each host's
+            # container monitor cache, so no SSH round trip while the row is locked
+            host = self.gpu_pool.acquire(
+                preferred=self.gpu_pool.preferred_host(self._affinity_keys(job))
+            )
+            if host is None:
+                logger.debug("Skipping job claim - no GPU host is free")
+                return None
+
+            if len(batch) > 1:
+                self._merge_batch(session, batch)
+
+            # Mark as running
+            job.status = "running"
+            job.started_at = datetime.now(timezone.utc)
+            job.host = host.name
+            job.lease_owner = self.lease_owner
+            job.lease_expires_at = lease_expiry(self.lease_seconds)
+            if job.job_type == "batch_inference" and not (job.config or {}).get("batch_id"):
+                # If this process dies, the reclaimed job resumes this batch
+                # instead of running every video again
+                job.config = {**(job.config or {}), "batch_id": f"batch_{uuid4().hex[:16]}"}
+            session.commit()
+            self._assignments[job.id] = host
+
+            logger.info("Claimed job {} (type: {}) on {}", job.id, job.job_type, host.name)
+            return job.id
+
+    def _collect_batch(self, session, leader: JobQueue) -> list[JobQueue]:
+        """Get the leader plus queued jobs that can share its GPU batch, in queue order."""
+        batch = [leader]
+        room = self.batch_size - len(leader.prompt_ids)
+        if room <= 0:
+            return batch
+
+        candidates = (
+            session.query(JobQueue)
+            .filter(
+                JobQueue.status == "queued",
+                JobQueue.id != leader.id,
+                JobQueue.job_type.in_(BATCHABLE_JOB_TYPES),
+            )
+            .order_by(*self._queue_order())
+            .with_for_update(skip_locked=True)
+        )
+        candidates = candidates.all()
+        memory = self._memory_budget(
+            session, [prompt_id for job in [leader, *candidates] for prompt_id in job.prompt_ids]
+        )
+        prompt_ids = list(leader.prompt_ids)
+        weights = get_run_weights(leader)
+        for job in candidates:
+            # Jobs too large for the remaining room wait for a later batch
+            if len(job.prompt_ids) > room:
+                continue
+            if not can_join_batch(leader, job):
+                if not self.batch_mix_controls or not can_join_batch(
+                    leader, job, mix_controls=True
+                ):
+                    continue
+                if not self._mixing_pays_off(weights, job):
+                    continue
+            job_weights = get_run_weights(job)
+            if memory and not memory.fits(prompt_ids + job.prompt_ids, weights + job_weights):
+                continue
+            batch.append(job)
+            prompt_ids += job.prompt_ids
+            weights = weights + job_weights
+            room -= len(job.prompt_ids)
+            if room == 0:
+                break
+        return batch
+
+    def _mixing_pays_off(self, weights: list[dict[str, Any]], job: JobQueue) -> bool:
+        """Check if adding a job with other controls beats running it apart."""
+        config = job.config or {}
+        job_weights = get_run_weights(job)
+        together = self.batch_cost_model.estimate(
+            BatchFeatures.from_runs(weights + job_weights, config)
+        )
+        apart = self.batch_cost_model.estimate(
+            BatchFeatures.from_runs(weights, config)
+        ) + self.batch_cost_model.estimate(BatchFeatures.from_runs(job_weights, config))
+        return together <= apart
+
+    def _should_linger(self, leader: JobQueue, batch: list[JobQueue]) -> bool:
+        """Hold back a partial batch while its leader is younger than batch_linger."""
+        if self.batch_linger <= 0:
+            return False
+        if sum(len(job.prompt_ids) for job in batch) >= self.batch_size:
+            return False
+
+        deadline = _as_utc(leader.created_at).timestamp() + self.batch_linger
+        if deadline <= time.time():
+            return False
+
+        self._linger_until = deadline
+        logger.debug(
+            "Holding job {} up to {:.1f}s for its batch to fill",
+            leader.id,
+            self.batch_linger_remaining(),
+        )
+        return True
+
+    @staticmethod
+    def _merge_batch(session, batch: list[JobQueue]) -> None:
+        """Turn the leader into one batch_inference job and drop the merged jobs."""
+        leader, members = batch[0], batch[1:]
+        config = merge_batch_config(batch)
+        config["merged_job_ids"] = [job.id for job in members]
+
+        leader.config = config
+        leader.prompt_ids = [prompt_id for job in batch for prompt_id in job.prompt_ids]
+        leader.job_type = "batch_inference"
+        # Jobs waiting for a merged job wait for the batch instead
+        SimplifiedQueueService._redirect_dependents(
+            session, {job.id: [leader.id] for job in members}
+        )
+        for job in members:
+            session.delete(job)
+
+        logger.info(
+            "Batched {} queued jobs into job {} ({} prompts)",
+            len(batch),
+            leader.id,
+            len(leader.prompt_ids),
+        )
 
     def process_next_job(self) -> dict[str, Any] | None:
         """Process the next job in the queue.
@@ -197,12 +684,108 @@ class SimplifiedQueueService:
     def execute_job(self, job_id: str) -> dict[str, Any]:
         """Execute a specific job.
 
+        Runs on the GPU host assigned by ``claim_next_job``; unclaimed jobs run
+        on the pool's first host. Inference jobs are pipelined: when their
+        container starts, the next queued inference job's inputs are uploaded
+        to the host in the background, and the host's slot is freed as soon as
+        the container exits, so the next job can start while this one
+        downloads its outputs. Other jobs free the slot when they finish.
+        Safe to call from several threads. A heartbeat renews the job's lease
+        until it finishes.
+
         Args:
             job_id: Job ID to execute
 
         Returns:
-            Dictionary with job execution status and results
+            Dictionary with job execution status and results, including the
+            job's stage timings under ``stages`` (see JobStages.summary)
         """
+        claimed_host = self._assignments.pop(job_id, None)
+        host = claimed_host or self.gpu_pool.default_host
+        released = False
+
+        def release_slot() -> None:
+            # Once per job: when its container exits, or when the job ends
+            nonlocal released
+            if released:
+                return
+            released = True
+            host.gpu_idle_since = time.time()
+            if claimed_host is not None:
+                self.gpu_pool.release(claimed_host)
+            # The job's container has exited; don't let the next claim trust the cache
+            host.api.invalidate_container_state()
+
+        stages = JobStages(on_gpu_done=release_slot)
+        stages.on_gpu_start = lambda: self._gpu_stage_started(host, stages)
+        lease = JobLease(self.db_connection, job_id, self.lease_owner, self.lease_seconds)
+        try:
+            # Tells processes starting meanwhile that this job is not orphaned
+            with self.signals.processing(), lease, track_stages(stages):
+                result = self._execute_job_on(job_id, host)
+        finally:
+            release_slot()
+
+        if result.get("status") in ("completed", "downloading", "failed"):
+            result["stages"] = timings = stages.summary()
+            logger.info(
+                "Job {} stages: upload {}s, GPU {}s, download {}s, GPU idle before start {}s",
+                job_id,
+                timings["upload_seconds"],
+                timings["gpu_seconds"],
+                timings["download_seconds"],
+                timings["gpu_idle_seconds"],
+            )
+        return result
+
+    def _gpu_stage_started(self, host: PoolHost, stages: JobStages) -> None:
+        """Measure the host's GPU idle time and prefetch the next job's inputs."""
+        now = time.time()
+        if host.gpu_idle_since is not None:
+            # Only idle time while this job was waiting counts against the pipeline
+            idle_since = max(host.gpu_idle_since, stages.queued_at or 0.0)
+            stages.gpu_idle_seconds = max(now - idle_since, 0.0)
+        host.gpu_idle_since = None
+        self._prefetch_next(host)
+
+    def _prefetch_next(self, host: PoolHost) -> None:
+        """Upload the inputs of the next queued inference prompts to a host in the background."""
+        prompt_ids: list[str] = []
+        with self.db_connection.get_session() as session:
+            for job in self._queued_jobs(session):
+                if job.job_type not in BATCHABLE_JOB_TYPES:
+                    continue
+                # Leave jobs that another host already has the files of to that host
+                if self.gpu_pool.preferred_host(job.prompt_ids) not in (None, host.name):
+                    continue
+                prompt_ids += [
+                    prompt_id for prompt_id in job.prompt_ids if prompt_id not in prompt_ids
+                ]
+                # Without online batching the next claim takes a single job
+                if not self.online_batching or len(prompt_ids) >= self.batch_size:
+                    break
+        prompt_ids = prompt_ids[: self.batch_size]
+        if not prompt_ids:
+            return
+
+        # The next claim prefers the host holding the prefetched inputs
+        self.gpu_pool.remember(prompt_ids, host.name)
+        if self._prefetcher is None:
+            self._prefetcher = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="queue-prefetch"
+            )
+        self._prefetcher.submit(self._prefetch, host, prompt_ids)
+
+    @staticmethod
+    def _prefetch(host: PoolHost, prompt_ids: list[str]) -> None:
+        try:
+            host.api.prefetch_inputs(prompt_ids)
+        except Exception as e:
+            # The job uploads its inputs itself when it runs
+            logger.warning("Could not prefetch inputs on {}: {}", host.name, e)
+
+    def _execute_job_on(self, job_id: str, host: PoolHost) -> dict[str, Any]:
+        api = host.api
         with self.db_connection.get_session() as session:
             job = session.query(JobQueue).filter_by(id=job_id).first()
 
@@ -211,24 +794,38 @@ class SimplifiedQueueService:
                 return {"status": "not_found", "job_id": job_id}
 
             try:
-                logger.info("Executing {} job {}", job.job_type, job_id)
+                logger.info("Executing {} job {} on {}", job.job_type, job_id, host.name)
+                current_stages().queued_at = _as_utc(job.created_at).timestamp()
 
                 # Execute based on job type
                 if job.job_type == "inference":
-                    result = self._execute_inference(job)
+                    result = self._execute_inference(job, api)
                 elif job.job_type == "batch_inference":
-                    result = self._execute_batch_inference(job)
+                    result = self._execute_batch_inference(job, api)
                 elif job.job_type == "enhancement":
-                    result = self._execute_enhancement(job)
+                    result = self._execute_enhancement(job, api)
                 elif job.job_type == "upscale":
-                    result = self._execute_upscale(job)
+                    result = self._execute_upscale(job, api)
                 else:
                     raise ValueError(f"Unknown job type: {job.job_type}")
 
-                # Mark as completed
+                # Follow-up jobs for these prompts/runs prefer this host
+                self.gpu_pool.remember(self._affinity_keys(job, result), host.name)
+
+                session.refresh(job)
+                if not self._holds_lease(job):
+                    return self._lease_lost(job, host)
+
+                retrievals = current_stages().retrievals
+                if retrievals:
+                    return self._start_download(session, job, result, retrievals, host)
+
+                # Mark as completed; jobs waiting for it get its outputs
                 job.status = "completed"
                 job.completed_at = datetime.now(timezone.utc)
                 job.result = result
+                job.lease_owner = job.lease_expires_at = None
+                self._release_dependents(session, job, result)
                 session.commit()
 
                 # Calculate elapsed time
@@ -237,7 +834,11 @@ class SimplifiedQueueService:
                 )
                 logger.info("Completed job {} in {:.1f} seconds", job.id, elapsed)
 
-                # Delete completed job (run record has all details)
+                # Keep the runtime for wait estimates, then delete the completed
+                # job (run record has all details)
+                self.duration_estimator.record(
+                    self._job_features(job), elapsed, job_id=job.id, host=host.name, session=session
+                )
                 session.delete(job)
                 session.commit()
 
@@ -246,13 +847,20 @@ class SimplifiedQueueService:
                     "status": "completed",
                     "result": result,
                     "elapsed_seconds": elapsed,
+                    "host": host.name,
                 }
 
             except Exception as e:
-                # Mark as failed
+                session.rollback()
+                if not self._holds_lease(job):
+                    return self._lease_lost(job, host)
+
+                # Mark as failed, along with the jobs waiting for it
                 job.status = "failed"
                 job.completed_at = datetime.now(timezone.utc)
                 job.result = {"error": str(e)}
+                job.lease_owner = job.lease_expires_at = None
+                self._end_dependents(session, [job.id], "failed", f"Parent job {job.id} failed")
                 session.commit()
 
                 logger.error("Failed job {} (type: {}): {}", job.id, job.job_type, e, exc_info=True)
@@ -261,11 +869,286 @@ class SimplifiedQueueService:
                     "job_id": job.id,
                     "status": "failed",
                     "error": str(e),
+                    "host": host.name,
                 }
 
+    def _start_download(
+        self,
+        session,
+        job: JobQueue,
+        result: dict[str, Any],
+        retrievals: list[Future],
+        host: PoolHost,
+    ) -> dict[str, Any]:
+        """Keep a job whose outputs are still being retrieved as ``downloading``.
+
+        The job keeps its lease, renewed until the retrievals finish; then it
+        completes, or fails if any retrieval gave up (see ``_finish_download``).
+        Its runtime up to the container exit is recorded now, as the GPU slot
+        is already free.
+        """
+        job_id = job.id
+        elapsed = (
+            (datetime.now(timezone.utc) - _as_utc(job.started_at)).total_seconds()
+            if job.started_at
+            else 0
+        )
+        job.status = "downloading"
+        job.result = result
+        lease = None
+        if job.lease_owner is not None:
+            job.lease_expires_at = lease_expiry(self.lease_seconds)
+            lease = JobLease(self.db_connection, job_id, self.lease_owner, self.lease_seconds)
+        self.duration_estimator.record(
+            self._job_features(job), elapsed, job_id=job_id, host=host.name, session=session
+        )
+        session.commit()
+        logger.info(
+            "Job {} left the GPU after {:.1f} seconds; waiting for its outputs", job_id, elapsed
+        )
+
+        finished = threading.Event()
+        with self._downloads_lock:
+            self._downloads[job_id] = finished
+        if lease is not None:
+            lease.__enter__()
+        pending = [len(retrievals)]
+        pending_lock = threading.Lock()
+
+        def retrieval_done(_future: Future) -> None:
+            with pending_lock:
+                pending[0] -= 1
+                if pending[0]:
+                    return
+            try:
+                if lease is not None:
+                    lease.__exit__(None, None, None)
+                self._finish_download(job_id, retrievals)
+            except Exception as e:
+                logger.error("Could not finish job {} after its downloads: {}", job_id, e)
+            finally:
+                with self._downloads_lock:
+                    self._downloads.pop(job_id, None)
+                finished.set()
+
+        for future in retrievals:
+            future.add_done_callback(retrieval_done)
+
+        return {
+            "job_id": job_id,
+            "status": "downloading",
+            "result": result,
+            "elapsed_seconds": elapsed,
+            "host": host.name,
+        }
+
+    def _finish_download(self, job_id: str, retrievals: list[Future]) -> None:
+        """Complete a ``downloading`` job, or fail it if an output retrieval gave up."""
+        failed = sum(1 for future in retrievals if future.exception() or not future.result())
+        with self.db_connection.get_session() as session:
+            job = session.query(JobQueue).filter_by(id=job_id).first()
+            if job is None or job.status != "downloading" or not self._holds_lease(job):
+                logger.warning("Job {} changed while downloading; leaving it as is", job_id)
+                return
+
+            job.completed_at = datetime.now(timezone.utc)
+            job.lease_owner = job.lease_expires_at = None
+            if failed:
+                # Kept in the queue like other failed jobs; the runs carry the details
+                job.status = "failed"
+                job.result = {
+                    **(job.result or {}),
+                    "error": f"Output download failed ({failed} of {len(retrievals)} retrievals)",
+                }
+                self._end_dependents(session, [job_id], "failed", f"Parent job {job_id} failed")
+                session.commit()
+                logger.error("Failed job {}: its outputs could not be downloaded", job_id)
+            else:
+                job.status = "completed"
+                self._release_dependents(session, job, job.result)
+                session.commit()
+                session.delete(job)
+                session.commit()
+                logger.info("Completed job {}; its outputs arrived", job_id)
+
+        self.signals.notify()
+
+    def wait_for_downloads(self, timeout: float | None = None) -> bool:
+        """Wait for outputs still being retrieved and for their jobs to finish.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            True if no job is downloading anymore
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        def remaining() -> float | None:
+            return None if deadline is None else max(deadline - time.monotonic(), 0.0)
+
+        if not self.gpu_pool.wait_for_downloads(remaining()):
+            return False
+        with self._downloads_lock:
+            pending = list(self._downloads.values())
+        return all(finished.wait(remaining()) for finished in pending)
+
+    # Job dependencies
+
+    @staticmethod
+    def _waiting_jobs(session) -> list[JobQueue]:
+        """Get the jobs waiting for parents to finish."""
+        return session.query(JobQueue).filter(JobQueue.status == "waiting").all()
+
+    @staticmethod
+    def _descendants(waiting: list[JobQueue], parent_ids: list[str]) -> list[JobQueue]:
+        """Get the waiting jobs that depend on any of the given jobs, directly or not."""
+        found: dict[str, JobQueue] = {}
+        frontier = set(parent_ids)
+        while frontier:
+            children = [
+                job
+                for job in waiting
+                if job.id not in found and frontier.intersection(job.depends_on or [])
+            ]
+            found.update((job.id, job) for job in children)
+            frontier = {job.id for job in children}
+        return list(found.values())
+
+    def _release_dependents(self, session, job: JobQueue, result: dict[str, Any] | None) -> None:
+        """Bind a completed job's outputs into the jobs waiting for it.
+
+        Jobs whose parents have all completed are queued. If the job produced
+        no usable output, its dependents fail instead.
+        """
+        waiting = self._waiting_jobs(session)
+        children = [child for child in waiting if job.id in (child.depends_on or [])]
+        if not children:
+            return
+
+        try:
+            outputs = parent_outputs(job.job_type, job.prompt_ids, result)
+        except ValueError as e:
+            self._end_dependents(
+                session, [job.id], "failed", f"Parent job {job.id} failed: {e}", waiting
+            )
+            return
+
+        prompt_map = outputs.get("prompt_ids") or {}
+        for child in children:
+            bind_outputs(child, job.id, outputs)
+            for descendant in self._descendants(waiting, [child.id]):
+                remap_prompts(descendant, prompt_map)
+            child.depends_on = [parent for parent in child.depends_on if parent != job.id] or None
+            if child.depends_on:
+                continue
+
+            problem = missing_inputs(child)
+            if problem:
+                child.status = "failed"
+                child.completed_at = datetime.now(timezone.utc)
+                child.result = {"error": f"Cannot run after job {job.id}: {problem}"}
+                self._end_dependents(
+                    session, [child.id], "failed", f"Parent job {child.id} failed", waiting
+                )
+                logger.warning("Failed job {}: {}", child.id, problem)
+            else:
+                child.status = "queued"
+                logger.info("Job {} is ready; its parent jobs completed", child.id)
+        self.signals.notify()
+
+    @classmethod
+    def _end_dependents(
+        cls,
+        session,
+        parent_ids: list[str],
+        status: str,
+        reason: str,
+        waiting: list[JobQueue] | None = None,
+    ) -> int:
+        """Fail or cancel every job waiting, directly or not, for the given jobs.
+
+        Returns:
+            Number of jobs ended
+        """
+        if waiting is None:
+            waiting = cls._waiting_jobs(session)
+        descendants = cls._descendants(waiting, parent_ids)
+        now = datetime.now(timezone.utc)
+        for job in descendants:
+            job.status = status
+            job.completed_at = now
+            job.result = {"error": reason} if status == "failed" else {"reason": reason}
+            logger.info("Marking job {} as {}: {}", job.id, status, reason)
+        return len(descendants)
+
+    @classmethod
+    def _redirect_dependents(cls, session, replacements: dict[str, list[str]]) -> None:
+        """Make jobs waiting for replaced jobs wait for their replacements instead.
+
+        Args:
+            session: Session of the transaction replacing the jobs
+            replacements: IDs of the jobs replacing each removed job ID
+        """
+        for job in cls._waiting_jobs(session):
+            parents = job.depends_on or []
+            if not any(parent in replacements for parent in parents):
+                continue
+            redirected: list[str] = []
+            for parent in parents:
+                for new_parent in replacements.get(parent, [parent]):
+                    if new_parent not in redirected:
+                        redirected.append(new_parent)
+            job.depends_on = redirected
+
+    def _holds_lease(self, job: JobQueue) -> bool:
+        """Check no other process has claimed the job (unclaimed jobs have no lease)."""
+        return job.lease_owner in (None, self.lease_owner)
+
+    @staticmethod
+    def _lease_lost(job: JobQueue, host: PoolHost) -> dict[str, Any]:
+        """Leave a job another process reclaimed to that process."""
+        logger.warning("Job {} was reclaimed by another process; not recording its result", job.id)
+        return {"job_id": job.id, "status": "reclaimed", "host": host.name}
+
+    def _job_features(self, job: JobQueue) -> JobFeatures:
+        """Get the runtime-relevant features of a job."""
+        return JobFeatures.from_job(job.job_type, job.prompt_ids, job.config, self.batch_size)
+
+    def estimate_job_duration(self, job: JobQueue) -> float:
+        """Estimate how long a job will run.
+
+        Args:
+            job: Queued or running job
+
+        Returns:
+            Predicted runtime in seconds, from the history of finished jobs
+        """
+        return self.duration_estimator.estimate(self._job_features(job))
+
+    def _remaining_seconds(self, job: JobQueue) -> float:
+        """Estimate the time left for a running job."""
+        return self.duration_estimator.remaining(self._job_features(job), job.started_at)
+
+    @staticmethod
+    def _affinity_keys(job: JobQueue, result: dict[str, Any] | None = None) -> list[str]:
+        """Get the prompt and run IDs whose files a job uses or produces."""
+        keys = list(job.prompt_ids or [])
+        config = job.config or {}
+        source_run_id = config.get("run_id") or config.get("video_source")
+        if isinstance(source_run_id, str):
+            keys.append(source_run_id)
+        if isinstance(result, dict):
+            keys.extend(
+                result[key]
+                for key in ("run_id", "upscale_run_id")
+                if isinstance(result.get(key), str)
+            )
+        return keys
+
     # Job execution methods (copied from QueueService with minimal changes)
 
-    def _execute_inference(self, job: JobQueue) -> dict[str, Any]:
+    def _execute_inference(self, job: JobQueue, api: "CosmosAPI") -> dict[str, Any]:
         """Execute single inference job."""
         if not job.prompt_ids:
             raise ValueError("No prompt IDs provided")
@@ -274,7 +1157,7 @@ class SimplifiedQueueService:
         config = job.config or {}
 
         # Execute inference
-        result = self.cosmos_api.quick_inference(
+        result = api.quick_inference(
             prompt_id=prompt_id,
             weights=config.get("weights"),
             stream_output=False,
@@ -285,11 +1168,12 @@ class SimplifiedQueueService:
             sigma_max=config.get("sigma_max", 1000.0),
             blur_strength=config.get("blur_strength", 0.5),
             canny_threshold=config.get("canny_threshold", 0.1),
+            use_cache=not config.get("no_cache", False),
         )
 
         return result
 
-    def _execute_batch_inference(self, job: JobQueue) -> dict[str, Any]:
+    def _execute_batch_inference(self, job: JobQueue, api: "CosmosAPI") -> dict[str, Any]:
         """Execute batch inference job with support for weights_list."""
         if not job.prompt_ids:
             raise ValueError("No prompt IDs provided")
@@ -310,12 +1194,17 @@ class SimplifiedQueueService:
             weights_list = [{}] * len(job.prompt_ids)
             logger.warning("No weights specified for batch inference job %s", job.id)
 
+        # Claimed jobs got their batch ID with the claim (see claim_next_job)
+        batch_id = config.get("batch_id") or f"batch_{uuid4().hex[:16]}"
+
         # Build kwargs with weights_list
         kwargs = {
             "prompt_ids": job.prompt_ids,
             "weights_list": weights_list,
             "num_steps": config.get("num_steps", 25),
             "batch_size": self.batch_size,
+            "batch_id": batch_id,
+            "use_cache": not config.get("no_cache", False),
         }
 
         # Add optional parameters with proper mapping
@@ -336,10 +1225,10 @@ class SimplifiedQueueService:
                 kwargs[param] = config[param]
 
         # Execute batch
-        result = self.cosmos_api.batch_inference(**kwargs)
+        result = api.batch_inference(**kwargs)
         return result
 
-    def _execute_enhancement(self, job: JobQueue) -> dict[str, Any]:
+    def _execute_enhancement(self, job: JobQueue, api: "CosmosAPI") -> dict[str, Any]:
         """Execute enhancement job."""
         if not job.prompt_ids:
             raise ValueError("No prompt IDs provided")
@@ -358,10 +1247,10 @@ class SimplifiedQueueService:
             kwargs["force_overwrite"] = config["force_overwrite"]
 
         # Execute enhancement
-        result = self.cosmos_api.enhance_prompt(**kwargs)
+        result = api.enhance_prompt(**kwargs)
         return result
 
-    def _execute_upscale(self, job: JobQueue) -> dict[str, Any]:
+    def _execute_upscale(self, job: JobQueue, api: "CosmosAPI") -> dict[str, Any]:
         """Execute upscale job."""
         config = job.config or {}
 
@@ -381,7 +1270,7 @@ class SimplifiedQueueService:
             raise ValueError("No run_id provided for upscale job")
 
         # Execute upscale
-        result = self.cosmos_api.upscale(**kwargs)
+        result = api.upscale(**kwargs)
         return result
 
     # Public API methods for UI (keep same interface as QueueService)
@@ -391,7 +1280,8 @@ class SimplifiedQueueService:
         prompt_ids: list[str],
         job_type: str,
         config: dict[str, Any],
-        priority: int = 50,
+        priority: int = DEFAULT_PRIORITY,
+        depends_on: list[str] | None = None,
     ) -> str:
         """Add a job to the queue.
 
@@ -399,12 +1289,22 @@ class SimplifiedQueueService:
             prompt_ids: List of prompt IDs to process
             job_type: Type of job (inference, batch_inference, enhancement)
             config: Job configuration parameters
-            priority: Job priority (not used in simplified version)
+            priority: Job priority (0-100, higher runs sooner; waiting jobs
+                gain priority over time so low-priority jobs still run)
+            depends_on: IDs of unfinished jobs this job runs after; it waits
+                until they complete and gets their outputs (see
+                job_dependencies). An upscale job may leave out ``run_id``
 
         Returns:
             Job ID for tracking
+
+        Raises:
+            ValueError: If priority is out of range, or a parent job is no
+                longer waiting, queued or running
         """
-        job_id = f"job_{uuid.uuid4().hex[:12]}"
+        self._validate_priority(priority)
+        depends_on = list(dict.fromkeys(depends_on or []))
+        job_id = self._new_job_id()
 
         logger.info("Adding {} job to queue with {} prompts", job_type, len(prompt_ids))
 
@@ -412,21 +1312,122 @@ class SimplifiedQueueService:
             id=job_id,
             prompt_ids=prompt_ids,
             job_type=job_type,
-            status="queued",
+            status="waiting" if depends_on else "queued",
             config=config,
             priority=priority,
+            depends_on=depends_on or None,
         )
 
         with self.db_connection.get_session() as session:
             session.add(job)
+            if depends_on:
+                # The insert holds the write lock, so no parent finishes unseen
+                session.flush()
+                self._check_parents(session, depends_on)
             session.commit()
             logger.info("Added job {} to queue", job_id)
 
+        self.signals.notify()
         return job_id
 
+    def add_pipeline(
+        self,
+        prompt_ids: list[str],
+        inference_config: dict[str, Any],
+        enhancement_config: dict[str, Any] | None = None,
+        upscale_config: dict[str, Any] | None = None,
+        priority: int = DEFAULT_PRIORITY,
+    ) -> list[list[str]]:
+        """Queue an enhance -> inference -> upscale pipeline for each prompt.
+
+        Each prompt gets a chain of jobs, each waiting for the previous one:
+        inference runs on the enhanced prompt and the upscale on the
+        inference run. Inference jobs of several chains can still share a GPU
+        batch (see ``set_online_batching``).
+
+        Args:
+            prompt_ids: Prompts to run through the pipeline
+            inference_config: Config of the inference jobs (as for ``add_job``)
+            enhancement_config: Config of the enhancement jobs (create_new,
+                model, force_overwrite); None skips enhancement
+            upscale_config: Config of the upscale jobs (control_weight,
+                prompt); None skips upscaling
+            priority: Priority of every job
+
+        Returns:
+            Job IDs of each prompt's chain, in pipeline order
+
+        Raises:
+            ValueError: If no prompts are given or priority is out of range
+        """
+        if not prompt_ids:
+            raise ValueError("No prompt IDs provided")
+        self._validate_priority(priority)
+
+        stages = [
+            ("enhancement", enhancement_config),
+            ("inference", inference_config),
+            ("upscale", upscale_config),
+        ]
+        chains = []
+        with self.db_connection.get_session() as session:
+            for prompt_id in prompt_ids:
+                chain: list[str] = []
+                for job_type, config in stages:
+                    if config is None:
+                        continue
+                    job_id = self._new_job_id()
+                    session.add(
+                        JobQueue(
+                            id=job_id,
+                            prompt_ids=[prompt_id],
+                            job_type=job_type,
+                            status="waiting" if chain else "queued",
+                            config=dict(config),
+                            priority=priority,
+                            depends_on=chain[-1:] or None,
+                        )
+                    )
+                    chain.append(job_id)
+                chains.append(chain)
+            session.commit()
+
+        logger.info(
+            "Added pipeline of {} job(s) for {} prompt(s)",
+            sum(len(chain) for chain in chains),
+            len(prompt_ids),
+        )
+        self.signals.notify()
+        return chains
+
+    @staticmethod
+    def _new_job_id() -> str:
+        return f"job_{uuid.uuid4().hex[:12]}"
+
+    @staticmethod
+    def _check_parents(session, parent_ids: list[str]) -> None:
+        """Raise ValueError unless every parent job can still complete."""
+        statuses = dict(
+            session.query(JobQueue.id, JobQueue.status).filter(JobQueue.id.in_(parent_ids)).all()
+        )
+        for parent_id in parent_ids:
+            status = statuses.get(parent_id)
+            if status is None:
+                raise ValueError(f"Parent job {parent_id} not found (finished jobs are removed)")
+            if status not in ("waiting", "queued", *LEASED_JOB_STATUSES):
+                raise ValueError(f"Parent job {parent_id} is {status}")
+
     def get_queue_status(self) -> dict[str, Any]:
         """Get current queue status.
 
+        Queued entries carry ``estimated_seconds`` (predicted runtime) and
+        ``estimated_wait`` (seconds until the job should be done, as in
+        ``get_estimated_wait_time``); running entries carry
+        ``estimated_remaining``. ``downloading_jobs`` lists jobs that left the
+        GPU and wait for their outputs, ``waiting_jobs`` jobs that wait for
+        parent jobs. ``estimated_total_seconds`` is the time to drain the
+        whole queue.
+
         Returns:
             Dictionary with queue information
         """
@@ -434,38 +1435,82 @@ class SimplifiedQueueService:
             # Force fresh read
             session.expire_all()
 
-            # Get queued jobs
-            queued_jobs = (
+            # Get queued jobs in the order they will be claimed
+            queued_jobs = self._queued_jobs(session)
+
+            # Get running jobs (one per busy GPU slot)
+            running_jobs = (
                 session.query(JobQueue)
-                .filter_by(status="queued")
+                .filter_by(status="running")
+                .order_by(JobQueue.started_at)
+                .all()
+            )
+            downloading_jobs = (
+                session.query(JobQueue)
+                .filter_by(status="downloading")
+                .order_by(JobQueue.started_at)
+                .all()
+            )
+            waiting_jobs = (
+                session.query(JobQueue)
+                .filter_by(status="waiting")
                 .order_by(JobQueue.created_at)
                 .all()
             )
 
-            # Get running job
-            running_job = session.query(JobQueue).filter_by(status="running").first()
-
             # Format status
             status = {
                 "total_queued": len(queued_jobs),
                 "queued": [],
                 "running": None,
+                "running_jobs": [],
+                "downloading_jobs": [
+                    {
+                        "id": job.id,
+                        "type": job.job_type,
+                        "prompt_count": len(job.prompt_ids),
+                        "host": job.host,
+                    }
+                    for job in downloading_jobs
+                ],
+                "waiting_jobs": [
+                    {
+                        "id": job.id,
+                        "type": job.job_type,
+                        "prompt_count": len(job.prompt_ids),
+                        "depends_on": list(job.depends_on or []),
+                    }
+                    for job in waiting_jobs
+                ],
+                "hosts": self.gpu_pool.status(),
                 "paused": self.queue_paused,  # Include pause state
+                "worker": self.signals.get_worker() if self.signals.worker_alive() else None,
             }
 
+            # Queued jobs start once the running ones (and those ahead) finish
+            slots = self.gpu_pool.total_capacity
+            backlog = sum(self._remaining_seconds(job) for job in running_jobs)
+
             # Add queued job details
             for i, job in enumerate(queued_jobs, 1):
+                estimate = self.estimate_job_duration(job)
+                backlog += estimate
                 status["queued"].append(
                     {
                         "id": job.id,
                         "position": i,
                         "type": job.job_type,
                         "prompt_count": len(job.prompt_ids),
+                        "priority": job.priority,
+                        "effective_priority": round(self.effective_priority(job), 1),
+                        "estimated_seconds": round(estimate),
+                        "estimated_wait": round(backlog / slots),
                     }
                 )
+            status["estimated_total_seconds"] = round(backlog / slots)
 
-            # Add running job details
-            if running_job:
+            # Add running job details ("running" keeps the longest-running one)
+            for running_job in running_jobs:
                 elapsed = None
                 if running_job.started_at:
                     started_at = running_job.started_at
@@ -473,12 +1518,18 @@ class SimplifiedQueueService:
                         started_at = started_at.replace(tzinfo=timezone.utc)
                     elapsed = (datetime.now(timezone.utc) - started_at).seconds
 
-                status["running"] = {
-                    "id": running_job.id,
-                    "type": running_job.job_type,
-                    "prompt_count": len(running_job.prompt_ids),
-                    "elapsed_time": elapsed,
-                }
+                status["running_jobs"].append(
+                    {
+                        "id": running_job.id,
+                        "type": running_job.job_type,
+                        "prompt_count": len(running_job.prompt_ids),
+                        "elapsed_time": elapsed,
+                        "host": running_job.host,
+                        "estimated_remaining": round(self._remaining_seconds(running_job)),
+                    }
+                )
+            if status["running_jobs"]:
+                status["running"] = status["running_jobs"][0]
 
             return status
 
@@ -505,6 +1556,12 @@ class SimplifiedQueueService:
                 "started_at": job.started_at,
                 "completed_at": job.completed_at,
                 "result": job.result,
+                "host": job.host,
+                "priority": job.priority,
+                "depends_on": list(job.depends_on or []),
+                "effective_priority": (
+                    round(self.effective_priority(job), 1) if job.status == "queued" else None
+                ),
             }
 
     def get_position(self, job_id: str) -> int | None:
@@ -517,12 +1574,7 @@ class SimplifiedQueueService:
             Position in queue (1-based), None if not queued
         """
         with self.db_connection.get_session() as session:
-            queued_jobs = (
-                session.query(JobQueue)
-                .filter_by(status="queued")
-                .order_by(JobQueue.created_at)
-                .all()
-            )
+            queued_jobs = self._queued_jobs(session)
 
             for i, job in enumerate(queued_jobs, 1):
                 if job.id == job_id:
@@ -531,7 +1583,7 @@ class SimplifiedQueueService:
             return None
 
     def cancel_job(self, job_id: str) -> bool:
-        """Cancel a queued job.
+        """Cancel a queued or waiting job and the jobs waiting for it.
 
         Args:
             job_id: Job ID to cancel
@@ -546,106 +1598,223 @@ class SimplifiedQueueService:
                 logger.warning("Cannot cancel job {}: not found", job_id)
                 return False
 
-            # Can only cancel queued jobs
-            if job.status != "queued":
+            # Can only cancel jobs that have not started
+            if job.status not in ("queued", "waiting"):
                 logger.warning("Cannot cancel job {}: status is {}", job_id, job.status)
                 return False
 
             job.status = "cancelled"
             job.completed_at = datetime.now(timezone.utc)
             job.result = {"reason": "User cancelled"}
+            self._end_dependents(session, [job_id], "cancelled", f"Parent job {job_id} cancelled")
             session.commit()
 
             logger.info("Cancelled job {}", job_id)
             return True
 
     def get_estimated_wait_time(self, job_id: str) -> int | None:
-        """Estimate wait time for a job in seconds.
+        """Estimate how long until a queued job has finished.
+
+        Adds the remaining time of running jobs, the predicted runtimes of the
+        jobs ahead in claim order, and the job's own runtime, spread over the
+        GPU pool's slots. Runtimes come from ``duration_estimator``.
 
         Args:
             job_id: Job ID to estimate
 
         Returns:
-            Estimated wait time in seconds, None if not queued
+            Estimated seconds, None if not queued
         """
-        position = self.get_position(job_id)
-        if not position:
-            return None
+        with self.db_connection.get_session() as session:
+            queued_jobs = self._queued_jobs(session)
+            if job_id not in {job.id for job in queued_jobs}:
+                return None
+            running_jobs = session.query(JobQueue).filter_by(status="running").all()
+
+            seconds = sum(self._remaining_seconds(job) for job in running_jobs)
+            for job in queued_jobs:
+                seconds += self.estimate_job_duration(job)
+                if job.id == job_id:
+                    break
 
-        # Simple estimate: 120 seconds per job
-        avg_job_time = 120
-        return position * avg_job_time
+        return round(seconds / self.gpu_pool.total_capacity)
 
     def _cleanup_orphaned_jobs(self) -> None:
-        """Mark jobs that were running when app closed as failed.
+        """Requeue jobs whose process died and fail their abandoned runs.
 
-        This runs on startup to clean up any jobs that were interrupted
-        by application restart, crash, or unexpected shutdown.
+        This runs on startup to recover jobs that were interrupted by an
+        application restart, crash, or unexpected shutdown.
         """
         if not self.db_connection:
             logger.debug("No database connection available for cleanup")
             return
 
-        # First, clean up orphaned JobQueue entries
+        # First, put jobs with expired leases back in the queue
         self._cleanup_orphaned_job_queue()
 
         # Second, clean up orphaned Run records that may not have associated jobs
         self._cleanup_orphaned_runs()
 
     def _cleanup_orphaned_job_queue(self) -> None:
-        """Clean up JobQueue entries stuck in running state."""
-        with self.db_connection.get_session() as session:
-            # Find jobs that were left in running state
-            orphaned_jobs = session.query(JobQueue).filter_by(status="running").all()
-
-            if not orphaned_jobs:
-                logger.debug("No orphaned jobs found on startup")
-                return
-
-            logger.info("Found {} orphaned job(s) from previous session", len(orphaned_jobs))
+        """Clean up JobQueue entries left running by a previous session.
 
+        Jobs running without a lease (started before leases existed, or
+        executed without being claimed) cannot be resumed and are failed;
+        jobs whose lease expired are reclaimed.
+        """
+        with self.db_connection.get_session() as session:
+            orphaned_jobs = (
+                session.query(JobQueue)
+                .filter(
+                    JobQueue.status.in_(LEASED_JOB_STATUSES),
+                    JobQueue.lease_expires_at.is_(None),
+                )
+                .all()
+            )
+            orphaned = [(job.id, list(job.prompt_ids or []), None) for job in orphaned_jobs]
             for job in orphaned_jobs:
-                # Mark job as failed
                 job.status = "failed"
                 job.completed_at = datetime.now(timezone.utc)
                 job.result = {"error": "Job interrupted by application restart"}
-
                 logger.info("Marking orphaned job {} (type: {}) as failed", job.id, job.job_type)
+            self._end_dependents(
+                session,
+                [job.id for job in orphaned_jobs],
+                "failed",
+                "Parent job interrupted by application restart",
+            )
+            session.commit()
+
+        for job_id, prompt_ids, started_at in orphaned:
+            self._fail_interrupted_runs(job_id, prompt_ids, started_at)
 
-                # Also mark associated runs as failed
-                # This ensures the Run records match the job status
-                for prompt_id in job.prompt_ids:
-                    try:
-                        # Get runs for this prompt
-                        runs = self.cosmos_api.service.list_runs(prompt_id=prompt_id)
-
-                        for run in runs:
-                            # Only update runs that were in progress
-                            if run.get("status") in ["pending", "running", "uploading"]:
-                                run_id = run.get("id")
-                                logger.info(
-                                    "Marking orphaned run {} (status: {}) as failed",
-                                    run_id,
-                                    run.get("status"),
-                                )
-
-                                # Use update_run to set error message
-                                # This automatically sets status to failed and completed_at
-                                self.cosmos_api.service.update_run(
-                                    run_id, error_message="Job interrupted by application restart"
-                                )
-                    except Exception as e:
-                        logger.error("Error updating runs for prompt {}: {}", prompt_id, e)
-                        # Continue with other prompts even if one fails
+        reclaimed = self.reclaim_expired_leases()
+        if not orphaned and not reclaimed:
+            logger.debug("No orphaned jobs found on startup")
+        elif orphaned:
+            logger.info("Cleaned up {} orphaned job(s) on startup", len(orphaned))
+
+    def reclaim_expired_leases(self) -> int:
+        """Put running jobs whose lease expired back in the queue.
+
+        A job's lease expires when the process executing it, or retrieving
+        its outputs, stops sending heartbeats. The job is queued again with its priority and queue
+        position; batch jobs keep their batch ID, so the next run downloads
+        the videos that already finished and only reruns the rest. Other jobs
+        start over, so their unfinished runs are failed. A job reclaimed
+        ``MAX_JOB_ATTEMPTS`` times is failed instead. Jobs running without a
+        lease are left to the startup cleanup.
+
+        Returns:
+            Number of jobs reclaimed
+        """
+        now = datetime.now(timezone.utc)
+        with self.db_connection.get_session() as session:
+            expired = (
+                session.query(JobQueue)
+                .filter(
+                    JobQueue.status.in_(LEASED_JOB_STATUSES),
+                    JobQueue.lease_expires_at.is_not(None),
+                    JobQueue.lease_expires_at < now,
+                )
+                .with_for_update(skip_locked=True)
+                .all()
+            )
+            if not expired:
+                return 0
+
+            abandoned = []  # (job ID, prompt IDs, started at) of jobs whose runs are failed
+            for job in expired:
+                job.attempts = (job.attempts or 0) + 1
+                resumable = bool((job.config or {}).get("batch_id"))
+                given_up = job.attempts >= MAX_JOB_ATTEMPTS
+                if given_up or not resumable:
+                    abandoned.append((job.id, list(job.prompt_ids or []), job.started_at))
+
+                if given_up:
+                    job.status = "failed"
+                    job.completed_at = now
+                    job.result = {"error": f"Job interrupted {job.attempts} times; giving up"}
+                    logger.warning("Failed job {} after {} interruptions", job.id, job.attempts)
+                else:
+                    job.status = "queued"
+                    job.started_at = None
+                    job.host = None
+                    logger.info(
+                        "Reclaimed job {} (type: {}) from {}; {}",
+                        job.id,
+                        job.job_type,
+                        job.lease_owner or "a previous session",
+                        "its batch will resume" if resumable else "it will run again",
+                    )
+                job.lease_owner = job.lease_expires_at = None
 
+            self._end_dependents(
+                session,
+                [job.id for job in expired if job.status == "failed"],
+                "failed",
+                "Parent job interrupted too often",
+            )
             session.commit()
-            logger.info("Cleaned up {} orphaned job(s) on startup", len(orphaned_jobs))
+
+        for job_id, prompt_ids, started_at in abandoned:
+            self._fail_interrupted_runs(job_id, prompt_ids, started_at)
+        logger.info("Reclaimed {} job(s) with expired leases", len(expired))
+        self.signals.notify()
+        return len(expired)
+
+    def _fail_interrupted_runs(
+        self, job_id: str, prompt_ids: list[str], started_at: datetime | None
+    ) -> None:
+        """Fail the unfinished runs an interrupted job created."""
+        if not prompt_ids:
+            return
+        try:
+            runs = self.cosmos_api.service.list_runs(
+                prompt_ids=prompt_ids, created_after=started_at, limit=1000
+            )
+        except Exception as e:
+            logger.error("Error listing runs of interrupted job {}: {}", job_id, e)
+            return
+
+        for run in runs:
+            if run.get("status") not in IN_PROGRESS_RUN_STATUSES:
+                continue
+            logger.info(
+                "Marking interrupted run {} (status: {}) as failed", run["id"], run.get("status")
+            )
+            try:
+                # update_run with an error sets status to failed and completed_at
+                self.cosmos_api.service.update_run(
+                    run["id"], error_message="Job interrupted by application restart"
+                )
+            except Exception as e:
+                logger.error("Error failing interrupted run {}: {}", run["id"], e)
+
+    def _active_job_work(self) -> tuple[set[str], set[str]]:
+        """Get the batch IDs and prompt IDs that queued, running or downloading jobs own."""
+        with self.db_connection.get_session() as session:
+            jobs = (
+                session.query(JobQueue.status, JobQueue.prompt_ids, JobQueue.config)
+                .filter(JobQueue.status.in_(("queued", *LEASED_JOB_STATUSES)))
+                .all()
+            )
+        batch_ids = {config["batch_id"] for _, _, config in jobs if (config or {}).get("batch_id")}
+        running_prompts = {
+            prompt_id
+            for status, prompt_ids, _ in jobs
+            if status in LEASED_JOB_STATUSES
+            for prompt_id in prompt_ids or []
+        }
+        return batch_ids, running_prompts
 
     def _cleanup_orphaned_runs(self) -> None:
-        """Clean up Run records stuck in pending/running/uploading state.
+        """Clean up Run records stuck in pending/running/uploading/downloading state.
 
         This handles runs that may not have associated JobQueue entries,
         such as runs created via CLI or runs whose jobs were already deleted.
+        Runs of batches a reclaimed job will resume, and of jobs another
+        process holds a lease on, are left alone.
         """
         try:
             from datetime import datetime, timedelta, timezone
@@ -655,11 +1824,16 @@ class SimplifiedQueueService:
             cutoff_time = datetime.now(timezone.utc) - timedelta(minutes=10)
 
             orphaned_runs = self.cosmos_api.service.list_runs(limit=1000)
+            active_batches, running_prompts = self._active_job_work()
             cleanup_count = 0
 
             for run in orphaned_runs:
                 # Check if run is stuck in an incomplete state
-                if run.get("status") in ["pending", "running", "uploading"]:
+                if run.get("status") in IN_PROGRESS_RUN_STATUSES:
+                    batch_id = (run.get("metadata") or {}).get("batch_id")
+                    if batch_id in active_batches or run.get("prompt_id") in running_prompts:
+                        continue
+
                     # Check if it's old enough to be considered orphaned
                     created_at = run.get("created_at")
                     if created_at:
@@ -704,9 +1878,14 @@ class SimplifiedQueueService:
     def analyze_queue_for_smart_batching(self, mix_controls: bool = False) -> dict[str, Any] | None:
         """Analyze queued jobs for batching opportunities.
 
+        Batch plans are compared on the GPU time the batch cost model
+        predicts from measured batch executions.
+
         Args:
-            mix_controls: If True, use mixed mode (master batch approach).
-                         If False, use strict mode (identical controls only).
+            mix_controls: If True, allow runs with different controls in a batch
+                         and use whichever of strict, mixed or cost-optimized
+                         grouping is predicted fastest. If False, use strict
+                         mode (identical controls only).
 
         Returns:
             Analysis dictionary with batches and efficiency metrics, or None if empty
@@ -714,8 +1893,7 @@ class SimplifiedQueueService:
         from cosmos_workflow.utils.smart_batching import (
             calculate_batch_efficiency,
             filter_batchable_jobs,
-            group_runs_mixed,
-            group_runs_strict,
+            plan_batches,
         )
 
         with self.db_connection.get_session() as session:
@@ -735,21 +1913,26 @@ class SimplifiedQueueService:
                 self._analysis_queue_size = 0
                 return None
 
-            # Use user's batch size directly - trust their GPU capacity
+            # Batches hold at most batch_size runs and, if set, fit the GPU memory
             logger.debug("Using batch size: %d", self.batch_size)
+            memory = self._memory_budget(
+                session, [prompt_id for job in batchable_jobs for prompt_id in job.prompt_ids]
+            )
 
-            # Group runs based on mode
-            if mix_controls:
-                batches = group_runs_mixed(batchable_jobs, self.batch_size)
-                mode = "mixed"
-                mode_desc = "Mixed (allows different controls, may run slower)"
-            else:
-                batches = group_runs_strict(batchable_jobs, self.batch_size)
-                mode = "strict"
-                mode_desc = "Strict (identical controls only, faster execution)"
+            # Group runs into the plan with the least predicted GPU time
+            batches, mode = plan_batches(
+                batchable_jobs, self.batch_size, mix_controls, self.batch_cost_model, memory
+            )
+            mode_desc = {
+                "strict": "Strict (identical controls only)",
+                "mixed": "Mixed (all controls share batches)",
+                "optimized": "Cost-optimized (controls mixed only where predicted faster)",
+            }[mode]
 
             # Calculate efficiency metrics
-            efficiency = calculate_batch_efficiency(batches, batchable_jobs, mode)
+            efficiency = calculate_batch_efficiency(
+                batches, batchable_jobs, mode, self.batch_cost_model
+            )
 
             # Create human-readable preview
             total_runs = efficiency["total_runs"]
@@ -762,14 +1945,18 @@ class SimplifiedQueueService:
                     total_runs, efficiency["original_jobs"], total_batches
                 ),
                 f"- Estimated speedup: {speedup:.1f}x",
+                "- Estimated GPU time: {:.1f} min → {:.1f} min".format(
+                    efficiency["estimated_seconds_before"] / 60,
+                    efficiency["estimated_seconds_after"] / 60,
+                ),
                 f"- Mode: {mode_desc}",
                 f"- Batch size: {self.batch_size} runs/batch",
             ]
+            if memory:
+                preview_lines.append(f"- GPU memory budget: {memory.budget_gb:g} GB/batch")
 
-            if mix_controls and total_batches > 0:
-                preview_lines.append(
-                    "⚠️ Mixed mode may run slower per batch but needs fewer batches"
-                )
+            if mix_controls and mode == "strict":
+                preview_lines.append("Note: mixing controls is not predicted to be faster")
 
             if batches:
                 preview_lines.append("\nBatch breakdown:")
@@ -786,8 +1973,10 @@ class SimplifiedQueueService:
                         ", ".join(sorted(control_types)) if control_types else "no controls"
                     )
 
+                    memory_desc = f", ~{batch['memory_gb']:g} GB" if "memory_gb" in batch else ""
                     preview_lines.append(
-                        f"  Batch {i}: {num_runs} runs from {num_source_jobs} jobs ({controls_desc})"
+                        f"  Batch {i}: {num_runs} runs from {num_source_jobs} jobs "
+                        f"({controls_desc}{memory_desc})"
                     )
 
             preview = "\n".join(preview_lines)
@@ -875,6 +2064,19 @@ class SimplifiedQueueService:
                     len(batch["source_job_ids"]),
                 )
 
+            # Jobs waiting for an original job wait for every batch holding its prompts
+            self._redirect_dependents(
+                session,
+                {
+                    source_job_id: [
+                        new_job_id
+                        for new_job_id, batch in zip(created_job_ids, batches)
+                        if source_job_id in batch["source_job_ids"]
+                    ]
+                    for source_job_id in all_source_job_ids
+                },
+            )
+
             # Delete original jobs
             deleted_count = 0
             for job_id in all_source_job_ids:
@@ -892,6 +2094,8 @@ class SimplifiedQueueService:
                 len(created_job_ids),
             )
 
+        self.signals.notify()
+
         # Capture speedup before clearing analysis
         speedup = self._smart_batch_analysis["efficiency"].get("speedup", 1.0)
 
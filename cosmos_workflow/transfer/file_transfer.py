@@ -1,6 +1,9 @@
 #!/usr/bin/env python3
 """File transfer service for Cosmos-Transfer1 workflows.
 Windows implementation using SFTP for file transfers.
+
+SFTP channels are borrowed from the host's shared, bounded pool
+(``SSHManager.get_sftp``), so one service can be used from several threads.
 """
 
 from __future__ import annotations
@@ -14,6 +17,8 @@ from cosmos_workflow.utils.logging import logger
 from cosmos_workflow.utils.workflow_utils import ensure_directory, sanitize_remote_path
 
 if TYPE_CHECKING:
+    import paramiko
+
     from cosmos_workflow.connection.ssh_manager import SSHManager
 
 
@@ -197,43 +202,49 @@ class FileTransferService:
         remote_abs_dir = sanitize_remote_path(remote_abs_dir)
         with self.ssh_manager.get_sftp() as sftp:
             logger.info("Uploading directory: {} -> {}", local_dir, remote_abs_dir)
-
-            for item in local_dir.iterdir():
-                if item.is_file():
-                    remote_path = f"{remote_abs_dir}/{item.name}"
-                    sftp.put(str(item), remote_path)
-                    logger.debug("Uploaded {}", item.name)
-                elif item.is_dir():
-                    # Recursively handle subdirectories
-                    remote_subdir = f"{remote_abs_dir}/{item.name}"
-                    self._remote_mkdirs([remote_subdir])
-                    self._sftp_upload_dir(item, remote_subdir)
+            self._upload_tree(sftp, local_dir, remote_abs_dir)
+
+    def _upload_tree(self, sftp: paramiko.SFTPClient, local_dir: Path, remote_dir: str) -> None:
+        """Upload a directory's files and subdirectories over one SFTP channel."""
+        for item in local_dir.iterdir():
+            if item.is_file():
+                remote_path = f"{remote_dir}/{item.name}"
+                sftp.put(str(item), remote_path)
+                logger.debug("Uploaded {}", item.name)
+            elif item.is_dir():
+                # Recursively handle subdirectories
+                remote_subdir = f"{remote_dir}/{item.name}"
+                self._remote_mkdirs([remote_subdir])
+                self._upload_tree(sftp, item, remote_subdir)
 
     def _sftp_download_dir(self, remote_abs_dir: str, local_dir: Path) -> None:
         """Download a remote directory to a local directory via SFTP."""
         remote_abs_dir = sanitize_remote_path(remote_abs_dir)
         with self.ssh_manager.get_sftp() as sftp:
             logger.info("Downloading directory: {} -> {}", remote_abs_dir, local_dir)
+            self._download_tree(sftp, remote_abs_dir, local_dir)
+
+    def _download_tree(self, sftp: paramiko.SFTPClient, remote_dir: str, local_dir: Path) -> None:
+        """Download a remote directory's files and subdirectories over one SFTP channel."""
+        # List remote directory contents
+        try:
+            items = sftp.listdir_attr(remote_dir)
+        except Exception as e:
+            logger.error("Failed to list directory {}: {}", remote_dir, e)
+            return
 
-            # List remote directory contents
-            try:
-                items = sftp.listdir_attr(remote_abs_dir)
-            except Exception as e:
-                logger.error("Failed to list directory {}: {}", remote_abs_dir, e)
-                return
-
-            for item in items:
-                remote_path = f"{remote_abs_dir}/{item.filename}"
-                local_path = local_dir / item.filename
-
-                if stat.S_ISDIR(item.st_mode):
-                    # Recursively download subdirectories
-                    ensure_directory(local_path)
-                    self._sftp_download_dir(remote_path, local_path)
-                else:
-                    # Download file
-                    sftp.get(remote_path, str(local_path))
-                    logger.debug("Downloaded {}", item.filename)
+        for item in items:
+            remote_path = f"{remote_dir}/{item.filename}"
+            local_path = local_dir / item.filename
+
+            if stat.S_ISDIR(item.st_mode):
+                # Recursively download subdirectories
+                ensure_directory(local_path)
+                self._download_tree(sftp, remote_path, local_path)
+            else:
+                # Download file
+                sftp.get(remote_path, str(local_path))
+                logger.debug("Downloaded {}", item.filename)
 
     # ------------------------------------------------------------------ #
     # Misc helpers
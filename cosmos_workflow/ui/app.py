@@ -17,10 +17,8 @@ import atexit
 import signal
 import threading
 
-from cosmos_workflow.api import CosmosAPI
 from cosmos_workflow.config import ConfigManager
-from cosmos_workflow.database import DatabaseConnection
-from cosmos_workflow.services.simple_queue_service import SimplifiedQueueService
+from cosmos_workflow.ui.context import AppContext, close_app_context, set_app_context
 from cosmos_workflow.ui.core import build_ui_components, wire_all_events
 from cosmos_workflow.ui.queue_handlers import QueueHandlers
 from cosmos_workflow.utils.logging import logger
@@ -28,7 +26,8 @@ from cosmos_workflow.utils.logging import logger
 # Load configuration
 config = ConfigManager()
 
-# Global services (properly managed in this refactor)
+# Global services (owned by the process-wide AppContext)
+app_context = None
 api = None
 queue_service = None
 queue_handlers = None
@@ -40,13 +39,20 @@ def create_ui():
     This refactored version replaces the 1,782-line monolithic create_ui()
     with a clean, modular approach that's easy to understand and maintain.
     """
-    global api, queue_service, queue_handlers
-
-    # Initialize services
-    api = CosmosAPI()
-    database_path = "outputs/cosmos.db"
-    db_connection = DatabaseConnection(database_path)
-    queue_service = SimplifiedQueueService(db_connection=db_connection)
+    global app_context, api, queue_service, queue_handlers
+
+    # Initialize services once per process: one engine, repository and executor
+    # shared by every tab (handlers reach it through ui.context.get_api())
+    # (create_ui can run twice: at import for the Gradio CLI and from `cosmos ui`)
+    if app_context is None:
+        app_context = AppContext(config=config)
+        set_app_context(app_context)
+    api = app_context.api
+    queue_service = app_context.queue_service
+
+    # Keep GPU/container state warm so status views and queue claims read the cache
+    api.container_monitor.start()
+    queue_service.gpu_pool.start_monitors()
     queue_handlers = QueueHandlers(queue_service)
 
     # Build UI components using the modular builder
@@ -79,9 +85,12 @@ def _register_shutdown_handlers():
         thread_names = [t.name for t in threading.enumerate()]
         logger.info("Active threads before cleanup: %d - %s", active_threads, thread_names)
 
-        # SimplifiedQueueService doesn't need cleanup - it has no background threads
-        # or exclusive resources to release. The database connection is shared
-        # across the app and handled elsewhere.
+        # SimplifiedQueueService has no background threads; the shared database
+        # connection is owned by the application context
+        try:
+            close_app_context()
+        except Exception as e:
+            logger.error("Error closing application context: %s", e)
 
         # Try to properly close Gradio app if it exists
         if "app" in globals() and hasattr(globals()["app"], "close"):
@@ -80,6 +80,12 @@ COMPONENT_GROUPS: Final[dict[str, list[str]]] = {
         "ops_prompts_table",
     ],
     "run_actions": ["delete_run_btn", "upscale_btn", "transfer_btn", "enhance_btn"],
-    "job_control": ["kill_job_btn", "cancel_job_btn", "queue_table", "active_job_display"],
+    "job_control": [
+        "kill_job_btn",
+        "cancel_job_btn",
+        "prioritize_job_btn",
+        "queue_table",
+        "active_job_display",
+    ],
     "navigation": ["tabs", "selected_tab", "status_display"],
 }
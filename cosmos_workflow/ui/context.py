@@ -0,0 +1,134 @@
+"""Process-wide application context for the Gradio UI.
+
+Every UI handler used to construct its own CosmosAPI, which re-parsed
+config.toml, opened a new SQLAlchemy engine, ran create_all and built a
+GPUExecutor with no warm SSH state - often several times per click. The
+AppContext owns exactly one of each per process and handlers reach it
+through get_api().
+"""
+
+import threading
+
+from cosmos_workflow.api.cosmos_api import CosmosAPI
+from cosmos_workflow.config import ConfigManager
+from cosmos_workflow.database import DatabaseConnection
+from cosmos_workflow.utils.logging import logger
+
+
+class AppContext:
+    """Owns the shared config, database, repository, executor and queue service.
+
+    The queue service's GPU pool executes jobs on executors of its own, so a
+    job's SSH session is never shared with the handlers using ``api``.
+    """
+
+    def __init__(
+        self, config: ConfigManager | None = None, database: DatabaseConnection | None = None
+    ):
+        """Initialize the context.
+
+        Args:
+            config: Configuration manager. If None, creates default.
+            database: Database connection to use. If None, opens
+                outputs_dir/cosmos.db with the configured SQLite profile.
+        """
+        self.config = config or ConfigManager()
+        self.api = CosmosAPI(config=self.config, database=database)
+        self.database = self.api.service.db
+        self._queue_service = None
+        self._lock = threading.Lock()
+
+        logger.info("Application context initialized for {}", self.database.database_url)
+
+    @property
+    def repository(self):
+        """The shared DataRepository."""
+        return self.api.service
+
+    @property
+    def executor(self):
+        """The shared GPUExecutor."""
+        return self.api.orchestrator
+
+    @property
+    def queue_service(self):
+        """The shared SimplifiedQueueService, created on first use."""
+        with self._lock:
+            if self._queue_service is None:
+                from cosmos_workflow.services.gpu_pool import GPUPool
+                from cosmos_workflow.services.simple_queue_service import (
+                    SimplifiedQueueService,
+                )
+
+                # Queued jobs run on the pool's own executors: UI handlers use self.api's
+                # SSH connection from other threads, which must not close a job's session
+                gpu_pool = GPUPool.from_config(
+                    self.config, self.database, primary_api=self.api, share_executor=False
+                )
+                self._queue_service = SimplifiedQueueService(
+                    cosmos_api=self.api, db_connection=self.database, gpu_pool=gpu_pool
+                )
+                queue_config = self.config.get_queue_config()
+                self._queue_service.set_online_batching(
+                    queue_config["online_batching"],
+                    linger=queue_config["batch_linger"],
+                    mix_controls=queue_config["mix_controls"],
+                )
+                self._queue_service.set_gpu_memory(queue_config["gpu_memory_gb"])
+                self._queue_service.set_lease_seconds(queue_config["lease_seconds"])
+            return self._queue_service
+
+    def close(self) -> None:
+        """Stop the container monitors and release the database connection."""
+        if self._queue_service is not None:
+            self._queue_service.gpu_pool.stop_monitors()
+        self.api.container_monitor.stop()
+        self.database.close()
+        logger.info("Application context closed")
+
+
+_context: AppContext | None = None
+_context_lock = threading.Lock()
+
+
+def get_app_context() -> AppContext:
+    """Get the process-wide AppContext, creating it on first use.
+
+    Returns:
+        The shared AppContext
+    """
+    global _context
+    if _context is None:
+        with _context_lock:
+            if _context is None:
+                _context = AppContext()
+    return _context
+
+
+def set_app_context(context: AppContext | None) -> None:
+    """Install a context (e.g. one built by create_ui or a test), or clear it.
+
+    Args:
+        context: Context to install, or None to drop the current one
+    """
+    global _context
+    with _context_lock:
+        _context = context
+
+
+def close_app_context() -> None:
+    """Close and drop the process-wide context if one exists."""
+    global _context
+    with _context_lock:
+        if _context is not None:
+            _context.close()
+            _context = None
+
+
+def get_api() -> CosmosAPI:
+    """Get the shared CosmosAPI for UI handlers.
+
+    Returns:
+        The CosmosAPI owned by the process-wide AppContext
+    """
+    return get_app_context().api
@@ -161,9 +161,9 @@ def wire_queue_timers(components: dict[str, Any], simple_queue_service: Any) ->
         )
         logger.info("Queue auto-refresh timer created - Interval: %d seconds, Active: %s", 5, True)
 
-    # Create timer for auto-processing queue every 2 seconds
+    # Create timer for auto-processing queue every 2 seconds (fallback when no worker runs)
     def auto_process_queue() -> None:
-        """Process next job in queue automatically."""
+        """Process next job in queue automatically, unless a queue worker is running."""
         try:
             # Check if queue is paused
             if hasattr(simple_queue_service, "queue_paused") and simple_queue_service.queue_paused:
@@ -172,6 +172,10 @@ def wire_queue_timers(components: dict[str, Any], simple_queue_service: Any) ->
                 )
                 return  # Return nothing instead of None
 
+            # A standalone `cosmos worker` processes the queue; the UI only displays it
+            if simple_queue_service.worker_running():
+                return
+
             # Only process if there are actually jobs in the queue
             status = simple_queue_service.get_queue_status()
             queued_count = status.get("total_queued", 0)
@@ -289,7 +293,7 @@ def wire_queue_selection_events(components: dict[str, Any], simple_queue_service
         def handle_queue_select(table_data, evt: gr.SelectData):
             """Handle queue table selection with proper event format."""
             if evt is None or table_data is None:
-                return "No selection", gr.update(visible=False), None
+                return "No selection", gr.update(visible=False), gr.update(visible=False), None
 
             # Get selected row index
             row_idx = evt.index[0] if isinstance(evt.index, list | tuple) else evt.index
@@ -301,10 +305,15 @@ def wire_queue_selection_events(components: dict[str, Any], simple_queue_service
                 details = queue_handlers.get_job_details(job_id)
                 # Also get the status to determine if we should show cancel button
                 status = df_utils.get_cell_value(table_data, row_idx, 3, default=None)
-                show_cancel = status == "queued"
-                return details, gr.update(visible=show_cancel), job_id
+                show_cancel = status in ("queued", "waiting")
+                return (
+                    details,
+                    gr.update(visible=show_cancel),
+                    gr.update(visible=show_cancel),
+                    job_id,
+                )
 
-            return "No selection", gr.update(visible=False), None
+            return "No selection", gr.update(visible=False), gr.update(visible=False), None
 
         components["queue_table"].select(
             fn=handle_queue_select,
@@ -312,10 +321,22 @@ def wire_queue_selection_events(components: dict[str, Any], simple_queue_service
             outputs=[
                 components.get("job_details"),
                 components.get("cancel_job_btn"),
+                components.get("prioritize_job_btn"),
                 components.get("selected_job_id"),
             ],
         )
 
+    if "prioritize_job_btn" in components:
+        components["prioritize_job_btn"].click(
+            fn=queue_handlers.prioritize_item,
+            inputs=[components.get("selected_job_id")],
+            outputs=[
+                components.get("queue_status"),
+                components.get("queue_table"),
+                components.get("job_details"),
+            ],
+        )
+
     # Queue item actions
     if "remove_queue_item_btn" in components:
         components["remove_queue_item_btn"].click(
@@ -118,11 +118,10 @@ def wire_cross_tab_navigation(components: dict[str, Any]) -> None:
             dir_name = selected_dir.split("/")[-1] if "/" in selected_dir else selected_dir
             dir_name = dir_name.split("\\")[-1] if "\\" in dir_name else dir_name
 
-            # Import here to avoid circular dependency
-            from cosmos_workflow.api.cosmos_api import CosmosAPI
+            from cosmos_workflow.ui.context import get_api
 
             # Find prompts that use this input
-            api = CosmosAPI()
+            api = get_api()
             prompts = api.list_prompts(limit=100)
             matching_prompt_ids = []
             matching_prompt_names = []
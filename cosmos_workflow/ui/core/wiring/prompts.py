@@ -10,6 +10,7 @@ from cosmos_workflow.ui.tabs.prompts_handlers import (
     cancel_delete_prompts,
     clear_selection,
     confirm_delete_prompts,
+    load_more_ops_prompts,
     load_ops_prompts,
     on_prompt_row_select,
     preview_delete_prompts,
@@ -27,11 +28,17 @@ def wire_prompts_events(components: dict[str, Any], api: Any, simple_queue_servi
         api: CosmosAPI instance
         simple_queue_service: SimplifiedQueueService instance
     """
+
     # Bind services to handlers
-    run_inference_bound = functools.partial(
-        run_inference_on_selected,
-        queue_service=simple_queue_service,
-    )
+    def run_inference_bound(*values):
+        pipeline_steps = None
+        if "inf_pipeline" in components:
+            # The pipeline step selection is the last input
+            *values, pipeline_steps = values
+        return run_inference_on_selected(
+            *values, queue_service=simple_queue_service, pipeline_steps=pipeline_steps
+        )
+
     run_enhance_bound = functools.partial(
         run_enhance_on_selected,
         queue_service=simple_queue_service,
@@ -68,6 +75,17 @@ def wire_prompts_events(components: dict[str, Any], api: Any, simple_queue_servi
                 show_progress=False,
             )
 
+        # Load More appends the next page after the last row shown
+        if "ops_load_more_btn" in components:
+            safe_wire(
+                components["ops_load_more_btn"],
+                "click",
+                load_more_ops_prompts,
+                inputs=[components["ops_prompts_table"], *filter_inputs],
+                outputs=[components["ops_prompts_table"]],
+                show_progress=False,
+            )
+
     # Old prompts_table selection removed - using ops_prompts_table now
 
     # Inference and enhance buttons
@@ -86,6 +104,7 @@ def wire_prompts_events(components: dict[str, Any], api: Any, simple_queue_servi
             components.get("inf_sigma_max"),
             components.get("inf_blur_strength"),
             components.get("inf_canny_threshold"),
+            components.get("inf_pipeline"),
         ]
 
         inference_inputs = [i for i in inference_inputs if i is not None]
@@ -10,6 +10,7 @@ from cosmos_workflow.ui.tabs.runs import (
     cancel_upscale,
     confirm_delete_run,
     execute_upscale,
+    load_more_runs,
     load_run_logs,
     load_runs_data,
     load_runs_with_filters,
@@ -78,6 +79,14 @@ def wire_runs_filtering_events(components: dict[str, Any]) -> None:
                     outputs=filter_outputs,
                 )
 
+        # Load More appends the next page after the last run in the table
+        if "runs_load_more_btn" in components:
+            components["runs_load_more_btn"].click(
+                fn=load_more_runs,
+                inputs=[components.get("runs_table"), *load_inputs],
+                outputs=[components.get("runs_table")],
+            )
+
         # Wire clear filter button
         if "clear_nav_filter_btn" in components:
 
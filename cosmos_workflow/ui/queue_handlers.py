@@ -34,49 +34,81 @@ class QueueHandlers:
 
             # Build status text
             queued_count = status["total_queued"]
-            has_running = status["running"] is not None
+            running_jobs = status.get("running_jobs") or (
+                [status["running"]] if status["running"] else []
+            )
             is_paused = status.get("paused", False)
 
             # Add pause indicator if queue is paused
             pause_indicator = " [PAUSED]" if is_paused else ""
-
-            if has_running:
-                status_text = f"📋 Queue Status: {queued_count} pending, 1 running{pause_indicator}"
+            worker = status.get("worker")
+            if worker:
+                pause_indicator += f" [worker pid {worker.get('pid')}]"
+
+            if running_jobs:
+                status_text = (
+                    f"📋 Queue Status: {queued_count} pending, "
+                    f"{len(running_jobs)} running{pause_indicator}"
+                )
             elif queued_count > 0:
                 status_text = f"📋 Queue Status: {queued_count} pending{pause_indicator}"
             else:
                 status_text = f"📋 Queue Status: Empty{pause_indicator}"
 
+            if queued_count > 0 and status.get("estimated_total_seconds"):
+                status_text += (
+                    f" (~{self._format_duration(status['estimated_total_seconds'])} left)"
+                )
+
             # Build table data
             table_data = []
 
-            # Add running job first if exists
-            if status["running"]:
-                job = status["running"]
+            # Add running jobs first (one per busy GPU slot)
+            for job in running_jobs:
+                started = (
+                    f"{job.get('elapsed_time', 0)}s ago"
+                    if job.get("elapsed_time")
+                    else "just started"
+                )
+                if job.get("host"):
+                    started += f" on {job['host']}"
                 table_data.append(
                     [
                         "🏃",  # Position/Status icon
                         job["id"],
                         job["type"],
                         "running",
-                        f"{job.get('elapsed_time', 0)}s ago"
-                        if job.get("elapsed_time")
-                        else "just started",
+                        started,
                     ]
                 )
 
+            # Jobs off the GPU whose outputs are still downloading
+            for job in status.get("downloading_jobs", []):
+                details = "retrieving outputs"
+                if job.get("host"):
+                    details += f" from {job['host']}"
+                table_data.append(["⬇️", job["id"], job["type"], "downloading", details])
+
             # Add queued jobs with positions
             for job in status["queued"]:
+                details = f"{job['prompt_count']} prompt(s), priority {job.get('priority', 50)}"
+                if job.get("estimated_wait") is not None:
+                    details += f", done in ~{self._format_duration(job['estimated_wait'])}"
                 table_data.append(
                     [
                         str(job["position"]),  # Queue position
                         job["id"],
                         job["type"],
                         "queued",
-                        f"{job['prompt_count']} prompt(s)",
+                        details,
                     ]
                 )
 
+            # Pipeline jobs waiting for their parent jobs come last
+            for job in status.get("waiting_jobs", []):
+                details = f"after {', '.join(job['depends_on'])}"
+                table_data.append(["⏳", job["id"], job["type"], "waiting", details])
+
             return status_text, table_data
 
         except Exception as e:
@@ -123,7 +155,7 @@ class QueueHandlers:
             details = f"""**Job ID:** {job_id}
 **Type:** {job_type}
 **Status:** {job_info.get("status", "unknown")}
-**Priority:** {job_info.get("priority", 50)}
+**Priority:** {self._format_priority(job_info)}
 **Created:** {self._format_time(job_info.get("created_at"))}"""
 
             if job_info.get("started_at"):
@@ -132,15 +164,20 @@ class QueueHandlers:
             if job_info.get("completed_at"):
                 details += f"  \n**Completed:** {self._format_time(job_info.get('completed_at'))}"
 
+            if job_info.get("depends_on"):
+                details += f"  \n**Waiting For:** {', '.join(job_info['depends_on'])}"
+
             if job_info.get("status") == "queued":
                 position = self.queue_service.get_position(job_id)
                 if position:
                     details += f"  \n**Queue Position:** #{position}"
-                    # Estimate wait time (assuming ~2 minutes per job)
-                    estimated_wait = position * 120
-                    details += (
-                        f"  \n**Estimated Wait:** ~{estimated_wait // 60}m {estimated_wait % 60}s"
-                    )
+                    # Estimated from the runtimes of finished jobs
+                    estimated_wait = self.queue_service.get_estimated_wait_time(job_id)
+                    if estimated_wait is not None:
+                        details += (
+                            f"  \n**Estimated Wait:** ~{estimated_wait // 60}m "
+                            f"{estimated_wait % 60}s"
+                        )
 
             if job_info.get("result") and job_info.get("status") == "failed":
                 error = job_info.get("result", {}).get("error", "Unknown error")
@@ -152,6 +189,26 @@ class QueueHandlers:
             logger.error("Error getting job details for %s: %s", job_id, e)
             return f"❌ Error getting job details: {e}"
 
+    @staticmethod
+    def _format_duration(seconds: int) -> str:
+        """Format a duration estimate as e.g. "45s", "4m 10s" or "1h 5m"."""
+        seconds = int(seconds)
+        if seconds < 60:
+            return f"{seconds}s"
+        if seconds < 3600:
+            return f"{seconds // 60}m {seconds % 60}s"
+        return f"{seconds // 3600}h {seconds % 3600 // 60}m"
+
+    @staticmethod
+    def _format_priority(job_info: dict[str, Any]) -> str:
+        """Format base priority, plus the aged priority for queued jobs."""
+        priority = job_info.get("priority")
+        priority = 50 if priority is None else priority
+        effective = job_info.get("effective_priority")
+        if effective is not None and effective != priority:
+            return f"{priority} (effective {effective:g} with wait time)"
+        return str(priority)
+
     def _format_time(self, timestamp) -> str:
         """Format timestamp for display.
 
@@ -119,22 +119,27 @@ def get_custom_css():
 
     #prompts-dataframe th:nth-child(2),
     #prompts-dataframe td:nth-child(2) {
-        width: 25% !important;  /* ID column */
+        width: 23% !important;  /* ID column */
     }
 
     #prompts-dataframe th:nth-child(3),
     #prompts-dataframe td:nth-child(3) {
-        width: 20% !important;  /* Name column */
+        width: 18% !important;  /* Name column */
     }
 
     #prompts-dataframe th:nth-child(4),
     #prompts-dataframe td:nth-child(4) {
-        width: 35% !important;  /* Prompt Text column */
+        width: 34% !important;  /* Prompt Text column */
     }
 
     #prompts-dataframe th:nth-child(5),
     #prompts-dataframe td:nth-child(5) {
-        width: 15% !important;  /* Created column */
+        width: 14% !important;  /* Created column */
+    }
+
+    #prompts-dataframe th:nth-child(6),
+    #prompts-dataframe td:nth-child(6) {
+        width: 6% !important;  /* Runs column */
     }
 
     /* Ensure text wraps in cells instead of causing horizontal scroll */
@@ -11,7 +11,7 @@ from pathlib import Path
 
 import gradio as gr
 
-from cosmos_workflow.api.cosmos_api import CosmosAPI
+from cosmos_workflow.ui.context import get_api
 from cosmos_workflow.ui.utils import video as video_utils
 from cosmos_workflow.utils.logging import logger
 
@@ -283,7 +283,7 @@ def create_prompt(prompt_text, video_dir, name, negative_prompt):
             video_path = Path(video_dir.strip())
 
         # Use CosmosAPI to create prompt (it handles validation)
-        ops = CosmosAPI()
+        ops = get_api()
         prompt = ops.create_prompt(
             prompt_text=prompt_text.strip(),
             video_dir=video_path,
@@ -8,7 +8,7 @@ import logging
 
 import gradio as gr
 
-from cosmos_workflow.api.cosmos_api import CosmosAPI
+from cosmos_workflow.ui.context import get_api
 from cosmos_workflow.ui.log_viewer import LogViewer
 
 logger = logging.getLogger(__name__)
@@ -22,7 +22,7 @@ def show_kill_confirmation():
     try:
         logger.debug("Showing kill confirmation dialog")
         # Check if there's actually an active job
-        api = CosmosAPI()
+        api = get_api()
         containers = api.get_active_containers()
 
         if containers and len(containers) > 0:
@@ -58,7 +58,7 @@ def execute_kill_job():
     """Execute the kill job operation and update job status in database."""
     try:
         logger.info("Executing kill job operation")
-        api = CosmosAPI()
+        api = get_api()
 
         # First get the active containers to find the run IDs
         containers = api.get_active_containers()
@@ -159,7 +159,7 @@ def start_log_streaming(auto_start=False):
         log_viewer.clear()
 
     try:
-        ops = CosmosAPI()
+        ops = get_api()
         containers = ops.get_active_containers()
 
         if not containers:
@@ -217,7 +217,7 @@ def refresh_and_stream():
 def check_running_jobs():
     """Check for active containers and system status on remote instance."""
     try:
-        ops = CosmosAPI()
+        ops = get_api()
         # Get comprehensive status like CLI does
         status_info = ops.check_status()
 
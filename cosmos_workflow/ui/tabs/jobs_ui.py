@@ -49,12 +49,19 @@ def create_jobs_tab_ui():
                 gr.Markdown("#### 📝 Job Details")
                 components["job_details"] = gr.Markdown("Select a job to view details")
                 components["selected_job_id"] = gr.State(None)  # Track selected job
-                components["cancel_job_btn"] = gr.Button(
-                    "❌ Cancel Selected Job",
-                    size="sm",
-                    variant="stop",
-                    visible=False,
-                )
+                with gr.Row():
+                    components["prioritize_job_btn"] = gr.Button(
+                        "⏫ Move to Front",
+                        size="sm",
+                        variant="secondary",
+                        visible=False,
+                    )
+                    components["cancel_job_btn"] = gr.Button(
+                        "❌ Cancel Selected Job",
+                        size="sm",
+                        variant="stop",
+                        visible=False,
+                    )
 
             with gr.Column(scale=2):
                 gr.Markdown("#### Current Execution")
@@ -1,18 +1,23 @@
 #!/usr/bin/env python3
 """Event handlers for Prompts tab functionality."""
 
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 import gradio as gr
 
-from cosmos_workflow.api import CosmosAPI
+from cosmos_workflow.services.data_repository import CURSOR_SEPARATOR
 from cosmos_workflow.services.simple_queue_service import SimplifiedQueueService
+from cosmos_workflow.ui.context import get_api
 from cosmos_workflow.ui.utils import dataframe as df_utils
 from cosmos_workflow.ui.utils import video as video_utils
 from cosmos_workflow.ui.utils.formatting import parse_timestamp_safe, truncate_text
 from cosmos_workflow.utils.logging import logger
 
+# Pipeline steps offered around inference in the Prompts tab
+PIPELINE_ENHANCE = "Enhance prompts first"
+PIPELINE_UPSCALE = "Upscale outputs to 4K"
+
 
 def select_all_prompts(table_data):
     """Select all prompts in the table."""
@@ -101,10 +106,8 @@ def preview_delete_prompts(table_data):
                 "",  # No IDs to store
             )
 
-        # Create CosmosAPI instance
-        from cosmos_workflow.api.cosmos_api import CosmosAPI
-
-        ops = CosmosAPI()
+        # Use the shared CosmosAPI instance
+        ops = get_api()
         if not ops:
             return (
                 gr.update(visible=False),
@@ -197,10 +200,8 @@ def confirm_delete_prompts(prompt_ids_string, delete_outputs):
                 gr.update(visible=False),  # Hide dialog
             )
 
-        # Create CosmosAPI instance
-        from cosmos_workflow.api.cosmos_api import CosmosAPI
-
-        ops = CosmosAPI()
+        # Use the shared CosmosAPI instance
+        ops = get_api()
         if not ops:
             return (
                 gr.update(),  # ops_prompts_table
@@ -276,7 +277,7 @@ def list_prompts(limit=50):
     """List prompts using CosmosAPI, formatted for display."""
     try:
         # Use CosmosAPI to list prompts
-        ops = CosmosAPI()
+        ops = get_api()
         prompts = ops.list_prompts(limit=limit)
 
         # Format for Gradio Dataframe display
@@ -334,23 +335,15 @@ def filter_prompts(
 
     # Apply runs filter
     if runs_filter != "all":
-        # Get run counts for each prompt
-        ops = CosmosAPI()
-
-        # Build a mapping of prompt_id -> run count
-        prompt_run_counts = {}
-        for prompt in filtered:
-            prompt_id = prompt.get("id")
-            if prompt_id:
-                # Get runs for this prompt
-                runs = ops.list_runs(prompt_id=prompt_id, limit=1)  # Just check if any exist
-                prompt_run_counts[prompt_id] = len(runs)
+        # Run counts for all candidates in one GROUP BY query
+        prompt_ids = [p.get("id") for p in filtered if p.get("id")]
+        run_stats = get_api().get_prompt_run_stats(prompt_ids)
 
         # Filter based on run counts
         if runs_filter == "no_runs":
-            filtered = [p for p in filtered if prompt_run_counts.get(p.get("id"), 0) == 0]
+            filtered = [p for p in filtered if p.get("id") not in run_stats]
         elif runs_filter == "has_runs":
-            filtered = [p for p in filtered if prompt_run_counts.get(p.get("id"), 0) > 0]
+            filtered = [p for p in filtered if p.get("id") in run_stats]
 
     # Apply date filter
     if date_filter != "all":
@@ -382,6 +375,80 @@ def filter_prompts(
     return filtered
 
 
+# Prompts tab date filters as (created_after, created_before) ages in days
+_DATE_FILTER_AGES = {
+    "today": (1, None),
+    "last_7_days": (8, None),
+    "last_30_days": (31, None),
+    "older_than_30_days": (None, 31),
+}
+
+
+def _ops_prompt_filters(enhanced_filter, runs_filter, date_filter):
+    """Translate the Prompts tab filters into list_prompts/search_prompts filters."""
+    filters = {}
+    if enhanced_filter in ("enhanced", "not_enhanced"):
+        filters["enhanced"] = enhanced_filter == "enhanced"
+    if runs_filter in ("has_runs", "no_runs"):
+        filters["has_runs"] = runs_filter == "has_runs"
+    if date_filter in _DATE_FILTER_AGES:
+        now = datetime.now(timezone.utc)
+        newer_than, older_than = _DATE_FILTER_AGES[date_filter]
+        if newer_than is not None:
+            filters["created_after"] = now - timedelta(days=newer_than)
+        if older_than is not None:
+            filters["created_before"] = now - timedelta(days=older_than)
+    return filters
+
+
+def _fetch_ops_prompts(
+    ops, limit, search_text, enhanced_filter, runs_filter, date_filter, after=None
+):
+    """Fetch up to limit prompts matching the Prompts tab filters.
+
+    Every filter runs in SQL, so a page is only short when no more prompts match.
+    """
+    filters = _ops_prompt_filters(enhanced_filter, runs_filter, date_filter)
+    if search_text and search_text.strip():
+        # Full-text search ranks results, so it has no cursor
+        return ops.search_prompts(search_text, limit=limit, **filters)
+    return ops.list_prompts(limit=limit, after=after, **filters)
+
+
+def _ops_row_cursor(row):
+    """Build the keyset cursor continuing after an operations table row.
+
+    The cursor keeps the row's created time next to its ID, so Load More still
+    works after that prompt has been deleted.
+    """
+    prompt_id, created = row[1], row[4]
+    return f"{created}{CURSOR_SEPARATOR}{prompt_id}" if created else prompt_id
+
+
+def _ops_prompt_rows(ops, prompts):
+    """Format prompts as unselected operations table rows with run counts."""
+    run_stats = ops.get_prompt_run_stats([p["id"] for p in prompts if p.get("id")])
+    return [
+        _ops_prompt_row(prompt, run_stats.get(prompt.get("id"), {}).get("total", 0))
+        for prompt in prompts
+    ]
+
+
+def _ops_prompt_row(prompt, run_count=0):
+    """Format a prompt as an unselected operations table row."""
+    prompt_id = prompt.get("id", "")
+    name = prompt.get("parameters", {}).get("name", "unnamed")
+    # Model type removed - prompts don't have model types
+    text = prompt.get("prompt_text", "")
+    created = prompt.get("created_at", "")[:19] if prompt.get("created_at") else ""
+
+    # Truncate text for display
+    text = truncate_text(text, max_length=60)
+
+    # Add with selection checkbox (False by default), created date and run count
+    return [False, prompt_id, name, text, created, run_count]
+
+
 def load_ops_prompts(
     limit=50, search_text="", enhanced_filter="all", runs_filter="all", date_filter="all"
 ):
@@ -397,60 +464,86 @@ def load_ops_prompts(
             date_filter,
         )
 
-        # Create fresh CosmosAPI instance
-        ops = CosmosAPI()
-
-        # Use CosmosAPI to get prompts (get more than limit to filter)
-        prompts = ops.list_prompts(
-            limit=limit * 3
-            if search_text
-            or enhanced_filter != "all"
-            or runs_filter != "all"
-            or date_filter != "all"
-            else limit
+        # Use the shared CosmosAPI instance
+        ops = get_api()
+        prompts = _fetch_ops_prompts(
+            ops, int(limit), search_text, enhanced_filter, runs_filter, date_filter
         )
 
-        # Apply filters
-        filtered_prompts = filter_prompts(
-            prompts, search_text, enhanced_filter, runs_filter, date_filter
-        )
-        logger.info("Filtered {} prompts to {} results", len(prompts), len(filtered_prompts))
-
-        # Limit results
-        filtered_prompts = filtered_prompts[:limit]
-
         # Format for operations table with selection column
-        table_data = []
-        for prompt in filtered_prompts:
-            prompt_id = prompt.get("id", "")
-            name = prompt.get("parameters", {}).get("name", "unnamed")
-            # Model type removed - prompts don't have model types
-            text = prompt.get("prompt_text", "")
-            created = prompt.get("created_at", "")[:19] if prompt.get("created_at") else ""
+        return _ops_prompt_rows(ops, prompts)
+    except Exception as e:
+        logger.error("Failed to load prompts for operations: {}", e)
+        return []
 
-            # Truncate text for display
-            text = truncate_text(text, max_length=60)
 
-            # Add with selection checkbox (False by default) and created date
-            table_data.append([False, prompt_id, name, text, created])
+def load_more_ops_prompts(
+    table_data,
+    limit=50,
+    search_text="",
+    enhanced_filter="all",
+    runs_filter="all",
+    date_filter="all",
+):
+    """Append the next page of prompts to the operations table.
 
-        return table_data
+    Pages continue after the last prompt shown (keyset cursor), so the cost
+    does not grow with the number of rows already loaded and selections are
+    kept. Search results are ranked rather than time ordered, so for searches
+    the table is reloaded with a larger limit and selections carried over.
+    """
+    try:
+        rows = df_utils.to_rows(table_data)
+        if not rows:
+            return load_ops_prompts(limit, search_text, enhanced_filter, runs_filter, date_filter)
+
+        ops = get_api()
+        limit = int(limit)
+        if search_text and search_text.strip():
+            selected_ids = set(get_selected_prompt_ids(rows))
+            prompts = _fetch_ops_prompts(
+                ops, len(rows) + limit, search_text, enhanced_filter, runs_filter, date_filter
+            )
+            new_rows = _ops_prompt_rows(ops, prompts)
+            for row in new_rows:
+                row[0] = row[1] in selected_ids
+            return new_rows
+
+        prompts = _fetch_ops_prompts(
+            ops,
+            limit,
+            "",
+            enhanced_filter,
+            runs_filter,
+            date_filter,
+            after=_ops_row_cursor(rows[-1]),
+        )
+        logger.info("Loaded {} more prompts after {}", len(prompts), rows[-1][1])
+        return rows + _ops_prompt_rows(ops, prompts)
     except Exception as e:
-        logger.error("Failed to load prompts for operations: {}", e)
-        return []
+        logger.error("Failed to load more prompts: {}", e)
+        return table_data
 
 
 def calculate_run_statistics(runs):
     """Calculate run statistics by model type and status.
 
     Args:
-        runs: List of run dictionaries
+        runs: List of run dictionaries, or a prompt's run summary from
+            CosmosAPI.get_prompt_run_stats
 
     Returns:
         Dictionary with counts by model_type for completed runs
     """
     stats = {"transfer": 0, "upscale": 0, "enhance": 0, "total_completed": 0}
 
+    if isinstance(runs, dict):
+        for model_type, count in runs.get("completed_by_model_type", {}).items():
+            if model_type.lower() in stats:
+                stats[model_type.lower()] += count
+            stats["total_completed"] += count
+        return stats
+
     for run in runs:
         if run.get("status") == "completed":
             model_type = run.get("model_type", "").lower()
@@ -465,11 +558,17 @@ def calculate_average_rating(runs):
     """Calculate average rating for completed runs.
 
     Args:
-        runs: List of run dictionaries
+        runs: List of run dictionaries, or a prompt's run summary from
+            CosmosAPI.get_prompt_run_stats
 
     Returns:
         Tuple of (average_rating, rated_count) or (None, 0) if no ratings
     """
+    if isinstance(runs, dict):
+        if runs.get("average_rating") is None:
+            return None, 0
+        return runs["average_rating"], runs["rated_count"]
+
     ratings = []
     for run in runs:
         if run.get("status") == "completed" and run.get("rating") is not None:
@@ -547,7 +646,7 @@ def on_prompt_row_select(dataframe_data, evt: gr.SelectData):
         logger.info("Selected row index: {}", row_idx)
 
         # Extract prompt ID using utility
-        # Columns: ["☑", "ID", "Name", "Prompt Text", "Created"]
+        # Columns: ["☑", "ID", "Name", "Prompt Text", "Created", "Runs"]
         prompt_id = df_utils.get_cell_value(dataframe_data, row_idx, 1, default="")
         if prompt_id:
             prompt_id = str(prompt_id)
@@ -569,7 +668,7 @@ def on_prompt_row_select(dataframe_data, evt: gr.SelectData):
             ]
 
         # Use CosmosAPI to get full prompt details
-        ops = CosmosAPI()
+        ops = get_api()
         prompt_details = ops.get_prompt(prompt_id)
         if prompt_details:
             name = prompt_details.get("parameters", {}).get("name", "unnamed")
@@ -588,11 +687,11 @@ def on_prompt_row_select(dataframe_data, evt: gr.SelectData):
                 inputs.get("video", "").replace("/color.mp4", "") if inputs.get("video") else ""
             )
 
-            # Fetch runs for this prompt
-            runs = ops.list_runs(prompt_id=prompt_id, limit=100)
+            # Aggregate this prompt's runs in SQL (all of them, not just a recent window)
+            run_summary = ops.get_prompt_run_stats([prompt_id]).get(prompt_id, {})
 
             # Calculate run statistics
-            stats = calculate_run_statistics(runs)
+            stats = calculate_run_statistics(run_summary)
             if stats["total_completed"] > 0:
                 parts = []
                 if stats["transfer"] > 0:
@@ -606,7 +705,7 @@ def on_prompt_row_select(dataframe_data, evt: gr.SelectData):
                 stats_text = "No completed runs"
 
             # Calculate average rating
-            avg_rating, rated_count = calculate_average_rating(runs)
+            avg_rating, rated_count = calculate_average_rating(run_summary)
             if avg_rating is not None:
                 rating_text = (
                     f"{avg_rating:.1f}/5 ({rated_count} {'run' if rated_count == 1 else 'runs'})"
@@ -623,7 +722,7 @@ def on_prompt_row_select(dataframe_data, evt: gr.SelectData):
                 prompt_id,
                 name,
                 enhanced,
-                len(runs),
+                run_summary.get("total", 0),
             )
             # Return gr.update() objects to force UI refresh
             return [
@@ -687,8 +786,14 @@ def run_inference_on_selected(
     canny_threshold,
     queue_service: SimplifiedQueueService,
     progress=None,
+    pipeline_steps=None,
 ):
-    """Run inference on selected prompts with queue progress tracking."""
+    """Run inference on selected prompts with queue progress tracking.
+
+    With pipeline steps selected, each prompt is queued as a chain instead:
+    enhancement, inference on the enhanced prompt, then a 4K upscale of the
+    run, each job starting when the previous one completes.
+    """
     if progress is None:
         progress = gr.Progress()
 
@@ -722,6 +827,27 @@ def run_inference_on_selected(
             "canny_threshold": canny_threshold,
         }
 
+        if pipeline_steps:
+            chains = queue_service.add_pipeline(
+                prompt_ids=selected_ids,
+                inference_config=config,
+                enhancement_config=(
+                    {"create_new": True, "model": "pixtral"}
+                    if PIPELINE_ENHANCE in pipeline_steps
+                    else None
+                ),
+                upscale_config=(
+                    {"control_weight": 0.5} if PIPELINE_UPSCALE in pipeline_steps else None
+                ),
+            )
+            job_count = sum(len(chain) for chain in chains)
+            gr.Info(f"🔗 Queued {len(chains)} pipeline(s) with {job_count} job(s)")
+            status_msg = (
+                f"✅ Queued {job_count} job(s) as {len(chains)} pipeline(s)\n"
+                f"📋 Each step starts when the previous one finishes"
+            )
+            return None, status_msg, gr.update(value=status_msg, visible=True)
+
         # Always use batch inference for consistency (even for single prompts)
         # This ensures consistent file naming and processing
         job_type = "batch_inference"
@@ -7,6 +7,8 @@ Business logic remains in the main app.py file.
 
 import gradio as gr
 
+from cosmos_workflow.ui.tabs.prompts_handlers import PIPELINE_ENHANCE, PIPELINE_UPSCALE
+
 
 def create_prompts_tab_ui():
     """Create the Prompts tab UI components.
@@ -89,10 +91,10 @@ def create_prompts_tab_ui():
                         elem_id="prompts-table-wrapper", elem_classes=["prompts-table-container"]
                     ):
                         components["ops_prompts_table"] = gr.Dataframe(
-                            headers=["☑", "ID", "Name", "Prompt Text", "Created"],
-                            datatype=["bool", "str", "str", "str", "str"],
+                            headers=["☑", "ID", "Name", "Prompt Text", "Created", "Runs"],
+                            datatype=["bool", "str", "str", "str", "str", "number"],
                             interactive=True,  # Must be True for select event to work
-                            col_count=(5, "fixed"),
+                            col_count=(6, "fixed"),
                             wrap=True,
                             elem_id="prompts-dataframe",
                             elem_classes=["prompts-table"],
@@ -106,6 +108,9 @@ def create_prompts_tab_ui():
                         components["clear_selection_btn"] = gr.Button(
                             "☐ Clear Selection", size="sm", variant="secondary"
                         )
+                        components["ops_load_more_btn"] = gr.Button(
+                            "⬇ Load More", size="sm", variant="secondary"
+                        )
                         components["delete_selected_btn"] = gr.Button(
                             "🗑️ Delete Selected", size="sm", variant="stop"
                         )
@@ -287,6 +292,14 @@ def create_prompts_tab_ui():
                                     interactive=True,
                                 )
 
+                        # Optional pipeline steps around inference
+                        components["inf_pipeline"] = gr.CheckboxGroup(
+                            label="Pipeline",
+                            choices=[PIPELINE_ENHANCE, PIPELINE_UPSCALE],
+                            value=[],
+                            info="Queue every step at once; each starts when the previous finishes",
+                        )
+
                         # Run button
                         components["run_inference_btn"] = gr.Button(
                             "🚀 Run Inference",
@@ -13,6 +13,7 @@ This package contains:
 
 # Re-export main functions
 from cosmos_workflow.ui.tabs.runs.data_loading import (
+    load_more_runs,
     load_runs_data,
     load_runs_for_multiple_prompts,
     load_runs_with_filters,
@@ -74,6 +75,7 @@ __all__ = [
     "handle_runs_tab_default",
     "handle_runs_tab_with_filter",
     "handle_runs_tab_with_pending_data",
+    "load_more_runs",
     "load_run_logs",
     "load_runs_data",
     "load_runs_for_multiple_prompts",
@@ -8,13 +8,14 @@ from typing import Any
 
 import gradio as gr
 
-from cosmos_workflow.api.cosmos_api import CosmosAPI
+from cosmos_workflow.ui.context import get_api
 from cosmos_workflow.ui.tabs.runs.display_builders import (
     build_gallery_data,
     build_runs_table_data,
     calculate_runs_statistics,
 )
-from cosmos_workflow.ui.tabs.runs.filters import apply_date_filter, apply_run_filters
+from cosmos_workflow.ui.tabs.runs.filters import build_run_query_filters
+from cosmos_workflow.ui.utils import dataframe as df_utils
 from cosmos_workflow.utils.logging import logger
 
 
@@ -50,8 +51,7 @@ class RunsLoader:
     """
 
     def __init__(self):
-        self.api = CosmosAPI()
-        self.max_search_limit = 500
+        self.api = get_api()
 
     def load_runs(self, filters: RunFilters) -> tuple[list, list, str]:
         """Load runs with the given filters.
@@ -70,21 +70,11 @@ class RunsLoader:
                 logger.warning("CosmosAPI not initialized")
                 return [], [], "No data available"
 
-            # Fetch runs based on filter configuration
-            all_runs = self._fetch_runs(filters)
-
-            # Enrich runs with additional data
-            self._enrich_runs(all_runs)
-
-            # Apply filtering
-            filtered_runs = self._apply_filters(all_runs, filters)
-
-            # Store total count before limiting display
-            total_filtered = len(filtered_runs)
-
-            # Limit to display size
+            # Filter in SQL and fetch only the displayed page, plus the total count
+            query_filters = self._query_filters(filters)
             display_limit = int(filters.limit)
-            filtered_runs = filtered_runs[:display_limit]
+            filtered_runs = self.api.list_runs_enriched(limit=display_limit, **query_filters)
+            total_filtered = self.api.count_runs(**query_filters)
 
             # Build output data
             gallery_data = build_gallery_data(filtered_runs, limit=50)
@@ -125,59 +115,36 @@ class RunsLoader:
 
         return gallery_data, table_data, stats, prompt_names
 
-    def _fetch_runs(self, filters: RunFilters) -> list[dict[str, Any]]:
-        """Fetch runs from the API based on filter configuration."""
-        if filters.prompt_ids:
-            # Fetch runs for specific prompts
-            return self._fetch_runs_for_prompts(filters.prompt_ids)
-        else:
-            # Standard fetch with optional version filter
-            status = None if filters.status_filter == "all" else filters.status_filter
-            return self.api.list_runs(
-                status=status,
-                limit=self.max_search_limit,
-                version_filter=filters.version_filter,
-            )
+    def load_more_table_rows(self, filters: RunFilters, after: str) -> list:
+        """Load the next page of table rows after the given run.
+
+        Uses the keyset cursor on (created_at, id), so each page costs the
+        same however many rows are already shown.
 
-    def _fetch_runs_for_prompts(self, prompt_ids: list[str]) -> list[dict[str, Any]]:
-        """Fetch runs for specific prompt IDs."""
-        all_runs = []
-        # Cap at 20 prompts for performance
-        for prompt_id in prompt_ids[:20]:
-            try:
-                runs = self.api.list_runs(prompt_id=prompt_id)
-                if runs:
-                    all_runs.extend(runs)
-            except Exception as e:
-                logger.warning("Failed to get runs for prompt {}: {}", prompt_id, e)
-        return all_runs
-
-    def _enrich_runs(self, runs: list[dict[str, Any]]) -> None:
-        """Enrich runs with additional data like prompt text."""
-        for run in runs:
-            # Add prompt text if missing
-            if not run.get("prompt_text") and run.get("prompt_id"):
-                prompt = self.api.get_prompt(run["prompt_id"])
-                if prompt:
-                    run["prompt_text"] = prompt.get("prompt_text", "")
-
-            # Check for upscaled versions of transfer runs
-            if run.get("model_type") == "transfer":
-                # Get upscaled run using the dedicated method
-                upscaled_run = self.api.get_upscaled_run(run["id"])
-                if upscaled_run:
-                    run["has_upscaled"] = True
-                    run["upscaled_run"] = upscaled_run
-
-    def _apply_filters(
-        self, runs: list[dict[str, Any]], filters: RunFilters
-    ) -> list[dict[str, Any]]:
-        """Apply all filters to the runs list."""
-        filtered = apply_date_filter(runs, filters.date_filter)
-        filtered = apply_run_filters(
-            filtered, filters.type_filter, filters.search_text, filters.rating_filter
+        Args:
+            filters: RunFilters object containing all filter parameters
+            after: ID of the last run currently in the table
+
+        Returns:
+            Table rows for the next page (empty when there are no more runs)
+        """
+        query_filters = self._query_filters(filters)
+        runs = self.api.list_runs_enriched(limit=int(filters.limit), after=after, **query_filters)
+        logger.info("Loaded {} more runs after {}", len(runs), after)
+        return build_runs_table_data(runs)
+
+    def _query_filters(self, filters: RunFilters) -> dict[str, Any]:
+        """Translate RunFilters into repository query filters."""
+        return build_run_query_filters(
+            status_filter=filters.status_filter,
+            date_filter=filters.date_filter,
+            type_filter=filters.type_filter,
+            search_text=filters.search_text,
+            rating_filter=filters.rating_filter,
+            version_filter=filters.version_filter,
+            # Cap at 20 prompts for performance
+            prompt_ids=filters.prompt_ids[:20] if filters.prompt_ids else None,
         )
-        return filtered
 
     def _get_prompt_names(self, prompt_ids: list[str]) -> list[str]:
         """Get prompt names for the given IDs."""
@@ -359,3 +326,60 @@ def load_runs_with_filters(
             gr.update(visible=False),  # Hide filter indicator
             gr.update(value=""),  # Clear filter text
         )
+
+
+def load_more_runs(
+    table_data,
+    status_filter,
+    date_filter,
+    type_filter,
+    search_text,
+    limit,
+    rating_filter,
+    version_filter,
+    nav_state,
+):
+    """Append the next page of runs to the Run Records table.
+
+    Args:
+        table_data: Current runs table data (Run ID in the first column)
+        status_filter: Filter by run status
+        date_filter: Filter by date range
+        type_filter: Filter by run type
+        search_text: Search text for filtering
+        limit: Number of runs to add
+        rating_filter: Filter by rating
+        version_filter: Filter by version (all/not upscaled/upscaled)
+        nav_state: Navigation state containing cross-tab filter info
+
+    Returns:
+        Updated table data
+    """
+    rows = df_utils.to_rows(table_data)
+    if not rows:
+        return table_data
+
+    prompt_ids = None
+    if (
+        nav_state
+        and nav_state.get("filter_type") in ["prompt_ids", "input"]
+        and nav_state.get("filter_values")
+    ):
+        prompt_ids = nav_state.get("filter_values", [])
+
+    filters = RunFilters(
+        status_filter=status_filter,
+        date_filter=date_filter,
+        type_filter=type_filter,
+        search_text=search_text,
+        limit=limit,
+        rating_filter=rating_filter,
+        # Same as load_runs_with_filters: prompt-filtered views ignore the version filter
+        version_filter=None if prompt_ids else version_filter,
+        prompt_ids=prompt_ids,
+    )
+    try:
+        return rows + RunsLoader().load_more_table_rows(filters, after=rows[-1][0])
+    except Exception as e:
+        logger.error("Error loading more runs: {}", e, exc_info=True)
+        return table_data
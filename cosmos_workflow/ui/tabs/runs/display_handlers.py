@@ -11,6 +11,7 @@ from typing import Any
 import gradio as gr
 
 from cosmos_workflow.api.cosmos_api import CosmosAPI
+from cosmos_workflow.ui.context import get_api
 from cosmos_workflow.ui.models.responses import create_empty_run_details_response
 
 # Import helper functions from new specialized modules
@@ -84,7 +85,7 @@ def on_runs_gallery_select(evt: gr.SelectData):
             if match:
                 run_id_prefix = match.group(1)
                 # If it's a shortened ID, we need to find the full one
-                ops = CosmosAPI()
+                ops = get_api()
 
                 # Get all runs and find the matching one
                 runs = ops.list_runs(limit=100)
@@ -141,7 +142,7 @@ def on_runs_table_select(table_data, evt: gr.SelectData):
             return list(create_empty_run_details_response())
 
         # Get run details from API
-        ops = CosmosAPI()
+        ops = get_api()
         run_details = ops.get_run(run_id)
         if not run_details:
             logger.warning("No run_details found for run_id: {}", run_id)
@@ -2,6 +2,10 @@
 
 This module contains functions for filtering runs based on various criteria
 including date ranges, model types, search text, and ratings.
+
+build_run_query_filters() translates the Runs tab filter widgets into
+DataRepository.list_runs keyword filters so filtering happens in SQL. The
+in-memory apply_* helpers remain for callers holding an already-fetched list.
 """
 
 from datetime import datetime, timedelta, timezone
@@ -109,6 +113,85 @@ def apply_run_filters(
     return filtered_runs
 
 
+def date_filter_bounds(
+    date_filter: str, now: datetime | None = None
+) -> tuple[datetime | None, datetime | None]:
+    """Convert a date filter choice into a [created_after, created_before) range.
+
+    Args:
+        date_filter: Date filter type (today, yesterday, last_7_days, last_30_days, all)
+        now: Reference time (defaults to current UTC time)
+
+    Returns:
+        Tuple of (created_after, created_before), either may be None
+    """
+    now = now or datetime.now(timezone.utc)
+    start_of_today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+
+    if date_filter == "today":
+        return start_of_today, None
+    if date_filter == "yesterday":
+        return start_of_today - timedelta(days=1), start_of_today
+    if date_filter == "last_7_days":
+        return now - timedelta(days=7), None
+    if date_filter == "last_30_days":
+        return now - timedelta(days=30), None
+    return None, None
+
+
+def build_run_query_filters(
+    status_filter: str = "all",
+    date_filter: str = "all",
+    type_filter: str = "all",
+    search_text: str = "",
+    rating_filter: str | None = None,
+    version_filter: str | None = None,
+    prompt_ids: list[str] | None = None,
+) -> dict:
+    """Translate Runs tab filter values into list_runs/count_runs keyword filters.
+
+    Args:
+        status_filter: Run status or "all"
+        date_filter: Date filter type (today, yesterday, last_7_days, last_30_days, all)
+        type_filter: Model type or "all"
+        search_text: Text to search in run ID and prompt text
+        rating_filter: Rating filter (unrated, 5, 4+, 3+, etc.)
+        version_filter: Version filter (all, not upscaled, upscaled)
+        prompt_ids: Optional prompt IDs to restrict to
+
+    Returns:
+        Dictionary of keyword filters, only containing active ones
+    """
+    query_filters = {}
+
+    if status_filter and status_filter != "all":
+        query_filters["status"] = status_filter
+    if type_filter and type_filter != "all":
+        query_filters["model_type"] = type_filter
+    if search_text and search_text.strip():
+        query_filters["search"] = search_text.strip()
+    if version_filter and version_filter != "all":
+        query_filters["version_filter"] = version_filter
+    if prompt_ids:
+        query_filters["prompt_ids"] = prompt_ids
+
+    created_after, created_before = date_filter_bounds(date_filter)
+    if created_after is not None:
+        query_filters["created_after"] = created_after
+    if created_before is not None:
+        query_filters["created_before"] = created_before
+
+    if rating_filter and rating_filter != "all":
+        if rating_filter == "unrated":
+            query_filters["unrated"] = True
+        elif rating_filter == "5":
+            query_filters["min_rating"] = 5
+        elif isinstance(rating_filter, str) and rating_filter.endswith("+"):
+            query_filters["min_rating"] = int(rating_filter[0])
+
+    return query_filters
+
+
 # Maintain backward compatibility with underscore-prefixed names
 _apply_date_filter = apply_date_filter
 _apply_run_filters = apply_run_filters
@@ -116,4 +199,6 @@ _apply_run_filters = apply_run_filters
 __all__ = [
     "apply_date_filter",
     "apply_run_filters",
+    "build_run_query_filters",
+    "date_filter_bounds",
 ]
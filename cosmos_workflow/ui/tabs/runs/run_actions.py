@@ -8,7 +8,7 @@ from pathlib import Path
 
 import gradio as gr
 
-from cosmos_workflow.api.cosmos_api import CosmosAPI
+from cosmos_workflow.ui.context import get_api
 from cosmos_workflow.utils.logging import logger
 
 
@@ -56,7 +56,7 @@ def preview_delete_run(selected_run_id):
         )
 
     try:
-        ops = CosmosAPI()
+        ops = get_api()
         run = ops.get_run(selected_run_id)
 
         if not run:
@@ -124,7 +124,7 @@ def confirm_delete_run(run_id, delete_outputs):
         )
 
     try:
-        ops = CosmosAPI()
+        ops = get_api()
         # CosmosAPI expects keep_outputs, which is opposite of delete_outputs
         keep_outputs = not delete_outputs
         result = ops.delete_run(run_id, keep_outputs=keep_outputs)
@@ -177,7 +177,7 @@ def show_upscale_dialog(run_id):
         )
 
     try:
-        ops = CosmosAPI()
+        ops = get_api()
         run = ops.get_run(run_id)
 
         if not run:
@@ -49,6 +49,7 @@ def create_runs_tab_ui():
                             "all",
                             "completed",
                             "running",
+                            "downloading",
                             "pending",
                             "failed",
                             "cancelled",
@@ -177,6 +178,9 @@ def create_runs_tab_ui():
                                 elem_id="runs-dataframe",
                                 elem_classes=["run-history-table"],
                             )
+                            components["runs_load_more_btn"] = gr.Button(
+                                "⬇ Load More", size="sm", variant="secondary"
+                            )
 
                 # Dialogs below both tabs - visible from either tab
                 # Delete confirmation dialog
@@ -129,6 +129,22 @@ def clear_selection(data: pd.DataFrame | list) -> pd.DataFrame | list:
     return data
 
 
+def to_rows(data: pd.DataFrame | list | None) -> list[list]:
+    """Convert Gradio table data to a list of row lists.
+
+    Args:
+        data: Gradio table data (DataFrame or list)
+
+    Returns:
+        List of rows (empty for None or empty data)
+    """
+    if data is None:
+        return []
+    if isinstance(data, pd.DataFrame):
+        return data.values.tolist()
+    return [list(row) for row in data if row]
+
+
 def get_row_by_index(data: pd.DataFrame | list, index: int) -> list:
     """Get a specific row by index.
 
@@ -147,6 +147,7 @@ def format_run_status(status: str | None) -> str:
         "cancelled": "🚫 Cancelled",
         "cancelling": "🔄 Cancelling",
         "queued": "📋 Queued",
+        "waiting": "⏳ Waiting",
         "processing": "⚙️ Processing",
         "uploading": "📤 Uploading",
         "downloading": "📥 Downloading",
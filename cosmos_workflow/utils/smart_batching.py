@@ -1,16 +1,127 @@
 """Smart batching utilities for optimizing job queue execution.
 
 Provides algorithms for grouping runs into efficient batches to reduce
-GPU processing overhead and improve throughput.
+GPU processing overhead and improve throughput. Plans are compared on the
+GPU time predicted by the batch cost model (see
+cosmos_workflow.services.batch_cost_model).
 """
 
 import json
+import os
+from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
 from cosmos_workflow.utils.logging import logger
 
 if TYPE_CHECKING:
     from cosmos_workflow.database.models import JobQueue
+    from cosmos_workflow.services.batch_cost_model import BatchCostModel
+
+# Job types whose runs can be combined into one batch_inference
+BATCHABLE_JOB_TYPES = frozenset({"inference", "batch_inference"})
+
+# GPU memory estimates (GB). The model is loaded once per batch with one
+# control branch per control in the batch's union; activations scale with each
+# run's pixels and frames (up to one 121-frame chunk) and the controls computed.
+DEFAULT_GPU_MEMORY_GB = 80.0
+MODEL_MEMORY_GB = 24.0
+CONTROL_MODEL_MEMORY_GB = 8.0
+RUN_MEMORY_GB = 6.0
+CONTROL_RUN_MEMORY_GB = 2.0
+
+# Clip the run memory estimates are expressed in (Cosmos Transfer defaults)
+REFERENCE_WIDTH = 1280
+REFERENCE_HEIGHT = 704
+CHUNK_FRAMES = 121
+
+
+@dataclass(frozen=True)
+class VideoProfile:
+    """Size of a prompt's input video, which drives a run's GPU memory."""
+
+    frames: int = CHUNK_FRAMES
+    width: int = REFERENCE_WIDTH
+    height: int = REFERENCE_HEIGHT
+
+    @property
+    def scale(self) -> float:
+        """Activation size relative to the reference clip."""
+        frames = min(max(self.frames, 1), CHUNK_FRAMES)
+        pixels = max(self.width, 1) * max(self.height, 1)
+        return frames / CHUNK_FRAMES * pixels / (REFERENCE_WIDTH * REFERENCE_HEIGHT)
+
+
+def probe_video_profile(video_path: str | None) -> VideoProfile:
+    """Read frame count and resolution of a video (cached per file version).
+
+    Args:
+        video_path: Path to the prompt's input video
+
+    Returns:
+        VideoProfile of the video, or the reference clip if it cannot be read
+    """
+    if not video_path:
+        return VideoProfile()
+    try:
+        mtime = os.path.getmtime(video_path)
+    except OSError:
+        return VideoProfile()
+    return _probe_video_profile(video_path, mtime)
+
+
+@lru_cache(maxsize=1024)
+def _probe_video_profile(video_path: str, _mtime: float) -> VideoProfile:
+    try:
+        import cv2
+    except ImportError:
+        return VideoProfile()
+
+    cap = cv2.VideoCapture(video_path)
+    try:
+        if not cap.isOpened():
+            return VideoProfile()
+        frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+        height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+    finally:
+        cap.release()
+    if frames <= 0 or width <= 0 or height <= 0:
+        return VideoProfile()
+    return VideoProfile(frames=frames, width=width, height=height)
+
+
+@dataclass
+class MemoryBudget:
+    """GPU memory budget for batches and the video profiles of their prompts."""
+
+    budget_gb: float = DEFAULT_GPU_MEMORY_GB
+    profiles: dict[str, VideoProfile] = field(default_factory=dict)
+
+    def run_gb(self, prompt_id: str, control_count: int) -> float:
+        """Estimate a run's activation memory when its batch computes control_count controls."""
+        scale = self.profiles.get(prompt_id, VideoProfile()).scale
+        return scale * (RUN_MEMORY_GB + CONTROL_RUN_MEMORY_GB * control_count)
+
+    def batch_gb(self, prompt_ids: list[str], weights_list: list[dict[str, Any]]) -> float:
+        """Estimate the peak GPU memory of running runs together in one batch.
+
+        Args:
+            prompt_ids: Prompts of the runs
+            weights_list: Control weights of each run
+
+        Returns:
+            Estimated GB for the model, control branches and every run
+        """
+        controls = len(
+            {control for weights in weights_list for control, w in weights.items() if w > 0}
+        )
+        model_gb = MODEL_MEMORY_GB + CONTROL_MODEL_MEMORY_GB * controls
+        return model_gb + sum(self.run_gb(prompt_id, controls) for prompt_id in prompt_ids)
+
+    def fits(self, prompt_ids: list[str], weights_list: list[dict[str, Any]]) -> bool:
+        """Check whether runs fit the budget together."""
+        return self.batch_gb(prompt_ids, weights_list) <= self.budget_gb
 
 
 def get_control_signature(config: dict[str, Any]) -> tuple[str, ...]:
@@ -49,7 +160,67 @@ def get_execution_signature(config: dict[str, Any]) -> str:
     return json.dumps(exec_params, sort_keys=True)
 
 
-def group_runs_strict(jobs: list["JobQueue"], max_batch_size: int) -> list[dict[str, Any]]:
+def get_run_weights(job: "JobQueue") -> list[dict[str, Any]]:
+    """Get the control weights of each run in an inference or batch job.
+
+    Args:
+        job: Job with either per-prompt ``weights_list`` or shared ``weights``
+
+    Returns:
+        One weights dictionary per prompt ID
+    """
+    config = job.config or {}
+    if "weights_list" in config:
+        return list(config["weights_list"])
+    return [config.get("weights", {})] * len(job.prompt_ids)
+
+
+def can_join_batch(leader: "JobQueue", job: "JobQueue", mix_controls: bool = False) -> bool:
+    """Check whether a job's runs can run in the same batch as the leader's.
+
+    Execution parameters must always match. In strict mode every run must
+    also use the same set of active controls.
+
+    Args:
+        leader: Job the batch is built around
+        job: Candidate job
+        mix_controls: Allow runs with different active controls
+
+    Returns:
+        True if the job can be merged into the leader's batch
+    """
+    if job.job_type not in BATCHABLE_JOB_TYPES:
+        return False
+    if get_execution_signature(job.config or {}) != get_execution_signature(leader.config or {}):
+        return False
+    if mix_controls:
+        return True
+    control_sigs = {
+        get_control_signature({"weights": weights})
+        for weights in get_run_weights(leader) + get_run_weights(job)
+    }
+    return len(control_sigs) <= 1
+
+
+def merge_batch_config(jobs: list["JobQueue"]) -> dict[str, Any]:
+    """Build the batch_inference config for running several jobs as one batch.
+
+    Args:
+        jobs: Compatible jobs (see can_join_batch), leader first
+
+    Returns:
+        Leader's execution parameters with a ``weights_list`` covering every
+        prompt, in the order of the jobs' prompt IDs
+    """
+    config = dict(jobs[0].config or {})
+    config.pop("weights", None)
+    config["weights_list"] = [weights for job in jobs for weights in get_run_weights(job)]
+    return config
+
+
+def group_runs_strict(
+    jobs: list["JobQueue"], max_batch_size: int, memory: MemoryBudget | None = None
+) -> list[dict[str, Any]]:
     """Group runs with identical control signatures AND execution params.
 
     Strict mode ensures homogeneous batches for fastest execution.
@@ -57,6 +228,8 @@ def group_runs_strict(jobs: list["JobQueue"], max_batch_size: int) -> list[dict[
     Args:
         jobs: List of job objects to group
         max_batch_size: Maximum number of runs per batch
+        memory: GPU memory budget; when given, runs are bin-packed so every
+            batch fits it instead of being cut into max_batch_size slices
 
     Returns:
         List of batch configurations
@@ -64,41 +237,19 @@ def group_runs_strict(jobs: list["JobQueue"], max_batch_size: int) -> list[dict[
     if not jobs:
         return []
 
-    groups = {}
-
-    for job in jobs:
-        # Must match both execution params and control types
-        exec_sig = get_execution_signature(job.config)
-        control_sig = get_control_signature(job.config)
-        group_key = (exec_sig, control_sig)
-
-        if group_key not in groups:
-            groups[group_key] = []
-
-        # Extract individual runs with their source
-        for prompt_id in job.prompt_ids:
-            groups[group_key].append(
-                {
-                    "prompt_id": prompt_id,
-                    "weights": job.config.get("weights", {}),
-                    "source_job_id": job.id,
-                    "exec_params": job.config,
-                }
-            )
-
-        logger.debug(
-            "Job %s with %d runs -> strict group %s", job.id, len(job.prompt_ids), control_sig
-        )
+    groups = _group_runs(jobs, by_controls=True)
 
     # Log grouping results
     logger.info("Strict grouping: %d groups from %d jobs", len(groups), len(jobs))
     for (_exec_sig, control_sig), runs in groups.items():
         logger.debug("  Group %s: %d runs", control_sig, len(runs))
 
-    return _create_batches_from_groups(groups, max_batch_size, "strict")
+    return _create_batches_from_groups(groups, max_batch_size, "strict", memory)
 
 
-def group_runs_mixed(jobs: list["JobQueue"], max_batch_size: int) -> list[dict[str, Any]]:
+def group_runs_mixed(
+    jobs: list["JobQueue"], max_batch_size: int, memory: MemoryBudget | None = None
+) -> list[dict[str, Any]]:
     """Group runs by execution params only, allowing mixed control types.
 
     Mixed mode creates fewer batches but may run slower due to control overhead.
@@ -106,6 +257,8 @@ def group_runs_mixed(jobs: list["JobQueue"], max_batch_size: int) -> list[dict[s
     Args:
         jobs: List of job objects to group
         max_batch_size: Maximum number of runs per batch
+        memory: GPU memory budget; when given, runs are bin-packed per control
+            signature and small batches are then merged while they fit it
 
     Returns:
         List of batch configurations
@@ -113,50 +266,148 @@ def group_runs_mixed(jobs: list["JobQueue"], max_batch_size: int) -> list[dict[s
     if not jobs:
         return []
 
+    if memory is not None:
+        # Every run computes the batch's control union, so pack per signature
+        # first and only mix controls where the merged batch still fits
+        groups = _group_runs(jobs, by_controls=True)
+        logger.info("Mixed grouping: %d control groups from %d jobs", len(groups), len(jobs))
+        batches = _create_batches_from_groups(groups, max_batch_size, "mixed", memory)
+        return _merge_small_batches(batches, max_batch_size, memory)
+
+    groups = _group_runs(jobs, by_controls=False)
+
+    # Log grouping results
+    logger.info("Mixed grouping: %d groups from %d jobs", len(groups), len(jobs))
+    for _exec_sig, runs in groups.items():
+        # Count unique control combinations
+        control_sigs = set()
+        for run in runs:
+            control_sigs.add(tuple(sorted(run["weights"].keys())))
+        logger.debug(
+            "  Group with %d runs, %d unique control signatures", len(runs), len(control_sigs)
+        )
+
+    return _create_batches_from_groups(groups, max_batch_size, "mixed")
+
+
+def _group_runs(jobs: list["JobQueue"], by_controls: bool) -> dict[Any, list[dict[str, Any]]]:
+    """Split jobs into runs grouped by execution params (and control signature).
+
+    Each run carries its own weights (``get_run_weights``), so in strict mode
+    the runs of a job with a ``weights_list`` are grouped by their own controls.
+    """
     groups = {}
 
     for job in jobs:
-        # Only group by execution params, not control types
         exec_sig = get_execution_signature(job.config)
 
-        if exec_sig not in groups:
-            groups[exec_sig] = []
-
-        # Extract individual runs
-        for prompt_id in job.prompt_ids:
-            groups[exec_sig].append(
+        # Extract individual runs with their source
+        for prompt_id, weights in zip(job.prompt_ids, get_run_weights(job), strict=True):
+            if by_controls:
+                group_key = (exec_sig, get_control_signature({"weights": weights}))
+            else:
+                group_key = exec_sig
+            groups.setdefault(group_key, []).append(
                 {
                     "prompt_id": prompt_id,
-                    "weights": job.config.get("weights", {}),
+                    "weights": weights,
                     "source_job_id": job.id,
                     "exec_params": job.config,
                 }
             )
 
-        control_sig = get_control_signature(job.config)
         logger.debug(
-            "Job %s with %d runs -> mixed group (controls: %s)",
+            "Job {} with {} runs -> {} groups",
             job.id,
             len(job.prompt_ids),
-            control_sig,
+            "strict" if by_controls else "mixed",
         )
 
-    # Log grouping results
-    logger.info("Mixed grouping: %d groups from %d jobs", len(groups), len(jobs))
-    for _exec_sig, runs in groups.items():
-        # Count unique control combinations
-        control_sigs = set()
-        for run in runs:
-            control_sigs.add(tuple(sorted(run["weights"].keys())))
-        logger.debug(
-            "  Group with %d runs, %d unique control signatures", len(runs), len(control_sigs)
+    return groups
+
+
+def _pack_runs(
+    runs: list[dict[str, Any]], max_batch_size: int, memory: MemoryBudget
+) -> list[list[dict[str, Any]]]:
+    """Bin-pack runs first-fit decreasing under the memory budget and batch size.
+
+    Runs keep their queue order inside each batch, and batches are ordered by
+    their earliest run.
+    """
+    weights = [run["weights"] for run in runs]
+    controls = len({c for w in weights for c, value in w.items() if value > 0})
+    order = sorted(range(len(runs)), key=lambda i: -memory.run_gb(runs[i]["prompt_id"], controls))
+
+    bins: list[list[int]] = []
+    for i in order:
+        for indices in bins:
+            candidate = [*indices, i]
+            if len(candidate) <= max_batch_size and memory.fits(
+                [runs[k]["prompt_id"] for k in candidate], [weights[k] for k in candidate]
+            ):
+                indices.append(i)
+                break
+        else:
+            if not memory.fits([runs[i]["prompt_id"]], [weights[i]]):
+                logger.warning(
+                    "Run for prompt %s alone needs %.1f GB, over the %.1f GB budget",
+                    runs[i]["prompt_id"],
+                    memory.batch_gb([runs[i]["prompt_id"]], [weights[i]]),
+                    memory.budget_gb,
+                )
+            bins.append([i])
+
+    return [[runs[i] for i in sorted(indices)] for indices in sorted(bins, key=min)]
+
+
+def _batch_fits(batch: dict[str, Any], memory: MemoryBudget | None) -> bool:
+    if memory is None:
+        return True
+    return memory.fits(batch["prompt_ids"], batch["config"].get("weights_list", []))
+
+
+def _merge_small_batches(
+    batches: list[dict[str, Any]], max_batch_size: int, memory: MemoryBudget
+) -> list[dict[str, Any]]:
+    """Combine batches with the same execution params while the result fits.
+
+    Repeatedly merges the pair giving the largest batch that stays within
+    max_batch_size and the memory budget.
+    """
+    batches = list(batches)
+    signatures = [get_execution_signature(batch["config"]) for batch in batches]
+
+    while True:
+        best = None
+        for i in range(len(batches)):
+            for j in range(i + 1, len(batches)):
+                size = len(batches[i]["prompt_ids"]) + len(batches[j]["prompt_ids"])
+                if signatures[i] != signatures[j] or size > max_batch_size:
+                    continue
+                if best is not None and size <= best[0]:
+                    continue
+                merged = _merge_two_batches(batches[i], batches[j])
+                if _batch_fits(merged, memory):
+                    best = (size, i, j, merged)
+        if best is None:
+            break
+
+        _, i, j, merged = best
+        merged["memory_gb"] = round(
+            memory.batch_gb(merged["prompt_ids"], merged["config"]["weights_list"]), 1
         )
+        batches[i] = merged
+        del batches[j], signatures[j]
 
-    return _create_batches_from_groups(groups, max_batch_size, "mixed")
+    logger.info("Mixed merge: %d batches after combining small groups", len(batches))
+    return batches
 
 
 def _create_batches_from_groups(
-    groups: dict[Any, list[dict[str, Any]]], max_batch_size: int, mode: str
+    groups: dict[Any, list[dict[str, Any]]],
+    max_batch_size: int,
+    mode: str,
+    memory: MemoryBudget | None = None,
 ) -> list[dict[str, Any]]:
     """Convert grouped runs into batch configurations.
 
@@ -164,6 +415,8 @@ def _create_batches_from_groups(
         groups: Dictionary mapping group keys to lists of runs
         max_batch_size: Maximum number of runs per batch
         mode: "strict" or "mixed" for logging
+        memory: GPU memory budget to bin-pack each group under (None cuts
+            groups into max_batch_size slices)
 
     Returns:
         List of batch configurations
@@ -187,10 +440,13 @@ def _create_batches_from_groups(
                 len(runs),
             )
 
-        # Split into batches respecting max_batch_size
-        for i in range(0, len(runs), max_batch_size):
-            batch_runs = runs[i : i + max_batch_size]
+        # Split into batches respecting max_batch_size (and the memory budget)
+        if memory is not None:
+            chunks = _pack_runs(runs, max_batch_size, memory)
+        else:
+            chunks = [runs[i : i + max_batch_size] for i in range(0, len(runs), max_batch_size)]
 
+        for batch_runs in chunks:
             # Extract exec params from first run (all same in group)
             base_config = batch_runs[0]["exec_params"].copy()
 
@@ -198,14 +454,17 @@ def _create_batches_from_groups(
             base_config.pop("weights", None)
             base_config["weights_list"] = [r["weights"] for r in batch_runs]
 
-            batches.append(
-                {
-                    "prompt_ids": [r["prompt_id"] for r in batch_runs],
-                    "config": base_config,
-                    "source_job_ids": list(set(r["source_job_id"] for r in batch_runs)),
-                    "mode": mode,
-                }
-            )
+            batch = {
+                "prompt_ids": [r["prompt_id"] for r in batch_runs],
+                "config": base_config,
+                "source_job_ids": list(set(r["source_job_id"] for r in batch_runs)),
+                "mode": mode,
+            }
+            if memory is not None:
+                batch["memory_gb"] = round(
+                    memory.batch_gb(batch["prompt_ids"], base_config["weights_list"]), 1
+                )
+            batches.append(batch)
 
             # Log batch details
             control_types = set()
@@ -222,18 +481,153 @@ def _create_batches_from_groups(
     return batches
 
 
+def _default_cost_model() -> "BatchCostModel":
+    from cosmos_workflow.services.batch_cost_model import BatchCostModel
+
+    return BatchCostModel()
+
+
+def predict_batches_seconds(batches: list[dict[str, Any]], cost_model: "BatchCostModel") -> float:
+    """Predict the total GPU time of a batch plan.
+
+    Args:
+        batches: List of batch configurations
+        cost_model: Batch cost model
+
+    Returns:
+        Sum of the predicted seconds of every batch
+    """
+    return sum(cost_model.estimate_batch(batch) for batch in batches)
+
+
+def merge_batches_by_cost(
+    batches: list[dict[str, Any]],
+    max_batch_size: int,
+    cost_model: "BatchCostModel",
+    memory: MemoryBudget | None = None,
+) -> list[dict[str, Any]]:
+    """Greedily merge batches while the cost model predicts a saving.
+
+    Starting from (typically strict) batches, repeatedly merges the pair with
+    the same execution parameters that fits in ``max_batch_size`` and saves
+    the most predicted GPU time, so controls are only mixed where sharing the
+    model load outweighs computing extra controls for every run.
+
+    Args:
+        batches: Batch configurations to start from
+        max_batch_size: Maximum number of runs per batch
+        cost_model: Batch cost model
+        memory: GPU memory budget merged batches must fit
+
+    Returns:
+        Merged batch configurations; merged batches have mode "mixed"
+    """
+    batches = list(batches)
+    costs = [cost_model.estimate_batch(batch) for batch in batches]
+    signatures = [get_execution_signature(batch["config"]) for batch in batches]
+
+    while True:
+        best = None
+        for i in range(len(batches)):
+            for j in range(i + 1, len(batches)):
+                if signatures[i] != signatures[j]:
+                    continue
+                size = len(batches[i]["prompt_ids"]) + len(batches[j]["prompt_ids"])
+                if size > max_batch_size:
+                    continue
+                merged = _merge_two_batches(batches[i], batches[j])
+                if not _batch_fits(merged, memory):
+                    continue
+                cost = cost_model.estimate_batch(merged)
+                saving = costs[i] + costs[j] - cost
+                if saving > 0 and (best is None or saving > best[0]):
+                    best = (saving, i, j, merged, cost)
+        if best is None:
+            return batches
+
+        _, i, j, merged, cost = best
+        batches[i], costs[i] = merged, cost
+        del batches[j], costs[j], signatures[j]
+
+
+def _merge_two_batches(first: dict[str, Any], second: dict[str, Any]) -> dict[str, Any]:
+    config = dict(first["config"])
+    config["weights_list"] = list(first["config"].get("weights_list", [])) + list(
+        second["config"].get("weights_list", [])
+    )
+    return {
+        "prompt_ids": first["prompt_ids"] + second["prompt_ids"],
+        "config": config,
+        "source_job_ids": list(dict.fromkeys(first["source_job_ids"] + second["source_job_ids"])),
+        "mode": "mixed",
+    }
+
+
+def plan_batches(
+    jobs: list["JobQueue"],
+    max_batch_size: int,
+    mix_controls: bool = False,
+    cost_model: "BatchCostModel | None" = None,
+    memory: MemoryBudget | None = None,
+) -> tuple[list[dict[str, Any]], str]:
+    """Choose the batch grouping with the least predicted GPU time.
+
+    Strict grouping is always a candidate. With ``mix_controls`` the plain
+    mixed grouping and cost-based merging of the strict batches (see
+    merge_batches_by_cost) compete with it.
+
+    Args:
+        jobs: Batchable jobs
+        max_batch_size: Maximum number of runs per batch
+        mix_controls: Allow runs with different active controls in a batch
+        cost_model: Batch cost model (default: uncalibrated prior)
+        memory: GPU memory budget every batch must fit (None: run count only)
+
+    Returns:
+        Tuple of the chosen batch configurations and their mode ("strict",
+        "mixed" or "optimized")
+    """
+    cost_model = cost_model or _default_cost_model()
+    strict = group_runs_strict(jobs, max_batch_size, memory)
+    candidates = {"strict": strict}
+    if mix_controls:
+        candidates["mixed"] = group_runs_mixed(jobs, max_batch_size, memory)
+        candidates["optimized"] = merge_batches_by_cost(strict, max_batch_size, cost_model, memory)
+
+    predicted = {
+        mode: predict_batches_seconds(batches, cost_model) for mode, batches in candidates.items()
+    }
+    # Ties keep the simpler plan (dict order: strict, mixed, optimized)
+    mode = min(predicted, key=predicted.get)
+    logger.info(
+        "Batch plan: %s mode (%s)",
+        mode,
+        ", ".join(f"{name} {seconds:.0f}s" for name, seconds in predicted.items()),
+    )
+    return candidates[mode], mode
+
+
 def calculate_batch_efficiency(
-    batches: list[dict[str, Any]], original_jobs: list["JobQueue"], mode: str = "strict"
+    batches: list[dict[str, Any]],
+    original_jobs: list["JobQueue"],
+    mode: str = "strict",
+    cost_model: "BatchCostModel | None" = None,
 ) -> dict[str, Any]:
     """Calculate efficiency metrics for batch configuration.
 
+    The speedup is the predicted GPU time of running every job as it is over
+    that of running the batches, both from the batch cost model calibrated on
+    measured batch executions.
+
     Args:
         batches: List of batch configurations
         original_jobs: Original list of jobs before batching
-        mode: "strict" or "mixed" for overhead calculation
+        mode: Grouping mode, for reporting
+        cost_model: Batch cost model (default: uncalibrated prior)
 
     Returns:
-        Dictionary with efficiency metrics
+        Dictionary with efficiency metrics, including estimated_seconds_before
+        and estimated_seconds_after
     """
     # Count total runs (not jobs!)
     total_runs = sum(len(job.prompt_ids) for job in original_jobs)
@@ -249,46 +643,19 @@ def calculate_batch_efficiency(
             "mode": mode,
         }
 
-    # Base speedup from batching runs
-    base_speedup = total_runs / total_batches
-
-    # Adjust for mixed mode overhead
-    if mode == "mixed":
-        # Calculate overhead from control diversity
-        total_overhead = 0
-        for batch in batches:
-            weights_list = batch["config"].get("weights_list", [])
-            unique_controls = set()
-            for weights in weights_list:
-                unique_controls.update(weights.keys())
-
-            # More diverse controls = more overhead
-            num_controls = len(unique_controls)
-            if num_controls > 2:
-                # Each additional control adds ~10% overhead
-                batch_overhead = 1 + (0.1 * (num_controls - 2))
-                total_overhead += batch_overhead
-            else:
-                total_overhead += 1.0
-
-        # Average overhead across batches
-        avg_overhead = total_overhead / max(1, total_batches)
-        adjusted_speedup = base_speedup / avg_overhead
-
-        logger.info("Mixed mode overhead factor: %.2fx due to control diversity", avg_overhead)
-    else:
-        # Strict mode has minimal overhead
-        adjusted_speedup = base_speedup * 0.95  # Small overhead for batching itself
-
-    # Ensure reasonable bounds
-    final_speedup = max(1.0, min(adjusted_speedup, total_runs))
+    cost_model = cost_model or _default_cost_model()
+    seconds_before = sum(cost_model.estimate_job(job) for job in original_jobs)
+    seconds_after = predict_batches_seconds(batches, cost_model)
+    speedup = seconds_before / seconds_after
 
     logger.info(
-        "Efficiency: %d runs from %d jobs -> %d batches (%.1fx speedup, %s mode)",
+        "Efficiency: %d runs from %d jobs -> %d batches (%.1fx speedup, %.0fs -> %.0fs, %s mode)",
         total_runs,
         original_job_count,
         total_batches,
-        final_speedup,
+        speedup,
+        seconds_before,
+        seconds_after,
         mode,
     )
 
@@ -296,7 +663,9 @@ def calculate_batch_efficiency(
         "total_runs": total_runs,
         "original_jobs": original_job_count,
         "total_batches": total_batches,
-        "speedup": final_speedup,
+        "speedup": speedup,
+        "estimated_seconds_before": round(seconds_before),
+        "estimated_seconds_after": round(seconds_after),
         "mode": mode,
     }
 
@@ -310,8 +679,7 @@ def filter_batchable_jobs(jobs: list["JobQueue"]) -> list["JobQueue"]:
     Returns:
         List of batchable jobs (inference and batch_inference only)
     """
-    batchable_types = {"inference", "batch_inference"}
-    batchable = [job for job in jobs if job.job_type in batchable_types]
+    batchable = [job for job in jobs if job.job_type in BATCHABLE_JOB_TYPES]
 
     if len(batchable) < len(jobs):
         excluded = len(jobs) - len(batchable)
@@ -7,6 +7,7 @@ Provides reusable functions for workflow orchestration.
 import logging
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Any
 
 logger = logging.getLogger(__name__)
 
@@ -82,6 +83,22 @@ def sanitize_remote_path(path: str) -> str:
     return path.replace("\\", "/")
 
 
+def positive_int(value: Any) -> int | None:
+    """Parse a positive integer from a loosely typed config value.
+
+    Args:
+        value: Value to parse, e.g. from a job's JSON config.
+
+    Returns:
+        The value as int, or None if it is missing, not a number or not positive.
+    """
+    try:
+        value = int(value)
+    except (TypeError, ValueError):
+        return None
+    return value if value > 0 else None
+
+
 def format_duration(seconds: float) -> str:
     """Format duration in seconds to a human-readable string.
 
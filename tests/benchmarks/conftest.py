@@ -0,0 +1,28 @@
+"""Benchmark test configuration.
+
+Benchmarks measure query plans, latency and throughput of hot paths against
+real SQLite databases. They assert on structural properties (index usage,
+query counts, relative speedups) and print timings for comparison.
+
+Sizes are kept small enough for the regular suite; set COSMOS_BENCH_SCALE
+to multiply dataset sizes when profiling locally. Run only benchmarks with:
+
+    pytest -m benchmark -s
+"""
+
+import os
+
+import pytest
+
+
+def pytest_collection_modifyitems(items):
+    """Mark every test in this directory as a benchmark."""
+    for item in items:
+        if "benchmarks" in item.nodeid.split("/"):
+            item.add_marker(pytest.mark.benchmark)
+
+
+@pytest.fixture
+def bench_scale() -> int:
+    """Dataset size multiplier for benchmarks (COSMOS_BENCH_SCALE)."""
+    return max(1, int(os.environ.get("COSMOS_BENCH_SCALE", "1")))
@@ -0,0 +1,152 @@
+"""Benchmark smart batching policies by replaying a queue trace on one GPU.
+
+Each policy re-plans the queued runs whenever the GPU is free and runs the
+first batch of its plan; batch durations come from a "true" cost model. The
+cost-based policy plans with a model calibrated on noisy measurements of that
+truth, the way ``batch_executions`` calibrates it in production.
+
+By default the trace is synthetic: bursts of single-run jobs with a few
+control combinations. Set COSMOS_BENCH_TRACE to a cosmos.db to replay its
+inference runs (arrival time, controls, steps; runs of one batch arrive
+together) with the true costs fitted on its recorded batch executions.
+
+    pytest tests/benchmarks/test_batch_planning.py -s
+"""
+
+import os
+import random
+from datetime import datetime
+from types import SimpleNamespace
+
+from cosmos_workflow.database.connection import DatabaseConnection
+from cosmos_workflow.database.models import BatchExecution, Run
+from cosmos_workflow.services.batch_cost_model import BatchCostModel, BatchFeatures
+from cosmos_workflow.utils.smart_batching import group_runs_mixed, group_runs_strict, plan_batches
+
+BATCH_SIZE = 4
+CONTROL_SETS = [{"edge": 0.5}, {"depth": 0.5}, {"edge": 0.3, "seg": 0.4}, {"vis": 0.5}]
+
+
+def _job(index: int, arrival: float, weights: dict, num_steps: int = 25):
+    return SimpleNamespace(
+        id=f"job_{index}",
+        arrival=arrival,
+        prompt_ids=[f"ps_{index}"],
+        job_type="inference",
+        config={"weights": weights, "num_steps": num_steps},
+    )
+
+
+def _synthetic_trace(scale: int) -> list[SimpleNamespace]:
+    rng = random.Random(7)
+    jobs = []
+    clock = 0.0
+    for _burst in range(12 * scale):
+        clock += rng.uniform(0, 900)
+        for _ in range(rng.randint(1, 9)):
+            clock += rng.uniform(0, 20)
+            jobs.append(_job(len(jobs), clock, dict(rng.choice(CONTROL_SETS))))
+    return jobs
+
+
+def _synthetic_truth() -> BatchCostModel:
+    # Model loading dominates; extra controls cost a fraction of a run each
+    return BatchCostModel(prior=(120.0, 40.0, 12.0, 4.0))
+
+
+def _calibrated(truth: BatchCostModel, samples: int = 60) -> BatchCostModel:
+    rng = random.Random(11)
+    model = BatchCostModel()
+    for _ in range(samples):
+        runs = [dict(rng.choice(CONTROL_SETS)) for _ in range(rng.randint(1, BATCH_SIZE))]
+        features = BatchFeatures.from_runs(runs, {"num_steps": 25})
+        model.observe(features, truth.estimate(features) * rng.uniform(0.9, 1.1))
+    return model
+
+
+def _database_trace(path: str) -> tuple[list[SimpleNamespace], BatchCostModel]:
+    conn = DatabaseConnection(path)
+    with conn.get_session() as session:
+        runs = (
+            session.query(Run)
+            .filter(Run.model_type == "transfer", Run.created_at.isnot(None))
+            .order_by(Run.created_at)
+            .all()
+        )
+        first: datetime | None = None
+        batch_arrivals: dict[str, float] = {}
+        jobs = []
+        for run in runs:
+            first = first or run.created_at
+            arrival = (run.created_at - first).total_seconds()
+            if run.batch_id:
+                arrival = batch_arrivals.setdefault(run.batch_id, arrival)
+            config = run.execution_config or {}
+            jobs.append(
+                _job(len(jobs), arrival, config.get("weights") or {}, config.get("num_steps", 25))
+            )
+        has_executions = session.query(BatchExecution).first() is not None
+    truth = BatchCostModel(conn) if has_executions else _synthetic_truth()
+    return jobs, truth
+
+
+def _replay(trace, truth: BatchCostModel, plan) -> dict[str, float]:
+    pending = sorted(trace, key=lambda job: job.arrival)
+    queue: list = []
+    clock = busy = 0.0
+    waits = []
+    while pending or queue:
+        if not queue:
+            clock = max(clock, pending[0].arrival)
+        while pending and pending[0].arrival <= clock:
+            queue.append(pending.pop(0))
+
+        batch = plan(queue)[0]
+        seconds = truth.estimate_batch(batch)
+        clock += seconds
+        busy += seconds
+        done = set(batch["prompt_ids"])
+        waits += [clock - job.arrival for job in queue if job.prompt_ids[0] in done]
+        queue = [job for job in queue if job.prompt_ids[0] not in done]
+
+    return {"gpu_seconds": busy, "makespan": clock, "mean_wait": sum(waits) / len(waits)}
+
+
+def _as_batch(job) -> dict:
+    config = dict(job.config)
+    config["weights_list"] = [config.pop("weights")]
+    return {"prompt_ids": job.prompt_ids, "config": config, "source_job_ids": [job.id]}
+
+
+def test_cost_based_planning_vs_fixed_modes(bench_scale):
+    """Replay a queue trace under unbatched, strict, mixed and cost-based planning."""
+    trace_path = os.environ.get("COSMOS_BENCH_TRACE")
+    if trace_path:
+        trace, truth = _database_trace(trace_path)
+    else:
+        trace, truth = _synthetic_trace(bench_scale), _synthetic_truth()
+    model = _calibrated(truth)
+
+    policies = {
+        "unbatched": lambda queue: [_as_batch(queue[0])],
+        "strict": lambda queue: group_runs_strict(queue, BATCH_SIZE),
+        "mixed": lambda queue: group_runs_mixed(queue, BATCH_SIZE),
+        "cost (prior)": lambda queue: plan_batches(queue, BATCH_SIZE, True)[0],
+        "cost (calibrated)": lambda queue: plan_batches(queue, BATCH_SIZE, True, model)[0],
+    }
+    results = {name: _replay(trace, truth, plan) for name, plan in policies.items()}
+
+    print(f"\nQueue trace replay: {len(trace)} runs, batch size {BATCH_SIZE}")
+    for name, result in results.items():
+        print(
+            f"  {name:<18} GPU {result['gpu_seconds'] / 3600:6.2f} h  "
+            f"makespan {result['makespan'] / 3600:6.2f} h  "
+            f"mean wait {result['mean_wait'] / 60:6.1f} min"
+        )
+    print("  calibrated model:", model.summary())
+
+    calibrated = results["cost (calibrated)"]["gpu_seconds"]
+    assert calibrated < results["unbatched"]["gpu_seconds"]
+    # Never meaningfully worse than either fixed mode on the trace
+    assert calibrated <= 1.02 * results["strict"]["gpu_seconds"]
+    assert calibrated <= 1.02 * results["mixed"]["gpu_seconds"]
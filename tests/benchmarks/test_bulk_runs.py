@@ -0,0 +1,74 @@
+"""Benchmark batch bookkeeping: per-row vs bulk prompt/run operations.
+
+pytest tests/benchmarks/test_bulk_runs.py -s
+"""
+
+import time
+
+from cosmos_workflow.config.config_manager import ConfigManager
+from cosmos_workflow.database.connection import DatabaseConnection
+from cosmos_workflow.services.data_repository import DataRepository
+
+
+def _repo(path) -> DataRepository:
+    conn = DatabaseConnection(str(path))
+    conn.create_tables()
+    return DataRepository(conn, ConfigManager())
+
+
+def _prompts(repo: DataRepository, count: int) -> list[str]:
+    return [
+        repo.create_prompt(prompt_text=f"prompt {i}", inputs={"video": f"v{i}.mp4"}, parameters={})[
+            "id"
+        ]
+        for i in range(count)
+    ]
+
+
+def _spec(prompt_id: str) -> dict:
+    return {
+        "prompt_id": prompt_id,
+        "execution_config": {"weights": {"vis": 0.5}, "batch_id": "batch_bench"},
+        "metadata": {"batch_id": "batch_bench"},
+    }
+
+
+def _outputs(index: int) -> dict:
+    return {"output_path": f"outputs/batch_bench/video_{index}/output.mp4", "batch_index": index}
+
+
+def test_batch_bookkeeping_per_row_vs_bulk(tmp_path, bench_scale):
+    """Bulk create/update of a 64-video batch beats one transaction per row."""
+    batch = 64 * bench_scale
+
+    per_row = _repo(tmp_path / "per_row.db")
+    prompt_ids = _prompts(per_row, batch)
+    start = time.perf_counter()
+    prompts = [per_row.get_prompt(prompt_id) for prompt_id in prompt_ids]
+    runs = [per_row.create_run(**_spec(prompt["id"])) for prompt in prompts]
+    for i, run in enumerate(runs):
+        per_row.update_run(run["id"], outputs=_outputs(i))
+        per_row.update_run_status(run["id"], "completed")
+    per_row_ms = (time.perf_counter() - start) * 1000
+
+    bulk = _repo(tmp_path / "bulk.db")
+    prompt_ids = _prompts(bulk, batch)
+    start = time.perf_counter()
+    prompts = bulk.get_prompts(prompt_ids)
+    runs = bulk.create_runs([_spec(prompt_id) for prompt_id in prompt_ids])
+    bulk.update_runs(
+        {run["id"]: {"outputs": _outputs(i), "status": "completed"} for i, run in enumerate(runs)}
+    )
+    bulk_ms = (time.perf_counter() - start) * 1000
+
+    assert len(prompts) == batch
+    assert bulk.count_runs(status="completed") == batch
+    assert per_row.count_runs(status="completed") == batch
+
+    print(
+        f"\n{batch}-run batch: per-row {per_row_ms:.1f} ms ({4 * batch} transactions), "
+        f"bulk {bulk_ms:.1f} ms (3 transactions)"
+    )
+    assert bulk_ms < per_row_ms
+    per_row.db.close()
+    bulk.db.close()
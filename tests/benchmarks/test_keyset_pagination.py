@@ -0,0 +1,53 @@
+"""Benchmark deep pages: OFFSET vs the (created_at, id) keyset cursor.
+
+pytest tests/benchmarks/test_keyset_pagination.py -s
+"""
+
+import time
+
+from cosmos_workflow.config.config_manager import ConfigManager
+from cosmos_workflow.database.connection import DatabaseConnection
+from cosmos_workflow.services.data_repository import DataRepository
+from tests.benchmarks.test_runs_listing import _seed_runs
+
+
+def _best_ms(fn, repeat: int = 5) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return min(timings)
+
+
+def test_deep_page_offset_vs_cursor(tmp_path, bench_scale):
+    """A cursor page near the end costs about the same as the first page."""
+    num_runs = 20_000 * bench_scale
+    conn = DatabaseConnection(str(tmp_path / "runs.db"))
+    conn.create_tables()
+    _seed_runs(conn, num_runs)
+    repo = DataRepository(conn, ConfigManager())
+    limit = 50
+    depth = num_runs - 2 * limit
+
+    cursor = repo.list_runs(limit=1, offset=depth - 1)[0]["id"]
+    by_offset = [r["id"] for r in repo.list_runs(limit=limit, offset=depth)]
+    by_cursor = [r["id"] for r in repo.list_runs(limit=limit, after=cursor)]
+    assert by_cursor == by_offset
+
+    first_ms = _best_ms(lambda: repo.list_runs(limit=limit))
+    offset_ms = _best_ms(lambda: repo.list_runs(limit=limit, offset=depth))
+    cursor_ms = _best_ms(lambda: repo.list_runs(limit=limit, after=cursor))
+
+    start = time.perf_counter()
+    streamed = sum(1 for _ in repo.iter_runs(batch_size=500))
+    stream_ms = (time.perf_counter() - start) * 1000
+    assert streamed == num_runs
+
+    print(
+        f"\n{num_runs} runs, page of {limit} at row {depth}: first {first_ms:.2f} ms, "
+        f"offset {offset_ms:.2f} ms, cursor {cursor_ms:.2f} ms; "
+        f"iter_runs over all rows {stream_ms:.0f} ms"
+    )
+    assert cursor_ms < offset_ms
+    conn.close()
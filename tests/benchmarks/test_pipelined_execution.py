@@ -0,0 +1,108 @@
+"""Benchmark GPU idle time between queued jobs with and without pipelining.
+
+A stand-in host spends fixed times uploading inputs, on the GPU and
+downloading outputs. Run back to back, the GPU idles through the next job's
+upload and the previous job's download. Pipelined, the next job's inputs are
+prefetched while the GPU is busy and the slot is released when the container
+exits, so only the short hand-over between jobs remains.
+
+    pytest tests/benchmarks/test_pipelined_execution.py -s
+"""
+
+import threading
+import time
+from itertools import pairwise
+from unittest.mock import Mock
+
+from cosmos_workflow.database import DatabaseConnection
+from cosmos_workflow.execution.job_stages import current_stages
+from cosmos_workflow.services.gpu_pool import GPUPool, PoolHost
+from cosmos_workflow.services.queue_worker import QueueWorker
+from cosmos_workflow.services.simple_queue_service import SimplifiedQueueService
+
+UPLOAD_SECONDS = 0.05
+GPU_SECONDS = 0.1
+DOWNLOAD_SECONDS = 0.05
+
+
+class StagedHost:
+    """A stand-in host whose jobs take real time in each stage."""
+
+    def __init__(self, pipelined: bool):
+        self.pipelined = pipelined
+        self.prefetched: set[str] = set()
+        self.gpu_intervals: list[tuple[float, float]] = []
+        self.lock = threading.Lock()
+
+    def prefetch_inputs(self, prompt_ids):
+        if not self.pipelined:
+            return 0
+        time.sleep(UPLOAD_SECONDS)
+        with self.lock:
+            self.prefetched.update(prompt_ids)
+        return len(prompt_ids)
+
+    def quick_inference(self, prompt_id, **kwargs):
+        stages = current_stages() if self.pipelined else None
+        with self.lock:
+            staged = prompt_id in self.prefetched
+        if not staged:
+            time.sleep(UPLOAD_SECONDS)
+        if stages:
+            stages.gpu_started()
+        started = time.monotonic()
+        time.sleep(GPU_SECONDS)
+        with self.lock:
+            self.gpu_intervals.append((started, time.monotonic()))
+        if stages:
+            stages.gpu_done()
+        time.sleep(DOWNLOAD_SECONDS)
+        return {"run_id": f"rs_{prompt_id}", "status": "completed"}
+
+
+def _api(host: StagedHost) -> Mock:
+    api = Mock()
+    api.get_active_containers.return_value = []
+    api.service.list_runs.return_value = []
+    api.quick_inference.side_effect = host.quick_inference
+    api.prefetch_inputs.side_effect = host.prefetch_inputs
+    return api
+
+
+def _gpu_idle(tmp_path, jobs: int, pipelined: bool) -> list[float]:
+    """Drain a queue of single-prompt jobs and return the GPU idle gaps between them."""
+    db = DatabaseConnection(str(tmp_path / f"cosmos_{pipelined}.db"))
+    db.create_tables()
+    host = StagedHost(pipelined)
+    api = _api(host)
+    pool = GPUPool([PoolHost(name="gpu", capacity=1, api=api)])
+    service = SimplifiedQueueService(cosmos_api=api, db_connection=db, gpu_pool=pool)
+    for index in range(jobs):
+        service.add_job([f"ps_{index}"], "inference", {})
+
+    QueueWorker(service, min_idle=0.005, max_idle=0.01).run(drain=True)
+    db.close()
+
+    intervals = sorted(host.gpu_intervals)
+    assert len(intervals) == jobs
+    return [start - previous_end for (_, previous_end), (start, _) in pairwise(intervals)]
+
+
+def test_pipelining_hides_transfers(tmp_path, bench_scale):
+    """Compare GPU idle time per job with sequential and pipelined stages."""
+    jobs = 6 * bench_scale
+    sequential = _gpu_idle(tmp_path, jobs, pipelined=False)
+    pipelined = _gpu_idle(tmp_path, jobs, pipelined=True)
+
+    sequential_mean = sum(sequential) / len(sequential)
+    pipelined_mean = sum(pipelined) / len(pipelined)
+    print(
+        f"\nGPU idle per job ({jobs} jobs; upload {UPLOAD_SECONDS}s, "
+        f"GPU {GPU_SECONDS}s, download {DOWNLOAD_SECONDS}s)"
+    )
+    print(f"  sequential  {sequential_mean * 1000:6.1f} ms")
+    print(f"  pipelined   {pipelined_mean * 1000:6.1f} ms")
+
+    # Back to back the GPU waits for a download and an upload between jobs
+    assert sequential_mean >= UPLOAD_SECONDS + DOWNLOAD_SECONDS
+    assert pipelined_mean < 0.5 * sequential_mean
@@ -0,0 +1,176 @@
+"""Benchmark run listing and queue claim query plans before and after indexing.
+
+Builds a pre-migration database, records EXPLAIN QUERY PLAN and timings for
+the hot list_runs/claim queries, applies migrations and compares.
+
+    pytest tests/benchmarks/test_query_plans.py -s
+"""
+
+import time
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import text
+
+from cosmos_workflow.database.connection import DatabaseConnection
+from cosmos_workflow.database.models import Base
+
+HOT_QUERIES = {
+    "runs by status": (
+        "SELECT id FROM runs WHERE status = 'completed' ORDER BY created_at DESC LIMIT 50"
+    ),
+    "runs by prompt": (
+        "SELECT id FROM runs WHERE prompt_id = 'ps_00007' ORDER BY created_at DESC LIMIT 50"
+    ),
+    "runs by type+status": (
+        "SELECT id FROM runs WHERE model_type = 'upscale' AND status = 'completed'"
+    ),
+    "queue claim": (
+        "SELECT id FROM job_queue WHERE status = 'queued' "
+        "ORDER BY priority DESC, created_at ASC LIMIT 1"
+    ),
+}
+
+
+def _seed(conn: DatabaseConnection, num_prompts: int, runs_per_prompt: int) -> None:
+    base = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    statuses = ["completed", "completed", "completed", "failed", "running", "pending"]
+    model_types = ["transfer", "transfer", "upscale", "enhance"]
+    with conn.engine.begin() as connection:
+        connection.execute(
+            text(
+                "INSERT INTO prompts (id, prompt_text, inputs, parameters, created_at) "
+                "VALUES (:id, :text, '{}', '{}', :created)"
+            ),
+            [
+                {"id": f"ps_{p:05d}", "text": f"prompt {p}", "created": base}
+                for p in range(num_prompts)
+            ],
+        )
+        rows = []
+        for p in range(num_prompts):
+            for r in range(runs_per_prompt):
+                n = p * runs_per_prompt + r
+                rows.append(
+                    {
+                        "id": f"rs_{n:08d}",
+                        "prompt_id": f"ps_{p:05d}",
+                        "model_type": model_types[n % len(model_types)],
+                        "status": statuses[n % len(statuses)],
+                        "created": base + timedelta(seconds=n),
+                    }
+                )
+        connection.execute(
+            text(
+                "INSERT INTO runs (id, prompt_id, model_type, status, execution_config, "
+                "outputs, metadata, created_at, updated_at) VALUES (:id, :prompt_id, "
+                ":model_type, :status, '{}', '{}', '{}', :created, :created)"
+            ),
+            rows,
+        )
+        connection.execute(
+            text(
+                "INSERT INTO job_queue (id, prompt_ids, job_type, status, config, priority, "
+                "created_at) VALUES (:id, '[]', 'inference', :status, '{}', :priority, :created)"
+            ),
+            [
+                {
+                    "id": f"job_{j:06d}",
+                    "status": "queued" if j % 10 == 0 else "completed",
+                    "priority": 50 + (j % 3) * 10,
+                    "created": base + timedelta(seconds=j),
+                }
+                for j in range(num_prompts * 2)
+            ],
+        )
+
+
+def _measure(conn: DatabaseConnection, repeats: int = 20) -> dict[str, tuple[str, float]]:
+    results = {}
+    with conn.engine.connect() as connection:
+        for name, sql in HOT_QUERIES.items():
+            plan = " | ".join(
+                row[-1] for row in connection.execute(text(f"EXPLAIN QUERY PLAN {sql}"))
+            )
+            start = time.perf_counter()
+            for _ in range(repeats):
+                connection.execute(text(sql)).fetchall()
+            elapsed_ms = (time.perf_counter() - start) * 1000 / repeats
+            results[name] = (plan, elapsed_ms)
+    return results
+
+
+def test_indexes_change_hot_query_plans(tmp_path, bench_scale):
+    """Compare plans/timings for hot queries on a legacy vs migrated database."""
+    conn = DatabaseConnection(str(tmp_path / "bench.db"))
+    Base.metadata.create_all(conn.engine)
+    with conn.engine.begin() as connection:
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                connection.execute(text(f"DROP INDEX IF EXISTS {index.name}"))
+        connection.execute(text("PRAGMA user_version = 0"))
+    _seed(conn, num_prompts=200 * bench_scale, runs_per_prompt=25)
+
+    before = _measure(conn)
+    conn.migrate()
+    with conn.engine.begin() as connection:
+        connection.execute(text("ANALYZE"))
+    after = _measure(conn)
+
+    print()
+    for name in HOT_QUERIES:
+        print(f"{name}:")
+        print(f"  before {before[name][1]:8.3f} ms  {before[name][0]}")
+        print(f"  after  {after[name][1]:8.3f} ms  {after[name][0]}")
+
+    for name in HOT_QUERIES:
+        assert "USING INDEX" not in before[name][0]
+        assert "USING INDEX" in after[name][0] or "USING COVERING INDEX" in after[name][0]
+    conn.close()
+
+
+def test_promoted_columns_replace_json_extract_scans(tmp_path, bench_scale):
+    """Compare json_extract lookups against their promoted, indexed columns."""
+    conn = DatabaseConnection(str(tmp_path / "bench.db"))
+    conn.create_tables()
+    _seed(conn, num_prompts=200 * bench_scale, runs_per_prompt=25)
+    with conn.engine.begin() as connection:
+        connection.execute(
+            text(
+                "UPDATE runs SET execution_config = json_object('source_run_id', "
+                "printf('rs_%08d', CAST(substr(id, 4) AS INTEGER) - 1)), "
+                "source_run_id = printf('rs_%08d', CAST(substr(id, 4) AS INTEGER) - 1) "
+                "WHERE model_type = 'upscale'"
+            )
+        )
+        connection.execute(text("ANALYZE"))
+
+    lookups = {
+        "find_upscaled_run": (
+            "SELECT id FROM runs WHERE model_type = 'upscale' "
+            "AND json_extract(execution_config, '$.source_run_id') = 'rs_00000001'",
+            "SELECT id FROM runs WHERE model_type = 'upscale' AND source_run_id = 'rs_00000001'",
+        ),
+        "list_enhanced_prompts": (
+            "SELECT id FROM prompts WHERE json_extract(parameters, '$.enhanced') "
+            "ORDER BY created_at DESC LIMIT 100",
+            "SELECT id FROM prompts WHERE enhanced = 1 ORDER BY created_at DESC LIMIT 100",
+        ),
+    }
+
+    print()
+    with conn.engine.connect() as connection:
+        for name, queries in lookups.items():
+            results = []
+            for sql in queries:
+                plan = " | ".join(
+                    row[-1] for row in connection.execute(text(f"EXPLAIN QUERY PLAN {sql}"))
+                )
+                start = time.perf_counter()
+                for _ in range(20):
+                    connection.execute(text(sql)).fetchall()
+                results.append((plan, (time.perf_counter() - start) * 1000 / 20))
+            print(f"{name}:")
+            print(f"  json_extract {results[0][1]:8.3f} ms  {results[0][0]}")
+            print(f"  column       {results[1][1]:8.3f} ms  {results[1][0]}")
+            assert "USING INDEX" in results[1][0]
+    conn.close()
@@ -0,0 +1,96 @@
+"""Benchmark the Runs tab refresh: per-run enrichment vs the enriched listing.
+
+pytest tests/benchmarks/test_runs_listing.py -s
+"""
+
+import time
+
+import pytest
+from sqlalchemy import text
+
+from cosmos_workflow.config.config_manager import ConfigManager
+from cosmos_workflow.database.connection import DatabaseConnection
+from cosmos_workflow.services.data_repository import DataRepository
+
+
+def _seed_runs(conn: DatabaseConnection, num_runs: int) -> None:
+    """Insert prompts, transfer runs and upscale children (every 4th run)."""
+    num_prompts = max(1, num_runs // 10)
+    with conn.engine.begin() as connection:
+        connection.execute(
+            text(
+                "INSERT INTO prompts (id, prompt_text, inputs, parameters, created_at) "
+                "VALUES (:id, :text, '{}', '{}', '2025-01-01 00:00:00')"
+            ),
+            [{"id": f"ps_{p:06d}", "text": f"prompt text {p}"} for p in range(num_prompts)],
+        )
+        rows = []
+        for n in range(num_runs):
+            upscale = n % 4 == 3
+            rows.append(
+                {
+                    "id": f"rs_{n:08d}",
+                    "prompt_id": f"ps_{n % num_prompts:06d}",
+                    "model_type": "upscale" if upscale else "transfer",
+                    "source": f"rs_{n - 1:08d}" if upscale else None,
+                    "config": f'{{"source_run_id": "rs_{n - 1:08d}"}}' if upscale else "{}",
+                    "created": f"2025-01-01 00:{n // 3600 % 60:02d}:{n % 60:02d}.{n:06d}",
+                }
+            )
+        connection.execute(
+            text(
+                "INSERT INTO runs (id, prompt_id, model_type, status, execution_config, "
+                "outputs, metadata, source_run_id, created_at, updated_at) VALUES (:id, "
+                ":prompt_id, :model_type, 'completed', :config, '{}', '{}', :source, "
+                ":created, :created)"
+            ),
+            rows,
+        )
+
+
+def _legacy_refresh(repo: DataRepository, limit: int) -> list[dict]:
+    """The old RunsLoader path: list, then get_prompt/find_upscaled_run per run."""
+    runs = repo.list_runs(limit=limit)
+    for run in runs:
+        if not run.get("prompt_text") and run.get("prompt_id"):
+            prompt = repo.get_prompt(run["prompt_id"])
+            if prompt:
+                run["prompt_text"] = prompt.get("prompt_text", "")
+        if run.get("model_type") == "transfer":
+            upscaled_run = repo.find_upscaled_run(run["id"])
+            if upscaled_run:
+                run["has_upscaled"] = True
+                run["upscaled_run"] = upscaled_run
+    return runs
+
+
+@pytest.mark.parametrize("num_runs", [500, 5000])
+def test_enriched_listing_vs_n_plus_one(tmp_path, num_runs, bench_scale):
+    """The enriched listing returns the same data in far less time."""
+    num_runs *= bench_scale
+    conn = DatabaseConnection(str(tmp_path / "runs.db"))
+    conn.create_tables()
+    _seed_runs(conn, num_runs)
+    repo = DataRepository(conn, ConfigManager())
+    limit = 500  # RunsLoader fetch size before filters moved into SQL
+
+    start = time.perf_counter()
+    legacy = _legacy_refresh(repo, limit)
+    legacy_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    enriched = repo.list_runs_enriched(limit=limit)
+    enriched_ms = (time.perf_counter() - start) * 1000
+
+    print(
+        f"\n{num_runs} runs: N+1 refresh {legacy_ms:8.1f} ms, "
+        f"enriched listing {enriched_ms:8.1f} ms ({legacy_ms / enriched_ms:.1f}x)"
+    )
+
+    assert [r["id"] for r in enriched] == [r["id"] for r in legacy]
+    assert [r["prompt_text"] for r in enriched] == [r["prompt_text"] for r in legacy]
+    assert {r["id"] for r in enriched if r["has_upscaled"]} == {
+        r["id"] for r in legacy if r.get("has_upscaled")
+    }
+    assert enriched_ms < legacy_ms
+    conn.close()
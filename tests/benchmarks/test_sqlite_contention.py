@@ -0,0 +1,127 @@
+"""Benchmark concurrent readers and writers on one SQLite file per profile.
+
+Mimics the UI refresh timers and the queue processor polling while runs are
+created and a long batch commits. Compares the "safe" (rollback journal)
+and "performance" (WAL) profiles.
+
+    pytest tests/benchmarks/test_sqlite_contention.py -s
+"""
+
+import statistics
+import threading
+import time
+
+from sqlalchemy.exc import OperationalError
+
+from cosmos_workflow.config.config_manager import ConfigManager
+from cosmos_workflow.database.connection import DatabaseConnection
+from cosmos_workflow.database.models import Run
+from cosmos_workflow.services.data_repository import DataRepository
+
+
+def _run_contention(db_path, profile, duration, readers=4, writers=2):
+    conn = DatabaseConnection(str(db_path), profile=profile)
+    conn.create_tables()
+    repo = DataRepository(conn, ConfigManager())
+    prompt = repo.create_prompt(prompt_text="bench", inputs={"video": "v.mp4"}, parameters={})
+
+    stop = threading.Event()
+    lock = threading.Lock()
+    read_latencies: list[float] = []
+    stats = {"writes": 0, "batch_commits": 0, "locked_errors": 0}
+
+    def reader():
+        while not stop.is_set():
+            start = time.perf_counter()
+            try:
+                with conn.get_session() as session:
+                    session.query(Run).order_by(Run.created_at.desc()).limit(50).all()
+            except OperationalError:
+                with lock:
+                    stats["locked_errors"] += 1
+                continue
+            with lock:
+                read_latencies.append(time.perf_counter() - start)
+            time.sleep(0.002)
+
+    def writer():
+        while not stop.is_set():
+            try:
+                run = repo.create_run(prompt_id=prompt["id"], execution_config={})
+                repo.update_run_status(run["id"], "completed")
+            except OperationalError:
+                with lock:
+                    stats["locked_errors"] += 1
+                continue
+            with lock:
+                stats["writes"] += 2
+
+    def batch_writer():
+        # Long transaction like execute_batch_runs updating many runs at once
+        while not stop.is_set():
+            try:
+                with conn.get_session() as session:
+                    for i in range(200):
+                        session.add(
+                            Run(
+                                id=f"rs_batch_{time.monotonic_ns()}_{i}",
+                                prompt_id=prompt["id"],
+                                model_type="transfer",
+                                status="completed",
+                                execution_config={},
+                                outputs={"output_path": "x" * 512},
+                                run_metadata={"batch_id": "batch_bench"},
+                            )
+                        )
+                    session.flush()
+                    time.sleep(0.05)
+                    session.commit()
+            except OperationalError:
+                with lock:
+                    stats["locked_errors"] += 1
+                continue
+            with lock:
+                stats["batch_commits"] += 1
+
+    threads = [threading.Thread(target=reader) for _ in range(readers)]
+    threads += [threading.Thread(target=writer) for _ in range(writers)]
+    threads.append(threading.Thread(target=batch_writer))
+    for t in threads:
+        t.start()
+    time.sleep(duration)
+    stop.set()
+    for t in threads:
+        t.join(timeout=30)
+    conn.close()
+
+    latencies = sorted(read_latencies)
+    return {
+        **stats,
+        "reads": len(latencies),
+        "read_p50_ms": statistics.median(latencies) * 1000 if latencies else 0.0,
+        "read_p95_ms": latencies[int(len(latencies) * 0.95)] * 1000 if latencies else 0.0,
+        "read_max_ms": latencies[-1] * 1000 if latencies else 0.0,
+    }
+
+
+def test_wal_profile_under_contention(tmp_path, bench_scale):
+    """Readers keep flowing and nothing hits 'database is locked' with WAL."""
+    duration = 1.5 * bench_scale
+    results = {
+        name: _run_contention(tmp_path / f"{name}.db", name, duration)
+        for name in ("safe", "performance")
+    }
+
+    print()
+    for name, r in results.items():
+        print(
+            f"{name:12s} reads={r['reads']:6d} writes={r['writes']:5d} "
+            f"batches={r['batch_commits']:3d} locked={r['locked_errors']:3d} "
+            f"read p50={r['read_p50_ms']:.2f}ms p95={r['read_p95_ms']:.2f}ms "
+            f"max={r['read_max_ms']:.2f}ms"
+        )
+
+    performance = results["performance"]
+    assert performance["locked_errors"] == 0
+    assert performance["reads"] > 0
+    assert performance["writes"] > 0
@@ -0,0 +1,49 @@
+"""Benchmark per-click latency of UI handlers with and without the shared context.
+
+Before: each handler constructed CosmosAPI() (config parse, new engine,
+create_all, new GPUExecutor). After: handlers use the process-wide AppContext.
+
+    pytest tests/benchmarks/test_ui_click_latency.py -s
+"""
+
+import time
+
+from cosmos_workflow.api.cosmos_api import CosmosAPI
+from cosmos_workflow.ui import context as ui_context
+from cosmos_workflow.ui.context import AppContext, set_app_context
+from cosmos_workflow.ui.tabs import prompts_handlers
+
+
+def _time_clicks(clicks: int) -> float:
+    start = time.perf_counter()
+    for _ in range(clicks):
+        prompts_handlers.load_ops_prompts(limit=50)
+    return (time.perf_counter() - start) * 1000 / clicks
+
+
+def test_shared_context_click_latency(tmp_path, monkeypatch, bench_scale):
+    """A refresh click is cheaper when it reuses the shared services."""
+    # Relative ./outputs in config.toml resolves into the temp directory
+    monkeypatch.chdir(tmp_path)
+    context = AppContext()
+    for i in range(100):
+        context.repository.create_prompt(
+            prompt_text=f"prompt {i}", inputs={"video": "v.mp4"}, parameters={"name": f"p{i}"}
+        )
+    clicks = 10 * bench_scale
+
+    monkeypatch.setattr(prompts_handlers, "get_api", lambda: CosmosAPI())
+    per_instance_ms = _time_clicks(clicks)
+
+    monkeypatch.setattr(prompts_handlers, "get_api", ui_context.get_api)
+    set_app_context(context)
+    try:
+        prompts_handlers.load_ops_prompts(limit=50)  # warm
+        shared_ms = _time_clicks(clicks)
+    finally:
+        set_app_context(None)
+        context.close()
+
+    print(f"\nper-click CosmosAPI(): {per_instance_ms:8.2f} ms")
+    print(f"shared AppContext:     {shared_ms:8.2f} ms")
+    assert shared_ms < per_instance_ms
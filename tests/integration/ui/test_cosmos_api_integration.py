@@ -14,7 +14,7 @@ class TestUICosmosAPIIntegration:
         """Test that prompt handlers work with actual API response format."""
         from cosmos_workflow.ui.tabs.prompts_handlers import load_ops_prompts
 
-        with patch("cosmos_workflow.ui.tabs.prompts_handlers.CosmosAPI") as mock_api:
+        with patch("cosmos_workflow.ui.tabs.prompts_handlers.get_api") as mock_api:
             # Use REAL response shape from CosmosAPI.list_prompts()
             mock_api.return_value.list_prompts.return_value = [
                 {
@@ -74,7 +74,7 @@ class TestUICosmosAPIIntegration:
         """Test that run handlers work with actual API response format."""
         from cosmos_workflow.ui.tabs.runs.run_actions import preview_delete_run
 
-        with patch("cosmos_workflow.ui.tabs.runs.run_actions.CosmosAPI") as mock_api:
+        with patch("cosmos_workflow.ui.tabs.runs.run_actions.get_api") as mock_api:
             # Use REAL response shape from CosmosAPI.get_run()
             mock_api.return_value.get_run.return_value = {
                 "id": "rs_9c8d7e6f5a4b3210",
@@ -192,7 +192,7 @@ class TestUICosmosAPIIntegration:
         """Test job status display with actual API status response."""
         from cosmos_workflow.ui.tabs.jobs_handlers import check_running_jobs
 
-        with patch("cosmos_workflow.ui.tabs.jobs_handlers.CosmosAPI") as mock_api:
+        with patch("cosmos_workflow.ui.tabs.jobs_handlers.get_api") as mock_api:
             # Use REAL response shape from CosmosAPI.check_status()
             mock_api.return_value.check_status.return_value = {
                 "ssh_status": "connected",
@@ -188,6 +188,16 @@ class TestSimplifiedQueueService:
         call_args = mock_cosmos_api.batch_inference.call_args
         assert call_args.kwargs["batch_size"] == 4  # Default batch size
 
+    def test_no_cache_job_bypasses_result_cache(self, queue_service, mock_cosmos_api):
+        """Test jobs use the result cache unless their config sets no_cache."""
+        queue_service.add_job(["ps_001"], "inference", {})
+        queue_service.process_next_job()
+        assert mock_cosmos_api.quick_inference.call_args.kwargs["use_cache"] is True
+
+        queue_service.add_job(["ps_001", "ps_002"], "batch_inference", {"no_cache": True})
+        queue_service.process_next_job()
+        assert mock_cosmos_api.batch_inference.call_args.kwargs["use_cache"] is False
+
     def test_process_enhancement_job(self, queue_service, mock_cosmos_api):
         """Test processing an enhancement job."""
         queue_service.add_job(["ps_enhance"], "enhancement", {"create_new": True, "model": "gpt-4"})
@@ -277,10 +287,14 @@ class TestSimplifiedQueueService:
         job2 = queue_service.add_job(["ps_002"], "inference", {})
         job3 = queue_service.add_job(["ps_003"], "inference", {})
 
-        # Claim jobs - should be in FIFO order
+        # Claim jobs - should be in FIFO order, one at a time on the single GPU slot
         assert queue_service.claim_next_job() == job1
+        assert queue_service.claim_next_job() is None  # Slot taken until job1 finishes
+        queue_service.execute_job(job1)
         assert queue_service.claim_next_job() == job2
+        queue_service.execute_job(job2)
         assert queue_service.claim_next_job() == job3
+        queue_service.execute_job(job3)
         assert queue_service.claim_next_job() is None  # Queue empty
 
     def test_claim_skips_when_container_running(self, queue_service, mock_cosmos_api):
@@ -300,6 +314,14 @@ class TestSimplifiedQueueService:
         status = queue_service.get_job_status(job_id)
         assert status["status"] == "queued"
 
+    def test_process_next_job_invalidates_container_state(self, queue_service, mock_cosmos_api):
+        """Test the cached container state is discarded once a job has run."""
+        queue_service.add_job(["ps_test"], "inference", {})
+
+        queue_service.process_next_job()
+
+        mock_cosmos_api.invalidate_container_state.assert_called_once()
+
     # Test Batch Size Configuration
 
     def test_set_batch_size(self, queue_service):
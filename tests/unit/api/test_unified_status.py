@@ -43,9 +43,8 @@ class TestSimplifiedActiveOperations:
         api = CosmosAPI()
         api.service = mock_repo_instance
         api.orchestrator = mock_executor_instance
-        # Mock the nested docker_executor attribute correctly
-        api.orchestrator.docker_executor = MagicMock()
-        api.orchestrator.docker_executor.get_active_container.return_value = container
+        api.container_monitor = MagicMock()
+        api.container_monitor.get_container.return_value = container
 
         result = api.get_active_operations()
 
@@ -76,9 +75,8 @@ class TestSimplifiedActiveOperations:
         api = CosmosAPI()
         api.service = mock_repo_instance
         api.orchestrator = mock_executor_instance
-        # Mock the nested docker_executor attribute - no container
-        api.orchestrator.docker_executor = MagicMock()
-        api.orchestrator.docker_executor.get_active_container.return_value = None
+        api.container_monitor = MagicMock()
+        api.container_monitor.get_container.return_value = None
 
         result = api.get_active_operations()
 
@@ -109,9 +107,8 @@ class TestSimplifiedActiveOperations:
         api = CosmosAPI()
         api.service = mock_repo_instance
         api.orchestrator = mock_executor_instance
-        # Mock the nested docker_executor attribute - no container
-        api.orchestrator.docker_executor = MagicMock()
-        api.orchestrator.docker_executor.get_active_container.return_value = None
+        api.container_monitor = MagicMock()
+        api.container_monitor.get_container.return_value = None
 
         result = api.get_active_operations()
 
@@ -144,9 +141,8 @@ class TestSimplifiedActiveOperations:
         api = CosmosAPI()
         api.service = mock_repo_instance
         api.orchestrator = mock_executor_instance
-        # Mock the nested docker_executor attribute - container exists
-        api.orchestrator.docker_executor = MagicMock()
-        api.orchestrator.docker_executor.get_active_container.return_value = container
+        api.container_monitor = MagicMock()
+        api.container_monitor.get_container.return_value = container
 
         result = api.get_active_operations()
 
@@ -169,7 +165,7 @@ class TestEnhancedCheckStatus:
         mock_executor_instance = MagicMock()
         mock_executor.return_value = mock_executor_instance
 
-        # Mock base status from orchestrator
+        # Mock the cached remote state
         base_status = {
             "ssh_status": "connected",
             "docker_status": {"docker_running": True},
@@ -181,7 +177,6 @@ class TestEnhancedCheckStatus:
                 "gpu_utilization": "85%",
             },
         }
-        mock_executor_instance.check_remote_status.return_value = base_status
 
         # Mock active run
         active_run = {
@@ -199,9 +194,9 @@ class TestEnhancedCheckStatus:
         api = CosmosAPI()
         api.service = mock_repo_instance
         api.orchestrator = mock_executor_instance
-        # Mock the nested docker_executor attribute
-        api.orchestrator.docker_executor = MagicMock()
-        api.orchestrator.docker_executor.get_active_container.return_value = container
+        api.container_monitor = MagicMock()
+        api.container_monitor.snapshot.return_value = base_status
+        api.container_monitor.get_container.return_value = container
 
         result = api.check_status()
 
@@ -229,13 +224,12 @@ class TestEnhancedCheckStatus:
             "docker_status": {"docker_running": False},
             "gpu_info": None,
         }
-        mock_executor_instance.check_remote_status.return_value = base_status
 
         api = CosmosAPI()
         api.service = mock_repo_instance
         api.orchestrator = mock_executor_instance
-        # Mock the nested docker_executor attribute
-        api.orchestrator.docker_executor = MagicMock()
+        api.container_monitor = MagicMock()
+        api.container_monitor.snapshot.return_value = base_status
 
         result = api.check_status()
 
@@ -265,3 +259,54 @@ class TestEnhancedCheckStatus:
         # Test short run_id
         name = api._generate_container_name("transfer", "run_123")
         assert name == "cosmos_transfer_123"
+
+
+class TestCachedActiveContainers:
+    """Test that container lookups go through the container monitor."""
+
+    @patch("cosmos_workflow.api.cosmos_api.init_database")
+    @patch("cosmos_workflow.api.cosmos_api.DataRepository")
+    @patch("cosmos_workflow.api.cosmos_api.GPUExecutor")
+    def test_get_active_containers_reads_cache(self, mock_executor, mock_repo, mock_db):
+        """Test containers come from the cached snapshot unless fresh is requested."""
+        api = CosmosAPI()
+        api.container_monitor = MagicMock()
+        api.container_monitor.get_container.return_value = {
+            "id": "abc123def4567890",
+            "id_short": "abc123def456",
+            "name": "cosmos_transfer_rs_1234",
+            "image": "cosmos:latest",
+            "status": "Up 1 minute",
+        }
+
+        containers = api.get_active_containers()
+
+        assert containers == [
+            {
+                "container_id": "abc123def456",
+                "name": "cosmos_transfer_rs_1234",
+                "image": "cosmos:latest",
+                "status": "Up 1 minute",
+            }
+        ]
+        api.container_monitor.get_container.assert_called_with(max_age=None)
+
+        api.get_active_containers(fresh=True)
+        api.container_monitor.get_container.assert_called_with(max_age=0)
+
+    @patch("cosmos_workflow.api.cosmos_api.init_database")
+    @patch("cosmos_workflow.api.cosmos_api.DataRepository")
+    @patch("cosmos_workflow.api.cosmos_api.GPUExecutor")
+    def test_kill_containers_invalidates_cache(self, mock_executor, mock_repo, mock_db):
+        """Test killing containers discards the cached container state."""
+        api = CosmosAPI()
+        api.container_monitor = MagicMock()
+        api.orchestrator.docker_executor.kill_containers.return_value = {
+            "status": "success",
+            "killed_count": 1,
+            "killed_containers": ["abc123"],
+        }
+
+        api.kill_containers()
+
+        api.container_monitor.invalidate.assert_called_once()
@@ -96,6 +96,7 @@ class TestQuickInferenceRefactored:
                 "canny_threshold": "medium",
                 "fps": 24,
             },
+            metadata={},
             model_type="transfer",
         )
 
@@ -148,6 +149,66 @@ class TestQuickInferenceRefactored:
         assert call_args[1]["execution_config"]["guidance"] == 8.5
         assert call_args[1]["execution_config"]["seed"] == 42
 
+    def test_quick_inference_reuses_identical_run(
+        self, ops, mock_config, mock_service, mock_orchestrator, tmp_path
+    ):
+        """Test a run identical to a completed one links to its output without the GPU."""
+        video = tmp_path / "color.mp4"
+        video.write_bytes(b"frames")
+        output = tmp_path / "output.mp4"
+        output.write_bytes(b"video")
+        mock_config.get_remote_config.return_value = MagicMock(docker_image="cosmos:1.0")
+        mock_service.get_prompt.return_value = {
+            "id": "ps_test123",
+            "prompt_text": "Test",
+            "inputs": {"video": str(video)},
+            "parameters": {},
+        }
+        mock_service.create_run.return_value = {"id": "rs_new"}
+        mock_service.find_runs_by_fingerprint.side_effect = lambda fingerprints: {
+            fingerprints[0]: [{"id": "rs_old", "outputs": {"output_path": str(output)}}]
+        }
+
+        result = ops.quick_inference("ps_test123", seed=7)
+
+        mock_orchestrator.execute_run.assert_not_called()
+        metadata = mock_service.create_run.call_args.kwargs["metadata"]
+        assert metadata["cached_from"] == "rs_old"
+        assert metadata["fingerprint"]
+        mock_service.update_runs.assert_called_once_with(
+            {
+                "rs_new": {
+                    "outputs": {"output_path": str(output), "cached_from": "rs_old"},
+                    "status": "completed",
+                }
+            }
+        )
+        assert result["status"] == "completed"
+        assert result["output_path"] == str(output)
+        assert result["cached_from"] == "rs_old"
+
+    def test_quick_inference_no_cache_runs_on_gpu(
+        self, ops, mock_config, mock_service, mock_orchestrator, tmp_path
+    ):
+        """Test use_cache=False records the fingerprint but always executes."""
+        video = tmp_path / "color.mp4"
+        video.write_bytes(b"frames")
+        mock_config.get_remote_config.return_value = MagicMock(docker_image="cosmos:1.0")
+        mock_service.get_prompt.return_value = {
+            "id": "ps_test123",
+            "prompt_text": "Test",
+            "inputs": {"video": str(video)},
+            "parameters": {},
+        }
+        mock_service.create_run.return_value = {"id": "rs_new"}
+        mock_orchestrator.execute_run.return_value = {"status": "completed"}
+
+        ops.quick_inference("ps_test123", use_cache=False)
+
+        mock_service.find_runs_by_fingerprint.assert_not_called()
+        mock_orchestrator.execute_run.assert_called_once()
+        assert "fingerprint" in mock_service.create_run.call_args.kwargs["metadata"]
+
     def test_quick_inference_invalid_prompt_id(self, ops, mock_service):
         """Test quick_inference with invalid prompt_id."""
         mock_service.get_prompt.return_value = None
@@ -207,13 +268,7 @@ class TestBatchInferenceRefactored:
             {"id": "ps_test3", "prompt_text": "Night", "inputs": {}, "parameters": {}},
         ]
 
-        def get_prompt_side_effect(prompt_id):
-            for p in mock_prompts:
-                if p["id"] == prompt_id:
-                    return p
-            return None
-
-        mock_service.get_prompt.side_effect = get_prompt_side_effect
+        mock_service.get_prompts.return_value = {p["id"]: p for p in mock_prompts}
 
         # Setup mock run creation
         mock_runs = [
@@ -221,7 +276,7 @@ class TestBatchInferenceRefactored:
             {"id": "rs_auto2", "prompt_id": "ps_test2", "status": "pending"},
             {"id": "rs_auto3", "prompt_id": "ps_test3", "status": "pending"},
         ]
-        mock_service.create_run.side_effect = mock_runs
+        mock_service.create_runs.return_value = mock_runs
 
         # Setup mock batch execution result
         mock_batch_result = {
@@ -241,8 +296,12 @@ class TestBatchInferenceRefactored:
         weights_list = [{"edge": 0.5}, {"edge": 0.5}, {"edge": 0.5}]  # Same weights for simplicity
         result = ops.batch_inference(prompt_ids, weights_list)
 
-        # Verify it creates runs for all prompts
-        assert mock_service.create_run.call_count == 3
+        # Verify it fetches prompts and creates runs for all of them in bulk
+        mock_service.get_prompts.assert_called_once_with(prompt_ids)
+        mock_service.create_runs.assert_called_once()
+        assert len(mock_service.create_runs.call_args[0][0]) == 3
+        mock_service.get_prompt.assert_not_called()
+        mock_service.create_run.assert_not_called()
 
         # Verify it calls batch execution
         mock_orchestrator.execute_batch_runs.assert_called_once()
@@ -264,10 +323,8 @@ class TestBatchInferenceRefactored:
             {"id": "ps_test2", "prompt_text": "Test2", "inputs": {}, "parameters": {}},
         ]
 
-        mock_service.get_prompt.side_effect = lambda pid: next(
-            (p for p in mock_prompts if p["id"] == pid), None
-        )
-        mock_service.create_run.side_effect = [
+        mock_service.get_prompts.return_value = {p["id"]: p for p in mock_prompts}
+        mock_service.create_runs.return_value = [
             {"id": "rs_auto1", "prompt_id": "ps_test1"},
             {"id": "rs_auto2", "prompt_id": "ps_test2"},
         ]
@@ -284,25 +341,103 @@ class TestBatchInferenceRefactored:
         ops.batch_inference(["ps_test1", "ps_test2"], weights_list=weights_list)
 
         # Verify different weights are used for each run
-        assert (
-            mock_service.create_run.call_args_list[0][1]["execution_config"]["weights"]
-            == weights_list[0]
-        )
-        assert (
-            mock_service.create_run.call_args_list[1][1]["execution_config"]["weights"]
-            == weights_list[1]
-        )
+        run_specs = mock_service.create_runs.call_args[0][0]
+        assert run_specs[0]["execution_config"]["weights"] == weights_list[0]
+        assert run_specs[1]["execution_config"]["weights"] == weights_list[1]
+
+    def test_batch_inference_resumes_existing_batch(self, ops, mock_service, mock_orchestrator):
+        """Test passing the ID of a started batch resumes its runs instead of creating new ones."""
+        mock_service.iter_runs.return_value = [
+            {
+                "id": "rs_b",
+                "prompt_id": "ps_2",
+                "status": "running",
+                "metadata": {"batch_index": 1},
+            },
+            {
+                "id": "rs_a",
+                "prompt_id": "ps_1",
+                "status": "completed",
+                "metadata": {"batch_index": 0},
+            },
+            {
+                "id": "rs_c",
+                "prompt_id": "ps_3",
+                "status": "running",
+                "metadata": {"batch_index": 2},
+            },
+        ]
+        mock_service.get_prompts.return_value = {
+            "ps_1": {"id": "ps_1"},
+            "ps_2": {"id": "ps_2"},
+            "ps_3": {"id": "ps_3"},
+        }
+        # rs_c's output was recovered before the rerun of rs_b failed
+        mock_orchestrator.resume_batch_runs.return_value = {
+            "status": "failed",
+            "error": "lost",
+            "recovered_run_ids": ["rs_c"],
+        }
+
+        ops.batch_inference(["ps_1", "ps_2", "ps_3"], [{}, {}, {}], batch_id="batch_x")
+
+        mock_service.iter_runs.assert_called_once_with(batch_id="batch_x")
+        mock_service.create_runs.assert_not_called()
+        runs_and_prompts = mock_orchestrator.resume_batch_runs.call_args.args[0]
+        assert [run["id"] for run, _ in runs_and_prompts] == ["rs_a", "rs_b", "rs_c"]
+        assert mock_orchestrator.resume_batch_runs.call_args.kwargs["batch_name"] == "batch_x"
+        # Only the unfinished run is failed
+        mock_service.update_runs.assert_called_once_with({"rs_b": {"status": "failed"}})
+
+    def test_batch_inference_runs_only_uncached_prompts(
+        self, ops, mock_config, mock_service, mock_orchestrator, tmp_path
+    ):
+        """Test cache hits are linked and left out of the GPU batch."""
+        video = tmp_path / "color.mp4"
+        video.write_bytes(b"frames")
+        output = tmp_path / "output.mp4"
+        output.write_bytes(b"video")
+        mock_config.get_remote_config.return_value = MagicMock(docker_image="cosmos:1.0")
+        mock_service.get_prompts.return_value = {
+            prompt_id: {
+                "id": prompt_id,
+                "prompt_text": prompt_id,
+                "inputs": {"video": str(video)},
+                "parameters": {},
+            }
+            for prompt_id in ("ps_hit", "ps_miss")
+        }
+        hit_fingerprint = []
+
+        def find_runs(fingerprints):
+            hit_fingerprint.append(fingerprints[0])
+            return {fingerprints[0]: [{"id": "rs_old", "outputs": {"output_path": str(output)}}]}
+
+        mock_service.find_runs_by_fingerprint.side_effect = find_runs
+        mock_service.create_runs.side_effect = lambda specs: [
+            {"id": f"rs_{spec['prompt_id']}", "prompt_id": spec["prompt_id"]} for spec in specs
+        ]
+        mock_orchestrator.execute_batch_runs.return_value = {"status": "success"}
+
+        result = ops.batch_inference(["ps_hit", "ps_miss"], [{}, {}])
+
+        specs = mock_service.create_runs.call_args.args[0]
+        assert specs[0]["metadata"]["cached_from"] == "rs_old"
+        assert "batch_index" not in specs[0]["metadata"]
+        assert specs[1]["metadata"]["batch_index"] == 0
+        assert specs[1]["metadata"]["fingerprint"] != hit_fingerprint[0]
+        runs_and_prompts = mock_orchestrator.execute_batch_runs.call_args.args[0]
+        assert [run["id"] for run, _ in runs_and_prompts] == ["rs_ps_miss"]
+        assert result["cached_runs"] == 1
 
     def test_batch_inference_skips_missing_prompts(self, ops, mock_service, mock_orchestrator):
         """Test batch_inference gracefully handles missing prompts."""
         # Only ps_test2 exists
-        mock_service.get_prompt.side_effect = lambda pid: (
-            {"id": "ps_test2", "prompt_text": "Test2", "inputs": {}, "parameters": {}}
-            if pid == "ps_test2"
-            else None
-        )
+        mock_service.get_prompts.return_value = {
+            "ps_test2": {"id": "ps_test2", "prompt_text": "Test2", "inputs": {}, "parameters": {}}
+        }
 
-        mock_service.create_run.return_value = {"id": "rs_auto2", "prompt_id": "ps_test2"}
+        mock_service.create_runs.return_value = [{"id": "rs_auto2", "prompt_id": "ps_test2"}]
         mock_orchestrator.execute_batch_runs.return_value = {
             "output_mapping": {"rs_auto2": "out2.mp4"}
         }
@@ -313,10 +448,10 @@ class TestBatchInferenceRefactored:
         ops.batch_inference(["ps_missing1", "ps_test2", "ps_missing3"], weights_list)
 
         # Verify only 1 run was created (for the existing prompt)
-        assert mock_service.create_run.call_count == 1
-        # Verify it was called with ps_test2
-        call_args = mock_service.create_run.call_args
-        assert call_args[1]["prompt_id"] == "ps_test2"
+        run_specs = mock_service.create_runs.call_args[0][0]
+        assert len(run_specs) == 1
+        # Verify it was created for ps_test2
+        assert run_specs[0]["prompt_id"] == "ps_test2"
 
     def test_batch_inference_handles_failed_runs(self, ops, mock_service, mock_orchestrator):
         """Test batch_inference properly marks failed runs."""
@@ -325,10 +460,8 @@ class TestBatchInferenceRefactored:
             {"id": "ps_test2", "prompt_text": "Test2", "inputs": {}, "parameters": {}},
         ]
 
-        mock_service.get_prompt.side_effect = lambda pid: next(
-            (p for p in mock_prompts if p["id"] == pid), None
-        )
-        mock_service.create_run.side_effect = [
+        mock_service.get_prompts.return_value = {p["id"]: p for p in mock_prompts}
+        mock_service.create_runs.return_value = [
             {"id": "rs_auto1", "prompt_id": "ps_test1"},
             {"id": "rs_auto2", "prompt_id": "ps_test2"},
         ]
@@ -351,8 +484,8 @@ class TestBatchInferenceRefactored:
     def test_batch_inference_with_additional_params(self, ops, mock_service, mock_orchestrator):
         """Test batch_inference with additional execution parameters."""
         mock_prompt = {"id": "ps_test1", "prompt_text": "Test", "inputs": {}, "parameters": {}}
-        mock_service.get_prompt.return_value = mock_prompt
-        mock_service.create_run.return_value = {"id": "rs_auto1", "prompt_id": "ps_test1"}
+        mock_service.get_prompts.return_value = {"ps_test1": mock_prompt}
+        mock_service.create_runs.return_value = [{"id": "rs_auto1", "prompt_id": "ps_test1"}]
         mock_orchestrator.execute_batch_runs.return_value = {
             "output_mapping": {"rs_auto1": "out.mp4"}
         }
@@ -360,10 +493,10 @@ class TestBatchInferenceRefactored:
         ops.batch_inference(["ps_test1"], [{"edge": 0.5}], num_steps=50, guidance=8.5, seed=42)
 
         # Verify additional params are passed to run creation
-        call_args = mock_service.create_run.call_args
-        assert call_args[1]["execution_config"]["num_steps"] == 50
-        assert call_args[1]["execution_config"]["guidance"] == 8.5
-        assert call_args[1]["execution_config"]["seed"] == 42
+        execution_config = mock_service.create_runs.call_args[0][0][0]["execution_config"]
+        assert execution_config["num_steps"] == 50
+        assert execution_config["guidance"] == 8.5
+        assert execution_config["seed"] == 42
 
     def test_batch_inference_empty_list(self, ops, mock_orchestrator):
         """Test batch_inference with empty prompt list."""
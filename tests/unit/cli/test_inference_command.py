@@ -46,6 +46,21 @@ class TestInferenceCommand:
         call_kwargs = mock_ops.quick_inference.call_args[1]
         assert call_kwargs["prompt_id"] == "ps_test"  # Keyword arg prompt_id
 
+    @patch("cosmos_workflow.cli.base.CLIContext.get_operations")
+    def test_inference_no_cache(self, mock_get_ops, runner):
+        """Test --no-cache turns off reuse of identical runs' outputs."""
+        mock_ops = MagicMock()
+        mock_get_ops.return_value = mock_ops
+        mock_ops.quick_inference.return_value = {"run_id": "rs_auto123", "status": "completed"}
+
+        result = runner.invoke(cli, ["inference", "ps_test", "--no-cache"])
+
+        assert result.exit_code == 0
+        assert mock_ops.quick_inference.call_args[1]["use_cache"] is False
+
+        runner.invoke(cli, ["inference", "ps_test"])
+        assert mock_ops.quick_inference.call_args[1]["use_cache"] is True
+
     @patch("cosmos_workflow.cli.base.CLIContext.get_operations")
     def test_inference_dry_run(self, mock_get_ops, runner):
         """Test dry-run mode doesn't execute."""
@@ -60,7 +60,7 @@ class TestListCommands:
         assert "ps_001" in result.output
         assert "ps_002" in result.output
         # Model type no longer displayed for prompts
-        mock_operations.list_prompts.assert_called_once_with(limit=50)
+        mock_operations.list_prompts.assert_called_once_with(limit=50, after=None)
 
     # Model filter removed - prompts no longer have model_type
 
@@ -76,7 +76,7 @@ class TestListCommands:
 
         # Assert
         assert result.exit_code == 0
-        mock_operations.list_prompts.assert_called_once_with(limit=10)
+        mock_operations.list_prompts.assert_called_once_with(limit=10, after=None)
 
     @patch("cosmos_workflow.cli.base.CLIContext.get_operations")
     def test_list_prompts_empty_result(self, mock_get_operations, runner, mock_operations):
@@ -151,7 +151,9 @@ class TestListCommands:
         assert "rs_002" in result.output
         assert "completed" in result.output
         assert "running" in result.output
-        mock_operations.list_runs.assert_called_once_with(status=None, prompt_id=None, limit=50)
+        mock_operations.list_runs.assert_called_once_with(
+            status=None, prompt_id=None, limit=50, after=None
+        )
 
     @patch("cosmos_workflow.cli.base.CLIContext.get_operations")
     def test_list_runs_with_status_filter(self, mock_get_operations, runner, mock_operations):
@@ -178,7 +180,7 @@ class TestListCommands:
         assert "rs_001" in result.output
         assert "completed" in result.output
         mock_operations.list_runs.assert_called_once_with(
-            status="completed", prompt_id=None, limit=50
+            status="completed", prompt_id=None, limit=50, after=None
         )
 
     @patch("cosmos_workflow.cli.base.CLIContext.get_operations")
@@ -206,7 +208,7 @@ class TestListCommands:
         assert "rs_001" in result.output
         assert "ps_specific" in result.output
         mock_operations.list_runs.assert_called_once_with(
-            status=None, prompt_id="ps_specific", limit=50
+            status=None, prompt_id="ps_specific", limit=50, after=None
         )
 
     @patch("cosmos_workflow.cli.base.CLIContext.get_operations")
@@ -224,7 +226,7 @@ class TestListCommands:
         # Assert
         assert result.exit_code == 0
         mock_operations.list_runs.assert_called_once_with(
-            status="failed", prompt_id="ps_001", limit=50
+            status="failed", prompt_id="ps_001", limit=50, after=None
         )
 
     @patch("cosmos_workflow.cli.base.CLIContext.get_operations")
@@ -280,3 +282,47 @@ class TestListCommands:
         assert len(output_data) == 1
         assert output_data[0]["id"] == "rs_001"
         assert output_data[0]["status"] == "completed"
+
+    @patch("cosmos_workflow.cli.base.CLIContext.get_operations")
+    def test_list_runs_after_cursor(self, mock_get_operations, runner, mock_operations):
+        """Test --after fetches the next page and a full page prints the next cursor."""
+        mock_operations.list_runs.return_value = [
+            {
+                "id": f"rs_00{n}",
+                "model_type": "transfer",
+                "prompt_id": "ps_001",
+                "status": "completed",
+                "created_at": "2024-01-01T00:00:00",
+            }
+            for n in range(2)
+        ]
+        mock_get_operations.return_value = mock_operations
+
+        result = runner.invoke(
+            list_group, ["runs", "--after", "rs_999", "--limit", "2"], obj=CLIContext()
+        )
+
+        assert result.exit_code == 0
+        mock_operations.list_runs.assert_called_once_with(
+            status=None, prompt_id=None, limit=2, after="rs_999"
+        )
+        assert "--after rs_001" in result.output
+
+    @patch("cosmos_workflow.cli.base.CLIContext.get_operations")
+    def test_list_prompts_all_streams_json_lines(
+        self, mock_get_operations, runner, mock_operations
+    ):
+        """Test --all --json streams one JSON object per line."""
+        prompts = [
+            {"id": f"ps_00{n}", "prompt_text": "Test", "created_at": "2024-01-01T00:00:00"}
+            for n in range(3)
+        ]
+        mock_operations.iter_prompts.return_value = iter(prompts)
+        mock_get_operations.return_value = mock_operations
+
+        result = runner.invoke(list_group, ["prompts", "--all", "--json"], obj=CLIContext())
+
+        assert result.exit_code == 0
+        mock_operations.iter_prompts.assert_called_once_with(after=None)
+        mock_operations.list_prompts.assert_not_called()
+        assert [json.loads(line) for line in result.output.splitlines()] == prompts
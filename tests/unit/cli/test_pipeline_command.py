@@ -0,0 +1,66 @@
+"""Tests for the pipeline command."""
+
+from unittest.mock import MagicMock, patch
+
+from click.testing import CliRunner
+
+from cosmos_workflow.cli.pipeline import pipeline
+
+
+class TestPipelineCommand:
+    """Test the pipeline command queues job chains."""
+
+    def _invoke(self, args, chains):
+        mock_ctx = MagicMock()
+        mock_ops = MagicMock()
+        mock_ctx.get_operations.return_value = mock_ops
+        with patch(
+            "cosmos_workflow.services.simple_queue_service.SimplifiedQueueService"
+        ) as mock_service_cls:
+            mock_service_cls.return_value.add_pipeline.return_value = chains
+            mock_service_cls.return_value.worker_running.return_value = False
+            result = CliRunner().invoke(pipeline, args, obj=mock_ctx)
+        return result, mock_ops, mock_service_cls
+
+    def test_queues_full_pipeline(self):
+        """Test every step is queued through a submit-only queue service."""
+        result, mock_ops, mock_service_cls = self._invoke(
+            ["ps_1", "--steps", "20", "--upscale-weight", "0.7", "--priority", "80"],
+            [["job_a", "job_b", "job_c"]],
+        )
+
+        assert result.exit_code == 0, result.output
+        mock_service_cls.assert_called_once_with(
+            cosmos_api=mock_ops, db_connection=mock_ops.service.db, submit_only=True
+        )
+        args, kwargs = mock_service_cls.return_value.add_pipeline.call_args
+        assert args[0] == ["ps_1"]
+        assert args[1]["num_steps"] == 20
+        assert kwargs["enhancement_config"] == {"create_new": True, "model": "pixtral"}
+        assert kwargs["upscale_config"] == {"control_weight": 0.7}
+        assert kwargs["priority"] == 80
+        assert "enhance -> inference -> upscale" in result.output
+        assert "cosmos worker" in result.output
+
+    def test_steps_can_be_skipped(self):
+        """Test --no-enhance and --no-upscale leave out their jobs."""
+        result, _, mock_service_cls = self._invoke(
+            ["ps_1", "--no-enhance", "--no-upscale"], [["job_b"]]
+        )
+
+        assert result.exit_code == 0, result.output
+        kwargs = mock_service_cls.return_value.add_pipeline.call_args.kwargs
+        assert kwargs["enhancement_config"] is None
+        assert kwargs["upscale_config"] is None
+
+    def test_unknown_prompt_is_rejected(self):
+        """Test nothing is queued for a prompt that does not exist."""
+        mock_ctx = MagicMock()
+        mock_ctx.get_operations.return_value.get_prompt.return_value = None
+        with patch(
+            "cosmos_workflow.services.simple_queue_service.SimplifiedQueueService"
+        ) as mock_service_cls:
+            result = CliRunner().invoke(pipeline, ["ps_missing"], obj=mock_ctx)
+
+        assert result.exit_code != 0
+        mock_service_cls.assert_not_called()
@@ -190,3 +190,45 @@ class TestStatusCommand:
         assert (
             "cosmos_verylongidthatshouldbeshortened" in result.output or "cont_xyz" in result.output
         )
+
+    def test_status_shows_queue_estimate(self):
+        """Test status reports the queue backlog and its estimated drain time."""
+        mock_ctx = MagicMock()
+        mock_ops = MagicMock()
+        mock_ctx.get_operations.return_value = mock_ops
+        mock_ops.check_status.return_value = {
+            "ssh_status": "connected",
+            "docker_status": {"docker_running": True},
+        }
+        mock_ops.get_queue_summary.return_value = {
+            "queued": 3,
+            "running": 1,
+            "estimated_seconds": 540,
+        }
+
+        result = CliRunner().invoke(status, obj=mock_ctx)
+
+        assert result.exit_code == 0
+        assert "3 queued, 1 running" in result.output
+        assert "~9 min" in result.output
+
+    def test_status_shows_cache_hit_rate(self):
+        """Test status reports how many inference runs reused cached outputs."""
+        mock_ctx = MagicMock()
+        mock_ops = MagicMock()
+        mock_ctx.get_operations.return_value = mock_ops
+        mock_ops.check_status.return_value = {
+            "ssh_status": "connected",
+            "docker_status": {"docker_running": True},
+        }
+        mock_ops.get_cache_stats.return_value = {
+            "runs": 8,
+            "hits": 2,
+            "misses": 6,
+            "hit_rate": 0.25,
+        }
+
+        result = CliRunner().invoke(status, obj=mock_ctx)
+
+        assert result.exit_code == 0
+        assert "2 of 8 runs reused (25%)" in result.output
@@ -0,0 +1,111 @@
+"""Tests for the worker command."""
+
+from unittest.mock import MagicMock, patch
+
+from click.testing import CliRunner
+
+from cosmos_workflow.cli.worker import worker
+from cosmos_workflow.services.queue_signals import QueueSignals
+
+
+class TestWorkerCommand:
+    """Test the worker command wiring."""
+
+    def test_worker_runs_queue_service(self):
+        """Test the command builds a queue worker on the CLI's database and GPU pool."""
+        mock_ctx = MagicMock()
+        mock_ops = MagicMock()
+        mock_ctx.get_operations.return_value = mock_ops
+
+        with (
+            patch(
+                "cosmos_workflow.services.simple_queue_service.SimplifiedQueueService"
+            ) as mock_service_cls,
+            patch("cosmos_workflow.services.queue_worker.QueueWorker") as mock_worker_cls,
+            patch("cosmos_workflow.services.gpu_pool.GPUPool.from_config") as mock_from_config,
+        ):
+            mock_pool = mock_from_config.return_value
+            mock_pool.hosts = []
+            mock_worker_cls.return_value.run.return_value = 3
+            result = CliRunner().invoke(worker, ["--batch-size", "8", "--drain"], obj=mock_ctx)
+
+        assert result.exit_code == 0, result.output
+        mock_from_config.assert_called_once_with(
+            mock_ops.config, mock_ops.service.db, primary_api=mock_ops
+        )
+        mock_service_cls.assert_called_once_with(
+            cosmos_api=mock_ops,
+            db_connection=mock_ops.service.db,
+            gpu_pool=mock_pool,
+            as_worker=True,
+        )
+        mock_service_cls.return_value.set_batch_size.assert_called_once_with(8)
+        mock_worker_cls.return_value.install_signal_handlers.assert_called_once()
+        mock_worker_cls.return_value.run.assert_called_once_with(max_jobs=None, drain=True)
+        mock_pool.start_monitors.assert_called_once()
+        mock_pool.stop_monitors.assert_called_once()
+        assert "after 3 job(s)" in result.output
+
+    def test_online_batching_flags_override_config(self):
+        """Test --online-batching and --batch-linger take precedence over [queue]."""
+        mock_ctx = MagicMock()
+        mock_ops = MagicMock()
+        mock_ops.config.get_queue_config.return_value = {
+            "online_batching": False,
+            "batch_linger": 0.0,
+            "mix_controls": True,
+            "gpu_memory_gb": 40.0,
+            "lease_seconds": 60.0,
+        }
+        mock_ctx.get_operations.return_value = mock_ops
+
+        with (
+            patch(
+                "cosmos_workflow.services.simple_queue_service.SimplifiedQueueService"
+            ) as mock_service_cls,
+            patch("cosmos_workflow.services.queue_worker.QueueWorker") as mock_worker_cls,
+            patch("cosmos_workflow.services.gpu_pool.GPUPool.from_config") as mock_from_config,
+        ):
+            mock_from_config.return_value.hosts = []
+            mock_worker_cls.return_value.run.return_value = 0
+            result = CliRunner().invoke(
+                worker, ["--online-batching", "--batch-linger", "5", "--drain"], obj=mock_ctx
+            )
+
+        assert result.exit_code == 0, result.output
+        mock_service_cls.return_value.set_online_batching.assert_called_once_with(
+            True, linger=5.0, mix_controls=True
+        )
+        mock_service_cls.return_value.set_gpu_memory.assert_called_once_with(40.0)
+
+    def test_worker_registers_before_building_queue_service(self, tmp_path):
+        """Test the service is created after the worker registered, and unregistered after."""
+        mock_ctx = MagicMock()
+        mock_ops = MagicMock()
+        mock_ctx.get_operations.return_value = mock_ops
+        signals = QueueSignals(tmp_path / "cosmos.queue")
+        registered_at_init = []
+
+        def build_service(**kwargs):
+            registered_at_init.append(signals.worker_alive())
+            return MagicMock()
+
+        with (
+            patch(
+                "cosmos_workflow.services.queue_signals.QueueSignals.for_database",
+                return_value=signals,
+            ),
+            patch(
+                "cosmos_workflow.services.simple_queue_service.SimplifiedQueueService",
+                side_effect=build_service,
+            ),
+            patch("cosmos_workflow.services.queue_worker.QueueWorker") as mock_worker_cls,
+            patch("cosmos_workflow.services.gpu_pool.GPUPool.from_config") as mock_from_config,
+        ):
+            mock_from_config.return_value.hosts = []
+            mock_worker_cls.return_value.run.return_value = 0
+            result = CliRunner().invoke(worker, ["--drain"], obj=mock_ctx)
+
+        assert result.exit_code == 0, result.output
+        assert registered_at_init == [True]
+        assert signals.get_worker() is None
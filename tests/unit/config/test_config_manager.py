@@ -261,6 +261,100 @@ image = "nvcr.io/ubuntu/cosmos-transfer1:latest"
         assert self.config_manager.get_remote_config().host == "192.168.1.200"
         assert self.config_manager.get_remote_config().host != initial_host
 
+    def test_gpu_hosts_default_to_remote(self):
+        """Test a config without [[gpu_hosts]] has the [remote] host as its only GPU host."""
+        hosts = self.config_manager.get_gpu_hosts()
+
+        assert len(hosts) == 1
+        assert hosts[0].name == "192.168.1.100"
+        assert hosts[0].capacity == 1
+        assert hosts[0].remote == self.config_manager.get_remote_config()
+
+    def test_gpu_hosts_inherit_unset_fields(self):
+        """Test [[gpu_hosts]] entries fall back to [remote], [paths] and [docker]."""
+        self.config_path.write_text(
+            self.sample_config
+            + """
+[[gpu_hosts]]
+name = "h100-a"
+host = "10.0.0.11"
+capacity = 1
+
+[[gpu_hosts]]
+host = "10.0.0.12"
+user = "gpu"
+remote_dir = "/data/cosmos"
+"""
+        )
+        self.config_manager._load_config()
+
+        first, second = self.config_manager.get_gpu_hosts()
+
+        assert (first.name, first.capacity, first.remote.host) == ("h100-a", 1, "10.0.0.11")
+        assert first.remote.user == "ubuntu"
+        assert first.remote.remote_dir == "/home/ubuntu/cosmos-transfer1"
+        assert (second.name, second.capacity) == ("10.0.0.12", 1)
+        assert (second.remote.user, second.remote.remote_dir) == ("gpu", "/data/cosmos")
+
+        host_config = self.config_manager.for_host(second)
+        assert host_config.get_ssh_options()["hostname"] == "10.0.0.12"
+        assert host_config.get_remote_config().remote_dir == "/data/cosmos"
+        # The original configuration is untouched
+        assert self.config_manager.get_remote_config().host == "192.168.1.100"
+
+    def test_gpu_hosts_reject_duplicate_names(self):
+        """Test two hosts with the same name are a configuration error."""
+        self.config_path.write_text(
+            self.sample_config
+            + """
+[[gpu_hosts]]
+host = "10.0.0.11"
+
+[[gpu_hosts]]
+host = "10.0.0.11"
+"""
+        )
+
+        with pytest.raises(ValueError, match="Duplicate GPU host name"):
+            self.config_manager._load_config()
+
+    def test_gpu_host_capacity_above_one_is_rejected(self):
+        """Test a host cannot run several jobs on one executor and one set of GPUs."""
+        self.config_path.write_text(
+            self.sample_config
+            + """
+[[gpu_hosts]]
+host = "10.0.0.11"
+capacity = 2
+"""
+        )
+
+        with pytest.raises(ValueError, match="must have capacity 1"):
+            self.config_manager._load_config()
+
+    def test_queue_config_defaults_and_overrides(self):
+        """Test [queue] settings default to batching off and read overrides."""
+        assert self.config_manager.get_queue_config() == {
+            "online_batching": False,
+            "batch_linger": 0.0,
+            "mix_controls": False,
+            "gpu_memory_gb": 80.0,
+            "download_attempts": 3,
+            "download_backoff": 5.0,
+            "lease_seconds": 60.0,
+        }
+
+        self.config_path.write_text(
+            self.sample_config
+            + "\n[queue]\nonline_batching = true\nbatch_linger = 5\ngpu_memory_gb = 48\n"
+        )
+        self.config_manager._load_config()
+
+        queue_config = self.config_manager.get_queue_config()
+        assert queue_config["online_batching"] is True
+        assert queue_config["batch_linger"] == 5.0
+        assert queue_config["gpu_memory_gb"] == 48.0
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
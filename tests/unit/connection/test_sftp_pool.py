@@ -0,0 +1,129 @@
+"""Tests for the bounded SFTP channel pool."""
+
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from cosmos_workflow.connection.sftp_pool import SFTPPool
+
+
+def _channel(alive: bool = True) -> Mock:
+    sftp = Mock()
+    sftp.get_channel.return_value.closed = not alive
+    sftp.get_channel.return_value.get_transport.return_value.is_active.return_value = alive
+    return sftp
+
+
+class TestSFTPPool:
+    """Test channels are bounded, reused and replaced when broken."""
+
+    def test_reuses_returned_channel(self):
+        """Test a returned channel serves the next borrower."""
+        opener = Mock(side_effect=lambda: _channel())
+        pool = SFTPPool(opener, size=2)
+
+        with pool.acquire() as first:
+            pass
+        with pool.acquire() as second:
+            assert second is first
+
+        assert opener.call_count == 1
+        assert pool.stats() == {"open": 1, "idle": 1, "size": 2, "waits": 0}
+
+    def test_nested_acquire_reuses_held_channel(self):
+        """Test a thread borrowing again gets its own channel instead of deadlocking."""
+        pool = SFTPPool(Mock(side_effect=lambda: _channel()), size=1)
+
+        with pool.acquire(timeout=1) as outer:
+            with pool.acquire(timeout=1) as inner:
+                assert inner is outer
+            with pool.acquire(timeout=1) as again:
+                assert again is outer
+
+        assert pool.stats()["idle"] == 1
+
+    def test_bound_makes_borrowers_wait(self):
+        """Test concurrent borrowers never hold more channels than the bound."""
+        pool = SFTPPool(Mock(side_effect=lambda: _channel()), size=2)
+        in_use, peak = [], []
+        lock = threading.Lock()
+
+        def transfer():
+            with pool.acquire(timeout=5) as sftp:
+                with lock:
+                    in_use.append(sftp)
+                    peak.append(len(in_use))
+                time.sleep(0.02)
+                with lock:
+                    in_use.remove(sftp)
+
+        threads = [threading.Thread(target=transfer) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert max(peak) == 2
+        stats = pool.stats()
+        assert stats["open"] == 2
+        assert stats["waits"] > 0
+
+    def test_times_out_when_exhausted(self):
+        """Test a borrower gives up once no channel frees within the timeout."""
+        pool = SFTPPool(Mock(side_effect=lambda: _channel()), size=1, name="gpu-1")
+        held = threading.Event()
+        release = threading.Event()
+
+        def hold():
+            with pool.acquire():
+                held.set()
+                release.wait(5)
+
+        thread = threading.Thread(target=hold)
+        thread.start()
+        held.wait(5)
+        try:
+            with pytest.raises(ConnectionError, match="gpu-1"):
+                with pool.acquire(timeout=0.05):
+                    pass
+        finally:
+            release.set()
+            thread.join()
+
+    def test_dead_channel_is_replaced(self):
+        """Test an idle channel whose transport died is closed and replaced."""
+        dead, fresh = _channel(alive=False), _channel()
+        pool = SFTPPool(Mock(side_effect=[dead, fresh]), size=1)
+
+        with pool.acquire():
+            pass
+        with pool.acquire() as sftp:
+            assert sftp is fresh
+
+        dead.close.assert_called_once()
+
+    def test_missing_file_keeps_channel(self):
+        """Test ordinary SFTP errors do not cost the channel."""
+        sftp = _channel()
+        pool = SFTPPool(Mock(return_value=sftp), size=1)
+
+        with pytest.raises(FileNotFoundError):
+            with pool.acquire():
+                raise FileNotFoundError("missing.mp4")
+
+        sftp.close.assert_not_called()
+        assert pool.stats()["idle"] == 1
+
+    def test_failed_open_frees_slot(self):
+        """Test a channel that fails to open does not count against the bound."""
+        pool = SFTPPool(Mock(side_effect=[OSError("refused"), _channel()]), size=1)
+
+        with pytest.raises(OSError):
+            with pool.acquire(timeout=0.05):
+                pass
+        with pool.acquire(timeout=0.05):
+            pass
+
+        assert pool.stats()["open"] == 1
@@ -7,10 +7,13 @@ that handles connections to remote instances using paramiko.
 
 from unittest.mock import Mock, patch
 
-import paramiko
 import pytest
 
-from cosmos_workflow.connection.ssh_manager import SSHManager
+from cosmos_workflow.connection.ssh_manager import (
+    SSHManager,
+    close_all_connections,
+    connection_stats,
+)
 
 
 class TestSSHManager:
@@ -29,11 +32,14 @@ class TestSSHManager:
         # Initialize SSHManager with mock options
         self.ssh_manager = SSHManager(self.ssh_options)
 
+    def teardown_method(self):
+        """Drop the shared connections created by a test."""
+        close_all_connections()
+
     def test_init_with_valid_options(self):
         """Test SSHManager initialization with valid connection options."""
         assert self.ssh_manager.ssh_options == self.ssh_options
         assert self.ssh_manager.ssh_client is None
-        assert self.ssh_manager.sftp_client is None
 
     def test_connect_establishes_ssh_connection(self):
         """Test that connect method establishes SSH connection successfully."""
@@ -58,22 +64,17 @@ class TestSSHManager:
             with pytest.raises(ConnectionError, match="SSH connection failed: Connection failed"):
                 self.ssh_manager.connect()
 
-    def test_disconnect_closes_connections(self):
-        """Test that disconnect method properly closes SSH and SFTP connections."""
-        # Mock existing connections
+    def test_disconnect_detaches_from_shared_connection(self):
+        """Test that disconnect leaves the shared SSH connection open."""
         mock_client = Mock()
-        mock_sftp = Mock()
         self.ssh_manager.ssh_client = mock_client
-        self.ssh_manager.sftp_client = mock_sftp
 
         # Disconnect
         self.ssh_manager.disconnect()
 
-        # Check that connections were closed
-        mock_sftp.close.assert_called_once()
-        mock_client.close.assert_called_once()
+        # The SSH client is only released
+        mock_client.close.assert_not_called()
         assert self.ssh_manager.ssh_client is None
-        assert self.ssh_manager.sftp_client is None
 
     def test_disconnect_handles_none_connections(self):
         """Test that disconnect method handles None connections gracefully."""
@@ -82,82 +83,85 @@ class TestSSHManager:
 
         # Connections should remain None
         assert self.ssh_manager.ssh_client is None
-        assert self.ssh_manager.sftp_client is None
 
     def test_is_connected_with_active_connection(self):
-        """Test is_connected returns True with active connection."""
-        # Mock SSH client with successful exec_command
+        """Test is_connected checks the transport without running a command."""
         mock_client = Mock()
-        mock_client.exec_command.return_value = (Mock(), Mock(), Mock())
+        mock_client.get_transport.return_value.is_active.return_value = True
         self.ssh_manager.ssh_client = mock_client
 
         assert self.ssh_manager.is_connected() is True
-        mock_client.exec_command.assert_called_once_with("echo 'test'", timeout=5)
+        mock_client.exec_command.assert_not_called()
 
     def test_is_connected_with_no_client(self):
         """Test is_connected returns False with no client."""
         assert self.ssh_manager.is_connected() is False
 
-    def test_is_connected_with_failed_command(self):
-        """Test is_connected returns False when command execution fails."""
-        # Mock SSH client with failed exec_command
+    def test_is_connected_with_dead_transport(self):
+        """Test is_connected returns False when the transport is no longer active."""
         mock_client = Mock()
-        mock_client.exec_command.side_effect = paramiko.SSHException("Connection lost")
+        mock_client.get_transport.return_value.is_active.return_value = False
         self.ssh_manager.ssh_client = mock_client
 
         assert self.ssh_manager.is_connected() is False
 
     def test_ensure_connected_reconnects_when_needed(self):
         """Test that ensure_connected reconnects when connection is lost."""
-        # Mock is_connected to return False, then True after connect
-        with patch.object(self.ssh_manager, "is_connected", side_effect=[False, True]):
-            with patch.object(self.ssh_manager, "connect") as mock_connect:
+        with patch.object(self.ssh_manager, "is_connected", return_value=False):
+            with patch.object(self.ssh_manager, "_attach") as mock_attach:
                 self.ssh_manager.ensure_connected()
-                mock_connect.assert_called_once()
+                mock_attach.assert_called_once()
 
     def test_ensure_connected_does_nothing_when_connected(self):
         """Test that ensure_connected does nothing when already connected."""
         with patch.object(self.ssh_manager, "is_connected", return_value=True):
-            with patch.object(self.ssh_manager, "connect") as mock_connect:
+            with patch.object(self.ssh_manager, "_attach") as mock_attach:
                 self.ssh_manager.ensure_connected()
-                mock_connect.assert_not_called()
+                mock_attach.assert_not_called()
 
-    def test_get_sftp_creates_sftp_session(self):
-        """Test that get_sftp creates SFTP session when connected."""
-        # Mock SSH client
+    def test_get_sftp_borrows_pooled_session(self):
+        """Test that get_sftp opens an SFTP session once and reuses it."""
         mock_client = Mock()
         mock_sftp = Mock()
+        mock_sftp.get_channel.return_value.closed = False
         mock_client.open_sftp.return_value = mock_sftp
 
-        self.ssh_manager.ssh_client = mock_client
+        with patch("paramiko.SSHClient", return_value=mock_client):
+            with self.ssh_manager.get_sftp() as sftp:
+                assert sftp == mock_sftp
+            with self.ssh_manager.get_sftp() as sftp:
+                assert sftp == mock_sftp
 
-        # Get SFTP
-        with self.ssh_manager.get_sftp() as sftp:
-            assert sftp == mock_sftp
-            mock_client.open_sftp.assert_called_once()
+        mock_client.open_sftp.assert_called_once()
+        mock_sftp.close.assert_not_called()
+        assert self.ssh_manager.connection_stats()["sftp_pool"]["idle"] == 1
 
     def test_get_sftp_without_connection(self):
-        """Test that get_sftp raises error when not connected."""
-        with pytest.raises(ConnectionError, match="SSH connection not established"):
-            with self.ssh_manager.get_sftp():
-                pass
+        """Test that get_sftp raises the connection error when the host is unreachable."""
+        mock_client = Mock()
+        mock_client.connect.side_effect = OSError("unreachable")
+
+        with patch("paramiko.SSHClient", return_value=mock_client):
+            with pytest.raises(OSError, match="unreachable"):
+                with self.ssh_manager.get_sftp():
+                    pass
+
+        assert self.ssh_manager.connection_stats()["sftp_pool"]["open"] == 0
 
-    def test_get_sftp_cleanup_on_exit(self):
-        """Test that get_sftp properly cleans up SFTP session."""
-        # Mock SSH client
+    def test_get_sftp_drops_broken_session(self):
+        """Test that a session failing with a channel error is closed, not reused."""
         mock_client = Mock()
         mock_sftp = Mock()
+        mock_sftp.get_channel.return_value.closed = False
         mock_client.open_sftp.return_value = mock_sftp
 
-        self.ssh_manager.ssh_client = mock_client
-
-        # Use get_sftp context manager
-        with self.ssh_manager.get_sftp() as sftp:
-            assert sftp == mock_sftp
+        with patch("paramiko.SSHClient", return_value=mock_client):
+            with pytest.raises(EOFError):
+                with self.ssh_manager.get_sftp():
+                    raise EOFError
 
-        # Check that SFTP was closed
         mock_sftp.close.assert_called_once()
-        assert self.ssh_manager.sftp_client is None
+        assert self.ssh_manager.connection_stats()["sftp_pool"]["open"] == 0
 
     def test_execute_command_ensures_connection(self):
         """Test that execute_command ensures connection before execution."""
@@ -258,5 +262,69 @@ class TestSSHManager:
                 mock_disconnect.assert_called_once()
 
 
+class TestSharedConnections:
+    """Test SSH connections are shared, kept alive and re-established."""
+
+    def setup_method(self):
+        """Set up connection options for a host."""
+        self.ssh_options = {"hostname": "192.168.1.100", "username": "ubuntu", "port": 22}
+
+    def teardown_method(self):
+        """Drop the shared connections created by a test."""
+        close_all_connections()
+
+    def test_managers_share_one_handshake(self):
+        """Test repeated and concurrent use of one host costs a single handshake."""
+        first = SSHManager(self.ssh_options)
+        second = SSHManager(self.ssh_options)
+
+        with patch("paramiko.SSHClient") as mock_client_cls:
+            with first:
+                with second:
+                    assert second.ssh_client is first.ssh_client
+            with first:
+                pass
+
+        mock_client_cls.return_value.connect.assert_called_once_with(**self.ssh_options)
+        mock_client_cls.return_value.close.assert_not_called()
+        transport = mock_client_cls.return_value.get_transport.return_value
+        transport.set_keepalive.assert_called_once()
+        assert connection_stats()[0]["handshakes"] == 1
+
+    def test_nested_with_keeps_client(self):
+        """Test leaving an inner with block does not detach an outer one."""
+        with patch("paramiko.SSHClient"):
+            with SSHManager(self.ssh_options) as manager:
+                with manager:
+                    pass
+                assert manager.ssh_client is not None
+            assert manager.ssh_client is None
+
+    def test_dead_transport_reconnects(self):
+        """Test a manager transparently reconnects once the transport dies."""
+        dead, alive = Mock(), Mock()
+        dead.get_transport.return_value.is_active.return_value = False
+        manager = SSHManager(self.ssh_options)
+
+        with patch("paramiko.SSHClient", side_effect=[dead, alive]):
+            manager.connect()
+            stdout = Mock()
+            stdout.read.return_value = b"ok"
+            stdout.channel.recv_exit_status.return_value = 0
+            stderr = Mock()
+            stderr.read.return_value = b""
+            alive.exec_command.return_value = (Mock(), stdout, stderr)
+
+            result = manager.execute_command("true", stream_output=False)
+
+        assert result == (0, "ok", "")
+        dead.close.assert_called_once()
+        stats = manager.connection_stats()
+        assert stats["handshakes"] == 2
+        assert stats["reconnects"] == 1
+        assert stats["exec_channels"] == 1
+        assert stats["exec_open_ms"] is not None
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -14,7 +14,9 @@ from sqlalchemy import text
 from sqlalchemy.orm import Session
 
 from cosmos_workflow.database.connection import (
+    SQLITE_PROFILES,
     DatabaseConnection,
+    SQLiteProfile,
     get_database_url,
     init_database,
 )
@@ -60,8 +62,11 @@ class TestDatabaseConnection:
             assert "prompts" in table_names
             assert "runs" in table_names
             assert "job_queue" in table_names
-            # Three tables should exist
-            assert len(table_names) == 3
+            assert "job_history" in table_names
+            assert "batch_executions" in table_names
+            # Five ORM tables plus the prompt search index and its shadow tables
+            assert "prompts_fts" in table_names
+            assert len({n for n in table_names if not n.startswith("prompts_fts")}) == 5
 
     def test_get_session_context_manager(self):
         """Test that get_session returns a working context manager."""
@@ -273,8 +278,11 @@ class TestDatabaseHelpers:
                 assert "prompts" in table_names
                 assert "runs" in table_names
                 assert "job_queue" in table_names
-                # Three tables should exist
-                assert len(table_names) == 3
+                assert "job_history" in table_names
+                assert "batch_executions" in table_names
+                # Five ORM tables plus the prompt search index and its shadow tables
+                assert "prompts_fts" in table_names
+                assert len({n for n in table_names if not n.startswith("prompts_fts")}) == 5
 
             # Clean up
             conn.close()
@@ -496,3 +504,72 @@ class TestDatabaseConcurrency:
         # Cleanup
         write_session.rollback()
         write_session.close()
+
+
+class TestSQLiteProfile:
+    """Test SQLite tuning profiles applied to file databases."""
+
+    def test_performance_profile_applies_pragmas(self):
+        """Test the default profile enables WAL and the tuned pragmas on connect."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            conn = DatabaseConnection(str(Path(tmpdir) / "test.db"))
+
+            with conn.engine.connect() as connection:
+
+                def pragma(name):
+                    return connection.execute(text(f"PRAGMA {name}")).scalar()
+
+                assert pragma("journal_mode") == "wal"
+                assert pragma("synchronous") == 1  # NORMAL
+                assert pragma("busy_timeout") == 5000
+                assert pragma("temp_store") == 2  # MEMORY
+                assert pragma("cache_size") == -64 * 1024
+
+            conn.close()
+
+    def test_safe_profile_by_name(self):
+        """Test selecting the safe profile keeps the rollback journal."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            conn = DatabaseConnection(str(Path(tmpdir) / "test.db"), profile="safe")
+
+            with conn.engine.connect() as connection:
+                assert connection.execute(text("PRAGMA journal_mode")).scalar() == "delete"
+                assert connection.execute(text("PRAGMA synchronous")).scalar() == 2  # FULL
+
+            assert conn.checkpoint() is None
+            conn.close()
+
+    def test_from_config_overrides(self):
+        """Test config sections pick a base profile and override settings."""
+        profile = SQLiteProfile.from_config({"profile": "safe", "busy_timeout_ms": 100})
+
+        assert profile.journal_mode == "DELETE"
+        assert profile.busy_timeout_ms == 100
+        assert SQLiteProfile.from_config(None) == SQLITE_PROFILES["performance"]
+
+    def test_from_config_rejects_unknown_values(self):
+        """Test unknown profiles, settings and pragma values are rejected."""
+        with pytest.raises(ValueError, match="Unknown database profile"):
+            SQLiteProfile.from_config({"profile": "turbo"})
+        with pytest.raises(ValueError, match="Unknown database settings"):
+            SQLiteProfile.from_config({"page_size": 4096})
+        with pytest.raises(ValueError, match="Invalid journal_mode"):
+            SQLiteProfile(journal_mode="WAL; DROP TABLE runs")
+
+    def test_checkpoint_and_close_truncate_wal(self):
+        """Test explicit checkpoints and the TRUNCATE checkpoint on close."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "test.db"
+            conn = DatabaseConnection(str(db_path))
+            conn.create_tables()
+            with conn.get_session() as session:
+                session.add(Prompt(id="ps_wal", prompt_text="wal", inputs={}, parameters={}))
+                session.commit()
+
+            result = conn.checkpoint("PASSIVE")
+            assert result["busy"] == 0
+            assert result["log_frames"] >= result["checkpointed_frames"]
+
+            conn.close()
+            wal_path = Path(f"{db_path}-wal")
+            assert not wal_path.exists() or wal_path.stat().st_size == 0
@@ -0,0 +1,204 @@
+"""Tests for versioned schema migrations."""
+
+import tempfile
+from pathlib import Path
+
+from sqlalchemy import inspect, text
+
+from cosmos_workflow.database.connection import DatabaseConnection
+from cosmos_workflow.database.migrations import (
+    LATEST_VERSION,
+    get_schema_version,
+    run_migrations,
+)
+from cosmos_workflow.database.models import Base
+
+EXPECTED_INDEXES = {
+    "prompts": {"ix_prompts_created_at", "ix_prompts_enhanced_created_at"},
+    "runs": {
+        "ix_runs_created_at",
+        "ix_runs_status_created_at",
+        "ix_runs_prompt_id_created_at",
+        "ix_runs_model_type_status",
+        "ix_runs_source_run_id",
+        "ix_runs_enhanced_prompt_id",
+        "ix_runs_original_prompt_id",
+        "ix_runs_batch_id",
+        "ix_runs_fingerprint_status",
+    },
+    "job_queue": {"ix_job_queue_status_priority_created_at"},
+    "job_history": {"ix_job_history_job_type_completed_at"},
+    "batch_executions": {"ix_batch_executions_completed_at"},
+}
+
+PROMOTED_COLUMNS = {
+    "prompts": ["enhanced"],
+    "runs": [
+        "source_run_id",
+        "enhanced_prompt_id",
+        "original_prompt_id",
+        "batch_id",
+        "fingerprint",
+        "cached_from",
+    ],
+    "job_queue": ["host", "lease_owner", "lease_expires_at", "attempts", "depends_on"],
+}
+
+
+def _index_names(engine, table_name):
+    return {index["name"] for index in inspect(engine).get_indexes(table_name)}
+
+
+SEARCH_TRIGGERS = [
+    "prompts_fts_after_insert",
+    "prompts_fts_after_delete",
+    "prompts_fts_after_update",
+]
+
+
+def _make_legacy_database(conn: DatabaseConnection) -> None:
+    """Create tables the way pre-migration versions did (no indexes, version 0)."""
+    Base.metadata.create_all(conn.engine)
+    with conn.engine.begin() as connection:
+        for trigger in SEARCH_TRIGGERS:
+            connection.execute(text(f"DROP TRIGGER IF EXISTS {trigger}"))
+        connection.execute(text("DROP TABLE IF EXISTS prompts_fts"))
+        connection.execute(text("DROP TABLE IF EXISTS job_history"))
+        connection.execute(text("DROP TABLE IF EXISTS batch_executions"))
+        for names in EXPECTED_INDEXES.values():
+            for name in names:
+                connection.execute(text(f"DROP INDEX IF EXISTS {name}"))
+        for table_name, columns in PROMOTED_COLUMNS.items():
+            for column in columns:
+                connection.execute(text(f"ALTER TABLE {table_name} DROP COLUMN {column}"))
+        connection.execute(text("PRAGMA user_version = 0"))
+
+
+class TestMigrations:
+    """Test migration application and versioning."""
+
+    def test_fresh_database_is_at_latest_version(self):
+        """Test create_tables leaves a new database fully migrated."""
+        conn = DatabaseConnection(":memory:")
+        conn.create_tables()
+
+        assert get_schema_version(conn.engine) == LATEST_VERSION
+        for table_name, names in EXPECTED_INDEXES.items():
+            assert names <= _index_names(conn.engine, table_name)
+
+    def test_upgrades_legacy_database_in_place(self):
+        """Test an existing database without indexes gains them on init."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = str(Path(tmpdir) / "legacy.db")
+            legacy = DatabaseConnection(db_path)
+            _make_legacy_database(legacy)
+            with legacy.engine.begin() as connection:
+                connection.execute(
+                    text(
+                        "INSERT INTO prompts (id, prompt_text, inputs, parameters, created_at) "
+                        "VALUES ('ps_keep', 'kept', '{}', '{}', '2025-01-01 00:00:00')"
+                    )
+                )
+            assert not _index_names(legacy.engine, "runs")
+            legacy.close()
+
+            upgraded = DatabaseConnection(db_path)
+            upgraded.create_tables()
+
+            assert get_schema_version(upgraded.engine) == LATEST_VERSION
+            for table_name, names in EXPECTED_INDEXES.items():
+                assert names <= _index_names(upgraded.engine, table_name)
+            with upgraded.engine.connect() as connection:
+                count = connection.execute(text("SELECT COUNT(*) FROM prompts")).scalar()
+            assert count == 1
+            job_columns = {
+                column["name"] for column in inspect(upgraded.engine).get_columns("job_queue")
+            }
+            assert {"host", "lease_owner", "lease_expires_at", "attempts", "depends_on"} <= job_columns
+            upgraded.close()
+
+    def test_backfills_promoted_json_keys(self):
+        """Test legacy rows get promoted columns populated from their JSON."""
+        conn = DatabaseConnection(":memory:")
+        _make_legacy_database(conn)
+        with conn.engine.begin() as connection:
+            connection.execute(
+                text(
+                    "INSERT INTO prompts (id, prompt_text, inputs, parameters, created_at) VALUES "
+                    "('ps_a', 'a', '{}', '{\"enhanced\": true}', '2025-01-01 00:00:00'), "
+                    "('ps_b', 'b', '{}', '{}', '2025-01-01 00:00:00')"
+                )
+            )
+            connection.execute(
+                text(
+                    "INSERT INTO runs (id, prompt_id, model_type, status, execution_config, "
+                    "outputs, metadata) VALUES ('rs_up', 'ps_a', 'upscale', 'completed', "
+                    '\'{"source_run_id": "rs_src"}\', '
+                    '\'{"enhanced_prompt_id": "ps_a", "original_prompt_id": "ps_b"}\', '
+                    '\'{"batch_id": "batch_1", "fingerprint": "fp_1", "cached_from": "rs_0"}\')'
+                )
+            )
+
+        conn.create_tables()
+
+        with conn.engine.connect() as connection:
+            enhanced = dict(connection.execute(text("SELECT id, enhanced FROM prompts")).all())
+            run = connection.execute(
+                text(
+                    "SELECT source_run_id, enhanced_prompt_id, original_prompt_id, batch_id, "
+                    "fingerprint, cached_from FROM runs"
+                )
+            ).one()
+        assert enhanced == {"ps_a": 1, "ps_b": 0}
+        assert tuple(run) == ("rs_src", "ps_a", "ps_b", "batch_1", "fp_1", "rs_0")
+
+    def test_backfills_job_priority(self):
+        """Test legacy jobs without a priority get the default."""
+        conn = DatabaseConnection(":memory:")
+        _make_legacy_database(conn)
+        with conn.engine.begin() as connection:
+            connection.execute(
+                text(
+                    "INSERT INTO job_queue (id, prompt_ids, job_type, status, config, priority) "
+                    "VALUES ('job_old', '[]', 'inference', 'queued', '{}', NULL)"
+                )
+            )
+
+        conn.create_tables()
+
+        with conn.engine.connect() as connection:
+            priority = connection.execute(text("SELECT priority FROM job_queue")).scalar()
+        assert priority == 50
+
+    def test_backfills_prompt_search_index(self):
+        """Test legacy prompts become searchable and new writes stay in sync."""
+        conn = DatabaseConnection(":memory:")
+        _make_legacy_database(conn)
+        with conn.engine.begin() as connection:
+            connection.execute(
+                text(
+                    "INSERT INTO prompts (id, prompt_text, inputs, parameters, created_at) VALUES "
+                    "('ps_a', 'neon city', '{\"video\": \"/in/rainy/color.mp4\"}', "
+                    "'{\"name\": \"cyber\"}', '2025-01-01 00:00:00')"
+                )
+            )
+
+        conn.create_tables()
+
+        assert conn.prompt_search_enabled
+        with conn.engine.begin() as connection:
+            indexed = connection.execute(
+                text("SELECT prompt_id, name, video_path FROM prompts_fts")
+            ).one()
+            assert tuple(indexed) == ("ps_a", "cyber", "/in/rainy/color.mp4")
+            connection.execute(text("DELETE FROM prompts WHERE id = 'ps_a'"))
+            remaining = connection.execute(text("SELECT COUNT(*) FROM prompts_fts")).scalar()
+        assert remaining == 0
+
+    def test_migrations_are_idempotent(self):
+        """Test running migrations repeatedly is a no-op after the first run."""
+        conn = DatabaseConnection(":memory:")
+        conn.create_tables()
+
+        assert run_migrations(conn.engine) == LATEST_VERSION
+        assert conn.migrate() == LATEST_VERSION
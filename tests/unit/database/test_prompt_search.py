@@ -0,0 +1,41 @@
+"""Tests for the FTS5 prompt search index helpers."""
+
+import re
+
+import pytest
+
+from cosmos_workflow.database.search import build_match_query
+
+
+class TestBuildMatchQuery:
+    """Test translation of user search text into FTS5 MATCH expressions."""
+
+    @pytest.mark.parametrize(
+        ("query", "expected"),
+        [
+            ("city", '"city"*'),
+            ("  neon   city ", '"neon"* "city"*'),
+            ('"city at night"', '"city at night"'),
+            ('"neon city" rain', '"neon city" "rain"*'),
+            ("cyber_city", '"cyber city"*'),
+            ("ps_1a2b", '"ps 1a2b"*'),
+            ("100%", '"100"*'),
+        ],
+    )
+    def test_builds_prefix_and_phrase_terms(self, query, expected):
+        """Test bare words become prefix terms and quoted text a phrase."""
+        assert build_match_query(query) == expected
+
+    @pytest.mark.parametrize(
+        "query", ["city OR forest", "NOT city", "name:city", "city*", "(city)", 'a"b', "c^d"]
+    )
+    def test_operators_are_treated_as_words(self, query):
+        """Test FTS5 syntax in user input never reaches the MATCH expression raw."""
+        expression = build_match_query(query)
+
+        assert re.fullmatch(r'"[^\W_]+( [^\W_]+)*"\*?( "[^\W_]+( [^\W_]+)*"\*?)*', expression)
+
+    @pytest.mark.parametrize("query", ["", "   ", "%", '""', "_-_"])
+    def test_no_searchable_words(self, query):
+        """Test text without letters or digits yields no expression."""
+        assert build_match_query(query) is None
@@ -0,0 +1,94 @@
+"""Tests for resuming an interrupted batch from the outputs left on the GPU host."""
+
+from unittest.mock import MagicMock, Mock
+
+import pytest
+
+from cosmos_workflow.execution.gpu_executor import GPUExecutor
+
+
+@pytest.fixture
+def executor(tmp_path, monkeypatch):
+    """Create a GPUExecutor with a service and stand-in connections."""
+    monkeypatch.chdir(tmp_path)
+    config = MagicMock()
+    config.get_remote_config.return_value = Mock(remote_dir="/remote/cosmos")
+    executor = GPUExecutor(config_manager=config, service=Mock())
+    executor.ssh_manager = MagicMock()
+    executor.file_transfer = Mock()
+    executor.docker_executor = Mock()
+    executor._services_initialized = True
+    executor.execute_batch_runs = Mock(return_value={"status": "success", "batch_name": "next"})
+    return executor
+
+
+def _run(run_id, index, status="running", **metadata):
+    return (
+        {
+            "id": run_id,
+            "status": status,
+            "metadata": {"batch_id": "batch_x", "batch_index": index, **metadata},
+        },
+        {"id": f"ps_{run_id}"},
+    )
+
+
+def _remote_files(executor, *paths):
+    executor.ssh_manager.execute_command.return_value = (0, "\n".join(paths), "")
+
+
+class TestResumeBatchRuns:
+    """Test GPUExecutor.resume_batch_runs."""
+
+    def test_recovers_finished_videos_and_reruns_the_rest(self, executor):
+        """Test finished outputs are downloaded and only missing indices run again."""
+        _remote_files(
+            executor,
+            "/remote/cosmos/outputs/batch_x/video_0/output.mp4",
+            "/remote/cosmos/outputs/batch_x/video_0/edge_input_control_0.mp4",
+            "/remote/cosmos/outputs/batch_x/video_2/edge_input_control_0.mp4",
+        )
+        runs = [_run("rs_0", 0), _run("rs_1", 1, status="completed"), _run("rs_2", 2)]
+
+        result = executor.resume_batch_runs(runs, batch_name="batch_x", batch_size=4)
+
+        downloaded = [call.args[0] for call in executor.file_transfer.download_file.call_args_list]
+        assert "/remote/cosmos/outputs/batch_x/video_0/output.mp4" in downloaded
+        assert not any("video_2" in path for path in downloaded)
+
+        recovered, moved = (call.args[0] for call in executor.service.update_runs.call_args_list)
+        assert recovered["rs_0"]["status"] == "completed"
+        assert recovered["rs_0"]["outputs"]["batch_index"] == 0
+        attempt = moved["rs_2"]["metadata"]["batch_name"]
+        assert attempt.startswith("batch_x_r")
+        assert moved["rs_2"]["metadata"]["batch_index"] == 0
+
+        (rerun,) = executor.execute_batch_runs.call_args.args
+        assert [run["id"] for run, _ in rerun] == ["rs_2"]
+        assert executor.execute_batch_runs.call_args.kwargs["batch_name"] == attempt
+        assert result["resumed_runs"] == 1
+
+    def test_looks_for_outputs_where_a_run_last_ran(self, executor):
+        """Test a run moved to a resume batch is found in that batch's directory."""
+        _remote_files(executor, "/remote/cosmos/outputs/batch_x_r1/video_1/output.mp4")
+        runs = [_run("rs_5", 1, batch_name="batch_x_r1")]
+
+        result = executor.resume_batch_runs(runs, batch_name="batch_x")
+
+        command = executor.ssh_manager.execute_command.call_args.args[0]
+        assert "/remote/cosmos/outputs/batch_x_r1" in command
+        executor.execute_batch_runs.assert_not_called()
+        assert result == {
+            "status": "success",
+            "batch_name": "batch_x",
+            "run_count": 1,
+            "resumed_runs": 1,
+            "recovered_run_ids": ["rs_5"],
+        }
+
+    def test_finished_batch_is_a_no_op(self, executor):
+        """Test a batch whose runs all completed does not touch the GPU host."""
+        result = executor.resume_batch_runs([_run("rs_0", 0, status="completed")], "batch_x")
+
+        assert result["run_count"] == 0
+        executor.ssh_manager.execute_command.assert_not_called()
@@ -0,0 +1,174 @@
+"""Tests for the cached GPU/container state monitor."""
+
+import threading
+import time
+from unittest.mock import MagicMock, Mock
+
+import pytest
+
+from cosmos_workflow.connection.ssh_manager import SSHManager
+from cosmos_workflow.execution.container_monitor import ContainerMonitor
+from cosmos_workflow.execution.docker_executor import DockerExecutor
+
+CONTAINER = {
+    "id": "abc123def4567890",
+    "id_short": "abc123def456",
+    "name": "cosmos_transfer_rs_1234",
+    "status": "Up 2 minutes",
+    "image": "cosmos:latest",
+    "created": "2026-10-16",
+}
+
+
+@pytest.fixture
+def monitor():
+    """Create a monitor whose SSH and Docker helpers are mocks."""
+    config = Mock()
+    config.get_monitor_config.return_value = {"status_ttl": 10, "poll_interval": 10}
+    monitor = ContainerMonitor(config)
+
+    ssh_manager = Mock(spec=SSHManager)
+    ssh_manager.ssh_client = None
+
+    def connect():
+        ssh_manager.ssh_client = MagicMock()
+
+    def disconnect():
+        ssh_manager.ssh_client = None
+
+    ssh_manager.connect.side_effect = connect
+    ssh_manager.disconnect.side_effect = disconnect
+
+    docker_executor = Mock(spec=DockerExecutor)
+    docker_executor.get_gpu_info.return_value = {"name": "NVIDIA H100"}
+    docker_executor.get_docker_status.return_value = {
+        "docker_running": True,
+        "active_container": CONTAINER,
+    }
+
+    monitor.ssh_manager = ssh_manager
+    monitor.docker_executor = docker_executor
+    yield monitor
+    monitor.stop()
+
+
+class TestContainerMonitorCache:
+    """Test TTL caching of the remote state."""
+
+    def test_reads_within_ttl_share_one_refresh(self, monitor):
+        """Test repeated reads hit the remote host once while the snapshot is fresh."""
+        for _ in range(30):
+            assert monitor.get_container() == CONTAINER
+
+        assert monitor.refresh_count == 1
+        monitor.docker_executor.get_docker_status.assert_called_once()
+        monitor.ssh_manager.connect.assert_called_once()
+
+    def test_snapshot_shape_matches_remote_status(self, monitor):
+        """Test the snapshot carries the fields check_status reports."""
+        state = monitor.snapshot()
+
+        assert state["ssh_status"] == "connected"
+        assert state["docker_status"]["docker_running"] is True
+        assert state["gpu_info"] == {"name": "NVIDIA H100"}
+        assert state["container"] == CONTAINER
+        assert state["checked_at"] > 0
+
+    def test_stale_snapshot_is_refreshed(self, monitor):
+        """Test reads after the TTL query the host again over the same connection."""
+        monitor.ttl = 0.01
+        monitor.get_container()
+        time.sleep(0.02)
+        monitor.get_container()
+
+        assert monitor.refresh_count == 2
+        monitor.ssh_manager.connect.assert_called_once()
+
+    def test_max_age_zero_forces_refresh(self, monitor):
+        """Test callers can demand a fresh query."""
+        monitor.get_container()
+        monitor.get_container(max_age=0)
+
+        assert monitor.refresh_count == 2
+
+    def test_invalidate_forces_next_read_to_refresh(self, monitor):
+        """Test invalidate discards the cached state."""
+        assert monitor.get_container() == CONTAINER
+
+        monitor.docker_executor.get_docker_status.return_value = {
+            "docker_running": True,
+            "active_container": None,
+        }
+        assert monitor.get_container() == CONTAINER  # Still cached
+
+        monitor.invalidate()
+        assert monitor.get_container() is None
+        assert monitor.refresh_count == 2
+
+    def test_connection_error_reports_error_and_reconnects(self, monitor):
+        """Test an unreachable host yields no container and a reconnect next time."""
+        monitor.ssh_manager.connect.side_effect = ConnectionError("SSH connection failed")
+
+        state = monitor.snapshot()
+
+        assert state["ssh_status"] == "error"
+        assert "SSH connection failed" in state["error"]
+        assert state["container"] is None
+        monitor.ssh_manager.disconnect.assert_called()
+
+        monitor.snapshot(max_age=0)
+        assert monitor.ssh_manager.connect.call_count == 2
+
+    def test_concurrent_stale_reads_share_one_refresh(self, monitor):
+        """Test threads that find the cache stale wait for a single refresh."""
+
+        def slow_status():
+            time.sleep(0.05)
+            return {"docker_running": True, "active_container": CONTAINER}
+
+        monitor.docker_executor.get_docker_status.side_effect = slow_status
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(monitor.get_container()))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == [CONTAINER] * 8
+        assert monitor.refresh_count == 1
+
+
+class TestContainerMonitorPoller:
+    """Test the background poller."""
+
+    def test_poller_keeps_snapshot_fresh(self, monitor):
+        """Test the poller refreshes on its own and stop closes the connection."""
+        monitor.poll_interval = 0.01
+        monitor.start()
+        assert monitor.running
+
+        deadline = time.monotonic() + 2
+        while monitor.refresh_count < 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert monitor.refresh_count >= 3
+
+        monitor.stop()
+        assert not monitor.running
+        assert monitor.ssh_manager.ssh_client is None
+        # Every poll reused the connection opened by the first one
+        monitor.ssh_manager.connect.assert_called_once()
+
+    def test_reads_do_not_refresh_while_poller_is_current(self, monitor):
+        """Test readers are served from the poller's snapshot."""
+        monitor.start()
+        deadline = time.monotonic() + 2
+        while monitor.refresh_count < 1 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        for _ in range(50):
+            monitor.get_container()
+
+        assert monitor.refresh_count == 1
@@ -0,0 +1,144 @@
+"""Tests for pipelined job stages in GPUExecutor."""
+
+from contextlib import contextmanager
+from unittest.mock import MagicMock, Mock
+
+import pytest
+
+from cosmos_workflow.execution.gpu_executor import GPUExecutor
+from cosmos_workflow.execution.job_stages import JobStages, current_stages, track_stages
+
+
+@pytest.fixture
+def executor(tmp_path, monkeypatch):
+    """Create a GPUExecutor with stand-in connections, working in a temp directory."""
+    monkeypatch.chdir(tmp_path)
+    config = MagicMock()
+    config.get_remote_config.return_value = Mock(remote_dir="/remote/cosmos")
+    executor = GPUExecutor(config_manager=config)
+    executor.ssh_manager = MagicMock()
+    executor.ssh_manager.execute_command.return_value = (0, "", "")
+    executor.file_transfer = Mock()
+    executor.remote_executor = Mock()
+    executor.docker_executor = Mock()
+    executor._services_initialized = True
+
+    # Separate connections (prefetch, pipelined downloads) use their own stand-in
+    executor.separate_transfer = Mock()
+
+    @contextmanager
+    def separate_transfer():
+        yield executor.separate_transfer
+
+    executor._separate_transfer = separate_transfer
+    return executor
+
+
+class TestJobStages:
+    """Test stage timing and hooks."""
+
+    def test_hooks_fire_once_and_stages_add_up(self):
+        """Test GPU hooks fire once each and repeated stages accumulate."""
+        events = []
+        stages = JobStages(
+            on_gpu_start=lambda: events.append("start"), on_gpu_done=lambda: events.append("done")
+        )
+
+        with stages.stage("upload"):
+            pass
+        with stages.stage("upload"):
+            pass
+        stages.gpu_started()
+        stages.gpu_started()
+        stages.gpu_done()
+        stages.gpu_done()
+
+        assert events == ["start", "done"]
+        assert stages.summary()["upload_seconds"] >= 0
+        assert stages.summary()["gpu_idle_seconds"] is None
+
+    def test_failing_hook_does_not_raise(self):
+        """Test a broken hook never fails the job."""
+        stages = JobStages(on_gpu_done=Mock(side_effect=RuntimeError("boom")))
+
+        stages.gpu_done()
+
+    def test_current_stages_is_inactive_outside_a_pipeline(self):
+        """Test only jobs under track_stages see an active tracker."""
+        stages = JobStages()
+
+        assert not current_stages().active
+        with track_stages(stages):
+            assert current_stages() is stages
+        assert not current_stages().active
+
+
+class TestPipelinedExecution:
+    """Test GPUExecutor stage boundaries and separate transfers."""
+
+    def test_prefetched_input_is_moved_into_place(self, executor, tmp_path):
+        """Test a staged input is moved on the host instead of uploaded again."""
+        video = tmp_path / "color.mp4"
+        video.write_bytes(b"frames")
+
+        assert executor.prefetch_inputs([str(video), str(tmp_path / "missing.mp4")]) == 1
+        assert executor.prefetch_inputs([str(video)]) == 0
+        staging_dir = executor.separate_transfer.upload_file.call_args.args[1]
+        assert staging_dir.startswith("/remote/cosmos/staging/")
+
+        executor._upload_input(video, "/remote/cosmos/runs/rs_1/inputs/videos")
+
+        executor.file_transfer.upload_file.assert_not_called()
+        command = executor.ssh_manager.execute_command.call_args.args[0]
+        assert f"mv -f {staging_dir}/color.mp4 /remote/cosmos/runs/rs_1/inputs/videos" in command
+
+    def test_changed_input_is_uploaded(self, executor, tmp_path):
+        """Test a file modified after prefetching is uploaded as usual."""
+        video = tmp_path / "color.mp4"
+        video.write_bytes(b"frames")
+        executor.prefetch_inputs([str(video)])
+        video.write_bytes(b"new frames")
+
+        executor._upload_input(video, "/remote/cosmos/runs/rs_1/inputs/videos")
+
+        executor.file_transfer.upload_file.assert_called_once()
+
+    def test_gpu_is_released_before_outputs_download(self, executor):
+        """Test the GPU-done hook fires before a separate connection downloads outputs."""
+        events = []
+        executor.docker_executor.run_inference.side_effect = lambda **kwargs: (
+            events.append("gpu") or {"status": "completed"}
+        )
+
+        def download(run_id, run_dir, upscaled=False, file_transfer=None):
+            events.append(("download", file_transfer))
+            return run_dir / "outputs" / "output.mp4", None
+
+        executor._download_outputs = download
+        stages = JobStages(
+            on_gpu_start=lambda: events.append("start"), on_gpu_done=lambda: events.append("done")
+        )
+
+        executor._hold_outputs("rs_0")  # Still downloading from an earlier job
+        with track_stages(stages):
+            result = executor.execute_run(
+                {"id": "rs_1", "execution_config": {}}, {"id": "ps_1", "inputs": {}}
+            )
+
+        assert result["status"] == "completed"
+        assert events == ["start", "gpu", "done", ("download", executor.separate_transfer)]
+        # Other runs' cleanup must spare outputs until they are downloaded
+        cleanup = executor.remote_executor.execute_command.call_args.args[0]
+        assert "! -name run_rs_0" in cleanup
+        assert executor._pending_downloads() == ["rs_0"]
+
+    def test_without_pipeline_downloads_over_main_session(self, executor):
+        """Test direct calls keep downloading over the executor's own connection."""
+        executor.docker_executor.run_inference.return_value = {"status": "completed"}
+        executor._download_outputs = Mock(return_value=("out.mp4", None))
+
+        executor.execute_run({"id": "rs_1", "execution_config": {}}, {"id": "ps_1", "inputs": {}})
+
+        assert executor._download_outputs.call_args.kwargs["file_transfer"] is (
+            executor.file_transfer
+        )
@@ -0,0 +1,130 @@
+"""Tests for background output retrieval."""
+
+import threading
+from contextlib import contextmanager
+from unittest.mock import MagicMock, Mock
+
+import pytest
+
+from cosmos_workflow.execution.gpu_executor import GPUExecutor
+from cosmos_workflow.execution.job_stages import JobStages, track_stages
+from cosmos_workflow.execution.output_retriever import OutputRetriever, RetryPolicy
+
+
+@pytest.fixture
+def retriever():
+    """Create a retriever that retries without waiting."""
+    retriever = OutputRetriever(RetryPolicy(attempts=3, backoff_seconds=0))
+    yield retriever
+    retriever.shutdown()
+
+
+@pytest.fixture
+def executor(tmp_path, monkeypatch):
+    """Create a GPUExecutor with a service and stand-in connections."""
+    monkeypatch.chdir(tmp_path)
+    config = MagicMock()
+    config.get_remote_config.return_value = Mock(remote_dir="/remote/cosmos")
+    config.get_queue_config.return_value = {"download_attempts": 2, "download_backoff": 0}
+    executor = GPUExecutor(config_manager=config, service=Mock())
+    executor.ssh_manager = MagicMock()
+    executor.ssh_manager.execute_command.return_value = (0, "", "")
+    executor.file_transfer = Mock()
+    executor.remote_executor = Mock()
+    executor.docker_executor = Mock()
+    executor.docker_executor.run_inference.return_value = {"status": "completed"}
+    executor._services_initialized = True
+
+    @contextmanager
+    def separate_transfer():
+        yield Mock()
+
+    executor._separate_transfer = separate_transfer
+    yield executor
+    if executor.output_retriever is not None:
+        executor.output_retriever.shutdown()
+
+
+class TestRetryPolicy:
+    """Test retry backoff."""
+
+    def test_backoff_doubles_per_attempt(self):
+        """Test each retry waits twice as long as the one before."""
+        policy = RetryPolicy(attempts=4, backoff_seconds=2.0)
+
+        assert [policy.delay(attempt) for attempt in (1, 2, 3)] == [2.0, 4.0, 8.0]
+
+
+class TestOutputRetriever:
+    """Test retries, failure hooks and deduplication."""
+
+    def test_retries_until_success(self, retriever):
+        """Test a retrieval failing transiently succeeds on a later attempt."""
+        retrieve = Mock(side_effect=[OSError("reset"), None])
+        on_failure = Mock()
+
+        assert retriever.submit("rs_1", retrieve, on_failure).result(timeout=5) is True
+        assert retrieve.call_count == 2
+        on_failure.assert_not_called()
+
+    def test_failure_hook_runs_after_last_attempt(self, retriever):
+        """Test the failure hook gets the last error once every attempt failed."""
+        error = OSError("gone")
+        retrieve = Mock(side_effect=error)
+        on_failure = Mock()
+
+        assert retriever.submit("rs_1", retrieve, on_failure).result(timeout=5) is False
+        assert retrieve.call_count == 3
+        on_failure.assert_called_once_with(error)
+
+    def test_pending_retrieval_is_not_started_twice(self, retriever):
+        """Test submitting a name already pending returns the pending retrieval."""
+        release = threading.Event()
+        retrieve = Mock(side_effect=lambda: release.wait(5))
+
+        first = retriever.submit("rs_1", retrieve)
+        second = retriever.submit("rs_1", retrieve)
+        assert retriever.pending() == ["rs_1"]
+        release.set()
+
+        assert first is second
+        assert retriever.wait(timeout=5)
+        assert retriever.pending() == []
+        assert retrieve.call_count == 1
+
+
+class TestDeferredRetrieval:
+    """Test GPUExecutor hands finished runs' outputs to the retriever under the queue."""
+
+    def test_run_finishes_as_downloading_and_completes_in_background(self, executor, tmp_path):
+        """Test the job returns when the container exits and the run completes later."""
+        executor._download_outputs = Mock(return_value=(tmp_path / "output.mp4", None))
+
+        with track_stages(JobStages()):
+            result = executor.execute_run(
+                {"id": "rs_1", "execution_config": {}}, {"id": "ps_1", "inputs": {}}
+            )
+
+        assert result["status"] == "downloading"
+        executor.service.update_run_status.assert_any_call("rs_1", "downloading")
+        assert executor.wait_for_downloads(timeout=5)
+        update = executor.service.update_runs.call_args.args[0]["rs_1"]
+        assert update["status"] == "completed"
+        assert update["outputs"]["output_path"] == str(tmp_path / "output.mp4")
+        assert executor._pending_downloads() == []
+
+    def test_run_fails_once_every_download_attempt_failed(self, executor):
+        """Test a run whose outputs never arrive is failed with the download error."""
+        executor._download_outputs = Mock(side_effect=OSError("connection lost"))
+
+        with track_stages(JobStages()):
+            executor.execute_run(
+                {"id": "rs_1", "execution_config": {}}, {"id": "ps_1", "inputs": {}}
+            )
+
+        assert executor.wait_for_downloads(timeout=5)
+        assert executor._download_outputs.call_count == 2
+        executor.service.update_run.assert_called_once_with(
+            "rs_1", error_message="Output download failed: connection lost"
+        )
+        executor.service.update_runs.assert_not_called()
@@ -0,0 +1,39 @@
+"""Shared fixtures for queue service tests.
+
+The queue tests run against a file database, since queue signals, worker
+heartbeats and leases live next to it on disk, and a stand-in CosmosAPI whose
+GPU is always free.
+"""
+
+from unittest.mock import Mock
+
+import pytest
+
+from cosmos_workflow.database import DatabaseConnection
+from cosmos_workflow.services.simple_queue_service import SimplifiedQueueService
+
+
+@pytest.fixture
+def db(tmp_path):
+    """Create a file database for the queue."""
+    conn = DatabaseConnection(str(tmp_path / "cosmos.db"))
+    conn.create_tables()
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def api():
+    """Create a CosmosAPI mock whose GPU is always free and whose jobs succeed."""
+    api = Mock()
+    api.get_active_containers.return_value = []
+    api.service.list_runs.return_value = []
+    api.quick_inference.return_value = {"run_id": "rs_1", "status": "completed"}
+    api.batch_inference.return_value = {"status": "success"}
+    return api
+
+
+@pytest.fixture
+def service(api, db):
+    """Create a queue service on the stand-in API."""
+    return SimplifiedQueueService(cosmos_api=api, db_connection=db)
@@ -0,0 +1,123 @@
+"""Tests for the smart batching cost model calibrated on batch executions."""
+
+import random
+from unittest.mock import Mock
+
+import pytest
+
+from cosmos_workflow.database.models import BatchExecution
+from cosmos_workflow.execution.gpu_executor import GPUExecutor
+from cosmos_workflow.services.batch_cost_model import (
+    BatchCostModel,
+    BatchFeatures,
+    batch_features,
+)
+
+TRUTH = (200.0, 30.0, 10.0, 5.0)
+CONTROL_SETS = [{"edge": 0.5}, {"depth": 0.5}, {"edge": 0.3, "seg": 0.4}, {"vis": 0.5}]
+
+
+def _measured_batches(count=40):
+    """Yield batches with GPU times from a known cost model."""
+    rng = random.Random(3)
+    truth = BatchCostModel(prior=TRUTH)
+    for _ in range(count):
+        runs = [rng.choice(CONTROL_SETS) for _ in range(rng.randint(1, 4))]
+        features = BatchFeatures.from_runs(runs, {"num_steps": rng.choice([25, 35])})
+        yield features, truth.estimate(features)
+
+
+class TestBatchFeatures:
+    """Test extracting cost drivers from batches."""
+
+    def test_control_union_and_sets(self):
+        """Test features count the control union and distinct control sets."""
+        features = BatchFeatures.from_runs(
+            [{"edge": 0.5}, {"edge": 0.5, "depth": 0.0}, {"seg": 0.3, "edge": 0.1}],
+            {"num_steps": 50},
+        )
+
+        assert features.run_count == 3
+        assert features.controls == ("edge", "seg")
+        assert features.control_sets == 2
+        assert features.vector() == (1.0, 6.0, 12.0, 6.0)
+
+    def test_planned_batch_pads_missing_weights(self):
+        """Test runs without an entry in weights_list count as control-free runs."""
+        features = batch_features(
+            {"prompt_ids": ["ps_1", "ps_2"], "config": {"weights_list": [{"vis": 0.5}]}}
+        )
+
+        assert features.run_count == 2
+        assert features.control_sets == 2
+
+
+class TestBatchCostModel:
+    """Test fitting and persisting the cost model."""
+
+    def test_prior_matches_old_default(self):
+        """Test one run with two controls is predicted at 120 seconds."""
+        features = BatchFeatures.from_runs([{"edge": 0.5, "depth": 0.5}])
+
+        assert BatchCostModel().estimate(features) == pytest.approx(120)
+
+    def test_calibrates_on_measurements(self):
+        """Test the fitted coefficients approach the measured behaviour."""
+        model = BatchCostModel()
+        for features, seconds in _measured_batches():
+            model.observe(features, seconds)
+
+        truth = BatchCostModel(prior=TRUTH)
+        assert model.summary()["observations"] == 40
+        for runs in ([{"edge": 0.5}], [{"edge": 0.5}, {"depth": 0.5}] * 2):
+            features = BatchFeatures.from_runs(runs)
+            assert model.estimate(features) == pytest.approx(truth.estimate(features), rel=0.1)
+
+    def test_recorded_executions_reload(self, db):
+        """Test a new model learns from executions recorded by another one."""
+        recorder = BatchCostModel(db)
+        for features, seconds in _measured_batches():
+            recorder.record(features, seconds, batch_name="batch_1")
+
+        with db.get_session() as session:
+            row = session.query(BatchExecution).first()
+            assert row.batch_name == "batch_1"
+            assert session.query(BatchExecution).count() == 40
+
+        features = BatchFeatures.from_runs([{"edge": 0.5}] * 4)
+        expected = BatchCostModel(prior=TRUTH).estimate(features)
+        assert BatchCostModel(db).estimate(features) == pytest.approx(expected, rel=0.05)
+        assert recorder.estimate(features) == pytest.approx(expected, rel=0.05)
+        assert recorder.summary()["observations"] == 40
+
+    def test_refresh_picks_up_new_rows(self, db):
+        """Test a running model learns from rows written by other processes."""
+        model = BatchCostModel(db)
+        prior = model.estimate(BatchFeatures(run_count=1))
+
+        writer = BatchCostModel(db)
+        for features, seconds in _measured_batches():
+            writer.record(features, seconds, batch_name="batch_2")
+
+        assert model.estimate(BatchFeatures(run_count=1)) == prior  # Throttled
+        model._next_refresh = 0.0
+        assert model.estimate(BatchFeatures(run_count=1)) != prior
+
+
+def test_executor_records_batch_execution(db):
+    """Test a finished batch stores its GPU time and control mix."""
+    executor = GPUExecutor(config_manager=Mock(), service=Mock(db=db))
+    runs_and_prompts = [
+        ({"id": "rs_1", "execution_config": {"weights": {"edge": 0.5}, "num_steps": 35}}, {}),
+        ({"id": "rs_2", "execution_config": {"weights": {"depth": 0.4}, "num_steps": 35}}, {}),
+    ]
+
+    executor._record_batch_execution("batch_abc", runs_and_prompts, 321.0)
+
+    with db.get_session() as session:
+        row = session.query(BatchExecution).one()
+        assert row.run_count == 2
+        assert row.controls == ["depth", "edge"]
+        assert row.control_sets == 2
+        assert row.num_steps == 35
+        assert row.duration_seconds == 321.0
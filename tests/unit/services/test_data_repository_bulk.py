@@ -0,0 +1,113 @@
+"""Tests for DataRepository bulk prompt and run operations."""
+
+import pytest
+
+from cosmos_workflow.services.data_repository import PromptNotFoundError
+
+
+@pytest.fixture
+def prompt_ids(test_service):
+    """Create three prompts."""
+    return [
+        test_service.create_prompt(prompt_text=f"prompt {i}", inputs={}, parameters={})["id"]
+        for i in range(3)
+    ]
+
+
+class TestGetPrompts:
+    """Test fetching several prompts at once."""
+
+    def test_returns_existing_prompts_by_id(self, test_service, prompt_ids):
+        """Test missing IDs are omitted and duplicates collapse."""
+        prompts = test_service.get_prompts([*prompt_ids, prompt_ids[0], "ps_missing"])
+
+        assert set(prompts) == set(prompt_ids)
+        assert prompts[prompt_ids[1]]["prompt_text"] == "prompt 1"
+        assert test_service.get_prompts([]) == {}
+
+
+class TestCreateRuns:
+    """Test creating several runs in one transaction."""
+
+    def test_creates_runs_in_order(self, test_service, prompt_ids):
+        """Test each spec becomes a run with create_run's defaults and log paths."""
+        runs = test_service.create_runs(
+            [
+                {"prompt_id": prompt_ids[0], "execution_config": {"weights": {"vis": 1.0}}},
+                {
+                    "prompt_id": prompt_ids[1],
+                    "execution_config": {},
+                    "metadata": {"batch_id": "batch_1"},
+                    "model_type": "upscale",
+                },
+            ]
+        )
+
+        assert [r["prompt_id"] for r in runs] == prompt_ids[:2]
+        assert runs[0]["status"] == "pending"
+        assert runs[0]["model_type"] == "transfer"
+        assert runs[0]["log_path"] == f"outputs/run_{runs[0]['id']}/logs/{runs[0]['id']}.log"
+        assert runs[1]["model_type"] == "upscale"
+        assert runs[1]["log_path"] == "outputs/batch_1/batch_run.log"
+        assert test_service.get_run(runs[1]["id"])["metadata"] == {"batch_id": "batch_1"}
+
+    def test_missing_prompt_creates_nothing(self, test_service, prompt_ids):
+        """Test the batch is all-or-nothing."""
+        specs = [
+            {"prompt_id": prompt_ids[0], "execution_config": {}},
+            {"prompt_id": "ps_missing", "execution_config": {}},
+        ]
+
+        with pytest.raises(PromptNotFoundError, match="ps_missing"):
+            test_service.create_runs(specs)
+        assert test_service.count_runs() == 0
+
+    def test_invalid_model_type_creates_nothing(self, test_service, prompt_ids):
+        """Test an invalid spec rolls back the whole batch."""
+        specs = [
+            {"prompt_id": prompt_ids[0], "execution_config": {}},
+            {"prompt_id": prompt_ids[1], "execution_config": {}, "model_type": "bogus"},
+        ]
+
+        with pytest.raises(ValueError, match="Invalid model_type"):
+            test_service.create_runs(specs)
+        assert test_service.count_runs() == 0
+
+
+class TestUpdateRuns:
+    """Test updating several runs in one transaction."""
+
+    @pytest.fixture
+    def runs(self, test_service, prompt_ids):
+        return test_service.create_runs(
+            [{"prompt_id": prompt_id, "execution_config": {}} for prompt_id in prompt_ids]
+        )
+
+    def test_updates_fields_and_status(self, test_service, runs):
+        """Test outputs and status are applied like update_run/update_run_status."""
+        updated = test_service.update_runs(
+            {
+                runs[0]["id"]: {"outputs": {"output_path": "a.mp4"}, "status": "completed"},
+                runs[1]["id"]: {"status": "failed"},
+                "rs_missing": {"status": "completed"},
+            }
+        )
+
+        assert {r["id"] for r in updated} == {runs[0]["id"], runs[1]["id"]}
+        first = test_service.get_run(runs[0]["id"])
+        assert first["status"] == "completed"
+        assert first["outputs"] == {"output_path": "a.mp4"}
+        assert first["completed_at"] is not None
+        assert test_service.get_run(runs[1]["id"])["status"] == "failed"
+        assert test_service.get_run(runs[2]["id"])["status"] == "pending"
+
+    def test_validates_before_writing(self, test_service, runs):
+        """Test one invalid entry leaves every run untouched."""
+        with pytest.raises(ValueError, match="Invalid status"):
+            test_service.update_runs(
+                {runs[0]["id"]: {"status": "completed"}, runs[1]["id"]: {"status": "bogus"}}
+            )
+        with pytest.raises(ValueError, match="Invalid fields"):
+            test_service.update_runs({runs[0]["id"]: {"prompt_id": "ps_other"}})
+
+        assert test_service.count_runs(status="pending") == 3
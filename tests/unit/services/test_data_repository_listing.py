@@ -0,0 +1,341 @@
+"""Tests for DataRepository run listings against a real in-memory database."""
+
+import pytest
+
+
+@pytest.fixture
+def prompt_with_runs(test_service):
+    """Create a prompt with a transfer run, its upscale and a plain transfer run."""
+    prompt = test_service.create_prompt(
+        prompt_text="A city at night", inputs={"video": "v.mp4"}, parameters={}
+    )
+    upscaled = test_service.create_run(prompt_id=prompt["id"], execution_config={})
+    plain = test_service.create_run(prompt_id=prompt["id"], execution_config={})
+    upscale = test_service.create_run(
+        prompt_id=prompt["id"],
+        execution_config={"source_run_id": upscaled["id"]},
+        model_type="upscale",
+    )
+    test_service.update_run_status(upscale["id"], "completed")
+    return {"prompt": prompt, "upscaled": upscaled, "plain": plain, "upscale": upscale}
+
+
+class TestListRunsEnriched:
+    """Test the single-pass enriched run listing."""
+
+    def test_attaches_prompt_text_and_upscaled_run(self, test_service, prompt_with_runs):
+        """Test every run carries its prompt text and transfer runs their upscale."""
+        runs = {r["id"]: r for r in test_service.list_runs_enriched()}
+
+        assert len(runs) == 3
+        assert all(r["prompt_text"] == "A city at night" for r in runs.values())
+
+        upscaled = runs[prompt_with_runs["upscaled"]["id"]]
+        assert upscaled["has_upscaled"] is True
+        assert upscaled["upscaled_run"]["id"] == prompt_with_runs["upscale"]["id"]
+        assert upscaled["upscaled_run"]["status"] == "completed"
+
+        plain = runs[prompt_with_runs["plain"]["id"]]
+        assert plain["has_upscaled"] is False
+        assert "upscaled_run" not in plain
+
+    def test_matches_list_runs_filters(self, test_service, prompt_with_runs):
+        """Test enriched listing returns the same runs as list_runs."""
+        for kwargs in (
+            {},
+            {"status": "completed"},
+            {"version_filter": "upscaled"},
+            {"prompt_ids": [prompt_with_runs["prompt"]["id"]]},
+            {"limit": 1, "offset": 1},
+        ):
+            plain_ids = [r["id"] for r in test_service.list_runs(**kwargs)]
+            enriched_ids = [r["id"] for r in test_service.list_runs_enriched(**kwargs)]
+            assert enriched_ids == plain_ids, kwargs
+
+    def test_issues_constant_number_of_queries(self, test_service, test_db, prompt_with_runs):
+        """Test the listing does not issue per-run queries."""
+        from sqlalchemy import event
+
+        statements = []
+
+        def count(*_args):
+            statements.append(1)
+
+        event.listen(test_db.engine, "before_cursor_execute", count)
+        try:
+            test_service.list_runs_enriched()
+        finally:
+            event.remove(test_db.engine, "before_cursor_execute", count)
+
+        assert len(statements) == 2
+
+
+class TestRunFiltersInSQL:
+    """Test list_runs/count_runs filters run in SQL across the whole history."""
+
+    @pytest.fixture
+    def history(self, test_service, test_db):
+        """Create runs with varied type, rating, age and prompt text."""
+        from datetime import datetime, timedelta, timezone
+
+        from cosmos_workflow.database.models import Run
+
+        city = test_service.create_prompt(
+            prompt_text="Neon city at night", inputs={"video": "v.mp4"}, parameters={}
+        )
+        forest = test_service.create_prompt(
+            prompt_text="Forest 100% green_leaves", inputs={"video": "v.mp4"}, parameters={}
+        )
+        runs = {
+            "old_city": test_service.create_run(prompt_id=city["id"], execution_config={}),
+            "new_city": test_service.create_run(prompt_id=city["id"], execution_config={}),
+            "forest_upscale": test_service.create_run(
+                prompt_id=forest["id"], execution_config={}, model_type="upscale"
+            ),
+        }
+        test_service.update_run(runs["old_city"]["id"], rating=5)
+        test_service.update_run(runs["new_city"]["id"], rating=3)
+
+        # Push one run far into the past, beyond any "newest N" window
+        with test_db.get_session() as session:
+            old = session.query(Run).filter_by(id=runs["old_city"]["id"]).one()
+            old.created_at = datetime.now(timezone.utc) - timedelta(days=400)
+            session.commit()
+        return runs
+
+    def _ids(self, test_service, **filters):
+        return {r["id"] for r in test_service.list_runs(limit=100, **filters)}
+
+    def test_model_type_and_rating(self, test_service, history):
+        """Test type, min rating and unrated filters."""
+        assert self._ids(test_service, model_type="upscale") == {history["forest_upscale"]["id"]}
+        assert self._ids(test_service, min_rating=4) == {history["old_city"]["id"]}
+        assert self._ids(test_service, min_rating=3) == {
+            history["old_city"]["id"],
+            history["new_city"]["id"],
+        }
+        assert self._ids(test_service, unrated=True) == {history["forest_upscale"]["id"]}
+
+    def test_date_range(self, test_service, history):
+        """Test created_after/created_before bounds."""
+        from datetime import datetime, timedelta, timezone
+
+        cutoff = datetime.now(timezone.utc) - timedelta(days=30)
+        assert history["old_city"]["id"] not in self._ids(test_service, created_after=cutoff)
+        assert self._ids(test_service, created_before=cutoff) == {history["old_city"]["id"]}
+
+    def test_search_prompt_text_and_run_id(self, test_service, history):
+        """Test search matches prompt text, run IDs and literal wildcards."""
+        assert self._ids(test_service, search="neon") == {
+            history["old_city"]["id"],
+            history["new_city"]["id"],
+        }
+        assert self._ids(test_service, search=history["new_city"]["id"][:12]) == {
+            history["new_city"]["id"]
+        }
+        assert self._ids(test_service, search="100%") == {history["forest_upscale"]["id"]}
+        assert self._ids(test_service, search="t_n") == set()  # "_" is not a wildcard
+
+    def test_count_matches_listing(self, test_service, history):
+        """Test count_runs agrees with list_runs beyond the page size."""
+        assert test_service.count_runs() == 3
+        assert test_service.count_runs(search="city") == 2
+        assert test_service.count_runs(search="city", min_rating=5) == 1
+        assert len(test_service.list_runs(limit=1, search="city")) == 1
+
+
+class TestKeysetPagination:
+    """Test after-cursor pagination and streaming over (created_at, id)."""
+
+    @pytest.fixture
+    def same_second_runs(self, test_service, test_db):
+        """Create prompts and runs that share created_at timestamps in pairs."""
+        from datetime import datetime, timezone
+
+        from cosmos_workflow.database.models import Prompt, Run
+
+        prompts = [
+            test_service.create_prompt(prompt_text=f"p{n}", inputs={}, parameters={})
+            for n in range(5)
+        ]
+        runs = [
+            test_service.create_run(prompt_id=prompts[n % 2]["id"], execution_config={})
+            for n in range(7)
+        ]
+        with test_db.get_session() as session:
+            for model, rows in ((Prompt, prompts), (Run, runs)):
+                for n, row in enumerate(rows):
+                    obj = session.get(model, row["id"])
+                    obj.created_at = datetime(2025, 1, 1, 0, 0, n // 2, tzinfo=timezone.utc)
+            session.commit()
+        return {"prompts": prompts, "runs": runs}
+
+    @staticmethod
+    def _walk(list_page, limit):
+        pages, after = [], None
+        while True:
+            page = [row["id"] for row in list_page(limit=limit, after=after)]
+            pages.append(page)
+            if len(page) < limit:
+                return pages
+            after = page[-1]
+
+    def test_pages_cover_every_row_once(self, test_service, same_second_runs):
+        """Test cursor pages match the full ordering with no gaps or repeats at ties."""
+        for list_page, total in (
+            (test_service.list_runs, 7),
+            (test_service.list_prompts, 5),
+            (test_service.list_runs_enriched, 7),
+        ):
+            full = [row["id"] for row in list_page(limit=100)]
+            pages = self._walk(list_page, limit=2)
+
+            assert [row_id for page in pages for row_id in page] == full
+            assert len(full) == total
+
+    def test_cursor_combines_with_filters(self, test_service, same_second_runs):
+        """Test the cursor applies within the filtered result set."""
+        prompt_id = same_second_runs["prompts"][0]["id"]
+        full = [r["id"] for r in test_service.list_runs(prompt_id=prompt_id, limit=100)]
+
+        pages = self._walk(lambda **kw: test_service.list_runs(prompt_id=prompt_id, **kw), limit=3)
+
+        assert [row_id for page in pages for row_id in page] == full
+
+    def test_iter_streams_everything(self, test_service, same_second_runs):
+        """Test iter_runs/iter_prompts yield the full ordering across batches."""
+        assert [r["id"] for r in test_service.iter_runs(batch_size=3)] == [
+            r["id"] for r in test_service.list_runs(limit=100)
+        ]
+        assert [p["id"] for p in test_service.iter_prompts(batch_size=2)] == [
+            p["id"] for p in test_service.list_prompts(limit=100)
+        ]
+
+    def test_unknown_cursor_raises(self, test_service, same_second_runs):
+        """Test a cursor that matches no row is rejected rather than ignored."""
+        with pytest.raises(ValueError, match="Cursor not found"):
+            test_service.list_runs(after="rs_missing")
+        with pytest.raises(ValueError, match="Cursor not found"):
+            test_service.list_prompts(after="ps_missing")
+
+    def test_cursor_survives_deleted_anchor(self, test_service, test_db, same_second_runs):
+        """Test a created_at|id cursor continues correctly after its row is deleted."""
+        from cosmos_workflow.database.models import Prompt
+        from cosmos_workflow.services.data_repository import keyset_cursor
+
+        full = [p["id"] for p in test_service.list_prompts(limit=100)]
+        first_page = test_service.list_prompts(limit=2)
+        cursor = keyset_cursor(first_page[-1])
+        with test_db.get_session() as session:
+            session.delete(session.get(Prompt, first_page[-1]["id"]))
+            session.commit()
+
+        assert [p["id"] for p in test_service.list_prompts(after=cursor)] == full[2:]
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            test_service.list_prompts(after="yesterday|ps_missing")
+
+
+class TestPromptFiltersInSQL:
+    """Test list_prompts/search_prompts filters run in SQL so pages stay full."""
+
+    @pytest.fixture
+    def prompts(self, test_service, test_db):
+        """Create enhanced, old and run-backed prompts among plain ones."""
+        from datetime import datetime, timedelta, timezone
+
+        from cosmos_workflow.database.models import Prompt
+
+        prompts = {
+            name: test_service.create_prompt(
+                prompt_text=f"{name} city", inputs={}, parameters={"enhanced": name == "enhanced"}
+            )
+            for name in ("plain", "enhanced", "with_run", "old")
+        }
+        test_service.create_run(prompt_id=prompts["with_run"]["id"], execution_config={})
+        with test_db.get_session() as session:
+            old = session.get(Prompt, prompts["old"]["id"])
+            old.created_at = datetime.now(timezone.utc) - timedelta(days=60)
+            session.commit()
+        return {name: prompt["id"] for name, prompt in prompts.items()}
+
+    def test_enhanced_runs_and_dates(self, test_service, prompts):
+        """Test each filter alone and combined with a page limit."""
+        from datetime import datetime, timedelta, timezone
+
+        def ids(**filters):
+            return {p["id"] for p in test_service.list_prompts(**filters)}
+
+        cutoff = datetime.now(timezone.utc) - timedelta(days=30)
+        assert ids(enhanced=True) == {prompts["enhanced"]}
+        assert ids(enhanced=False) == set(prompts.values()) - {prompts["enhanced"]}
+        assert ids(has_runs=True) == {prompts["with_run"]}
+        assert ids(has_runs=False, created_after=cutoff) == {
+            prompts["plain"],
+            prompts["enhanced"],
+        }
+        assert ids(created_before=cutoff) == {prompts["old"]}
+        assert len(test_service.list_prompts(limit=2, has_runs=False)) == 2
+
+    def test_search_applies_filters(self, test_service, prompts):
+        """Test search results honour the same filters."""
+        results = test_service.search_prompts("city", has_runs=True)
+
+        assert [p["id"] for p in results] == [prompts["with_run"]]
+
+
+class TestPromptRunStats:
+    """Test the per-prompt run aggregation."""
+
+    @pytest.fixture
+    def prompts(self, test_service):
+        """Create one prompt with mixed runs and one prompt without runs."""
+        busy = test_service.create_prompt(prompt_text="busy", inputs={}, parameters={})
+        idle = test_service.create_prompt(prompt_text="idle", inputs={}, parameters={})
+
+        for model_type, status, rating in [
+            ("transfer", "completed", 5),
+            ("transfer", "completed", 4),
+            ("upscale", "completed", None),
+            ("transfer", "failed", 1),  # ratings on failed runs are ignored
+            ("enhance", "pending", None),
+        ]:
+            run = test_service.create_run(
+                prompt_id=busy["id"], execution_config={}, model_type=model_type
+            )
+            if status != "pending":
+                test_service.update_run_status(run["id"], status)
+            if rating is not None:
+                test_service.update_run(run["id"], rating=rating)
+        return {"busy": busy["id"], "idle": idle["id"]}
+
+    def test_summarizes_runs_per_prompt(self, test_service, prompts):
+        """Test counts, status breakdown and average rating of completed runs."""
+        stats = test_service.get_prompt_run_stats()
+
+        assert prompts["idle"] not in stats
+        assert stats[prompts["busy"]] == {
+            "total": 5,
+            "by_status": {"completed": 3, "failed": 1, "pending": 1},
+            "completed_by_model_type": {"transfer": 2, "upscale": 1},
+            "rated_count": 2,
+            "average_rating": 4.5,
+        }
+
+    def test_restricts_to_prompt_ids(self, test_service, prompts):
+        """Test only the requested prompts are aggregated, in one query."""
+        from sqlalchemy import event
+
+        statements = []
+
+        def count(*_args):
+            statements.append(1)
+
+        event.listen(test_service.db.engine, "before_cursor_execute", count)
+        try:
+            stats = test_service.get_prompt_run_stats([prompts["idle"]])
+        finally:
+            event.remove(test_service.db.engine, "before_cursor_execute", count)
+
+        assert stats == {}
+        assert len(statements) == 1
+        assert test_service.get_prompt_run_stats([]) == {}
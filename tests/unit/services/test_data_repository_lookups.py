@@ -0,0 +1,130 @@
+"""Tests for DataRepository lookups backed by promoted JSON columns."""
+
+from cosmos_workflow.database.models import Run
+
+
+class TestPromotedColumnLookups:
+    """Test lineage lookups use columns kept in sync with their JSON source."""
+
+    def test_create_and_update_run_populate_promoted_columns(self, test_service, test_db):
+        """Test create_run/update_run write the promoted columns."""
+        prompt = test_service.create_prompt(
+            prompt_text="test", inputs={"video": "v.mp4"}, parameters={}
+        )
+        run = test_service.create_run(
+            prompt_id=prompt["id"],
+            execution_config={"source_run_id": "rs_source"},
+            metadata={"batch_id": "batch_42"},
+            model_type="upscale",
+        )
+        test_service.update_run(
+            run["id"], outputs={"enhanced_prompt_id": "ps_new", "original_prompt_id": "ps_old"}
+        )
+
+        with test_db.get_session() as session:
+            row = session.query(Run).filter_by(id=run["id"]).one()
+            assert row.source_run_id == "rs_source"
+            assert row.batch_id == "batch_42"
+            assert row.enhanced_prompt_id == "ps_new"
+            assert row.original_prompt_id == "ps_old"
+
+    def test_find_upscaled_run(self, test_service):
+        """Test finding the upscale run for a source run."""
+        prompt = test_service.create_prompt(
+            prompt_text="test", inputs={"video": "v.mp4"}, parameters={}
+        )
+        source = test_service.create_run(prompt_id=prompt["id"], execution_config={})
+        upscale = test_service.create_run(
+            prompt_id=prompt["id"],
+            execution_config={"source_run_id": source["id"]},
+            model_type="upscale",
+        )
+
+        assert test_service.find_upscaled_run(source["id"])["id"] == upscale["id"]
+        assert test_service.find_upscaled_run(upscale["id"]) is None
+
+    def test_version_filter_uses_upscale_sources(self, test_service):
+        """Test upscaled/not upscaled filters, including upscales with no source."""
+        prompt = test_service.create_prompt(
+            prompt_text="test", inputs={"video": "v.mp4"}, parameters={}
+        )
+        upscaled = test_service.create_run(prompt_id=prompt["id"], execution_config={})
+        plain = test_service.create_run(prompt_id=prompt["id"], execution_config={})
+        upscale = test_service.create_run(
+            prompt_id=prompt["id"],
+            execution_config={"source_run_id": upscaled["id"]},
+            model_type="upscale",
+        )
+        test_service.update_run_status(upscale["id"], "completed")
+        orphan = test_service.create_run(
+            prompt_id=prompt["id"], execution_config={}, model_type="upscale"
+        )
+        test_service.update_run_status(orphan["id"], "completed")
+
+        with_upscale = {r["id"] for r in test_service.list_runs(version_filter="upscaled")}
+        without = {r["id"] for r in test_service.list_runs(version_filter="not upscaled")}
+
+        assert with_upscale == {upscaled["id"]}
+        assert plain["id"] in without
+        assert upscaled["id"] not in without
+
+    def test_enhancement_lineage(self, test_service):
+        """Test enhanced prompt listing and original prompt lookup."""
+        original = test_service.create_prompt(
+            prompt_text="original", inputs={"video": "v.mp4"}, parameters={}
+        )
+        enhanced = test_service.create_prompt(
+            prompt_text="enhanced", inputs={"video": "v.mp4"}, parameters={"enhanced": True}
+        )
+        run = test_service.create_run(
+            prompt_id=original["id"], execution_config={"model": "pixtral"}, model_type="enhance"
+        )
+        test_service.update_run(
+            run["id"],
+            outputs={
+                "enhanced_text": "enhanced",
+                "original_prompt_id": original["id"],
+                "enhanced_prompt_id": enhanced["id"],
+            },
+        )
+        test_service.update_run_status(run["id"], "completed")
+
+        assert [p["id"] for p in test_service.list_enhanced_prompts()] == [enhanced["id"]]
+        assert test_service.get_original_prompt(enhanced["id"])["id"] == original["id"]
+        details = test_service.get_enhancement_details(enhanced["id"])
+        assert details["original_prompt_id"] == original["id"]
+        assert len(test_service.get_enhancement_history(original["id"])) == 1
+
+        test_service.update_prompt(enhanced["id"], parameters={"enhanced": False})
+        assert test_service.list_enhanced_prompts() == []
+
+    def test_find_runs_by_fingerprint_and_cache_stats(self, test_service):
+        """Test fingerprint lookups return completed runs and stats count cache hits."""
+        prompt = test_service.create_prompt(
+            prompt_text="test", inputs={"video": "v.mp4"}, parameters={}
+        )
+        done = test_service.create_run(
+            prompt_id=prompt["id"], execution_config={}, metadata={"fingerprint": "fp_a"}
+        )
+        test_service.update_run_status(done["id"], "completed")
+        test_service.create_run(
+            prompt_id=prompt["id"], execution_config={}, metadata={"fingerprint": "fp_a"}
+        )
+        hit = test_service.create_run(
+            prompt_id=prompt["id"],
+            execution_config={},
+            metadata={"fingerprint": "fp_a", "cached_from": done["id"]},
+        )
+        test_service.update_run_status(hit["id"], "completed")
+        test_service.create_run(prompt_id=prompt["id"], execution_config={})
+
+        found = test_service.find_runs_by_fingerprint(["fp_a", "fp_b"])
+
+        assert [run["id"] for run in found["fp_a"]] == [hit["id"], done["id"]]
+        assert "fp_b" not in found
+        assert test_service.get_cache_stats() == {
+            "runs": 3,
+            "hits": 1,
+            "misses": 2,
+            "hit_rate": 1 / 3,
+        }
@@ -0,0 +1,84 @@
+"""Tests for DataRepository full-text prompt search against a real database."""
+
+import pytest
+
+
+@pytest.fixture
+def prompts(test_service):
+    """Create prompts whose text, names and video paths overlap in different ways."""
+    return {
+        "neon": test_service.create_prompt(
+            prompt_text="Neon city at night with heavy rain",
+            inputs={"video": "/inputs/downtown/color.mp4"},
+            parameters={"name": "rainy_downtown"},
+        ),
+        "named_city": test_service.create_prompt(
+            prompt_text="Slow pan across rooftops",
+            inputs={"video": "/inputs/skyline/color.mp4"},
+            parameters={"name": "city"},
+        ),
+        "forest": test_service.create_prompt(
+            prompt_text="A quiet forest, 100% green",
+            inputs={"video": "/inputs/woods/color.mp4"},
+            parameters={"name": "forest"},
+        ),
+    }
+
+
+def _ids(results):
+    return [p["id"] for p in results]
+
+
+class TestSearchPrompts:
+    """Test ranked, prefix and phrase prompt search."""
+
+    def test_matches_text_name_and_video_path(self, test_service, prompts):
+        """Test search covers prompt text, name and input video path."""
+        assert _ids(test_service.search_prompts("rain")) == [prompts["neon"]["id"]]
+        assert _ids(test_service.search_prompts("skyline")) == [prompts["named_city"]["id"]]
+        assert _ids(test_service.search_prompts("rainy_downtown")) == [prompts["neon"]["id"]]
+
+    def test_ranks_name_matches_first(self, test_service, prompts):
+        """Test a name match outranks a match in longer prompt text."""
+        assert _ids(test_service.search_prompts("city")) == [
+            prompts["named_city"]["id"],
+            prompts["neon"]["id"],
+        ]
+
+    def test_prefix_and_phrase_queries(self, test_service, prompts):
+        """Test words match as prefixes and quoted text as an exact phrase."""
+        assert _ids(test_service.search_prompts("fore gre")) == [prompts["forest"]["id"]]
+        assert _ids(test_service.search_prompts('"city at night"')) == [prompts["neon"]["id"]]
+        assert test_service.search_prompts('"night at city"') == []
+
+    def test_finds_prompt_by_id(self, test_service, prompts):
+        """Test a prompt ID finds that prompt."""
+        prompt_id = prompts["forest"]["id"]
+        assert _ids(test_service.search_prompts(prompt_id)) == [prompt_id]
+
+    def test_index_follows_updates_and_deletes(self, test_service, prompts):
+        """Test updated and deleted prompts are reflected immediately."""
+        prompt_id = prompts["neon"]["id"]
+        test_service.update_prompt(prompt_id, prompt_text="Sunny beach at noon")
+
+        assert test_service.search_prompts("neon") == []
+        assert _ids(test_service.search_prompts("sunny")) == [prompt_id]
+
+        test_service.delete_prompt(prompt_id)
+        assert test_service.search_prompts("sunny") == []
+
+    def test_falls_back_to_like_without_index(self, test_service, test_db, prompts):
+        """Test substring matching is used when FTS5 is unavailable."""
+        test_db._prompt_search_enabled = False
+
+        assert _ids(test_service.search_prompts("100%")) == [prompts["forest"]["id"]]
+        assert _ids(test_service.search_prompts("ity at nig")) == [prompts["neon"]["id"]]
+
+    def test_run_search_uses_prompt_index(self, test_service, prompts):
+        """Test run search matches prompt names and phrases through the index."""
+        run = test_service.create_run(prompt_id=prompts["neon"]["id"], execution_config={})
+        test_service.create_run(prompt_id=prompts["forest"]["id"], execution_config={})
+
+        assert [r["id"] for r in test_service.list_runs(search="downtown")] == [run["id"]]
+        assert test_service.count_runs(search='"heavy rain"') == 1
+        assert test_service.count_runs(search='"rain heavy"') == 0
@@ -0,0 +1,164 @@
+"""Tests for queue job runtime estimates learned from finished jobs."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from cosmos_workflow.database.models import JobHistory, JobQueue, Prompt, Run
+from cosmos_workflow.services.duration_estimator import DurationEstimator, JobFeatures
+
+
+def _inference(prompts=1, **config):
+    return JobFeatures.from_job("inference", [f"ps_{i}" for i in range(prompts)], config)
+
+
+class TestDurationEstimator:
+    """Test the per-job-type runtime model."""
+
+    def test_empty_history_keeps_old_default(self):
+        """Test a single-prompt job with no history is estimated at the former 120 seconds."""
+        estimator = DurationEstimator()
+
+        assert estimator.estimate(_inference()) == pytest.approx(120)
+        assert estimator.estimate(_inference(prompts=3)) == pytest.approx(360)
+
+    def test_empty_history_prices_batches_per_prompt(self):
+        """Test a multi-prompt batch with no history pays the prior per prompt."""
+        estimator = DurationEstimator()
+
+        features = JobFeatures.from_job("batch_inference", ["ps"] * 4, {}, batch_size=4)
+        # One GPU batch (30 s) plus four default runs (90 s each)
+        assert estimator.estimate(features) == pytest.approx(390)
+        features = JobFeatures.from_job("batch_inference", ["ps"] * 8, {}, batch_size=4)
+        assert estimator.estimate(features) == pytest.approx(780)
+
+    def test_learns_from_finished_jobs(self):
+        """Test estimates move to the measured runtimes."""
+        estimator = DurationEstimator()
+        for _ in range(20):
+            estimator.observe(_inference(), 600)
+
+        assert estimator.estimate(_inference()) == pytest.approx(600, rel=0.05)
+        # Other job types keep the prior
+        assert estimator.estimate(JobFeatures("upscale", 1)) == pytest.approx(120)
+
+    def test_scales_with_steps(self):
+        """Test jobs with more inference steps are predicted to take longer."""
+        estimator = DurationEstimator()
+        for steps, seconds in [(25, 100), (50, 180), (25, 100), (50, 180)] * 5:
+            estimator.observe(_inference(num_steps=steps), seconds)
+
+        short = estimator.estimate(_inference(num_steps=25))
+        long = estimator.estimate(_inference(num_steps=100))
+        assert short == pytest.approx(100, rel=0.1)
+        assert long > 2 * short
+
+    def test_batch_jobs_share_startup_cost(self):
+        """Test batch estimates count GPU batches, not prompts, for startup."""
+        estimator = DurationEstimator()
+        for prompts in (4, 8, 4, 8, 12) * 4:
+            features = JobFeatures.from_job("batch_inference", ["ps"] * prompts, {}, batch_size=4)
+            # 40 s per GPU batch plus 20 s per prompt
+            estimator.observe(features, 40 * (prompts // 4) + 20 * prompts)
+
+        features = JobFeatures.from_job("batch_inference", ["ps"] * 16, {}, batch_size=4)
+        assert estimator.estimate(features) == pytest.approx(480, rel=0.1)
+
+    def test_history_survives_restart(self, db):
+        """Test a new estimator reloads recorded jobs from the database."""
+        DurationEstimator(db).record(_inference(), 300, job_id="job_1", host="gpu")
+        for i in range(10):
+            DurationEstimator(db).record(_inference(), 300, job_id=f"job_{i + 2}")
+
+        with db.get_session() as session:
+            assert session.query(JobHistory).count() == 11
+        assert DurationEstimator(db).estimate(_inference()) == pytest.approx(300, rel=0.1)
+
+    def test_picks_up_other_processes_history(self, db):
+        """Test jobs stored by another estimator are learned on the next refresh, once."""
+        estimator = DurationEstimator(db)
+        estimator.record(_inference(), 300, job_id="job_1")
+        for i in range(10):
+            DurationEstimator(db).record(_inference(), 900, job_id=f"job_{i + 2}")
+
+        # Still within the refresh interval: only its own job is known
+        assert estimator.summary()["inference"]["observations"] == 1
+
+        estimator._next_refresh = 0.0
+        assert estimator.summary()["inference"]["observations"] == 11
+        assert estimator.estimate(_inference()) > 600
+
+    def test_seeds_from_completed_runs(self, db):
+        """Test an empty history is bootstrapped from completed runs."""
+        with db.get_session() as session:
+            session.add(Prompt(id="ps_1", prompt_text="p", inputs={}, parameters={}))
+            started = datetime(2025, 1, 1, tzinfo=timezone.utc)
+            for i in range(10):
+                session.add(
+                    Run(
+                        id=f"rs_{i}",
+                        prompt_id="ps_1",
+                        model_type="transfer",
+                        status="completed",
+                        execution_config={},
+                        outputs={},
+                        run_metadata={},
+                        started_at=started,
+                        completed_at=started + timedelta(seconds=400),
+                    )
+                )
+            session.commit()
+
+        estimator = DurationEstimator(db)
+
+        assert estimator.estimate(_inference()) == pytest.approx(400, rel=0.1)
+        assert estimator.summary()["inference"]["observations"] == 10
+
+
+class TestQueueEstimates:
+    """Test the queue service using recorded runtimes."""
+
+    def test_finished_jobs_are_recorded(self, service, db):
+        """Test executing a job stores its runtime."""
+        job_id = service.add_job(["ps_1"], "inference", {"num_steps": 35})
+        service.process_next_job()
+
+        with db.get_session() as session:
+            row = session.query(JobHistory).one()
+            assert row.job_id == job_id
+            assert row.num_steps == 35
+            assert row.duration_seconds > 0
+
+    def test_wait_time_uses_history(self, service):
+        """Test wait estimates follow measured runtimes instead of 120 s per job."""
+        for _ in range(20):
+            service.duration_estimator.observe(_inference(), 300)
+        jobs = [service.add_job([f"ps_{i}"], "inference", {}) for i in range(3)]
+
+        assert service.get_estimated_wait_time(jobs[2]) == pytest.approx(900, rel=0.05)
+        status = service.get_queue_status()
+        assert [job["estimated_wait"] for job in status["queued"]] == pytest.approx(
+            [300, 600, 900], rel=0.05
+        )
+
+    def test_wait_time_counts_running_job_remaining(self, service, db):
+        """Test a running job only adds the time it still needs."""
+        running = service.add_job(["ps_1"], "inference", {})
+        queued = service.add_job(["ps_2"], "inference", {})
+        service.claim_next_job()
+        with db.get_session() as session:
+            job = session.query(JobQueue).filter_by(id=running).one()
+            job.started_at = datetime.now(timezone.utc) - timedelta(seconds=60)
+            session.commit()
+
+        assert service.get_estimated_wait_time(queued) == pytest.approx(180, abs=5)
+        assert service.get_estimated_wait_time(running) is None
+
+    def test_estimate_queue_summary(self, service, db):
+        """Test the queue drain estimate used by cosmos status."""
+        for i in range(2):
+            service.add_job([f"ps_{i}"], "inference", {})
+
+        summary = DurationEstimator(db).estimate_queue(capacity=2)
+
+        assert summary == {"queued": 2, "running": 0, "estimated_seconds": 120}
@@ -0,0 +1,342 @@
+"""Tests for multi-host GPU pool scheduling with stand-in host executors."""
+
+import threading
+from concurrent.futures import Future
+from unittest.mock import Mock, patch
+
+import pytest
+
+from cosmos_workflow.execution.job_stages import current_stages
+from cosmos_workflow.services.gpu_pool import GPUPool, PoolHost
+from cosmos_workflow.services.queue_worker import QueueWorker
+from cosmos_workflow.services.simple_queue_service import SimplifiedQueueService
+
+
+def _host_api(name):
+    """Create a stand-in CosmosAPI for one GPU host."""
+    api = Mock(name=name)
+    api.get_active_containers.return_value = []
+    api.service.list_runs.return_value = []
+    api.quick_inference.side_effect = lambda prompt_id, **kwargs: {
+        "run_id": f"rs_{prompt_id}",
+        "status": "completed",
+    }
+    api.upscale.return_value = {"upscale_run_id": "rs_up", "status": "success"}
+    return api
+
+
+@pytest.fixture
+def pool():
+    """Create a pool of two single-slot stand-in hosts."""
+    return GPUPool(
+        [
+            PoolHost(name="h100-a", capacity=1, api=_host_api("h100-a")),
+            PoolHost(name="h100-b", capacity=1, api=_host_api("h100-b")),
+        ]
+    )
+
+
+class TestGPUPool:
+    """Test slot accounting and host selection."""
+
+    def test_acquire_respects_capacity(self, pool):
+        """Test each host hands out at most its capacity."""
+        first = pool.acquire()
+        second = pool.acquire()
+
+        assert {first.name, second.name} == {"h100-a", "h100-b"}
+        assert pool.acquire() is None
+        assert pool.free_capacity() == 0
+
+        pool.release(first)
+        assert pool.acquire() is first
+
+    def test_prefers_affinity_host_when_free(self, pool):
+        """Test the preferred host wins over configuration order."""
+        assert pool.acquire(preferred="h100-b").name == "h100-b"
+        # Preferred host busy: fall back to any free host
+        assert pool.acquire(preferred="h100-b").name == "h100-a"
+
+    def test_picks_least_loaded_host(self):
+        """Test jobs spread across hosts with spare capacity."""
+        pool = GPUPool(
+            [
+                PoolHost(name="small", capacity=1, api=_host_api("small")),
+                PoolHost(name="big", capacity=3, api=_host_api("big")),
+            ]
+        )
+
+        names = [pool.acquire().name for _ in range(4)]
+
+        assert names == ["big", "big", "small", "big"]
+        assert pool.total_capacity == 4
+
+    def test_skips_idle_host_with_foreign_container(self, pool):
+        """Test a host running a container this process did not start is busy."""
+        pool.hosts[0].api.get_active_containers.return_value = [{"container_id": "cli_run"}]
+
+        assert pool.acquire().name == "h100-b"
+        assert pool.acquire() is None
+
+    def test_container_check_runs_outside_the_lock(self, pool):
+        """Test a slow container check does not block release or other hosts."""
+        checking = threading.Event()
+        finish_check = threading.Event()
+        slow_api = pool.get("h100-a").api
+
+        def slow_check():
+            checking.set()
+            finish_check.wait(timeout=5)
+            return []
+
+        slow_api.get_active_containers.side_effect = slow_check
+        acquired = []
+        thread = threading.Thread(target=lambda: acquired.append(pool.acquire(preferred="h100-a")))
+        thread.start()
+        try:
+            assert checking.wait(timeout=5)
+            host_b = pool.acquire(preferred="h100-b")
+            assert host_b.name == "h100-b"
+            pool.release(host_b)
+        finally:
+            finish_check.set()
+            thread.join(timeout=5)
+
+        assert acquired[0].name == "h100-a"
+
+    def test_slot_taken_during_check_is_not_overbooked(self, pool):
+        """Test the slot is re-checked after the container check."""
+        host_a = pool.get("h100-a")
+
+        def check_while_other_thread_claims():
+            host_a.in_flight = 1  # Another thread claimed the only slot meanwhile
+            return []
+
+        host_a.api.get_active_containers.side_effect = check_while_other_thread_claims
+
+        assert pool.acquire(preferred="h100-a").name == "h100-b"
+        assert host_a.in_flight == 1
+
+    def test_affinity_remembers_latest_host(self, pool):
+        """Test preferred_host returns the host that last used an ID."""
+        pool.remember(["ps_1", "rs_1"], "h100-a")
+        pool.remember(["rs_1"], "h100-b")
+
+        assert pool.preferred_host(["rs_1"]) == "h100-b"
+        assert pool.preferred_host(["ps_1"]) == "h100-a"
+        assert pool.preferred_host(["ps_unknown"]) is None
+
+    def test_requires_a_host(self):
+        """Test an empty pool is rejected."""
+        with pytest.raises(ValueError):
+            GPUPool([])
+
+
+class TestPoolScheduling:
+    """Test the queue assigning and running jobs across hosts."""
+
+    def test_claim_assigns_free_hosts(self, pool, db):
+        """Test claimed jobs go to different hosts and record the host."""
+        service = SimplifiedQueueService(cosmos_api=Mock(), db_connection=db, gpu_pool=pool)
+        jobs = [service.add_job([f"ps_{i}"], "inference", {}) for i in range(3)]
+
+        assert service.claim_next_job() == jobs[0]
+        assert service.claim_next_job() == jobs[1]
+        assert service.claim_next_job() is None  # Both hosts busy
+
+        status = service.get_queue_status()
+        assert {job["host"] for job in status["running_jobs"]} == {"h100-a", "h100-b"}
+        assert status["running"]["id"] == jobs[0]
+        assert [host["in_flight"] for host in status["hosts"]] == [1, 1]
+
+        result = service.execute_job(jobs[1])
+        assert result["status"] == "completed"
+        assert service.claim_next_job() == jobs[2]
+
+    def test_job_runs_on_assigned_host(self, pool, db):
+        """Test execute_job calls the assigned host's API and frees its slot."""
+        service = SimplifiedQueueService(cosmos_api=Mock(), db_connection=db, gpu_pool=pool)
+        service.add_job(["ps_1"], "inference", {})
+
+        result = service.process_next_job()
+
+        assert result["host"] == "h100-a"
+        pool.hosts[0].api.quick_inference.assert_called_once()
+        pool.hosts[1].api.quick_inference.assert_not_called()
+        pool.hosts[0].api.invalidate_container_state.assert_called_once()
+        assert pool.free_capacity() == 2
+
+    def test_upscale_follows_source_run_host(self, pool, db):
+        """Test an upscale goes to the host that produced its source run."""
+        service = SimplifiedQueueService(cosmos_api=Mock(), db_connection=db, gpu_pool=pool)
+        busy = pool.acquire(preferred="h100-a")  # Push the inference onto h100-b
+        service.add_job(["ps_1"], "inference", {})
+        assert service.process_next_job()["host"] == "h100-b"
+        pool.release(busy)
+
+        service.add_job([], "upscale", {"run_id": "rs_ps_1"})
+        result = service.process_next_job()
+
+        assert result["host"] == "h100-b"
+        pool.hosts[1].api.upscale.assert_called_once()
+
+    def test_worker_runs_hosts_concurrently(self, pool, db):
+        """Test the worker runs one job per host at the same time."""
+        both_running = threading.Barrier(2, timeout=5)
+        hosts_used = []
+
+        def inference(prompt_id, host_name, **kwargs):
+            hosts_used.append(host_name)
+            both_running.wait()  # Only passes if the other host runs concurrently
+            return {"run_id": f"rs_{prompt_id}", "status": "completed"}
+
+        for host in pool.hosts:
+            host.api.quick_inference.side_effect = lambda prompt_id, _name=host.name, **kwargs: (
+                inference(prompt_id, _name, **kwargs)
+            )
+
+        service = SimplifiedQueueService(cosmos_api=Mock(), db_connection=db, gpu_pool=pool)
+        for prompt_id in ("ps_1", "ps_2"):
+            service.add_job([prompt_id], "inference", {})
+
+        processed = QueueWorker(service, min_idle=0.01).run(drain=True)
+
+        assert processed == 2
+        assert sorted(hosts_used) == ["h100-a", "h100-b"]
+        assert service.get_queue_status()["total_queued"] == 0
+        assert pool.free_capacity() == 2
+
+
+class TestPipelinedSlots:
+    """Test slots freeing at container exit and prefetching the next job."""
+
+    def test_slot_frees_when_container_exits(self, db):
+        """Test the next job can be claimed while the previous one downloads."""
+        api = _host_api("gpu")
+        pool = GPUPool([PoolHost(name="gpu", capacity=1, api=api)])
+        service = SimplifiedQueueService(cosmos_api=api, db_connection=db, gpu_pool=pool)
+        first = service.add_job(["ps_1"], "inference", {})
+        second = service.add_job(["ps_2"], "inference", {})
+        claimed_during_download = []
+
+        def inference(prompt_id, **kwargs):
+            stages = current_stages()
+            stages.gpu_started()
+            stages.gpu_done()
+            if prompt_id == "ps_1":
+                # Outputs are still downloading here
+                claimed_during_download.append(service.claim_next_job())
+            return {"run_id": f"rs_{prompt_id}", "status": "completed"}
+
+        api.quick_inference.side_effect = inference
+
+        assert service.claim_next_job() == first
+        result = service.execute_job(first)
+
+        assert claimed_during_download == [second]
+        assert set(result["stages"]) == {
+            "upload_seconds",
+            "gpu_seconds",
+            "download_seconds",
+            "gpu_idle_seconds",
+        }
+        assert pool.free_capacity() == 0  # Still held by the second job
+        service.execute_job(second)
+        assert pool.free_capacity() == 1
+
+    def _downloading_job(self, db):
+        """Execute a job whose outputs are still retrieved after it returns."""
+        api = _host_api("gpu")
+        pool = GPUPool([PoolHost(name="gpu", capacity=1, api=api)])
+        service = SimplifiedQueueService(cosmos_api=api, db_connection=db, gpu_pool=pool)
+        job_id = service.add_job(["ps_1"], "inference", {})
+        retrieval = Future()
+
+        def inference(prompt_id, **kwargs):
+            current_stages().retrieving(retrieval)
+            return {"run_id": "rs_1", "status": "downloading"}
+
+        api.quick_inference.side_effect = inference
+        service.claim_next_job()
+        return service, job_id, retrieval
+
+    def test_job_waits_for_its_outputs(self, db):
+        """Test a job stays downloading, and leased, until its outputs arrive."""
+        service, job_id, retrieval = self._downloading_job(db)
+
+        assert service.execute_job(job_id)["status"] == "downloading"
+        status = service.get_queue_status()
+        assert [job["id"] for job in status["downloading_jobs"]] == [job_id]
+        assert service.gpu_pool.free_capacity() == 1
+        assert service.get_job_status(job_id)["status"] == "downloading"
+        assert service.wait_for_downloads(timeout=0.01) is False
+
+        retrieval.set_result(True)
+
+        assert service.wait_for_downloads(timeout=5)
+        assert service.get_job_status(job_id)["status"] == "not_found"
+
+    def test_failed_download_fails_job(self, db):
+        """Test a job whose outputs could not be retrieved stays in the queue as failed."""
+        service, job_id, retrieval = self._downloading_job(db)
+        service.execute_job(job_id)
+
+        retrieval.set_result(False)
+
+        job = service.get_job_status(job_id)
+        assert job["status"] == "failed"
+        assert "Output download failed" in job["result"]["error"]
+        assert job["result"]["run_id"] == "rs_1"
+
+    def test_next_job_inputs_are_prefetched(self, pool, db):
+        """Test the next queued inference job's inputs go to the busy host."""
+        service = SimplifiedQueueService(cosmos_api=Mock(), db_connection=db, gpu_pool=pool)
+        first = service.add_job(["ps_1"], "inference", {})
+        service.add_job(["ps_x"], "enhancement", {})
+        service.add_job(["ps_2"], "inference", {})
+        service.claim_next_job()
+        host = pool.get(service.get_job_status(first)["host"])
+        host.api.quick_inference.side_effect = lambda prompt_id, **kwargs: (
+            current_stages().gpu_started() or {"run_id": "rs_1", "status": "completed"}
+        )
+
+        service.execute_job(first)
+        service._prefetcher.shutdown(wait=True)
+
+        host.api.prefetch_inputs.assert_called_once_with(["ps_2"])
+        assert pool.preferred_host(["ps_2"]) == host.name
+
+
+class TestPoolFromConfig:
+    """Test building a pool from configuration."""
+
+    def test_single_remote_reuses_primary_api(self):
+        """Test the default configuration keeps using the existing CosmosAPI."""
+        host = Mock(remote="remote-config", capacity=1)
+        host.name = "gpu"
+        config = Mock()
+        config.get_gpu_hosts.return_value = [host]
+        primary = Mock()
+        primary.config.get_remote_config.return_value = "remote-config"
+
+        pool = GPUPool.from_config(config, Mock(), primary_api=primary)
+
+        assert pool.hosts[0].api is primary
+        config.for_host.assert_not_called()
+
+    def test_unshared_primary_api_gets_own_executor(self):
+        """Test share_executor=False builds a separate CosmosAPI that shares the monitor."""
+        host = Mock(remote="remote-config", capacity=1)
+        host.name = "gpu"
+        config = Mock()
+        config.get_gpu_hosts.return_value = [host]
+        primary = Mock()
+        primary.config.get_remote_config.return_value = "remote-config"
+
+        with patch("cosmos_workflow.api.CosmosAPI") as mock_api_cls:
+            pool = GPUPool.from_config(config, Mock(), primary_api=primary, share_executor=False)
+
+        assert pool.hosts[0].api is mock_api_cls.return_value
+        assert pool.hosts[0].api is not primary
+        assert pool.hosts[0].api.container_monitor is primary.container_monitor
+        config.for_host.assert_called_once_with(host)
@@ -0,0 +1,155 @@
+"""Tests for queue jobs that wait for parent jobs and run on their outputs."""
+
+import pytest
+
+from cosmos_workflow.database.models import JobQueue
+from cosmos_workflow.services.job_dependencies import bind_outputs, parent_outputs
+from cosmos_workflow.services.simple_queue_service import SimplifiedQueueService
+
+INFERENCE = {"weights": {"edge": 0.5}, "num_steps": 30}
+
+
+@pytest.fixture
+def api(api):
+    """Make the stand-in CosmosAPI's jobs report the outputs children bind."""
+    api.enhance_prompt.side_effect = lambda prompt_id, **kwargs: {
+        "status": "success",
+        "enhanced_prompt_id": f"{prompt_id}_enh",
+    }
+    api.quick_inference.side_effect = lambda prompt_id, **kwargs: {
+        "status": "completed",
+        "run_id": f"rs_{prompt_id}",
+    }
+    api.batch_inference.side_effect = lambda prompt_ids, **kwargs: {
+        "status": "success",
+        "prompt_runs": {prompt_id: f"rs_{prompt_id}" for prompt_id in prompt_ids},
+    }
+    api.upscale.side_effect = lambda run_id, **kwargs: {
+        "status": "success",
+        "upscale_run_id": f"up_{run_id}",
+    }
+    return api
+
+
+def _job(db, job_id) -> JobQueue | None:
+    with db.get_session() as session:
+        job = session.query(JobQueue).filter_by(id=job_id).first()
+        if job is not None:
+            session.expunge(job)
+        return job
+
+
+def _run_next(service):
+    job_id = service.claim_next_job()
+    assert job_id is not None
+    return service.execute_job(job_id)
+
+
+class TestDependencies:
+    """Test waiting jobs are held back and released with their parents' outputs."""
+
+    def test_child_waits_for_parent(self, service, db):
+        """Test a job depending on an unfinished job is not claimed."""
+        parent = service.add_job(["ps_1"], "enhancement", {})
+        child = service.add_job(["ps_1"], "inference", dict(INFERENCE), depends_on=[parent])
+
+        assert _job(db, child).status == "waiting"
+        assert service.claim_next_job() == parent
+        assert service.claim_next_job() is None
+        assert service.get_queue_status()["waiting_jobs"][0]["depends_on"] == [parent]
+
+    def test_pipeline_binds_outputs_down_the_chain(self, service, api, db):
+        """Test enhancement, inference and upscale run on each other's outputs."""
+        [[enhance, inference, upscale]] = service.add_pipeline(
+            ["ps_1"], dict(INFERENCE), enhancement_config={}, upscale_config={}
+        )
+
+        assert _run_next(service)["job_id"] == enhance
+        child = _job(db, inference)
+        assert child.status == "queued"
+        assert child.prompt_ids == ["ps_1_enh"]
+        assert child.config["parent_outputs"][enhance] == {"prompt_ids": {"ps_1": "ps_1_enh"}}
+        # The grandchild follows the enhanced prompt before its own parent finishes
+        assert _job(db, upscale).prompt_ids == ["ps_1_enh"]
+
+        assert _run_next(service)["job_id"] == inference
+        assert api.quick_inference.call_args.kwargs["prompt_id"] == "ps_1_enh"
+        assert _job(db, upscale).config["run_id"] == "rs_ps_1_enh"
+
+        assert _run_next(service)["status"] == "completed"
+        assert api.upscale.call_args.kwargs["run_id"] == "rs_ps_1_enh"
+        assert service.get_queue_status()["waiting_jobs"] == []
+
+    def test_failed_parent_fails_descendants(self, service, api, db):
+        """Test a failing job fails every job waiting for it."""
+        [[inference, upscale]] = service.add_pipeline(["ps_1"], dict(INFERENCE), upscale_config={})
+        [[_, inference_2]] = service.add_pipeline(["ps_2"], dict(INFERENCE), enhancement_config={})
+        api.quick_inference.side_effect = RuntimeError("GPU lost")
+        api.enhance_prompt.side_effect = None
+        api.enhance_prompt.return_value = {"status": "failed", "error": "model timeout"}
+
+        assert _run_next(service)["status"] == "failed"
+        assert _job(db, upscale).status == "failed"
+        assert inference in _job(db, upscale).result["error"]
+
+        _run_next(service)
+        failed = _job(db, inference_2)
+        assert failed.status == "failed"
+        assert "model timeout" in failed.result["error"]
+
+    def test_cancel_cascades(self, service, db):
+        """Test cancelling a job cancels its pipeline, including waiting jobs."""
+        [[enhance, inference, upscale]] = service.add_pipeline(
+            ["ps_1"], dict(INFERENCE), enhancement_config={}, upscale_config={}
+        )
+
+        assert service.cancel_job(inference) is True
+
+        assert _job(db, enhance).status == "queued"
+        assert _job(db, inference).status == "cancelled"
+        assert _job(db, upscale).status == "cancelled"
+
+    def test_rejects_finished_or_unknown_parent(self, service):
+        """Test a job cannot wait for a job that will never complete."""
+        parent = service.add_job(["ps_1"], "inference", {})
+        service.cancel_job(parent)
+
+        with pytest.raises(ValueError, match="cancelled"):
+            service.add_job([], "upscale", {}, depends_on=[parent])
+        with pytest.raises(ValueError, match="not found"):
+            service.add_job([], "upscale", {}, depends_on=["job_missing"])
+
+    def test_merged_parent_passes_each_prompt_its_run(self, api, db):
+        """Test upscales of jobs merged into one batch get the run of their own prompt."""
+        service = SimplifiedQueueService(cosmos_api=api, db_connection=db, online_batching=True)
+        chains = service.add_pipeline(["ps_1", "ps_2"], dict(INFERENCE), upscale_config={})
+
+        leader = service.claim_next_job()
+        assert leader == chains[0][0]
+        assert _job(db, chains[1][1]).depends_on == [leader]
+        service.execute_job(leader)
+
+        assert _job(db, chains[0][1]).config["run_id"] == "rs_ps_1"
+        assert _job(db, chains[1][1]).config["run_id"] == "rs_ps_2"
+
+
+class TestParentOutputs:
+    """Test the outputs jobs pass on and how they bind."""
+
+    def test_enhancement_without_prompt_is_an_error(self):
+        """Test an enhancement that ran in the background gives children nothing to run."""
+        with pytest.raises(ValueError, match="no enhanced prompt"):
+            parent_outputs("enhancement", ["ps_1"], {"status": "started"})
+
+    def test_upscale_without_prompt_takes_a_single_run(self):
+        """Test an upscale with no prompt binds the parent's run only when unambiguous."""
+        single = JobQueue(prompt_ids=[], job_type="upscale", config={})
+        bind_outputs(single, "job_a", parent_outputs("inference", ["ps_1"], {"run_id": "rs_1"}))
+        assert single.config["run_id"] == "rs_1"
+
+        several = JobQueue(prompt_ids=[], job_type="upscale", config={})
+        outputs = parent_outputs(
+            "batch_inference", ["ps_1", "ps_2"], {"prompt_runs": {"ps_1": "rs_1", "ps_2": "rs_2"}}
+        )
+        bind_outputs(several, "job_a", outputs)
+        assert "run_id" not in several.config
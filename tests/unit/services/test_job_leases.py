@@ -0,0 +1,231 @@
+"""Tests for job leases, reclaiming jobs of dead processes and batch checkpoints."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from cosmos_workflow.database.models import JobQueue
+from cosmos_workflow.services.job_lease import MAX_JOB_ATTEMPTS, JobLease
+from cosmos_workflow.services.simple_queue_service import SimplifiedQueueService
+
+
+def _service(api, db):
+    return SimplifiedQueueService(cosmos_api=api, db_connection=db)
+
+
+def _job(db, job_id) -> JobQueue:
+    with db.get_session() as session:
+        job = session.query(JobQueue).filter_by(id=job_id).one()
+        session.expunge(job)
+        return job
+
+
+def _expire_lease(db, job_id):
+    """Make a running job look like its process stopped heartbeating."""
+    with db.get_session() as session:
+        job = session.query(JobQueue).filter_by(id=job_id).one()
+        job.lease_expires_at = datetime.now(timezone.utc) - timedelta(seconds=1)
+        session.commit()
+
+
+class TestLeases:
+    """Test claiming leases a job and heartbeats keep the lease."""
+
+    def test_claim_leases_job_to_service(self, api, db):
+        """Test a claimed job records its owner and a future expiry."""
+        service = _service(api, db)
+        job_id = service.add_job(["ps_1"], "inference", {})
+
+        assert service.claim_next_job() == job_id
+
+        job = _job(db, job_id)
+        assert job.lease_owner == service.lease_owner
+        expires_at = job.lease_expires_at.replace(tzinfo=timezone.utc)
+        assert expires_at > datetime.now(timezone.utc)
+
+    def test_renew_extends_lease_until_job_is_taken_over(self, api, db):
+        """Test renewal succeeds for the owner and reports the loss of the lease."""
+        service = _service(api, db)
+        service.set_lease_seconds(30)
+        job_id = service.add_job(["ps_1"], "inference", {})
+        service.claim_next_job()
+        _expire_lease(db, job_id)
+        lease = JobLease(db, job_id, service.lease_owner, lease_seconds=30)
+
+        assert lease.renew() is True
+        assert _job(db, job_id).lease_expires_at.replace(tzinfo=timezone.utc) > datetime.now(
+            timezone.utc
+        )
+
+        with db.get_session() as session:
+            session.query(JobQueue).filter_by(id=job_id).update({"lease_owner": "other"})
+            session.commit()
+        assert lease.renew() is False
+        assert lease.lost is True
+
+    def test_finished_job_clears_lease(self, api, db):
+        """Test executing a job to completion removes it without a dangling lease."""
+        service = _service(api, db)
+        job_id = service.add_job(["ps_1"], "inference", {})
+        service.claim_next_job()
+
+        assert service.execute_job(job_id)["status"] == "completed"
+        assert service.reclaim_expired_leases() == 0
+
+    def test_rejects_non_positive_lease(self, api, db):
+        """Test the lease duration must be positive."""
+        with pytest.raises(ValueError, match="positive"):
+            _service(api, db).set_lease_seconds(0)
+
+
+class TestReclaim:
+    """Test jobs of dead processes go back to the queue."""
+
+    def test_live_lease_is_left_alone(self, api, db):
+        """Test another service does not take a job whose owner is still heartbeating."""
+        owner = _service(api, db)
+        job_id = owner.add_job(["ps_1"], "inference", {})
+        owner.claim_next_job()
+
+        _service(api, db)
+
+        assert owner.get_job_status(job_id)["status"] == "running"
+
+    def test_expired_lease_is_requeued_and_claimed_again(self, api, db):
+        """Test a job whose process died is queued again with its position and reruns."""
+        owner = _service(api, db)
+        job_id = owner.add_job(["ps_1"], "inference", {})
+        owner.claim_next_job()
+        _expire_lease(db, job_id)
+        api.service.list_runs.return_value = [{"id": "rs_old", "status": "running"}]
+
+        survivor = _service(api, db)
+
+        job = _job(db, job_id)
+        assert job.status == "queued"
+        assert job.attempts == 1
+        assert job.lease_owner is None and job.host is None
+        api.service.update_run.assert_called_once_with(
+            "rs_old", error_message="Job interrupted by application restart"
+        )
+        assert survivor.claim_next_job() == job_id
+        assert _job(db, job_id).lease_owner == survivor.lease_owner
+
+    def test_running_job_without_lease_is_not_reclaimed(self, api, db):
+        """Test a job executing without a claim is not requeued under its runner."""
+        service = _service(api, db)
+        with db.get_session() as session:
+            session.add(
+                JobQueue(
+                    id="job_direct",
+                    prompt_ids=["ps_1"],
+                    job_type="inference",
+                    status="running",
+                    config={},
+                )
+            )
+            session.commit()
+
+        assert service.reclaim_expired_leases() == 0
+        assert service.claim_next_job() is None
+        assert _job(db, "job_direct").status == "running"
+
+    def test_batch_job_keeps_its_runs_for_resume(self, api, db):
+        """Test a reclaimed batch job keeps its batch ID and its runs stay in progress."""
+        owner = _service(api, db)
+        job_id = owner.add_job(["ps_1", "ps_2"], "batch_inference", {"batch_id": "batch_x"})
+        owner.claim_next_job()
+        _expire_lease(db, job_id)
+        api.service.list_runs.return_value = [
+            {"id": "rs_1", "status": "running", "metadata": {"batch_id": "batch_x"}}
+        ]
+
+        assert owner.reclaim_expired_leases() == 1
+
+        assert _job(db, job_id).config["batch_id"] == "batch_x"
+        api.service.update_run.assert_not_called()
+
+    def test_gives_up_after_max_attempts(self, api, db):
+        """Test a job interrupted again and again is failed instead of looping."""
+        job_id = _service(api, db).add_job(["ps_1"], "inference", {})
+        for _ in range(MAX_JOB_ATTEMPTS):
+            # Each attempt's process dies holding the job
+            service = _service(api, db)
+            assert service.claim_next_job() == job_id
+            _expire_lease(db, job_id)
+            service.reclaim_expired_leases()
+
+        job = _job(db, job_id)
+        assert job.status == "failed"
+        assert "interrupted 3 times" in job.result["error"]
+
+    def test_result_of_reclaimed_job_is_not_recorded(self, api, db):
+        """Test a process that lost its lease leaves the job to the new owner."""
+        owner = _service(api, db)
+        job_id = owner.add_job(["ps_1"], "inference", {})
+        owner.claim_next_job()
+
+        def taken_over(**_kwargs):
+            with db.get_session() as session:
+                session.query(JobQueue).filter_by(id=job_id).update({"lease_owner": "other"})
+                session.commit()
+            return {"status": "completed"}
+
+        api.quick_inference.side_effect = taken_over
+
+        assert owner.execute_job(job_id)["status"] == "reclaimed"
+        job = _job(db, job_id)
+        assert job.status == "running"
+        assert job.lease_owner == "other"
+
+    def test_result_of_unclaimed_job_is_recorded(self, api, db):
+        """Test a job executed without a claim records its result."""
+        service = _service(api, db)
+        job_id = service.add_job(["ps_1"], "inference", {})
+        api.quick_inference.side_effect = RuntimeError("boom")
+
+        assert service.execute_job(job_id)["status"] == "failed"
+        assert _job(db, job_id).status == "failed"
+
+    def test_orphaned_runs_of_resumable_batches_survive_startup(self, api, db):
+        """Test startup cleanup keeps old in-progress runs a requeued batch will resume."""
+        owner = _service(api, db)
+        owner.add_job(["ps_1"], "batch_inference", {"batch_id": "batch_x"})
+        old = (datetime.now(timezone.utc) - timedelta(hours=1)).isoformat()
+        api.service.list_runs.return_value = [
+            {
+                "id": "rs_batch",
+                "status": "running",
+                "created_at": old,
+                "metadata": {"batch_id": "batch_x"},
+            },
+            {"id": "rs_stray", "status": "running", "created_at": old, "metadata": {}},
+        ]
+
+        _service(api, db)
+
+        api.service.update_run.assert_called_once_with(
+            "rs_stray", error_message="Run orphaned - no active job or container"
+        )
+
+
+class TestBatchCheckpoint:
+    """Test batch jobs get their batch ID when claimed."""
+
+    def test_batch_id_is_stored_and_passed_to_api(self, api, db):
+        """Test the claim persists the job's batch ID and the execution reuses it."""
+        service = _service(api, db)
+        job_id = service.add_job(["ps_1", "ps_2"], "batch_inference", {"weights": {}})
+        seen = []
+
+        def run_batch(**kwargs):
+            seen.append((kwargs["batch_id"], _job(db, job_id).config.get("batch_id")))
+            return {"status": "success"}
+
+        api.batch_inference.side_effect = run_batch
+        service.claim_next_job()
+        service.execute_job(job_id)
+
+        batch_id, stored = seen[0]
+        assert batch_id.startswith("batch_")
+        assert stored == batch_id
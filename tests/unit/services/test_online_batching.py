@@ -0,0 +1,176 @@
+"""Tests for merging compatible queued jobs into one batch at claim time."""
+
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from cosmos_workflow.database.models import JobQueue
+from cosmos_workflow.services.batch_cost_model import BatchCostModel
+from cosmos_workflow.services.queue_worker import QueueWorker
+from cosmos_workflow.services.simple_queue_service import SimplifiedQueueService
+
+EDGE = {"weights": {"edge": 0.5}, "num_steps": 30}
+
+
+@pytest.fixture
+def api(api):
+    """Make the stand-in CosmosAPI report a run for every prompt of a batch."""
+    api.batch_inference.side_effect = lambda prompt_ids, **kwargs: {
+        "status": "completed",
+        "run_ids": [f"rs_{prompt_id}" for prompt_id in prompt_ids],
+    }
+    return api
+
+
+@pytest.fixture
+def service(api, db):
+    """Create a queue service with online batching of up to 4 prompts."""
+    service = SimplifiedQueueService(cosmos_api=api, db_connection=db, online_batching=True)
+    service.set_batch_size(4)
+    return service
+
+
+def _job(db, job_id):
+    with db.get_session() as session:
+        return session.query(JobQueue).filter_by(id=job_id).first()
+
+
+class TestOnlineBatching:
+    """Test the claim path with online batching enabled."""
+
+    def test_claim_merges_compatible_jobs(self, service, api, db):
+        """Test compatible jobs run as one batch_inference with per-prompt weights."""
+        jobs = [service.add_job([f"ps_{i}"], "inference", dict(EDGE)) for i in range(3)]
+
+        assert service.claim_next_job() == jobs[0]
+
+        leader = _job(db, jobs[0])
+        assert leader.job_type == "batch_inference"
+        assert leader.prompt_ids == ["ps_0", "ps_1", "ps_2"]
+        assert leader.config["weights_list"] == [{"edge": 0.5}] * 3
+        assert leader.config["merged_job_ids"] == jobs[1:]
+        assert _job(db, jobs[1]) is None
+        assert service.get_queue_status()["total_queued"] == 0
+
+        result = service.execute_job(jobs[0])
+
+        assert result["status"] == "completed"
+        api.batch_inference.assert_called_once()
+        assert api.batch_inference.call_args.kwargs["prompt_ids"] == ["ps_0", "ps_1", "ps_2"]
+        assert api.batch_inference.call_args.kwargs["num_steps"] == 30
+
+    def test_batch_respects_batch_size(self, service, db):
+        """Test a batch takes prompts up to batch_size and leaves the rest queued."""
+        service.add_job(["ps_a", "ps_b", "ps_c"], "batch_inference", dict(EDGE))
+        too_big = service.add_job(["ps_d", "ps_e"], "batch_inference", dict(EDGE))
+        fits = service.add_job(["ps_f"], "inference", dict(EDGE))
+
+        leader = _job(db, service.claim_next_job())
+
+        assert leader.prompt_ids == ["ps_a", "ps_b", "ps_c", "ps_f"]
+        assert leader.config["merged_job_ids"] == [fits]
+        assert [job["id"] for job in service.get_queue_status()["queued"]] == [too_big]
+
+    def test_incompatible_jobs_stay_queued(self, service, db):
+        """Test jobs with other parameters, controls or types are not merged."""
+        leader = service.add_job(["ps_1"], "inference", dict(EDGE))
+        other_steps = service.add_job(["ps_2"], "inference", {**EDGE, "num_steps": 50})
+        other_controls = service.add_job(["ps_3"], "inference", {"weights": {"depth": 0.5}})
+        enhancement = service.add_job(["ps_4"], "enhancement", {})
+
+        assert service.claim_next_job() == leader
+
+        assert _job(db, leader).prompt_ids == ["ps_1"]
+        queued = [job["id"] for job in service.get_queue_status()["queued"]]
+        assert queued == [other_steps, other_controls, enhancement]
+
+    def test_mix_controls_merges_when_predicted_faster(self, service, db):
+        """Test mixed mode batches different controls when model loading dominates."""
+        service.batch_cost_model = BatchCostModel(prior=(120.0, 40.0, 12.0, 0.0))
+        service.set_online_batching(True, mix_controls=True)
+        leader = service.add_job(["ps_1"], "inference", dict(EDGE))
+        service.add_job(["ps_2"], "inference", {**EDGE, "weights": {"depth": 0.5}})
+
+        service.claim_next_job()
+
+        assert _job(db, leader).config["weights_list"] == [{"edge": 0.5}, {"depth": 0.5}]
+
+    def test_mix_controls_skips_when_predicted_slower(self, service, db):
+        """Test mixed mode keeps jobs apart when the extra controls cost more."""
+        service.batch_cost_model = BatchCostModel(prior=(10.0, 60.0, 30.0, 0.0))
+        service.set_online_batching(True, mix_controls=True)
+        leader = service.add_job(["ps_1"], "inference", dict(EDGE))
+        other = service.add_job(["ps_2"], "inference", {**EDGE, "weights": {"depth": 0.5}})
+
+        service.claim_next_job()
+
+        assert _job(db, leader).job_type == "inference"
+        assert _job(db, other).status == "queued"
+
+    def test_batch_respects_gpu_memory(self, service, db):
+        """Test a batch stops growing once its estimated memory would exceed the budget."""
+        # Model (24 GB) + edge branch (8 GB) + 8 GB per reference-size run
+        service.set_gpu_memory(50.0)
+        jobs = [service.add_job([f"ps_{i}"], "inference", dict(EDGE)) for i in range(3)]
+
+        leader = _job(db, service.claim_next_job())
+
+        assert leader.prompt_ids == ["ps_0", "ps_1"]
+        assert [job["id"] for job in service.get_queue_status()["queued"]] == [jobs[2]]
+
+    def test_disabled_by_default(self, api, db):
+        """Test the claim path is unchanged unless online batching is enabled."""
+        service = SimplifiedQueueService(cosmos_api=api, db_connection=db)
+        first = service.add_job(["ps_1"], "inference", dict(EDGE))
+        service.add_job(["ps_2"], "inference", dict(EDGE))
+
+        assert service.claim_next_job() == first
+        assert _job(db, first).job_type == "inference"
+        assert service.get_queue_status()["total_queued"] == 1
+
+
+class TestBatchLinger:
+    """Test holding back partial batches so they can fill."""
+
+    def test_partial_batch_lingers_then_claims(self, service, db):
+        """Test a fresh partial batch waits for the linger window."""
+        service.set_online_batching(True, linger=30)
+        job_id = service.add_job(["ps_1"], "inference", dict(EDGE))
+
+        assert service.claim_next_job() is None
+        assert 0 < service.batch_linger_remaining() <= 30
+
+        # Once the leader has waited out the window the partial batch runs
+        with db.get_session() as session:
+            job = session.query(JobQueue).filter_by(id=job_id).one()
+            job.created_at = datetime.now(timezone.utc) - timedelta(seconds=31)
+            session.commit()
+
+        assert service.claim_next_job() == job_id
+        assert service.batch_linger_remaining() == 0
+
+    def test_full_batch_claims_without_lingering(self, service):
+        """Test a batch that reached batch_size is claimed immediately."""
+        service.set_online_batching(True, linger=30)
+        jobs = [service.add_job([f"ps_{i}"], "inference", dict(EDGE)) for i in range(4)]
+
+        assert service.claim_next_job() == jobs[0]
+
+    def test_worker_waits_out_linger_window(self, service, api):
+        """Test a draining worker claims the lingering batch instead of exiting."""
+        service.set_online_batching(True, linger=0.3)
+        service.add_job(["ps_1"], "inference", dict(EDGE))
+        service.add_job(["ps_2"], "inference", dict(EDGE))
+
+        started = time.monotonic()
+        processed = QueueWorker(service, min_idle=0.05).run(drain=True)
+
+        assert processed == 1
+        assert time.monotonic() - started >= 0.25
+        assert api.batch_inference.call_args.kwargs["prompt_ids"] == ["ps_1", "ps_2"]
+
+    def test_negative_linger_rejected(self, service):
+        """Test the linger window cannot be negative."""
+        with pytest.raises(ValueError):
+            service.set_online_batching(True, linger=-1)
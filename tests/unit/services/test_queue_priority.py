@@ -0,0 +1,153 @@
+"""Tests for priority scheduling with aging in the job queue."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import text
+
+from cosmos_workflow.database.models import JobQueue
+from cosmos_workflow.services.simple_queue_service import SimplifiedQueueService
+
+
+@pytest.fixture
+def service(api, db):
+    """Create a queue service that ages jobs one point per minute."""
+    return SimplifiedQueueService(cosmos_api=api, db_connection=db, aging_seconds=60)
+
+
+def _age(db, job_id, minutes):
+    """Move a job's creation time into the past."""
+    with db.get_session() as session:
+        job = session.query(JobQueue).filter_by(id=job_id).one()
+        job.created_at = datetime.now(timezone.utc) - timedelta(minutes=minutes)
+        session.commit()
+
+
+class TestPriorityOrder:
+    """Test which job is claimed next."""
+
+    def test_equal_priority_is_fifo(self, service):
+        """Test jobs of the same priority keep first-in, first-out order."""
+        jobs = [service.add_job([f"ps_{i}"], "inference", {}) for i in range(3)]
+
+        assert service.claim_next_job() == jobs[0]
+        assert [job["id"] for job in service.get_queue_status()["queued"]] == jobs[1:]
+
+    def test_high_priority_job_skips_backlog(self, service, db):
+        """Test an urgent job is claimed before a backlog of older normal jobs."""
+        backlog = [service.add_job([f"ps_{i}"], "inference", {}) for i in range(20)]
+        for minutes, job_id in enumerate(reversed(backlog), 1):
+            _age(db, job_id, minutes)
+
+        urgent = service.add_job(["ps_urgent"], "inference", {}, priority=90)
+
+        assert service.get_position(urgent) == 1
+        assert service.claim_next_job() == urgent
+
+    def test_aging_prevents_starvation(self, service, db):
+        """Test a long-waiting low-priority job overtakes newer high-priority jobs."""
+        old = service.add_job(["ps_old"], "inference", {}, priority=0)
+        _age(db, old, 120)  # 120 minutes = 120 aging points > 90
+
+        for i in range(5):
+            service.add_job([f"ps_new_{i}"], "inference", {}, priority=90)
+
+        assert service.claim_next_job() == old
+
+    def test_aging_bonus_is_bounded_by_wait(self, service, db):
+        """Test a low-priority job still yields while its aging bonus is small."""
+        old = service.add_job(["ps_old"], "inference", {}, priority=0)
+        _age(db, old, 30)
+        urgent = service.add_job(["ps_urgent"], "inference", {}, priority=90)
+
+        assert service.claim_next_job() == urgent
+        status = service.get_job_status(old)
+        assert status["priority"] == 0
+        assert 29 < status["effective_priority"] < 32
+
+    def test_null_priority_counts_as_default(self, service, db):
+        """Test jobs created before priorities were used are still claimable."""
+        legacy = service.add_job(["ps_1"], "inference", {})
+        newer = service.add_job(["ps_2"], "inference", {})
+        with db.get_session() as session:
+            session.execute(text("UPDATE job_queue SET priority = NULL"))
+            session.commit()
+
+        assert service.get_job_status(legacy)["effective_priority"] >= 50
+        assert service.claim_next_job() == legacy
+        service.execute_job(legacy)
+        assert service.claim_next_job() == newer
+
+
+class TestChangingPriority:
+    """Test the priority API used by the UI."""
+
+    def test_prioritize_moves_job_to_front(self, service, db):
+        """Test prioritize_job puts a job first even behind long-waiting jobs."""
+        jobs = [service.add_job([f"ps_{i}"], "inference", {}) for i in range(4)]
+        _age(db, jobs[0], 300)
+
+        assert service.prioritize_job(jobs[3]) is True
+
+        assert service.get_position(jobs[3]) == 1
+        assert service.claim_next_job() == jobs[3]
+
+    def test_prioritize_head_is_a_noop(self, service):
+        """Test prioritizing the job already in front leaves its priority alone."""
+        first = service.add_job(["ps_1"], "inference", {})
+        service.add_job(["ps_2"], "inference", {})
+
+        assert service.prioritize_job(first) is True
+        assert service.get_job_status(first)["priority"] == 50
+
+    def test_set_job_priority(self, service):
+        """Test set_job_priority reorders the queue."""
+        low = service.add_job(["ps_1"], "inference", {})
+        high = service.add_job(["ps_2"], "inference", {})
+
+        assert service.set_job_priority(high, 80) is True
+
+        assert service.get_position(high) == 1
+        assert service.get_position(low) == 2
+
+    def test_only_queued_jobs_can_change(self, service):
+        """Test running jobs keep their priority."""
+        job_id = service.add_job(["ps_1"], "inference", {})
+        service.claim_next_job()
+
+        assert service.set_job_priority(job_id, 80) is False
+        assert service.prioritize_job(job_id) is False
+        assert service.prioritize_job("job_missing") is False
+
+    @pytest.mark.parametrize("priority", [-1, 101, 2.5])
+    def test_priority_out_of_range_rejected(self, service, priority):
+        """Test priorities outside 0-100 are rejected."""
+        job_id = service.add_job(["ps_1"], "inference", {})
+
+        with pytest.raises(ValueError, match="Priority"):
+            service.add_job(["ps_2"], "inference", {}, priority=priority)
+        with pytest.raises(ValueError, match="Priority"):
+            service.set_job_priority(job_id, priority)
+
+    def test_priority_change_wakes_worker(self, service):
+        """Test changing priority signals the worker to re-check the queue."""
+        job_id = service.add_job(["ps_1"], "inference", {})
+        token = service.signals.wakeup_token()
+
+        service.set_job_priority(job_id, 70)
+
+        assert service.signals.wakeup_token() != token
+
+
+def test_claim_query_uses_priority_index(service, db):
+    """Test the claim query reads queue heads from the priority index."""
+    service.add_job(["ps_1"], "inference", {})
+    with db.get_session() as session:
+        plan = session.execute(
+            text(
+                "EXPLAIN QUERY PLAN SELECT priority, min(created_at) FROM job_queue "
+                "WHERE status = 'queued' GROUP BY priority"
+            )
+        ).fetchall()
+
+    assert any("ix_job_queue_status_priority_created_at" in str(row) for row in plan)
@@ -0,0 +1,266 @@
+"""Tests for the standalone queue worker and its cross-process signals."""
+
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from cosmos_workflow.database import DatabaseConnection
+from cosmos_workflow.database.models import JobQueue
+from cosmos_workflow.services.queue_signals import QueueSignals
+from cosmos_workflow.services.queue_worker import (
+    QueueWorker,
+    WorkerAlreadyRunningError,
+    register_worker,
+)
+from cosmos_workflow.services.simple_queue_service import SimplifiedQueueService
+
+
+def _service(api, db):
+    return SimplifiedQueueService(cosmos_api=api, db_connection=db)
+
+
+class TestQueueSignals:
+    """Test the file-based signals shared by processes on one database."""
+
+    def test_signal_directory_sits_next_to_database(self, db, tmp_path):
+        """Test file databases get a sibling directory, in-memory ones none."""
+        assert QueueSignals.for_database(db).directory == tmp_path / "cosmos.queue"
+        assert QueueSignals.for_database(DatabaseConnection(":memory:")).directory is None
+
+    def test_notify_wakes_another_instance(self, tmp_path):
+        """Test a notification from one instance ends another's wait."""
+        waiter = QueueSignals(tmp_path, poll_interval=0.01)
+        notifier = QueueSignals(tmp_path)
+        token = waiter.wakeup_token()
+
+        assert waiter.wait(0.05, since=token) is False
+        notifier.notify()
+        assert waiter.wait(5, since=token) is True
+
+    def test_notification_before_wait_is_not_lost(self, tmp_path):
+        """Test passing the earlier token catches a notify that happened in between."""
+        signals = QueueSignals(tmp_path, poll_interval=0.01)
+        token = signals.wakeup_token()
+        time.sleep(0.01)  # Distinct mtime on coarse filesystems
+        QueueSignals(tmp_path).notify()
+
+        start = time.monotonic()
+        assert signals.wait(5, since=token) is True
+        assert time.monotonic() - start < 1
+
+    def test_stop_event_ends_wait(self, tmp_path):
+        """Test a set stop event returns without a notification."""
+        stop = threading.Event()
+        stop.set()
+        assert QueueSignals(tmp_path).wait(5, stop=stop) is False
+
+    def test_pause_is_shared(self, tmp_path):
+        """Test pausing through one instance is visible to another."""
+        QueueSignals(tmp_path).set_paused(True)
+        assert QueueSignals(tmp_path).is_paused() is True
+        QueueSignals(tmp_path).set_paused(False)
+        assert QueueSignals(tmp_path).is_paused() is False
+
+    def test_worker_registration(self, tmp_path):
+        """Test registration, heartbeat staleness and unregistration."""
+        signals = QueueSignals(tmp_path)
+        assert signals.worker_alive() is False
+
+        signals.register_worker()
+        assert signals.worker_alive() is True
+        assert signals.worker_alive(stale_after=0) is False
+        assert QueueSignals(tmp_path).get_worker()["pid"] > 0
+
+        signals.unregister_worker()
+        assert signals.get_worker() is None
+
+    def test_processing_heartbeat_is_seen_by_other_processes(self, tmp_path):
+        """Test a process executing jobs is visible to others, not to itself."""
+        signals = QueueSignals(tmp_path / "cosmos.queue")
+
+        with signals.processing():
+            assert signals.processing_elsewhere() is False
+            own = next((tmp_path / "cosmos.queue").glob("processing-*"))
+            # Another process's heartbeat file
+            own.with_name("processing-otherhost-1").touch()
+            assert signals.processing_elsewhere() is True
+            assert signals.processing_elsewhere(stale_after=0) is False
+
+        assert not own.exists()
+
+
+class TestQueueServiceSignals:
+    """Test SimplifiedQueueService publishes and honors the signals."""
+
+    def test_add_job_notifies(self, api, db):
+        """Test adding a job wakes a waiting worker."""
+        service = _service(api, db)
+        token = service.signals.wakeup_token()
+        time.sleep(0.01)
+
+        service.add_job(["ps_1"], "inference", {})
+
+        assert service.signals.wakeup_token() != token
+
+    def test_pause_reaches_other_service(self, api, db):
+        """Test the UI's pause toggle applies to the worker's service."""
+        ui_service = _service(api, db)
+        worker_service = _service(api, db)
+
+        ui_service.set_queue_paused(True)
+
+        assert worker_service.is_queue_paused() is True
+        assert worker_service.claim_next_job() is None
+
+    def test_live_worker_keeps_its_running_jobs(self, api, db):
+        """Test a service started beside a live worker skips orphan cleanup."""
+        worker_service = _service(api, db)
+        job_id = worker_service.add_job(["ps_1"], "inference", {})
+        assert worker_service.claim_next_job() == job_id
+        worker_service.set_queue_paused(True)
+        worker_service.signals.register_worker()
+
+        ui_service = _service(api, db)
+
+        assert ui_service.worker_running() is True
+        assert ui_service.get_job_status(job_id)["status"] == "running"
+        assert ui_service.is_queue_paused() is True
+        assert ui_service.get_queue_status()["worker"]["pid"] > 0
+
+    def test_startup_leaves_jobs_another_process_is_executing(self, api, db):
+        """Test a new service neither fails nor unpauses while another process runs jobs."""
+        ui_service = _service(api, db)
+        job_id = ui_service.add_job(["ps_1"], "inference", {})
+        assert ui_service.claim_next_job() == job_id
+        ui_service.set_queue_paused(True)
+        (ui_service.signals.directory / "processing-otherhost-1").touch()
+
+        _service(api, db)
+
+        assert ui_service.get_job_status(job_id)["status"] == "running"
+        assert ui_service.is_queue_paused() is True
+
+    def test_registered_worker_keeps_pause_and_reclaims_orphans(self, api, db):
+        """Test the worker's own registration does not stop it from reclaiming jobs."""
+        ui_service = _service(api, db)
+        job_id = ui_service.add_job(["ps_1"], "inference", {})
+        assert ui_service.claim_next_job() == job_id
+        ui_service.set_queue_paused(True)
+        register_worker(ui_service.signals)
+        with db.get_session() as session:
+            job = session.query(JobQueue).filter_by(id=job_id).one()
+            job.lease_expires_at = datetime.now(timezone.utc) - timedelta(seconds=1)
+            session.commit()
+
+        SimplifiedQueueService(cosmos_api=api, db_connection=db, as_worker=True)
+
+        assert ui_service.get_job_status(job_id)["status"] == "queued"
+        assert ui_service.is_queue_paused() is True
+
+
+class TestQueueWorker:
+    """Test the worker loop."""
+
+    def test_drain_processes_queued_jobs(self, api, db):
+        """Test --drain runs every queued job then exits and unregisters."""
+        service = _service(api, db)
+        for prompt_id in ("ps_1", "ps_2"):
+            service.add_job([prompt_id], "inference", {})
+
+        processed = QueueWorker(service).run(drain=True)
+
+        assert processed == 2
+        assert api.quick_inference.call_count == 2
+        assert service.get_queue_status()["total_queued"] == 0
+        assert service.signals.get_worker() is None
+
+    def test_wakes_on_new_job(self, api, db):
+        """Test an idle worker picks up a job added from another service promptly."""
+        worker = QueueWorker(_service(api, db), min_idle=10.0, max_idle=10.0)
+        worker.signals.poll_interval = 0.01
+        thread = threading.Thread(target=worker.run, kwargs={"max_jobs": 1})
+        thread.start()
+        try:
+            time.sleep(0.1)  # Let the worker find the queue empty and start waiting
+            _service(api, db).add_job(["ps_1"], "inference", {})
+            thread.join(timeout=5)
+        finally:
+            worker.stop()
+            thread.join(timeout=5)
+
+        assert not thread.is_alive()
+        assert worker.jobs_processed == 1
+
+    def test_stop_exits_idle_worker(self, api, db):
+        """Test stop() ends the idle wait without waiting for the backoff."""
+        worker = QueueWorker(_service(api, db), min_idle=30.0, max_idle=30.0)
+        thread = threading.Thread(target=worker.run)
+        thread.start()
+        time.sleep(0.1)
+
+        worker.stop()
+        thread.join(timeout=5)
+
+        assert not thread.is_alive()
+
+    def test_refuses_second_worker(self, api, db):
+        """Test only one worker serves a database at a time."""
+        service = _service(api, db)
+        service.signals.register_worker()
+
+        with pytest.raises(WorkerAlreadyRunningError):
+            QueueWorker(service).run(drain=True)
+
+    def test_only_one_of_concurrent_workers_registers(self, tmp_path):
+        """Test checking for a live worker and registering is atomic."""
+        barrier = threading.Barrier(8)
+        outcomes = []
+
+        def start():
+            signals = QueueSignals(tmp_path)
+            barrier.wait()
+            try:
+                register_worker(signals)
+                outcomes.append("registered")
+            except WorkerAlreadyRunningError:
+                outcomes.append("refused")
+
+        threads = [threading.Thread(target=start) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=10)
+
+        assert sorted(outcomes) == ["refused"] * 7 + ["registered"]
+        assert not (tmp_path / "worker.lock").exists()
+
+    def test_heartbeat_continues_while_draining(self, api, db):
+        """Test stop() leaves the heartbeat running until in-flight jobs finish."""
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_inference(**kwargs):
+            started.set()
+            release.wait(timeout=5)
+            return {"status": "completed", "run_id": "rs_1"}
+
+        api.quick_inference.side_effect = slow_inference
+        service = _service(api, db)
+        service.add_job(["ps_1"], "inference", {})
+        worker = QueueWorker(service, heartbeat_interval=0.02)
+        thread = threading.Thread(target=worker.run)
+        thread.start()
+        try:
+            assert started.wait(timeout=5)
+            worker.stop()
+            before = service.signals.get_worker()["heartbeat"]
+            time.sleep(0.2)
+            assert service.signals.get_worker()["heartbeat"] > before
+        finally:
+            release.set()
+            thread.join(timeout=5)
+
+        assert not thread.is_alive()
+        assert service.signals.get_worker() is None
@@ -0,0 +1,63 @@
+"""Tests for result cache fingerprints."""
+
+from cosmos_workflow.services.result_cache import cached_outputs, file_digest, run_fingerprint
+
+CONFIG = {"weights": {"vis": 0.5}, "num_steps": 35, "guidance": 5.0, "seed": 1}
+
+
+def _prompt(tmp_path, video=b"frames"):
+    path = tmp_path / "color.mp4"
+    path.write_bytes(video)
+    return {
+        "id": "ps_1",
+        "prompt_text": "a city",
+        "inputs": {"video": str(path)},
+        "parameters": {"negative_prompt": "blurry"},
+    }
+
+
+class TestRunFingerprint:
+    """Test fingerprints identify runs that produce the same output."""
+
+    def test_same_run_same_fingerprint(self, tmp_path):
+        """Test fingerprints are stable and ignore the batch a run belongs to."""
+        prompt = _prompt(tmp_path)
+
+        first = run_fingerprint(prompt, CONFIG, "cosmos:1.0")
+
+        assert first == run_fingerprint(prompt, {**CONFIG}, "cosmos:1.0")
+        assert first == run_fingerprint(
+            prompt, {**CONFIG, "batch_id": "batch_x", "batch_name": "nightly"}, "cosmos:1.0"
+        )
+
+    def test_output_relevant_changes_change_fingerprint(self, tmp_path):
+        """Test settings, prompt text, input video contents and image tag all count."""
+        prompt = _prompt(tmp_path)
+        base = run_fingerprint(prompt, CONFIG, "cosmos:1.0")
+
+        assert base != run_fingerprint(prompt, {**CONFIG, "seed": 2}, "cosmos:1.0")
+        assert base != run_fingerprint(prompt, CONFIG, "cosmos:1.1")
+        assert base != run_fingerprint({**prompt, "prompt_text": "a town"}, CONFIG, "cosmos:1.0")
+        (tmp_path / "other").mkdir()
+        other_video = _prompt(tmp_path / "other", video=b"other frames")
+        assert base != run_fingerprint(other_video, CONFIG, "cosmos:1.0")
+
+    def test_missing_input_is_not_cached(self, tmp_path):
+        """Test runs whose input videos are gone get no fingerprint."""
+        prompt = {"prompt_text": "a city", "inputs": {"video": str(tmp_path / "gone.mp4")}}
+
+        assert run_fingerprint(prompt, CONFIG, "cosmos:1.0") is None
+        assert file_digest(tmp_path / "gone.mp4") is None
+
+
+class TestCachedOutputs:
+    """Test a cache hit needs the earlier output to still exist."""
+
+    def test_requires_existing_output(self, tmp_path):
+        """Test outputs are reused only while the output video exists."""
+        video = tmp_path / "output.mp4"
+        run = {"id": "rs_1", "outputs": {"output_path": str(video)}}
+
+        assert cached_outputs(run) is None
+        video.write_bytes(b"video")
+        assert cached_outputs(run) == {"output_path": str(video)}
@@ -24,6 +24,8 @@ class TestWorkflowServiceQueries:
         connection = MagicMock()
         connection.get_session.return_value.__enter__ = MagicMock(return_value=mock_session)
         connection.get_session.return_value.__exit__ = MagicMock(return_value=None)
+        # Exercise the LIKE fallback; FTS5 search is covered against a real database
+        connection.prompt_search_enabled = False
         return connection
 
     @pytest.fixture
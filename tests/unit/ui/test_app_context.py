@@ -0,0 +1,74 @@
+"""Tests for the process-wide UI application context."""
+
+import pytest
+
+from cosmos_workflow.config import ConfigManager
+from cosmos_workflow.ui import context as ui_context
+from cosmos_workflow.ui.context import (
+    AppContext,
+    close_app_context,
+    get_api,
+    get_app_context,
+    set_app_context,
+)
+
+
+@pytest.fixture
+def app_context(test_db):
+    """Install an AppContext over the in-memory test database."""
+    context = AppContext(config=ConfigManager(), database=test_db)
+    set_app_context(context)
+    yield context
+    set_app_context(None)
+
+
+class TestAppContext:
+    """Test that UI handlers share one set of services per process."""
+
+    def test_services_share_one_database(self, app_context, test_db):
+        """Test the API, repository and queue service all use one connection."""
+        assert app_context.database is test_db
+        assert app_context.repository.db is test_db
+        assert app_context.executor is app_context.api.orchestrator
+        assert app_context.queue_service.db_connection is test_db
+        assert app_context.queue_service.cosmos_api is app_context.api
+
+    def test_queue_jobs_run_on_their_own_executor(self, app_context):
+        """Test queued jobs never share the SSH connection UI handlers use."""
+        host = app_context.queue_service.gpu_pool.default_host
+
+        assert host.api is not app_context.api
+        assert host.api.orchestrator is not app_context.executor
+        assert host.api.service.db is app_context.database
+        assert host.api.container_monitor is app_context.api.container_monitor
+
+    def test_get_api_returns_shared_instance(self, app_context):
+        """Test repeated handler lookups return the same CosmosAPI."""
+        assert get_api() is app_context.api
+        assert get_api() is get_api()
+        assert get_app_context() is app_context
+        assert app_context.queue_service is app_context.queue_service
+
+    def test_get_app_context_creates_once(self, monkeypatch, test_db):
+        """Test lazy creation happens only once."""
+        created = []
+
+        def fake_context():
+            created.append(1)
+            return AppContext(config=ConfigManager(), database=test_db)
+
+        monkeypatch.setattr(ui_context, "AppContext", fake_context)
+        set_app_context(None)
+        try:
+            first = get_app_context()
+            assert get_app_context() is first
+            assert len(created) == 1
+        finally:
+            set_app_context(None)
+
+    def test_close_app_context(self, app_context, test_db):
+        """Test closing releases the database and clears the context."""
+        close_app_context()
+
+        assert test_db.closed
+        assert ui_context._context is None
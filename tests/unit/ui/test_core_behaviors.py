@@ -120,12 +120,14 @@ class TestQueueBehaviors:
             "created_at": "2025-01-15T10:00:00Z",
         }
         mock_service.get_position.return_value = 5
+        mock_service.get_estimated_wait_time.return_value = 600
 
         handler = QueueHandlers(mock_service)
         details = handler.get_job_details("job_123")
 
         assert "Queue Position:** #5" in details
-        assert "Estimated Wait:** ~10m" in details  # 5 * 2 minutes
+        assert "Estimated Wait:** ~10m" in details
+        mock_service.get_estimated_wait_time.assert_called_once_with("job_123")
 
     def test_queue_prioritization(self):
         """Test job prioritization behavior."""
@@ -148,6 +150,23 @@ class TestQueueBehaviors:
         assert len(table_data) == 1
         mock_service.prioritize_job.assert_called_with("job_123")
 
+    def test_job_details_show_aged_priority(self):
+        """Test queued job details show base and effective priority."""
+        from cosmos_workflow.ui.queue_handlers import QueueHandlers
+
+        mock_service = Mock()
+        mock_service.get_job_status.return_value = {
+            "status": "queued",
+            "priority": 50,
+            "effective_priority": 62.5,
+        }
+        mock_service.get_position.return_value = 1
+        mock_service.get_estimated_wait_time.return_value = 120
+
+        details = QueueHandlers(mock_service).get_job_details("job_123")
+
+        assert "**Priority:** 50 (effective 62.5 with wait time)" in details
+
     def test_batch_inference_handling(self):
         """Test batch inference job creation."""
         from cosmos_workflow.ui.tabs.prompts_handlers import run_inference_on_selected
@@ -182,7 +201,7 @@ class TestStatusDisplay:
         """Test GPU status information formatting."""
         from cosmos_workflow.ui.tabs.jobs_handlers import check_running_jobs
 
-        with patch("cosmos_workflow.ui.tabs.jobs_handlers.CosmosAPI") as mock_api:
+        with patch("cosmos_workflow.ui.tabs.jobs_handlers.get_api") as mock_api:
             mock_api.return_value.check_status.return_value = {
                 "ssh_status": "connected",
                 "docker_status": {"docker_running": True},
@@ -214,7 +233,7 @@ class TestStatusDisplay:
         """Test active job status display."""
         from cosmos_workflow.ui.tabs.jobs_handlers import check_running_jobs
 
-        with patch("cosmos_workflow.ui.tabs.jobs_handlers.CosmosAPI") as mock_api:
+        with patch("cosmos_workflow.ui.tabs.jobs_handlers.get_api") as mock_api:
             mock_api.return_value.check_status.return_value = {
                 "ssh_status": "connected",
                 "active_run": {
@@ -249,7 +268,7 @@ class TestDataTransformations:
         """Test transformation of API data to table format."""
         from cosmos_workflow.ui.tabs.prompts_handlers import load_ops_prompts
 
-        with patch("cosmos_workflow.ui.tabs.prompts_handlers.CosmosAPI") as mock_api:
+        with patch("cosmos_workflow.ui.tabs.prompts_handlers.get_api") as mock_api:
             mock_api.return_value.list_prompts.return_value = [
                 {
                     "id": "ps_12345678",
@@ -269,6 +288,42 @@ class TestDataTransformations:
             assert len(row[3]) <= 63  # Truncated text (60 + "...")
             assert row[4] == "2025-01-15T10:30:45"  # Formatted date
 
+    def test_load_more_appends_next_page(self):
+        """Test Load More continues after the last row and keeps selections."""
+        from cosmos_workflow.ui.tabs.prompts_handlers import load_more_ops_prompts
+
+        table = [[True, "ps_new", "a", "text", ""], [False, "ps_mid", "b", "text", ""]]
+        with patch("cosmos_workflow.ui.tabs.prompts_handlers.get_api") as mock_api:
+            mock_api.return_value.list_prompts.return_value = [
+                {"id": "ps_old", "prompt_text": "older", "parameters": {}, "created_at": ""}
+            ]
+
+            result = load_more_ops_prompts(table, limit=10)
+
+            mock_api.return_value.list_prompts.assert_called_once_with(limit=10, after="ps_mid")
+            assert [row[1] for row in result] == ["ps_new", "ps_mid", "ps_old"]
+            assert [row[0] for row in result] == [True, False, False]
+
+    def test_load_more_filters_in_sql(self):
+        """Test Load More passes filters and a created_at|id cursor to list_prompts."""
+        from cosmos_workflow.ui.tabs.prompts_handlers import load_more_ops_prompts
+
+        table = [[False, "ps_mid", "b", "text", "2025-01-15T10:30:45", 0]]
+        with patch("cosmos_workflow.ui.tabs.prompts_handlers.get_api") as mock_api:
+            mock_api.return_value.list_prompts.return_value = [
+                {"id": f"ps_{n}", "prompt_text": "", "parameters": {}, "created_at": ""}
+                for n in range(10)
+            ]
+
+            result = load_more_ops_prompts(
+                table, limit=10, enhanced_filter="enhanced", runs_filter="no_runs"
+            )
+
+            mock_api.return_value.list_prompts.assert_called_once_with(
+                limit=10, after="2025-01-15T10:30:45|ps_mid", enhanced=True, has_runs=False
+            )
+            assert len(result) == 11
+
     def test_selection_state_management(self):
         """Test managing selection state across operations."""
         from cosmos_workflow.ui.tabs.prompts_handlers import (
@@ -227,35 +227,46 @@ class TestPromptFiltering:
 
     def test_filter_prompts_with_runs(self, sample_prompts):
         """Test filtering by run status."""
-        with patch("cosmos_workflow.ui.tabs.prompts_handlers.CosmosAPI") as mock_api:
+        with patch("cosmos_workflow.ui.tabs.prompts_handlers.get_api") as mock_api:
             mock_api_instance = Mock()
             mock_api.return_value = mock_api_instance
 
-            # Setup mock returns for each prompt
-            mock_api_instance.list_runs.side_effect = [
-                [{"id": "rs_001"}],  # ps_001 has runs
-                [],  # ps_002 has no runs
-                [{"id": "rs_002"}, {"id": "rs_003"}],  # ps_003 has runs
-            ]
+            # One aggregate lookup; prompts without runs are absent from the result
+            mock_api_instance.get_prompt_run_stats.return_value = {
+                "ps_001": {"total": 1},
+                "ps_003": {"total": 2},
+            }
 
             # Filter for prompts with runs
             filtered = filter_prompts(sample_prompts, runs_filter="has_runs")
             assert len(filtered) == 2
             assert filtered[0]["id"] == "ps_001"
             assert filtered[1]["id"] == "ps_003"
-
-            # Reset side_effect for next test
-            mock_api_instance.list_runs.side_effect = [
-                [{"id": "rs_001"}],  # ps_001 has runs
-                [],  # ps_002 has no runs
-                [{"id": "rs_002"}],  # ps_003 has runs
-            ]
+            mock_api_instance.get_prompt_run_stats.assert_called_once_with(
+                ["ps_001", "ps_002", "ps_003"]
+            )
+            mock_api_instance.list_runs.assert_not_called()
 
             # Filter for prompts without runs
             filtered = filter_prompts(sample_prompts, runs_filter="no_runs")
             assert len(filtered) == 1
             assert filtered[0]["id"] == "ps_002"
 
+    def test_run_statistics_from_summary(self):
+        """Test statistics accept an aggregated run summary."""
+        summary = {
+            "total": 4,
+            "by_status": {"completed": 3, "failed": 1},
+            "completed_by_model_type": {"transfer": 2, "upscale": 1},
+            "rated_count": 2,
+            "average_rating": 4.5,
+        }
+
+        stats = calculate_run_statistics(summary)
+        assert stats == {"transfer": 2, "upscale": 1, "enhance": 0, "total_completed": 3}
+        assert calculate_average_rating(summary) == (4.5, 2)
+        assert calculate_average_rating({}) == (None, 0)
+
 
 class TestDataframeUtils:
     """Test dataframe utility functions."""
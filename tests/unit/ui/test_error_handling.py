@@ -29,7 +29,7 @@ class TestPromptsErrorHandling:
 
     def test_load_ops_prompts_api_failure(self):
         """Test graceful handling when API fails."""
-        with patch("cosmos_workflow.ui.tabs.prompts_handlers.CosmosAPI") as mock_api:
+        with patch("cosmos_workflow.ui.tabs.prompts_handlers.get_api") as mock_api:
             mock_api.return_value.list_prompts.side_effect = Exception("Database connection failed")
 
             result = load_ops_prompts()
@@ -39,7 +39,7 @@ class TestPromptsErrorHandling:
 
     def test_load_ops_prompts_malformed_data(self):
         """Test handling of malformed API responses."""
-        with patch("cosmos_workflow.ui.tabs.prompts_handlers.CosmosAPI") as mock_api:
+        with patch("cosmos_workflow.ui.tabs.prompts_handlers.get_api") as mock_api:
             # Return malformed data
             mock_api.return_value.list_prompts.return_value = [
                 {"id": "ps_001"},  # Missing required fields
@@ -80,7 +80,7 @@ class TestPromptsErrorHandling:
 
         table_data = [[False, "ps_001", "Test", "Text", "2025-01-15"]]
 
-        with patch("cosmos_workflow.ui.tabs.prompts_handlers.CosmosAPI") as mock_api:
+        with patch("cosmos_workflow.ui.tabs.prompts_handlers.get_api") as mock_api:
             mock_api.return_value.get_prompt.side_effect = Exception("Network error")
 
             result = on_prompt_row_select(table_data, mock_evt)
@@ -113,7 +113,7 @@ class TestPromptsErrorHandling:
             [True, "ps_001", "Test", "Text", "2025-01-15"]  # Selected
         ]
 
-        with patch("cosmos_workflow.ui.tabs.prompts_handlers.CosmosAPI") as mock_api:
+        with patch("cosmos_workflow.ui.tabs.prompts_handlers.get_api") as mock_api:
             mock_api.return_value.preview_prompt_deletion.side_effect = Exception("API Error")
 
             dialog_visible, preview_text, checkbox_state, ids_string = preview_delete_prompts(
@@ -141,7 +141,7 @@ class TestRunsErrorHandling:
 
     def test_preview_delete_run_api_failure(self):
         """Test delete preview when API fails."""
-        with patch("cosmos_workflow.ui.tabs.runs.run_actions.CosmosAPI") as mock_api:
+        with patch("cosmos_workflow.ui.tabs.runs.run_actions.get_api") as mock_api:
             mock_api.return_value.get_run.side_effect = Exception("Database error")
 
             result = preview_delete_run("rs_12345")
@@ -152,7 +152,7 @@ class TestRunsErrorHandling:
 
     def test_confirm_delete_run_api_failure(self):
         """Test delete confirmation when API fails."""
-        with patch("cosmos_workflow.ui.tabs.runs.run_actions.CosmosAPI") as mock_api:
+        with patch("cosmos_workflow.ui.tabs.runs.run_actions.get_api") as mock_api:
             mock_api.return_value.delete_run.side_effect = Exception("Permission denied")
 
             dialog, selected_id, status = confirm_delete_run("rs_12345", True)
@@ -163,7 +163,7 @@ class TestRunsErrorHandling:
 
     def test_show_upscale_dialog_missing_run(self):
         """Test upscale dialog when run doesn't exist."""
-        with patch("cosmos_workflow.ui.tabs.runs.run_actions.CosmosAPI") as mock_api:
+        with patch("cosmos_workflow.ui.tabs.runs.run_actions.get_api") as mock_api:
             mock_api.return_value.get_run.return_value = None
 
             dialog, preview, run_id = show_upscale_dialog("rs_12345")
@@ -278,7 +278,7 @@ class TestJobsErrorHandling:
 
     def test_check_running_jobs_api_failure(self):
         """Test checking jobs when API fails."""
-        with patch("cosmos_workflow.ui.tabs.jobs_handlers.CosmosAPI") as mock_api:
+        with patch("cosmos_workflow.ui.tabs.jobs_handlers.get_api") as mock_api:
             mock_api.return_value.check_status.side_effect = Exception("Connection refused")
 
             details, status, display = check_running_jobs()
@@ -288,7 +288,7 @@ class TestJobsErrorHandling:
 
     def test_check_running_jobs_partial_data(self):
         """Test with incomplete status information."""
-        with patch("cosmos_workflow.ui.tabs.jobs_handlers.CosmosAPI") as mock_api:
+        with patch("cosmos_workflow.ui.tabs.jobs_handlers.get_api") as mock_api:
             # Return partial data
             mock_api.return_value.check_status.return_value = {
                 "ssh_status": "connected",
@@ -303,7 +303,7 @@ class TestJobsErrorHandling:
 
     def test_execute_kill_job_no_containers(self):
         """Test killing when no containers exist."""
-        with patch("cosmos_workflow.ui.tabs.jobs_handlers.CosmosAPI") as mock_api:
+        with patch("cosmos_workflow.ui.tabs.jobs_handlers.get_api") as mock_api:
             mock_api.return_value.get_active_containers.return_value = []
             mock_api.return_value.kill_containers.return_value = {
                 "status": "success",
@@ -0,0 +1,92 @@
+"""Tests for translating Runs tab filters into SQL query filters."""
+
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+
+from cosmos_workflow.ui.tabs.runs.data_loading import RunFilters, RunsLoader
+from cosmos_workflow.ui.tabs.runs.filters import build_run_query_filters, date_filter_bounds
+
+
+class TestBuildRunQueryFilters:
+    """Test widget values map onto repository filters."""
+
+    def test_all_filters_inactive(self):
+        """Test default widget values produce no filters."""
+        assert build_run_query_filters() == {}
+
+    def test_active_filters(self):
+        """Test each widget maps to its repository keyword."""
+        filters = build_run_query_filters(
+            status_filter="completed",
+            type_filter="upscale",
+            search_text="  city ",
+            rating_filter="4+",
+            version_filter="upscaled",
+            prompt_ids=["ps_1"],
+        )
+
+        assert filters == {
+            "status": "completed",
+            "model_type": "upscale",
+            "search": "city",
+            "min_rating": 4,
+            "version_filter": "upscaled",
+            "prompt_ids": ["ps_1"],
+        }
+        assert build_run_query_filters(rating_filter="unrated") == {"unrated": True}
+        assert build_run_query_filters(rating_filter="5") == {"min_rating": 5}
+
+    def test_date_filter_bounds(self):
+        """Test date choices become half-open ranges."""
+        now = datetime(2025, 3, 10, 15, 30, tzinfo=timezone.utc)
+        today = datetime(2025, 3, 10, tzinfo=timezone.utc)
+
+        assert date_filter_bounds("today", now) == (today, None)
+        assert date_filter_bounds("yesterday", now) == (
+            datetime(2025, 3, 9, tzinfo=timezone.utc),
+            today,
+        )
+        assert date_filter_bounds("last_7_days", now) == (
+            datetime(2025, 3, 3, 15, 30, tzinfo=timezone.utc),
+            None,
+        )
+        assert date_filter_bounds("all", now) == (None, None)
+
+
+class TestRunsLoaderPaging:
+    """Test the Runs tab only fetches the displayed page."""
+
+    def test_fetches_page_and_total_count(self):
+        """Test list is limited to the display size and total comes from count_runs."""
+        api = MagicMock()
+        api.list_runs_enriched.return_value = []
+        api.count_runs.return_value = 1234
+
+        with patch("cosmos_workflow.ui.tabs.runs.data_loading.get_api", return_value=api):
+            loader = RunsLoader()
+            _, _, stats = loader.load_runs(
+                RunFilters(type_filter="transfer", search_text="city", limit=25)
+            )
+
+        api.list_runs_enriched.assert_called_once_with(
+            limit=25, model_type="transfer", search="city"
+        )
+        api.count_runs.assert_called_once_with(model_type="transfer", search="city")
+        assert "1234" in stats
+
+    def test_load_more_continues_after_last_row(self):
+        """Test Load More fetches the page after the last run in the table."""
+        from cosmos_workflow.ui.tabs.runs.data_loading import load_more_runs
+
+        api = MagicMock()
+        api.list_runs_enriched.return_value = [
+            {"id": "rs_3", "status": "completed", "model_type": "transfer"}
+        ]
+        table = [["rs_1", "completed", "transfer", "N/A", "-", ""]]
+        table.append(["rs_2", "failed", "transfer", "N/A", "-", ""])
+
+        with patch("cosmos_workflow.ui.tabs.runs.data_loading.get_api", return_value=api):
+            rows = load_more_runs(table, "failed", "all", "all", "", 25, None, "all", None)
+
+        api.list_runs_enriched.assert_called_once_with(limit=25, after="rs_2", status="failed")
+        assert [row[0] for row in rows] == ["rs_1", "rs_2", "rs_3"]
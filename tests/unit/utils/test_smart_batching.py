@@ -4,13 +4,23 @@ These tests define the behavioral contract for smart batching algorithms.
 Tests focus on run-level batching behavior with individual weight configs.
 """
 
+import pytest
+
+from cosmos_workflow.services.batch_cost_model import BatchCostModel
 from cosmos_workflow.utils.smart_batching import (
+    MemoryBudget,
+    VideoProfile,
     calculate_batch_efficiency,
+    can_join_batch,
     filter_batchable_jobs,
     get_control_signature,
     get_execution_signature,
     group_runs_mixed,
     group_runs_strict,
+    merge_batch_config,
+    merge_batches_by_cost,
+    plan_batches,
+    probe_video_profile,
 )
 
 
@@ -111,6 +121,22 @@ class TestRunLevelStrictGrouping:
         assert len(edge_batches[0]["prompt_ids"]) == 3  # ps_1, ps_2, ps_5
         assert len(depth_batches[0]["prompt_ids"]) == 2  # ps_3, ps_4
 
+    def test_group_runs_uses_each_runs_weights_list_entry(self):
+        """Runs of a job with a weights_list are grouped and costed by their own weights."""
+        jobs = [
+            MockJob(
+                "job1",
+                {"weights_list": [{"edge": 0.5}, {"depth": 0.3}]},
+                ["ps_1", "ps_2"],
+            ),
+            MockJob("job2", {"weights": {"depth": 0.3}}, ["ps_3"]),
+        ]
+
+        batches = group_runs_strict(jobs, max_batch_size=4)
+
+        by_prompts = {tuple(b["prompt_ids"]): b["config"]["weights_list"] for b in batches}
+        assert by_prompts == {("ps_1",): [{"edge": 0.5}], ("ps_2", "ps_3"): [{"depth": 0.3}] * 2}
+
     def test_group_runs_strict_creates_weights_list(self):
         """Each batch should have weights_list with entry per run."""
         jobs = [
@@ -246,6 +272,165 @@ class TestBatchEfficiencyCalculation:
         assert efficiency["speedup"] < 4.0  # Less than theoretical max due to overhead
 
 
+class TestCostBasedPlanning:
+    """Test choosing batch plans by predicted GPU time."""
+
+    # Model loading dominates: mixing controls pays off
+    LOAD_BOUND = BatchCostModel(prior=(300.0, 30.0, 5.0, 0.0))
+    # Controls dominate: mixing controls does not pay off
+    CONTROL_BOUND = BatchCostModel(prior=(5.0, 30.0, 60.0, 0.0))
+
+    def _jobs(self):
+        return [
+            MockJob("job1", {"weights": {"edge": 0.5}}),
+            MockJob("job2", {"weights": {"depth": 0.5}}),
+            MockJob("job3", {"weights": {"edge": 0.5}}),
+        ]
+
+    def test_efficiency_uses_cost_model(self):
+        """Speedup should be the predicted GPU time before over after batching."""
+        jobs = [MockJob(f"job{i}", {"weights": {"edge": 0.5}}) for i in range(2)]
+        batches = group_runs_strict(jobs, 4)
+
+        efficiency = calculate_batch_efficiency(batches, jobs, "strict", self.LOAD_BOUND)
+
+        # Two single runs (300 + 30 + 5 each) vs one batch of two (300 + 60 + 10)
+        assert efficiency["estimated_seconds_before"] == 670
+        assert efficiency["estimated_seconds_after"] == 370
+        assert efficiency["speedup"] == pytest.approx(670 / 370)
+
+    def test_merges_only_when_predicted_faster(self):
+        """Cost-based merging mixes controls only when it saves time."""
+        strict = group_runs_strict(self._jobs(), 4)
+        assert len(strict) == 2
+
+        merged = merge_batches_by_cost(strict, 4, self.LOAD_BOUND)
+        kept = merge_batches_by_cost(strict, 4, self.CONTROL_BOUND)
+
+        assert len(merged) == 1
+        assert merged[0]["mode"] == "mixed"
+        assert sorted(merged[0]["source_job_ids"]) == ["job1", "job2", "job3"]
+        assert len(kept) == 2
+
+    def test_merging_respects_batch_size_and_params(self):
+        """Merged batches stay within max size and identical execution params."""
+        jobs = [*self._jobs(), MockJob("job4", {"weights": {"vis": 0.5}, "num_steps": 50})]
+        merged = merge_batches_by_cost(group_runs_strict(jobs, 2), 2, self.LOAD_BOUND)
+
+        assert all(len(batch["prompt_ids"]) <= 2 for batch in merged)
+        assert any(batch["config"].get("num_steps") == 50 for batch in merged)
+        assert len(merged) == 3
+
+    def test_plan_without_mixing_is_strict(self):
+        """Without mix_controls only strict grouping is considered."""
+        batches, mode = plan_batches(self._jobs(), 4, False, self.LOAD_BOUND)
+
+        assert mode == "strict"
+        assert len(batches) == 2
+
+    def test_plan_picks_fastest_mode(self):
+        """With mix_controls the plan with the least predicted time wins."""
+        _, load_mode = plan_batches(self._jobs(), 4, True, self.LOAD_BOUND)
+        _, control_mode = plan_batches(self._jobs(), 4, True, self.CONTROL_BOUND)
+
+        assert load_mode == "mixed"  # Ties with optimized; the simpler plan wins
+        assert control_mode == "strict"
+
+
+class TestMemoryAwarePacking:
+    """Test packing batches under a GPU memory budget."""
+
+    HD = VideoProfile(frames=121, width=1920, height=1080)
+    SHORT = VideoProfile(frames=30, width=1280, height=704)
+
+    def _edge_jobs(self, count):
+        return [MockJob(f"job{i}", {"weights": {"edge": 0.5}}, [f"ps_{i}"]) for i in range(count)]
+
+    def test_large_clips_split_batches(self):
+        """High-resolution clips leave room for fewer runs per batch."""
+        jobs = self._edge_jobs(4)
+        memory = MemoryBudget(80.0, {"ps_0": self.HD, "ps_1": self.HD})
+
+        unpacked = group_runs_strict(jobs, 4)
+        packed = group_runs_strict(jobs, 4, memory)
+
+        assert len(unpacked) == 1
+        assert len(packed) == 2
+        assert all(batch["memory_gb"] <= 80.0 for batch in packed)
+        # Runs keep queue order inside their batch
+        assert packed[0]["prompt_ids"] == ["ps_0", "ps_1", "ps_2"]
+
+    def test_short_clips_still_capped_by_batch_size(self):
+        """Small runs pack densely but never beyond max_batch_size."""
+        jobs = self._edge_jobs(6)
+        memory = MemoryBudget(80.0, {f"ps_{i}": self.SHORT for i in range(6)})
+
+        packed = group_runs_strict(jobs, 4, memory)
+
+        assert [len(batch["prompt_ids"]) for batch in packed] == [4, 2]
+
+    def test_oversized_run_runs_alone(self):
+        """A run over the budget on its own still gets a batch."""
+        jobs = self._edge_jobs(2)
+        memory = MemoryBudget(30.0)
+
+        packed = group_runs_strict(jobs, 4, memory)
+
+        assert [batch["prompt_ids"] for batch in packed] == [["ps_0"], ["ps_1"]]
+
+    def test_mixed_merges_small_groups_that_fit(self):
+        """Mixed mode combines small control groups while the union fits the budget."""
+        jobs = [
+            MockJob("job1", {"weights": {"edge": 0.5}}, ["ps_1"]),
+            MockJob("job2", {"weights": {"depth": 0.5}}, ["ps_2"]),
+        ]
+
+        merged = group_runs_mixed(jobs, 4, MemoryBudget(80.0))
+        kept = group_runs_mixed(jobs, 4, MemoryBudget(50.0))
+
+        assert len(merged) == 1
+        assert merged[0]["config"]["weights_list"] == [{"edge": 0.5}, {"depth": 0.5}]
+        assert merged[0]["memory_gb"] == 60.0
+        assert len(kept) == 2
+
+    def test_cost_merge_respects_budget(self):
+        """Cost-based merging skips merges that would not fit in memory."""
+        jobs = TestCostBasedPlanning()._jobs()
+        memory = MemoryBudget(50.0)
+        load_bound = TestCostBasedPlanning.LOAD_BOUND
+
+        merged = merge_batches_by_cost(group_runs_strict(jobs, 4, memory), 4, load_bound, memory)
+        batches, _ = plan_batches(jobs, 4, True, load_bound, memory)
+
+        assert len(merged) == 2
+        assert all(memory.fits(b["prompt_ids"], b["config"]["weights_list"]) for b in batches)
+
+    def test_unreadable_video_uses_reference_profile(self, tmp_path):
+        """Missing or unreadable videos are treated as the reference clip."""
+        broken = tmp_path / "color.mp4"
+        broken.write_bytes(b"not a video")
+
+        assert probe_video_profile(None) == VideoProfile()
+        assert probe_video_profile(str(tmp_path / "missing.mp4")) == VideoProfile()
+        assert probe_video_profile(str(broken)) == VideoProfile()
+        assert VideoProfile(frames=500).scale == 1.0
+
+    def test_probes_video_frames_and_resolution(self, tmp_path):
+        """Frame count and resolution come from the input video."""
+        cv2 = pytest.importorskip("cv2")
+        np = pytest.importorskip("numpy")
+        path = str(tmp_path / "color.mp4")
+        writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"mp4v"), 24, (640, 352))
+        for _ in range(12):
+            writer.write(np.zeros((352, 640, 3), np.uint8))
+        writer.release()
+
+        profile = probe_video_profile(path)
+
+        assert profile == VideoProfile(frames=12, width=640, height=352)
+        assert profile.scale == pytest.approx(12 / 121 / 4)
+
+
 class TestFilterBatchableJobs:
     """Test filtering of jobs that can be batched."""
 
@@ -272,3 +457,60 @@ class TestFilterBatchableJobs:
 
         assert len(batchable) == 1
         assert batchable[0].job_type == "batch_inference"
+
+
+class TestOnlineBatchMerging:
+    """Test the compatibility check and config merge used at claim time."""
+
+    def test_same_params_and_controls_can_join(self):
+        """Jobs with matching parameters and controls share a batch."""
+        leader = MockJob("job1", {"weights": {"edge": 0.5}, "num_steps": 30})
+        job = MockJob("job2", {"weights": {"edge": 0.9}, "num_steps": 30})
+
+        assert can_join_batch(leader, job)
+
+    def test_different_exec_params_never_join(self):
+        """Execution parameters must match even when mixing controls."""
+        leader = MockJob("job1", {"weights": {"edge": 0.5}, "num_steps": 30})
+        job = MockJob("job2", {"weights": {"edge": 0.5}, "num_steps": 50})
+
+        assert not can_join_batch(leader, job, mix_controls=True)
+
+    def test_different_controls_join_only_when_mixing(self):
+        """Strict mode keeps control sets apart; mixed mode combines them."""
+        leader = MockJob("job1", {"weights": {"edge": 0.5}})
+        job = MockJob("job2", {"weights": {"depth": 0.5}})
+
+        assert not can_join_batch(leader, job)
+        assert can_join_batch(leader, job, mix_controls=True)
+
+    def test_batch_job_weights_list_is_checked_per_run(self):
+        """A batch job joins in strict mode only if each run uses the leader's controls."""
+        leader = MockJob("job1", {"weights": {"edge": 0.5}})
+        job = MockJob(
+            "job2",
+            {"weights_list": [{"edge": 0.3}, {"edge": 0.7, "vis": 0.2}]},
+            ["ps_a", "ps_b"],
+        )
+        job.job_type = "batch_inference"
+
+        assert not can_join_batch(leader, job)
+
+    def test_non_batchable_type_never_joins(self):
+        """Enhancement and upscale jobs are not batched."""
+        leader = MockJob("job1", {})
+        job = MockJob("job2", {})
+        job.job_type = "enhancement"
+
+        assert not can_join_batch(leader, job, mix_controls=True)
+
+    def test_merge_batch_config_keeps_per_prompt_weights(self):
+        """Merged config carries one weights entry per prompt in job order."""
+        leader = MockJob("job1", {"weights": {"edge": 0.5}, "seed": 7}, ["ps_1", "ps_2"])
+        job = MockJob("job2", {"weights_list": [{"edge": 0.9}], "seed": 7}, ["ps_3"])
+
+        config = merge_batch_config([leader, job])
+
+        assert "weights" not in config
+        assert config["seed"] == 7
+        assert config["weights_list"] == [{"edge": 0.5}, {"edge": 0.5}, {"edge": 0.9}]
@@ -333,19 +333,19 @@ class TestGPUExecutorBatchExecution:
             ],
         }
 
-        # Mock service.update_run to track updates
+        # Mock service.update_runs to track updates
         run_updates = {}
 
-        def track_updates(run_id, **kwargs):
-            if "outputs" in kwargs:
-                run_updates[run_id] = kwargs["outputs"]
+        def track_updates(updates):
+            for run_id, fields in updates.items():
+                run_updates[run_id] = fields["outputs"]
+                assert fields["status"] == "completed"
 
         # Create mock service if not present
         if not hasattr(self.orchestrator, "service"):
             self.orchestrator.service = Mock()
 
-        self.orchestrator.service.update_run = Mock(side_effect=track_updates)
-        self.orchestrator.service.update_run_status = Mock()
+        self.orchestrator.service.update_runs = Mock(side_effect=track_updates)
 
         with patch("cosmos_workflow.execution.gpu_executor.nvidia_format") as mock_nv:
             self._setup_nvidia_format_mock(mock_nv)
@@ -384,6 +384,9 @@ class TestGPUExecutorBatchExecution:
             assert "output_path" in run_updates["rs_001"]
             assert "output_path" in run_updates["rs_002"]
 
+            # All runs are written in a single bulk update
+            self.orchestrator.service.update_runs.assert_called_once()
+
     def test_execute_batch_runs_with_mixed_video_inputs(self):
         """Test batch execution with different video input combinations."""
         # Create outputs directory in temp dir